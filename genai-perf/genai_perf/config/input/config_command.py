@@ -73,6 +73,11 @@ class ConfigCommand(BaseConfig):
             add_to_template=False,
         )
 
+        self.tokenized_corpus_filename: Any = ConfigField(
+            default=TopLevelDefaults.TOKENIZED_CORPUS_FILENAME,
+            add_to_template=False,
+        )
+
         self.analyze = ConfigAnalyze()
         self.endpoint = ConfigEndPoint()
         self.perf_analyzer = ConfigPerfAnalyzer()
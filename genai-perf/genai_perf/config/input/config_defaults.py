@@ -20,8 +20,10 @@ from genai_perf.inputs.input_constants import (
     ImageFormat,
     ModelSelectionStrategy,
     OutputFormat,
+    OutputTokenAccounting,
     PerfAnalyzerMeasurementMode,
     Subcommand,
+    TokenizerBackend,
 )
 
 
@@ -44,6 +46,7 @@ class TopLevelDefaults:
     SUBCOMMAND = Subcommand.CONFIG
     VERBOSE = False
     TEMPLATE_FILENAME = "genai_perf_config.yaml"
+    TOKENIZED_CORPUS_FILENAME = None
 
 
 @dataclass(frozen=True)
@@ -125,6 +128,7 @@ class OutputTokenDefaults:
 class SyntheticTokenDefaults:
     MEAN = 550
     STDDEV = 0
+    CORPUS = None
 
 
 @dataclass(frozen=True)
@@ -138,6 +142,9 @@ class InputDefaults:
     BATCH_SIZE = 1
     EXTRA = None
     GOODPUT = ""
+    GOODPUT_PROFILES = None
+    SLO_ATTAINMENT = []
+    SLO_ATTAINMENT_GRID_SIZE = 20
     HEADER = ""
     FILE = ""
     NUM_DATASET_ENTRIES = 100
@@ -168,6 +175,17 @@ class OutputDefaults:
     CHECKPOINT_DIRECTORY = "./checkpoint"
     PROFILE_EXPORT_FILE = "profile_export.json"
     GENERATE_PLOTS = False
+    PLOT_STATIC_IMAGES = False
+    PLOT_MAX_POINTS = 100_000
+    STREAM_PROFILE_EXPORT = False
+    NUM_PARSE_WORKERS = 1
+    CACHE_PARSED_METRICS = False
+    EXPORT_TIMELINE = False
+    TIMELINE_BUCKET_SIZE = 1.0
+    TIMELINE_ROLLING_WINDOW = 5.0
+    STEADY_STATE_DETECTION = False
+    STEADY_STATE_TOLERANCE = 0.1
+    PERCENTILES = [25, 50, 75, 90, 95, 99]
 
 
 @dataclass(frozen=True)
@@ -175,6 +193,13 @@ class TokenizerDefaults:
     NAME = ""
     REVISION = "main"
     TRUST_REMOTE_CODE = False
+    BATCH_SIZE = 1024
+    COUNT_CACHE_DIR = None
+    COUNT_CACHE_SIZE = 1_000_000
+    CORPUS_CACHE_DIR = None
+    OUTPUT_TOKEN_ACCOUNTING = OutputTokenAccounting.PREFIX
+    USE_SERVER_TOKEN_COUNTS = False
+    BACKEND = TokenizerBackend.TRANSFORMERS
 
 
 @dataclass(frozen=True)
@@ -62,6 +62,26 @@ class ConfigInput(BaseConfig):
                 \n  request_latency:300\
                 \n  output_token_throughput_per_user:600",
         )
+        self.goodput_profiles: Any = ConfigField(
+            default=InputDefaults.GOODPUT_PROFILES,
+            verbose_template_comment="Named sets of goodput constraints, each evaluated like goodput.\
+                \nThe goodput of every profile is reported next to each other.\
+                \nFor example:\
+                \n  interactive:\
+                \n    time_to_first_token: 200\
+                \n  batch:\
+                \n    request_latency: 10000",
+        )
+        self.slo_attainment: Any = ConfigField(
+            default=InputDefaults.SLO_ATTAINMENT,
+            verbose_template_comment="One or two metrics to compute the fraction of requests and the goodput\
+                \nthat meet each threshold on a grid, e.g. [time_to_first_token, inter_token_latency].",
+        )
+        self.slo_attainment_grid_size: Any = ConfigField(
+            default=InputDefaults.SLO_ATTAINMENT_GRID_SIZE,
+            bounds={"min": 2},
+            verbose_template_comment="The number of thresholds of each SLO attainment metric.",
+        )
         self.header: Any = ConfigField(
             default=InputDefaults.HEADER,
             verbose_template_comment="Adds a custom header to the requests.\
@@ -109,6 +129,13 @@ class ConfigInput(BaseConfig):
             elif key == "goodput":
                 if value:
                     self._parse_goodput(value)
+            elif key == "goodput_profiles":
+                if value:
+                    self._parse_goodput_profiles(value)
+            elif key == "slo_attainment":
+                self._parse_slo_attainment(value)
+            elif key == "slo_attainment_grid_size":
+                self.slo_attainment_grid_size = value
             elif key == "header":
                 self.header = value
             elif key == "file":
@@ -133,6 +160,29 @@ class ConfigInput(BaseConfig):
                 raise ValueError(f"User Config: {key} is not a valid input parameter")
 
     def _parse_goodput(self, goodputs: Dict[str, Any]) -> None:
+        self.goodput = self._parse_goodput_constraints(goodputs)
+
+    def _parse_goodput_profiles(self, profiles: Dict[str, Any]) -> None:
+        goodput_profiles = {}
+        for profile, goodputs in profiles.items():
+            if not isinstance(goodputs, dict) or not goodputs:
+                raise ValueError(
+                    f"User Config: Goodput profile {profile} must have at least one constraint"
+                )
+            goodput_profiles[profile] = self._parse_goodput_constraints(goodputs)
+
+        self.goodput_profiles = goodput_profiles
+
+    def _parse_slo_attainment(self, value: Any) -> None:
+        metrics = [value] if isinstance(value, str) else value
+        if not isinstance(metrics, list) or len(metrics) > 2:
+            raise ValueError(
+                "User Config: slo_attainment must be a list of one or two metrics"
+            )
+
+        self.slo_attainment = metrics
+
+    def _parse_goodput_constraints(self, goodputs: Dict[str, Any]) -> Dict[str, float]:
         constraints = {}
         for target_metric, target_value in goodputs.items():
             if isinstance(target_value, int) or isinstance(target_value, float):
@@ -147,7 +197,7 @@ class ConfigInput(BaseConfig):
                     "User Config: Goodput values must be integers or floats"
                 )
 
-        self.goodput = constraints
+        return constraints
 
     def _parse_file(self, value: str) -> None:
         if not value:
@@ -478,6 +528,12 @@ class ConfigSyntheticTokens(BaseConfig):
             bounds={"min": 0},
             verbose_template_comment="The standard deviation of number of tokens in the generated prompts when using synthetic data.",
         )
+        self.corpus: Any = ConfigField(
+            default=SyntheticTokenDefaults.CORPUS,
+            verbose_template_comment="The corpus the synthetic prompts are sampled from, either a text file\
+                \nor a .npy file written by the tokenize-corpus subcommand.\
+                \nThe corpus bundled with GenAI-Perf is used by default.",
+        )
 
     def parse(self, synthetic_tokens: Dict[str, Any]) -> None:
         for key, value in synthetic_tokens.items():
@@ -490,6 +546,8 @@ class ConfigSyntheticTokens(BaseConfig):
                     )
             elif key == "stddev":
                 self.stddev = value
+            elif key == "corpus":
+                self.corpus = Path(value) if value else None
             else:
                 raise ValueError(
                     f"User Config: {key} is not a valid synthetic_tokens parameter"
@@ -46,6 +46,59 @@ class ConfigOutput(BaseConfig):
             default=OutputDefaults.GENERATE_PLOTS,
             verbose_template_comment="Enables the generation of plots",
         )
+        self.plot_static_images: Any = ConfigField(
+            default=OutputDefaults.PLOT_STATIC_IMAGES,
+            verbose_template_comment="Exports the plots as jpeg images in addition to html",
+        )
+        self.plot_max_points: Any = ConfigField(
+            default=OutputDefaults.PLOT_MAX_POINTS,
+            verbose_template_comment="The maximum number of points of each run drawn in the per-token\
+                \nscatter plots, which are sampled by percentile at each token position",
+        )
+        self.stream_profile_export: Any = ConfigField(
+            default=OutputDefaults.STREAM_PROFILE_EXPORT,
+            verbose_template_comment="Parses the profile export file one request at a time\
+                \ninstead of loading it in memory. Use this for very large exports.",
+        )
+        self.num_parse_workers: Any = ConfigField(
+            default=OutputDefaults.NUM_PARSE_WORKERS,
+            verbose_template_comment="The number of worker processes used to parse the requests\
+                \nof the profile export file. A value of 1 parses the requests serially.",
+        )
+        self.cache_parsed_metrics: Any = ConfigField(
+            default=OutputDefaults.CACHE_PARSED_METRICS,
+            verbose_template_comment="Saves the parsed requests in a Parquet sidecar next to the\
+                \nprofile export file, which is reused when the same export is parsed again.",
+        )
+        self.export_timeline: Any = ConfigField(
+            default=OutputDefaults.EXPORT_TIMELINE,
+            verbose_template_comment="Exports the throughput, in-flight requests and latency percentiles\
+                \nover time to <profile_export_file>_genai_perf_timeline.json and .csv",
+        )
+        self.timeline_bucket_size: Any = ConfigField(
+            default=OutputDefaults.TIMELINE_BUCKET_SIZE,
+            verbose_template_comment="The duration, in seconds, of each bucket of the timeline",
+        )
+        self.timeline_rolling_window: Any = ConfigField(
+            default=OutputDefaults.TIMELINE_ROLLING_WINDOW,
+            verbose_template_comment="The duration, in seconds, of the trailing window over which\
+                \nthe latency percentiles of each bucket of the timeline are computed",
+        )
+        self.steady_state_detection: Any = ConfigField(
+            default=OutputDefaults.STEADY_STATE_DETECTION,
+            verbose_template_comment="Computes the metrics only over the requests inside the steady state\
+                \nof each experiment, trimming the ramp-up and the drain",
+        )
+        self.steady_state_tolerance: Any = ConfigField(
+            default=OutputDefaults.STEADY_STATE_TOLERANCE,
+            verbose_template_comment="The relative variation of the in-flight requests and the throughput\
+                \nallowed in the steady state",
+        )
+        self.percentiles: Any = ConfigField(
+            default=OutputDefaults.PERCENTILES,
+            verbose_template_comment="The percentiles of each metric reported in the outputs,\
+                \nsuch as 99.9 and 99.99 for tail latency SLOs",
+        )
 
     def parse(self, output: Dict[str, Any]) -> None:
         for key, value in output.items():
@@ -57,5 +110,41 @@ class ConfigOutput(BaseConfig):
                 self.profile_export_file = Path(value)
             elif key == "generate_plots":
                 self.generate_plots = value
+            elif key == "plot_static_images":
+                self.plot_static_images = value
+            elif key == "plot_max_points":
+                self.plot_max_points = value
+            elif key == "stream_profile_export":
+                self.stream_profile_export = value
+            elif key == "num_parse_workers":
+                self.num_parse_workers = value
+            elif key == "cache_parsed_metrics":
+                self.cache_parsed_metrics = value
+            elif key == "export_timeline":
+                self.export_timeline = value
+            elif key == "timeline_bucket_size":
+                self.timeline_bucket_size = value
+            elif key == "timeline_rolling_window":
+                self.timeline_rolling_window = value
+            elif key == "steady_state_detection":
+                self.steady_state_detection = value
+            elif key == "steady_state_tolerance":
+                self.steady_state_tolerance = value
+            elif key == "percentiles":
+                self._parse_percentiles(value)
             else:
                 raise ValueError(f"User Config: {key} is not a valid output parameter")
+
+    def _parse_percentiles(self, value: Any) -> None:
+        percentiles = value if isinstance(value, list) else [value]
+        for percentile in percentiles:
+            if (
+                isinstance(percentile, bool)
+                or not isinstance(percentile, (int, float))
+                or not 0 < percentile < 100
+            ):
+                raise ValueError(
+                    "User Config: percentiles must be numbers between 0 and 100"
+                )
+
+        self.percentiles = percentiles
@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 import genai_perf.logging as logging
 from genai_perf.config.input.base_config import BaseConfig
 from genai_perf.config.input.config_defaults import TokenizerDefaults
 from genai_perf.config.input.config_field import ConfigField
+from genai_perf.inputs.input_constants import OutputTokenAccounting, TokenizerBackend
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +50,53 @@ class ConfigTokenizer(BaseConfig):
                 \nThis carries security risks and should only be used for repositories you trust.\
                 \nThis is only necessary for custom tokenizers stored in HuggingFace Hub.",
         )
+        self.batch_size: Any = ConfigField(
+            default=TokenizerDefaults.BATCH_SIZE,
+            verbose_template_comment="The number of texts tokenized together when counting the\
+                \ninput and output tokens of the profile export requests,\
+                \nand of synthetic prompts decoded together.",
+        )
+        self.count_cache_dir: Any = ConfigField(
+            default=TokenizerDefaults.COUNT_CACHE_DIR,
+            verbose_template_comment="The directory of a persistent cache of the token counts,\
+                \nwhich is reused across runs with the same tokenizer.\
+                \nThe cache is disabled by default.",
+        )
+        self.count_cache_size: Any = ConfigField(
+            default=TokenizerDefaults.COUNT_CACHE_SIZE,
+            verbose_template_comment="The maximum number of texts kept in the token count cache.\
+                \nThe least recently used texts are evicted first.",
+        )
+        self.corpus_cache_dir: Any = ConfigField(
+            default=TokenizerDefaults.CORPUS_CACHE_DIR,
+            verbose_template_comment="The directory of a persistent cache of the tokenized corpus\
+                \nof the synthetic prompts, which is memory-mapped by later runs\
+                \nwith the same tokenizer. The cache is disabled by default.",
+        )
+        self.output_token_accounting: Any = ConfigField(
+            default=TokenizerDefaults.OUTPUT_TOKEN_ACCOUNTING,
+            choices=OutputTokenAccounting,
+            verbose_template_comment="How the output tokens of each response chunk are counted.\
+                \nprefix: tokenize each chunk separately behind a fixed prefix token.\
+                \noffsets: tokenize the full output once and split its tokens across\
+                \nthe chunks with the token offsets. This requires a fast tokenizer.",
+        )
+        self.use_server_token_counts: Any = ConfigField(
+            default=TokenizerDefaults.USE_SERVER_TOKEN_COUNTS,
+            verbose_template_comment="Take the input and output token counts from the usage reported\
+                \nby OpenAI compatible servers, and only use the tokenizer for the\
+                \nrequests without usage. Streaming requests ask for the usage\
+                \nwith stream_options.include_usage.",
+        )
+        self.backend: Any = ConfigField(
+            default=TokenizerDefaults.BACKEND,
+            choices=TokenizerBackend,
+            verbose_template_comment="The library that loads and runs the tokenizer.\
+                \ntransformers: load the tokenizer with transformers' AutoTokenizer.\
+                \ntokenizers: load the tokenizer.json of the tokenizer directly with the\
+                \ntokenizers library, which starts faster and uses less memory. Tokenizers\
+                \nwithout a tokenizer.json or with trust_remote_code use transformers.",
+        )
 
         self._enable_debug_logging: Any = ConfigField(
             default=None, add_to_template=False, value=enable_debug_logging
@@ -61,6 +110,20 @@ class ConfigTokenizer(BaseConfig):
                 self.revision = value
             elif key == "trust_remote_code":
                 self.trust_remote_code = value
+            elif key == "batch_size":
+                self.batch_size = value
+            elif key == "count_cache_dir":
+                self.count_cache_dir = Path(value) if value else None
+            elif key == "corpus_cache_dir":
+                self.corpus_cache_dir = Path(value) if value else None
+            elif key == "count_cache_size":
+                self.count_cache_size = value
+            elif key == "output_token_accounting":
+                self.output_token_accounting = OutputTokenAccounting(value.upper())
+            elif key == "use_server_token_counts":
+                self.use_server_token_counts = value
+            elif key == "backend":
+                self.backend = TokenizerBackend(value.upper())
             else:
                 raise ValueError(
                     f"User Config: {key} is not a valid tokenizer parameter"
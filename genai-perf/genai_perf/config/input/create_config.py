@@ -24,9 +24,11 @@ from genai_perf.inputs.input_constants import (
     ImageFormat,
     ModelSelectionStrategy,
     OutputFormat,
+    OutputTokenAccounting,
     PerfAnalyzerMeasurementMode,
     PromptSource,
     Subcommand,
+    TokenizerBackend,
 )
 from genai_perf.subcommand.common import get_extra_inputs_as_dict
 
@@ -43,6 +45,8 @@ class CreateConfig:
 
         if args.subcommand == Subcommand.TEMPLATE.value:
             config = CreateConfig._create_template_config(args)
+        elif args.subcommand == Subcommand.TOKENIZE_CORPUS.value:
+            config = CreateConfig._create_tokenize_corpus_config(args)
         else:
             if args.subcommand == Subcommand.CONFIG.value:
                 user_config = utils.load_yaml(args.file)
@@ -71,6 +75,21 @@ class CreateConfig:
 
         return config
 
+    @staticmethod
+    def _create_tokenize_corpus_config(args: argparse.Namespace) -> ConfigCommand:
+        config = ConfigCommand(skip_inferencing_and_checking=True)
+
+        config.verbose = args.verbose
+        config.subcommand = Subcommand(args.subcommand)
+        config.input.synthetic_tokens.corpus = args.corpus
+        if args.output:
+            config.tokenized_corpus_filename = args.output
+        else:
+            config.tokenized_corpus_filename = args.corpus.with_suffix(".npy")
+        CreateConfig._add_tokenizer_args_to_config(config, args)
+
+        return config
+
     @staticmethod
     def _print_warnings(config: ConfigCommand) -> None:
         if config.tokenizer.trust_remote_code:
@@ -256,6 +275,12 @@ class CreateConfig:
 
         if args.goodput:
             config.input.goodput = args.goodput
+        if args.goodput_profile:
+            config.input.goodput_profiles = args.goodput_profile
+        if args.slo_attainment:
+            config.input.slo_attainment = args.slo_attainment
+        if args.slo_attainment_grid_size:
+            config.input.slo_attainment_grid_size = args.slo_attainment_grid_size
         if args.header:
             config.input.header = args.header
         if args.input_file:
@@ -310,6 +335,8 @@ class CreateConfig:
             config.input.synthetic_tokens.mean = args.synthetic_input_tokens_mean
         if args.synthetic_input_tokens_stddev:
             config.input.synthetic_tokens.stddev = args.synthetic_input_tokens_stddev
+        if args.synthetic_input_tokens_corpus:
+            config.input.synthetic_tokens.corpus = args.synthetic_input_tokens_corpus
 
         # Input - Prefix Prompt
         if args.num_prefix_prompts:
@@ -344,6 +371,28 @@ class CreateConfig:
             config.output.profile_export_file = args.profile_export_file
         if args.generate_plots:
             config.output.generate_plots = args.generate_plots
+        if args.plot_static_images:
+            config.output.plot_static_images = args.plot_static_images
+        if args.plot_max_points:
+            config.output.plot_max_points = args.plot_max_points
+        if args.stream_profile_export:
+            config.output.stream_profile_export = args.stream_profile_export
+        if args.num_parse_workers:
+            config.output.num_parse_workers = args.num_parse_workers
+        if args.cache_parsed_metrics:
+            config.output.cache_parsed_metrics = args.cache_parsed_metrics
+        if args.export_timeline:
+            config.output.export_timeline = args.export_timeline
+        if args.timeline_bucket_size:
+            config.output.timeline_bucket_size = args.timeline_bucket_size
+        if args.timeline_rolling_window:
+            config.output.timeline_rolling_window = args.timeline_rolling_window
+        if args.steady_state_detection:
+            config.output.steady_state_detection = args.steady_state_detection
+        if args.steady_state_tolerance:
+            config.output.steady_state_tolerance = args.steady_state_tolerance
+        if args.percentiles:
+            config.output.percentiles = args.percentiles
 
         return config
 
@@ -357,6 +406,22 @@ class CreateConfig:
             config.tokenizer.revision = args.tokenizer_revision
         if args.tokenizer_trust_remote_code:
             config.tokenizer.trust_remote_code = args.tokenizer_trust_remote_code
+        if args.tokenizer_batch_size:
+            config.tokenizer.batch_size = args.tokenizer_batch_size
+        if args.tokenizer_count_cache_dir:
+            config.tokenizer.count_cache_dir = args.tokenizer_count_cache_dir
+        if args.tokenizer_count_cache_size:
+            config.tokenizer.count_cache_size = args.tokenizer_count_cache_size
+        if args.tokenizer_corpus_cache_dir:
+            config.tokenizer.corpus_cache_dir = args.tokenizer_corpus_cache_dir
+        if args.tokenizer_output_token_accounting:
+            config.tokenizer.output_token_accounting = OutputTokenAccounting(
+                args.tokenizer_output_token_accounting.upper()
+            )
+        if args.use_server_token_counts:
+            config.tokenizer.use_server_token_counts = args.use_server_token_counts
+        if args.tokenizer_backend:
+            config.tokenizer.backend = TokenizerBackend(args.tokenizer_backend.upper())
 
         return config
 
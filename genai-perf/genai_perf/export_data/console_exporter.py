@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 from . import exporter_utils
@@ -44,6 +45,9 @@ class ConsoleExporter:
         self._telemetry_stats = config.telemetry_stats
         self._metrics = config.metrics
         self._config = config.config
+        self._stat_column_keys = exporter_utils.get_stat_keys(
+            self.STAT_COLUMN_KEYS, self._config.output.percentiles
+        )
 
         # Set the maximum width of the 'Statistic' column.
         # Any metric name+unit longer than this width will be wrapped.
@@ -67,7 +71,7 @@ class ConsoleExporter:
         table = Table(title=self._get_title())
 
         table.add_column("Statistic", justify="right", style="cyan")
-        for stat in self.STAT_COLUMN_KEYS:
+        for stat in self._stat_column_keys:
             table.add_column(stat, justify="right", style="green")
 
         # Request metrics table
@@ -77,7 +81,7 @@ class ConsoleExporter:
         console.print(table)
         if self._config.verbose:
             telem_utils.export_telemetry_stats_console(
-                self._telemetry_stats, self.STAT_COLUMN_KEYS, console
+                self._telemetry_stats, self._stat_column_keys, console
             )
 
     def _construct_table(self, table: Table) -> None:
@@ -91,7 +95,7 @@ class ConsoleExporter:
             )
             row_values = [metric_str]
 
-            for stat in self.STAT_COLUMN_KEYS:
+            for stat in self._stat_column_keys:
                 row_values.append(
                     exporter_utils.fetch_stat(self._stats, metric.name, stat)
                 )
@@ -102,18 +106,33 @@ class ConsoleExporter:
             metric_str = exporter_utils.format_metric_name(
                 metric.name, metric.unit, self._max_width
             )
-            if metric.name == "request_goodput" and not self._config.input.goodput:
-                continue
-
-            row_values = [metric_str]
-            for stat in self.STAT_COLUMN_KEYS:
-                if stat == "avg":
-                    row_values.append(
-                        exporter_utils.fetch_stat(self._stats, metric.name, "avg")
-                    )
-                else:
-                    row_values.append("N/A")
-
+            if metric.name != "request_goodput" or self._config.input.goodput:
+                row_values = [metric_str]
+                for stat in self._stat_column_keys:
+                    if stat == "avg":
+                        row_values.append(
+                            exporter_utils.fetch_stat(self._stats, metric.name, "avg")
+                        )
+                    else:
+                        row_values.append("N/A")
+
+                table.add_row(*row_values)
+
+            # The goodput of each SLO profile follows the goodput
+            if metric.name == "request_goodput" and self._config.input.goodput_profiles:
+                self._add_goodput_profile_rows(table, metric.unit)
+
+    def _add_goodput_profile_rows(self, table: Table, unit: str) -> None:
+        for profile, goodput in self._metrics.request_goodputs_by_profile.items():
+            metric_str = exporter_utils.format_goodput_profile_name(
+                profile, unit, self._max_width
+            )
+            # The profile name in brackets is not a console markup tag
+            row_values = [
+                escape(metric_str),
+                exporter_utils.format_stat_value(goodput[0]),
+            ]
+            row_values += ["N/A"] * (len(self._stat_column_keys) - 1)
             table.add_row(*row_values)
 
     # (TMA-1976) Refactor this method as the csv exporter shares identical method.
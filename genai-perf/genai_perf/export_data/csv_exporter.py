@@ -66,6 +66,9 @@ class CsvExporter:
         self._output_dir = config.perf_analyzer_config.get_artifact_directory()
         self._profile_export_file = config.config.output.profile_export_file
         self._config = config.config
+        self._stat_keys = exporter_utils.get_stat_keys(
+            self.REQUEST_METRICS_HEADER[1:], self._config.output.percentiles
+        )
 
     def export(self) -> None:
         filename = self._output_dir / f"{self._profile_export_file.stem}_genai_perf.csv"
@@ -76,17 +79,19 @@ class CsvExporter:
             self._write_request_metrics(writer)
             writer.writerow([])
             self._write_system_metrics(writer)
-            telem_utils.export_telemetry_stats_csv(self._telemetry_stats, writer)
+            telem_utils.export_telemetry_stats_csv(
+                self._telemetry_stats, writer, self._config.output.percentiles
+            )
 
     def _write_request_metrics(self, csv_writer) -> None:
-        csv_writer.writerow(self.REQUEST_METRICS_HEADER)
+        csv_writer.writerow(self.REQUEST_METRICS_HEADER[:1] + self._stat_keys)
         for metric in self._metrics.request_metrics:
             if self._should_skip(metric.name):
                 continue
 
             metric_str = exporter_utils.format_metric_name(metric.name, metric.unit)
             row_values = [metric_str]
-            for stat in self.REQUEST_METRICS_HEADER[1:]:
+            for stat in self._stat_keys:
                 row_values.append(
                     exporter_utils.fetch_stat(self._stats, metric.name, stat)
                 )
@@ -97,10 +102,22 @@ class CsvExporter:
         csv_writer.writerow(self.SYSTEM_METRICS_HEADER)
         for metric in self._metrics.system_metrics:
             metric_str = exporter_utils.format_metric_name(metric.name, metric.unit)
-            if metric.name == "request_goodput" and not self._config.input.goodput:
-                continue
-            value = exporter_utils.fetch_stat(self._stats, metric.name, "avg")
-            csv_writer.writerow([metric_str, exporter_utils.format_stat_value(value)])
+            if metric.name != "request_goodput" or self._config.input.goodput:
+                value = exporter_utils.fetch_stat(self._stats, metric.name, "avg")
+                csv_writer.writerow(
+                    [metric_str, exporter_utils.format_stat_value(value)]
+                )
+
+            # The goodput of each SLO profile follows the goodput
+            if metric.name == "request_goodput" and self._config.input.goodput_profiles:
+                self._write_goodput_profiles(csv_writer, metric.unit)
+
+    def _write_goodput_profiles(self, csv_writer, unit: str) -> None:
+        for profile, goodput in self._metrics.request_goodputs_by_profile.items():
+            metric_str = exporter_utils.format_goodput_profile_name(profile, unit)
+            csv_writer.writerow(
+                [metric_str, exporter_utils.format_stat_value(goodput[0])]
+            )
 
     def _should_skip(self, metric_name: str) -> bool:
         if self._config.endpoint.type == "embeddings":
@@ -30,10 +30,24 @@ from genai_perf.export_data.console_exporter import ConsoleExporter
 from genai_perf.export_data.csv_exporter import CsvExporter
 from genai_perf.export_data.exporter_config import ExporterConfig
 from genai_perf.export_data.json_exporter import JsonExporter
+from genai_perf.export_data.slo_attainment_exporter import SLOAttainmentExporter
+from genai_perf.export_data.timeline_exporter import TimelineExporter
 from genai_perf.inputs.input_constants import Subcommand
 
-ProfileDataExporterList = [ConsoleExporter, JsonExporter, CsvExporter]
-AnalyzeDataExporterList = [ConsoleExporter, JsonExporter, CsvExporter]
+ProfileDataExporterList = [
+    ConsoleExporter,
+    JsonExporter,
+    CsvExporter,
+    TimelineExporter,
+    SLOAttainmentExporter,
+]
+AnalyzeDataExporterList = [
+    ConsoleExporter,
+    JsonExporter,
+    CsvExporter,
+    TimelineExporter,
+    SLOAttainmentExporter,
+]
 
 
 class DataExporterFactory:
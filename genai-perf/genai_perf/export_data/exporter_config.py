@@ -28,11 +28,12 @@
 import argparse as args
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
-from genai_perf.metrics import Metrics
+from genai_perf.goodput_calculator import SLOAttainment
+from genai_perf.metrics import Metrics, SteadyStateWindow, Timeline
 
 
 @dataclass
@@ -44,3 +45,6 @@ class ExporterConfig:
     extra_inputs: Dict[str, Any]
     telemetry_stats: Dict[str, Any] = field(default_factory=dict)
     session_stats: Dict[str, Any] = field(default_factory=dict)
+    timeline: Optional[Timeline] = None
+    steady_state_window: Optional[SteadyStateWindow] = None
+    slo_attainment: Optional[SLOAttainment] = None
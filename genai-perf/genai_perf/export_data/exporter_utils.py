@@ -26,7 +26,9 @@
 
 import logging
 import textwrap
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from genai_perf.metrics.statistics import DEFAULT_PERCENTILES, get_percentile_label
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,52 @@ def format_metric_name(
     return metric_str
 
 
+def format_goodput_profile_name(
+    profile: str, unit: Optional[str], width: Optional[int] = None
+) -> str:
+    """
+    Formats the name of the request goodput of an SLO profile.
+
+    Args:
+        profile: The name of the SLO profile, which is kept as is.
+        unit: The unit of the goodput (e.g., 'per sec').
+        width: The maximum width of the metric name.
+
+    Returns:
+        The formatted metric name with the profile and the unit if provided.
+    """
+    metric_str = format_metric_name("request_goodput", None) + f" [{profile}]"
+    metric_str = f"{metric_str} ({unit})" if unit else metric_str
+
+    if width and len(metric_str) > width:
+        metric_str = textwrap.fill(metric_str, width=width)
+    return metric_str
+
+
+def get_stat_keys(stat_keys: List[str], percentiles: List[float]) -> List[str]:
+    """
+    Selects the statistics to export for the configured percentiles.
+
+    Args:
+        stat_keys: The statistics exported with the default percentiles.
+        percentiles: The percentiles calculated for each metric.
+
+    Returns:
+        The statistics other than percentiles, followed by the percentiles of
+        stat_keys that were calculated and the calculated percentiles outside
+        of the defaults, from the highest to the lowest.
+    """
+    labels = {get_percentile_label(p): p for p in percentiles}
+    default_labels = {get_percentile_label(p) for p in DEFAULT_PERCENTILES}
+
+    other_keys = [key for key in stat_keys if key not in default_labels]
+    selected = {key: labels[key] for key in stat_keys if key in labels}
+    selected.update(
+        {label: p for label, p in labels.items() if label not in default_labels}
+    )
+    return other_keys + sorted(selected, key=lambda key: selected[key], reverse=True)
+
+
 def format_stat_value(value: Any) -> str:
     """
     Formats a statistic value for human-readable output.
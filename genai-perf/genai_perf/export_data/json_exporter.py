@@ -33,6 +33,7 @@ from typing import Dict, Union
 import genai_perf.logging as logging
 from genai_perf.export_data import telemetry_data_exporter_util as telem_utils
 from genai_perf.export_data.exporter_config import ExporterConfig
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,8 @@ class JsonExporter:
             config.telemetry_stats
         )
         self._session_stats: Dict = config.session_stats
+        self._metrics = config.metrics
+        self._steady_state_window = config.steady_state_window
         self._config = config.config
         self._args = self._config.to_json_dict()
         self._output_dir = config.perf_analyzer_config.get_artifact_directory()
@@ -55,6 +58,9 @@ class JsonExporter:
 
         self._merge_stats_and_args()
         self._add_session_stats()
+        self._add_goodput_profiles()
+        self._add_steady_state_window()
+        self._add_sketches()
 
     def export(self) -> None:
         prefix = os.path.splitext(
@@ -73,3 +79,37 @@ class JsonExporter:
     def _add_session_stats(self) -> None:
         if self._session_stats:
             self._export_data.update({"sessions": self._session_stats})
+
+    def _add_goodput_profiles(self) -> None:
+        if self._config.input.goodput_profiles:
+            goodputs = self._metrics.request_goodputs_by_profile
+            self._export_data.update(
+                {
+                    "request_goodput_profiles": {
+                        profile: {"unit": "requests/sec", "avg": goodput[0]}
+                        for profile, goodput in goodputs.items()
+                    }
+                }
+            )
+
+    def _add_steady_state_window(self) -> None:
+        if self._steady_state_window is not None:
+            self._export_data.update(
+                {"steady_state_window": self._steady_state_window.to_dict()}
+            )
+
+    def _add_sketches(self) -> None:
+        # The sketches of the request metrics, in the units of the profile
+        # export, let process-export-files merge the profiles of several runs
+        # without their requests
+        request_metrics = {metric.name for metric in self._metrics.request_metrics}
+        sketches = {}
+        for attr, values in self._metrics.arrays.items():
+            name = self._metrics.get_base_name(attr)
+            if name not in request_metrics or name not in self._stats:
+                continue
+            if values is not None and len(values):
+                sketches[name] = QuantileSketch.from_values(values).to_dict()
+
+        if sketches:
+            self._export_data.update({"sketches": sketches})
@@ -24,14 +24,21 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Dict
+from typing import Dict, Optional
 
 from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.export_data.data_exporter_factory import DataExporterFactory
 from genai_perf.export_data.exporter_config import ExporterConfig
+from genai_perf.goodput_calculator import SLOAttainment
 from genai_perf.inputs import input_constants as ic
-from genai_perf.metrics import Metrics, Statistics, TelemetryStatistics
+from genai_perf.metrics import (
+    Metrics,
+    Statistics,
+    SteadyStateWindow,
+    TelemetryStatistics,
+    Timeline,
+)
 
 
 class OutputReporter:
@@ -46,12 +53,18 @@ class OutputReporter:
         config: ConfigCommand,
         perf_analyzer_config: PerfAnalyzerConfig,
         session_stats: Dict[str, Statistics],
+        timeline: Optional[Timeline] = None,
+        steady_state_window: Optional[SteadyStateWindow] = None,
+        slo_attainment: Optional[SLOAttainment] = None,
     ):
         self.config = config
         self.perf_analyzer_config = perf_analyzer_config
         self.stats = stats
         self.telemetry_stats = telemetry_stats
         self.session_stats = session_stats
+        self.timeline = timeline
+        self.steady_state_window = steady_state_window
+        self.slo_attainment = slo_attainment
 
         # scale the data to be in milliseconds
         self.stats.scale_data()
@@ -83,6 +96,9 @@ class OutputReporter:
             extra_inputs=self.config.input.extra,
             telemetry_stats=telemetry_stats,
             session_stats=session_stats,
+            timeline=self.timeline,
+            steady_state_window=self.steady_state_window,
+            slo_attainment=self.slo_attainment,
         )
 
         return config
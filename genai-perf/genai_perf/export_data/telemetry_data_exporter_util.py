@@ -27,9 +27,12 @@
 from typing import Dict, List
 
 from genai_perf.constants import ABBREVIATIONS
+from genai_perf.metrics.statistics import DEFAULT_PERCENTILES
 from rich.console import Console
 from rich.table import Table
 
+from .exporter_utils import get_stat_keys
+
 TELEMETRY_DYNAMIC_METRICS_HEADER = [
     "Metric",
     "GPU",
@@ -70,8 +73,12 @@ def merge_telemetry_stats_json(telemetry_stats: Dict, stats_and_args: Dict) -> N
         stats_and_args.update({"telemetry_stats": filtered_telemetry_stats})
 
 
-def export_telemetry_stats_csv(telemetry_stats: Dict, csv_writer) -> None:
-    _write_dynamic_telemetry_stats(telemetry_stats, csv_writer)
+def export_telemetry_stats_csv(
+    telemetry_stats: Dict,
+    csv_writer,
+    percentiles: List[float] = DEFAULT_PERCENTILES,
+) -> None:
+    _write_dynamic_telemetry_stats(telemetry_stats, csv_writer, percentiles)
     _write_constant_telemetry_stats(telemetry_stats, csv_writer)
 
 
@@ -141,7 +148,9 @@ def _construct_telemetry_stats_subtable(
         table.add_row(*row)
 
 
-def _write_dynamic_telemetry_stats(telemetry_stats: Dict, csv_writer) -> None:
+def _write_dynamic_telemetry_stats(
+    telemetry_stats: Dict, csv_writer, percentiles: List[float]
+) -> None:
     filtered_metrics = {
         metric_name: metric_data
         for metric_name, metric_data in telemetry_stats.items()
@@ -151,8 +160,9 @@ def _write_dynamic_telemetry_stats(telemetry_stats: Dict, csv_writer) -> None:
     if not filtered_metrics:
         return
 
+    stat_keys = get_stat_keys(TELEMETRY_DYNAMIC_METRICS_HEADER[2:], percentiles)
     csv_writer.writerow([])
-    csv_writer.writerow(TELEMETRY_DYNAMIC_METRICS_HEADER)
+    csv_writer.writerow(TELEMETRY_DYNAMIC_METRICS_HEADER[:2] + stat_keys)
 
     for metric_name, metric_data in telemetry_stats.items():
         if metric_name in TELEMETRY_CONSTANT_METRICS:
@@ -166,7 +176,7 @@ def _write_dynamic_telemetry_stats(telemetry_stats: Dict, csv_writer) -> None:
 
             row_values = [metric_str, key]
 
-            for stat in TELEMETRY_DYNAMIC_METRICS_HEADER[2:]:
+            for stat in stat_keys:
                 value = gpu_data.get(stat, 0.0)
                 row_values.append(f"{value:,.2f}")
 
@@ -0,0 +1,74 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import csv
+import json
+from typing import List
+
+import genai_perf.logging as logging
+from genai_perf.metrics import Timeline
+
+from .exporter_config import ExporterConfig
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineExporter:
+    """
+    A class to export the timeline of the profile in json and csv formats.
+    """
+
+    def __init__(self, config: ExporterConfig):
+        self._timeline = config.timeline
+        self._output_dir = config.perf_analyzer_config.get_artifact_directory()
+        self._profile_export_file = config.config.output.profile_export_file
+
+    def export(self) -> None:
+        if self._timeline is None:
+            return
+
+        prefix = (
+            self._output_dir / f"{self._profile_export_file.stem}_genai_perf_timeline"
+        )
+        filename = prefix.with_suffix(".json")
+        logger.info(f"Generating {filename}")
+        with open(filename, "w") as f:
+            f.write(json.dumps(self._timeline.to_dict(), indent=2))
+
+        filename = prefix.with_suffix(".csv")
+        logger.info(f"Generating {filename}")
+        with open(filename, mode="w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self._get_header(self._timeline))
+            writer.writerows(self._timeline.to_rows())
+
+    def _get_header(self, timeline: Timeline) -> List[str]:
+        header = []
+        for column in timeline.COLUMNS:
+            unit = timeline.get_unit(column)
+            header.append(f"{column} ({unit})" if unit else column)
+        return header
@@ -26,3 +26,4 @@
 
 from genai_perf.goodput_calculator.goodput_calculator import GoodputCalculator
 from genai_perf.goodput_calculator.llm_goodput_calculator import LLMGoodputCalculator
+from genai_perf.goodput_calculator.slo_attainment import SLOAttainment
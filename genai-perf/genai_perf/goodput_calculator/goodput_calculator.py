@@ -44,11 +44,14 @@ class GoodputCalculator(ABC):
         goodput_constraints: Dict[str, float],
         metric: Metrics,
         benchmark_duration: float,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
     ) -> None:
         self._goodput_constraints = goodput_constraints
+        self._goodput_profiles = goodput_profiles
         self._benchmark_duration = benchmark_duration
         self._metric = metric
         self._goodput_val: Optional[List[float]] = None
+        self._profile_goodput_vals: Dict[str, List[float]] = {}
         self._slo_names = {
             "request_latency": "request_latencies",
         }
@@ -59,12 +62,14 @@ class GoodputCalculator(ABC):
 
         The compute method sets the valid goodput constraints from user's
         inputs, aggregates request metric values, counts the number of good requests,
-        and calculates the final goodput.
+        and calculates the final goodput. The goodput of every SLO profile is
+        computed from the same aggregated request metric values.
         """
         self._set_valid_slos()
         self._combine_requests_metric_values()
         good_count = self._count_good_reqs()
         self._compute_goodput(good_count)
+        self._compute_profile_goodputs()
 
     @abstractmethod
     def _set_valid_slos(self) -> None:
@@ -89,10 +94,19 @@ class GoodputCalculator(ABC):
         """Compute the goodput."""
         pass
 
+    @abstractmethod
+    def _compute_profile_goodputs(self) -> None:
+        """Compute the goodput of each SLO profile."""
+        pass
+
     @property
     def goodput(self) -> Optional[List[float]]:
         return self._goodput_val
 
+    @property
+    def goodputs_by_profile(self) -> Dict[str, List[float]]:
+        return self._profile_goodput_vals
+
     def get_slo_name(self, metric_name: str) -> str:
         """Returns the plural name of a given metric."""
         if metric_name in self._slo_names:
@@ -26,19 +26,29 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, Optional, Tuple
 
 import genai_perf.logging as logging
+import numpy as np
 from genai_perf.goodput_calculator.goodput_calculator import GoodputCalculator
 from genai_perf.metrics.metrics import Metrics
 
 logger = logging.getLogger(__name__)
 
+# The time and the throughput related SLOs of a set of goodput constraints
+SLOs = Tuple[Dict[str, float], Dict[str, float]]
+
 
 class LLMGoodputCalculator(GoodputCalculator):
     """
     A subclass to calculate goodput for LLMs according to
     LLM-related goodput constraints.
+
+    A request is good when its value of every time related metric is at
+    most the SLO and its value of every throughput related metric is at
+    least the SLO. The SLOs are evaluated as boolean masks over the metric
+    arrays, which are gathered once for the constraints and all the SLO
+    profiles.
     """
 
     def __init__(
@@ -46,14 +56,14 @@ class LLMGoodputCalculator(GoodputCalculator):
         goodput_constraints: Dict[str, float],
         metric: Metrics,
         benchmark_duration: float,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
     ) -> None:
-        super().__init__(goodput_constraints, metric, benchmark_duration)
+        super().__init__(
+            goodput_constraints, metric, benchmark_duration, goodput_profiles
+        )
 
         self._set_valid_metric_names()
 
-        self._has_time_target = False
-        self._has_throughput_target = False
-
         self._add_slo_mapping()
 
     def _set_valid_metric_names(self) -> None:
@@ -78,104 +88,89 @@ class LLMGoodputCalculator(GoodputCalculator):
         self._slo_names["image_latency"] = "image_latencies"
 
     def _set_valid_slos(self) -> None:
+        self._valid_slos = self._split_slos(self._goodput_constraints)
+        if self._valid_slos is None:
+            self._goodput_val = self.INVALID_GOODPUT
+
+        self._valid_profile_slos = {
+            profile: self._split_slos(constraints, profile)
+            for profile, constraints in self._goodput_profiles.items()
+        }
+
+    def _split_slos(
+        self, constraints: Dict[str, float], profile: Optional[str] = None
+    ) -> Optional[SLOs]:
+        """Split the constraints into the time and the throughput related SLOs,
+        or return None when some of them are invalid."""
         invalid_slos = []
-        self._valid_time_related_slos = {}
-        self._valid_throughput_related_slos = {}
-        for slo_name, slo_value in self._goodput_constraints.items():
+        time_related_slos = {}
+        throughput_related_slos = {}
+        for slo_name, slo_value in constraints.items():
             if slo_name in self._valid_time_related_names:
-                self._valid_time_related_slos[slo_name] = (
-                    slo_value * self.MS_TO_NS_CONVERSION
-                )
-                self._has_time_target = True
+                time_related_slos[slo_name] = slo_value * self.MS_TO_NS_CONVERSION
             elif slo_name in self._valid_throughput_related_names:
-                self._valid_throughput_related_slos[slo_name] = slo_value
-                self._has_throughput_target = True
+                throughput_related_slos[slo_name] = slo_value
             else:
                 invalid_slos.append(slo_name)
 
         if invalid_slos:
             valid_slos_list = ", ".join(self._valid_metric_names)
+            location = f" in the '{profile}' goodput profile" if profile else ""
             logger.info(
-                f"Invalid Service Level Objectives found: {', '.join(invalid_slos)}. "
+                f"Invalid Service Level Objectives found{location}: "
+                f"{', '.join(invalid_slos)}. "
                 f"Valid Service Level Objectives are: {valid_slos_list}."
             )
-            self._goodput_val = self.INVALID_GOODPUT
+            return None
+        return time_related_slos, throughput_related_slos
 
     def _combine_requests_metric_values(self) -> None:
-        if self.goodput == self.INVALID_GOODPUT:
-            return
-
-        if self._has_time_target:
-            time_names = [
-                self.get_slo_name(key) for key in self._valid_time_related_slos
-            ]
-            requests_time_metric_values = [
-                self._metric.data[name] for name in time_names
-            ]
-
-            self._combined_requests_time_metric_values = list(
-                zip(*requests_time_metric_values)
-            )
-
-        if self._has_throughput_target:
-            throughput_names = [
-                self.get_slo_name(key) for key in self._valid_throughput_related_slos
-            ]
-            requests_throughput_metric_values = [
-                self._metric.data[name] for name in throughput_names
-            ]
-
-            self._combined_requests_throughput_metric_values = list(
-                zip(*requests_throughput_metric_values)
-            )
+        slo_names = set()
+        for slos in [self._valid_slos, *self._valid_profile_slos.values()]:
+            if slos is not None:
+                time_related_slos, throughput_related_slos = slos
+                slo_names.update(time_related_slos, throughput_related_slos)
+
+        # One value per request, NaN when the request has none
+        aligned_arrays = self._metric.get_request_aligned_arrays(
+            [self.get_slo_name(slo_name) for slo_name in slo_names]
+        )
+        self._requests_metric_values = {
+            slo_name: aligned_arrays[self.get_slo_name(slo_name)]
+            for slo_name in slo_names
+        }
 
     def _count_good_reqs(self) -> Optional[int]:
-        if self.goodput == self.INVALID_GOODPUT:
+        if not self._goodput_constraints or self._valid_slos is None:
             return None
-        target_time_metric_values = []
-        target_throughput_metric_values = []
-        if self._has_time_target:
-            num_of_requests = len(self._combined_requests_time_metric_values)
-            target_time_metric_values = list(self._valid_time_related_slos.values())
-        if self._has_throughput_target:
-            num_of_requests = len(self._combined_requests_throughput_metric_values)
-            target_throughput_metric_values = list(
-                self._valid_throughput_related_slos.values()
-            )
+        return self._count_requests_meeting(self._valid_slos)
+
+    def _count_requests_meeting(self, slos: SLOs) -> int:
+        time_related_slos, throughput_related_slos = slos
+        values = self._requests_metric_values
+
+        # A request without a value of a metric (NaN) does not meet its SLO
+        num_of_requests = len(next(iter(values.values())))
+        is_good_request = np.ones(num_of_requests, dtype=bool)
+        for slo_name, slo in time_related_slos.items():
+            is_good_request &= values[slo_name] <= slo
+        for slo_name, slo in throughput_related_slos.items():
+            is_good_request &= values[slo_name] >= slo
 
-        good_req_count = 0
-        for idx in range(num_of_requests):
-            is_good_request = True
-            request_time_metric_values: List[float] = []
-            request_throughput_metric_values: List[float] = []
-            if self._has_time_target:
-                request_time_metric_values = list(
-                    self._combined_requests_time_metric_values[idx]
-                )
-            if self._has_throughput_target:
-                request_throughput_metric_values = list(
-                    self._combined_requests_throughput_metric_values[idx]
-                )
-
-            for val, slo in zip(request_time_metric_values, target_time_metric_values):
-                if val > slo:
-                    is_good_request = False
-                    break
-            if is_good_request:
-                for val, slo in zip(
-                    request_throughput_metric_values, target_throughput_metric_values
-                ):
-                    if val < slo:
-                        is_good_request = False
-                        break
-
-            if is_good_request:
-                good_req_count += 1
-
-        return good_req_count
+        return int(np.count_nonzero(is_good_request))
 
     def _compute_goodput(self, good_count) -> None:
-        if self.goodput == self.INVALID_GOODPUT:
+        if good_count is None:
             return
         else:
             self._goodput_val = [good_count / self._benchmark_duration]
+
+    def _compute_profile_goodputs(self) -> None:
+        for profile, slos in self._valid_profile_slos.items():
+            if slos is None or not any(slos):
+                self._profile_goodput_vals[profile] = self.INVALID_GOODPUT
+            else:
+                good_count = self._count_requests_meeting(slos)
+                self._profile_goodput_vals[profile] = [
+                    good_count / self._benchmark_duration
+                ]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from typing import Any, Dict, List
+
+import numpy as np
+from genai_perf.metrics.metrics import Metrics
+
+MS_TO_NS_CONVERSION = 1e6
+
+
+class SLOAttainment:
+    """
+    The fraction of the requests and the goodput that meet the SLOs of one or
+    two metrics, for each combination of thresholds on a grid.
+
+    The thresholds of each metric are spread evenly between its lowest and
+    highest value. A request meets the threshold of a time related metric
+    (in milliseconds) when its value is at most the threshold, and of a
+    throughput related metric when its value is at least the threshold.
+    Like goodput, the metrics are paired by request, and a request without a
+    value of one of the metrics meets none of its thresholds.
+
+    Each request is mapped with a binary search to the thresholds of each
+    metric that it meets, so the number of requests meeting every
+    combination of thresholds is a cumulative sum of a histogram over the
+    grid, and the whole grid costs about as much as a single goodput.
+    """
+
+    MAX_SLOS = 2
+
+    def __init__(
+        self,
+        slo_names: List[str],
+        metric: Metrics,
+        benchmark_duration: float,
+        grid_size: int,
+    ) -> None:
+        if not 1 <= len(slo_names) <= self.MAX_SLOS:
+            raise ValueError("The SLO attainment takes one or two metrics.")
+        if grid_size < 2:
+            raise ValueError("The SLO attainment grid needs at least two thresholds.")
+
+        time_related = {m.name: "ms" for m in metric.request_time_metrics}
+        throughput_related = {m.name: m.unit for m in metric.request_throughput_metrics}
+        invalid_names = [
+            name
+            for name in slo_names
+            if name not in time_related and name not in throughput_related
+        ]
+        if invalid_names:
+            valid_names = ", ".join([*time_related, *throughput_related])
+            raise ValueError(
+                f"Invalid SLO attainment metrics: {', '.join(invalid_names)}. "
+                f"Valid metrics are: {valid_names}."
+            )
+
+        plural_names = {metric.get_base_name(name): name for name in metric.arrays}
+        aligned_arrays = metric.get_request_aligned_arrays(
+            [plural_names[name] for name in slo_names]
+        )
+        values = [aligned_arrays[plural_names[name]] for name in slo_names]
+        num_requests = len(values[0])
+        if num_requests == 0:
+            raise ValueError("There are no requests to compute the SLO attainment.")
+
+        self.slo_names = list(slo_names)
+        self.units = {
+            name: time_related.get(name, throughput_related.get(name, ""))
+            for name in slo_names
+        }
+        self.num_requests = num_requests
+        self.thresholds: Dict[str, np.ndarray] = {}
+
+        bins = []
+        for name, v in zip(slo_names, values):
+            if name in time_related:
+                v = v / MS_TO_NS_CONVERSION
+            has_value = ~np.isnan(v)
+            if not has_value.any():
+                raise ValueError(f"No request has a value of {name}.")
+            thresholds = np.linspace(v[has_value].min(), v[has_value].max(), grid_size)
+            self.thresholds[name] = thresholds
+
+            if name in time_related:
+                # The index of the lowest threshold that the request meets
+                request_bins = np.searchsorted(thresholds, v, side="left")
+                request_bins[~has_value] = grid_size
+            else:
+                # The number of the lowest thresholds that the request meets
+                request_bins = np.searchsorted(thresholds, v, side="right")
+                request_bins[~has_value] = 0
+            bins.append(request_bins)
+
+        shape = [grid_size + 1] * len(slo_names)
+        histogram = np.bincount(
+            np.ravel_multi_index(bins, shape), minlength=int(np.prod(shape))
+        )
+        counts = histogram.reshape(shape)
+        for axis, name in enumerate(slo_names):
+            if name in time_related:
+                # Count the requests meeting a threshold or a lower one
+                counts = np.cumsum(counts, axis=axis)
+                counts = np.take(counts, np.arange(grid_size), axis=axis)
+            else:
+                # Count the requests meeting more thresholds than its index
+                counts = np.flip(np.cumsum(np.flip(counts, axis), axis=axis), axis)
+                counts = np.take(counts, np.arange(1, grid_size + 1), axis=axis)
+
+        self.counts = counts
+        self.fractions = counts / num_requests
+        self.goodputs = counts / benchmark_duration
+
+    @property
+    def columns(self) -> List[str]:
+        return [*self.slo_names, "fraction", "goodput"]
+
+    def get_unit(self, column: str) -> str:
+        if column == "goodput":
+            return "requests/sec"
+        return self.units.get(column, "")
+
+    def to_rows(self) -> List[List[Any]]:
+        """Return a row of the thresholds, the fraction of the requests and
+        the goodput for each point of the grid."""
+        rows = []
+        for index in np.ndindex(*self.counts.shape):
+            thresholds = [
+                float(self.thresholds[name][i])
+                for name, i in zip(self.slo_names, index)
+            ]
+            rows.append(
+                [
+                    *thresholds,
+                    float(self.fractions[index]),
+                    float(self.goodputs[index]),
+                ]
+            )
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_requests": self.num_requests,
+            "slos": [
+                {
+                    "name": name,
+                    "unit": self.units[name],
+                    "thresholds": self.thresholds[name].tolist(),
+                }
+                for name in self.slo_names
+            ],
+            "fractions": self.fractions.tolist(),
+            "goodputs": self.goodputs.tolist(),
+            "goodput_unit": self.get_unit("goodput"),
+        }
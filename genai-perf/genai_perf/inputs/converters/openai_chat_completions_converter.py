@@ -124,6 +124,8 @@ class OpenAIChatCompletionsConverter(BaseConverter):
     def _add_request_params(self, payload: Dict, optional_data: Dict[Any, Any]) -> None:
         if self.config.endpoint.streaming:
             payload["stream"] = True
+            if self.config.tokenizer.use_server_token_counts:
+                payload["stream_options"] = {"include_usage": True}
         max_tokens = self._get_max_tokens(optional_data)
         if max_tokens != OutputTokenDefaults.MEAN:
             payload["max_tokens"] = max_tokens
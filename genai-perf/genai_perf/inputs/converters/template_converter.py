@@ -27,7 +27,6 @@
 import os
 from typing import Any, Dict, cast
 
-import jinja2
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.inputs.converters.base_converter import BaseConverter
 from genai_perf.inputs.retrievers.generic_dataset import GenericDataset
@@ -50,6 +49,7 @@ class TemplateConverter(BaseConverter):
     """
 
     def resolve_template(self, template_name_or_content: str):
+        import jinja2
 
         if template_name_or_content in NAMED_TEMPLATES:
             environment = jinja2.Environment(
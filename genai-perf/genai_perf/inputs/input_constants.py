@@ -33,6 +33,7 @@ class Subcommand(Enum):
     ANALYZE = "analyze"
     TEMPLATE = "create-template"
     PROCESS = "process-export-files"
+    TOKENIZE_CORPUS = "tokenize-corpus"
 
 
 class ModelSelectionStrategy(Enum):
@@ -40,6 +41,16 @@ class ModelSelectionStrategy(Enum):
     RANDOM = "RANDOM"
 
 
+class OutputTokenAccounting(Enum):
+    PREFIX = "PREFIX"
+    OFFSETS = "OFFSETS"
+
+
+class TokenizerBackend(Enum):
+    TRANSFORMERS = "TRANSFORMERS"
+    TOKENIZERS = "TOKENIZERS"
+
+
 class PromptSource(Enum):
     SYNTHETIC = "SYNTHETIC"
     FILE = "FILE"
@@ -27,6 +27,10 @@ from genai_perf.inputs.input_constants import (
 )
 from genai_perf.inputs.inputs_config import InputsConfig
 from genai_perf.inputs.retrievers.input_retriever_factory import InputRetrieverFactory
+from genai_perf.inputs.retrievers.synthetic_prompt_generator import (
+    SyntheticPromptGenerator,
+)
+from genai_perf.tokenized_corpus_cache import get_tokenized_corpus_cache
 
 
 class Inputs:
@@ -46,6 +50,12 @@ class Inputs:
         self.converter.check_config()
 
         random.seed(self.config.input.random_seed)
+        SyntheticPromptGenerator.set_corpus_cache(
+            get_tokenized_corpus_cache(self.config)
+        )
+        SyntheticPromptGenerator.set_corpus_file(
+            self.config.input.synthetic_tokens.corpus
+        )
 
     def create_inputs(self) -> None:
         """
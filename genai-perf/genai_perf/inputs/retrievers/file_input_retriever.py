@@ -44,7 +44,6 @@ from genai_perf.inputs.retrievers.synthetic_prompt_generator import (
     SyntheticPromptGenerator,
 )
 from genai_perf.utils import load_json_str
-from PIL import Image
 
 
 class FileInputRetriever(BaseFileInputRetriever):
@@ -188,6 +187,9 @@ class FileInputRetriever(BaseFileInputRetriever):
         str
             The base64-encoded image string.
         """
+        # Lazy import for vision related endpoints
+        from PIL import Image
+
         try:
             img = Image.open(filename)
         except FileNotFoundError:
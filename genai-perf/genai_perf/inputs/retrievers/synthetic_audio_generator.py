@@ -30,7 +30,6 @@ from enum import Enum, auto
 from typing import List
 
 import numpy as np
-import soundfile as sf
 from genai_perf.config.input.config_input import ConfigAudio
 from genai_perf.inputs.input_constants import AudioFormat
 
@@ -180,7 +179,9 @@ class SyntheticAudioGenerator:
         numpy_type, _ = SUPPORTED_BIT_DEPTHS[bit_depth]
         audio_data = (audio_data * max_val).astype(numpy_type)
 
-        # Write audio using soundfile
+        # Write audio using soundfile, imported lazily for audio inputs only
+        import soundfile as sf
+
         output_buffer = io.BytesIO()
 
         # Select appropriate subtype based on format
@@ -27,6 +27,7 @@
 import uuid
 from typing import List
 
+import numpy as np
 from genai_perf.inputs.input_constants import DEFAULT_SYNTHETIC_FILENAME
 from genai_perf.inputs.inputs_config import InputsConfig
 from genai_perf.inputs.retrievers import (
@@ -52,6 +53,7 @@ class SyntheticDataRetriever(BaseInputRetriever):
             and self.config.input.image.height.mean > 0
         )
         self._include_audio: bool = self.config.input.audio.length.mean > 0
+        self._rng = np.random.default_rng(self.config.input.random_seed)
 
     def retrieve_data(self) -> GenericDataset:
         files = self.config.input.synthetic_files or [DEFAULT_SYNTHETIC_FILENAME]
@@ -81,6 +83,7 @@ class SyntheticDataRetriever(BaseInputRetriever):
 
     def _generate_multi_turn_sessions(self, use_prefix_prompts: bool) -> List[DataRow]:
         data_rows = []
+        is_first_turns = []
 
         for _ in range(self.config.input.sessions.num):
             num_turns = sample_bounded_normal_int(
@@ -92,9 +95,7 @@ class SyntheticDataRetriever(BaseInputRetriever):
 
             session_delay = 0
             for turn_idx in range(num_turns):
-                is_first_turn = turn_idx == 0
                 row = self._create_data_row(session_id)
-                row.texts = self._generate_prompts(use_prefix_prompts and is_first_turn)
 
                 if turn_idx < num_turns - 1:
                     session_delay = sample_bounded_normal_int(
@@ -105,7 +106,13 @@ class SyntheticDataRetriever(BaseInputRetriever):
                     row.payload_metadata["delay"] = session_delay
 
                 data_rows.append(row)
+                is_first_turns.append(turn_idx == 0)
 
+        # Only the first turn of each session gets a prefix prompt
+        self._add_prompts(
+            data_rows,
+            [use_prefix_prompts and is_first_turn for is_first_turn in is_first_turns],
+        )
         return data_rows
 
     def _generate_stateless_entries(self, use_prefix_prompts: bool) -> List[DataRow]:
@@ -113,11 +120,11 @@ class SyntheticDataRetriever(BaseInputRetriever):
 
         for _ in range(self.config.input.num_dataset_entries):
             row = self._create_data_row()
-            row.texts = self._generate_prompts(use_prefix_prompts)
             row.images = self._generate_images()
             row.audios = self._generate_audios()
             data_rows.append(row)
 
+        self._add_prompts(data_rows, [use_prefix_prompts] * len(data_rows))
         return data_rows
 
     def _create_data_row(self, session_id: str = "") -> DataRow:
@@ -127,20 +134,31 @@ class SyntheticDataRetriever(BaseInputRetriever):
             row.payload_metadata["session_id"] = session_id
         return row
 
-    def _generate_prompts(self, use_prefix_prompts: bool) -> List[str]:
-        prompts = []
-        for _ in range(self.config.input.batch_size):
-            prompt = SyntheticPromptGenerator.create_synthetic_prompt(
-                self.tokenizer,
-                self.config.input.synthetic_tokens.mean,
-                self.config.input.synthetic_tokens.stddev,
-            )
-            if use_prefix_prompts:
-                prefix_prompt = SyntheticPromptGenerator.get_random_prefix_prompt()
-                prompt = f"{prefix_prompt} {prompt}"
-
-            prompts.append(prompt)
-        return prompts
+    def _add_prompts(
+        self, data_rows: List[DataRow], use_prefix_prompts: List[bool]
+    ) -> None:
+        """
+        Generate the prompts of all the rows in one batch, and add a prefix
+        prompt to the prompts of the rows that use one.
+        """
+        batch_size = self.config.input.batch_size
+        prompts = SyntheticPromptGenerator.create_synthetic_prompts(
+            self.tokenizer,
+            len(data_rows) * batch_size,
+            self.config.input.synthetic_tokens.mean,
+            self.config.input.synthetic_tokens.stddev,
+            rng=self._rng,
+            batch_size=self.config.tokenizer.batch_size,
+        )
+        for index, (row, use_prefix_prompt) in enumerate(
+            zip(data_rows, use_prefix_prompts)
+        ):
+            row.texts = prompts[index * batch_size : (index + 1) * batch_size]
+            if use_prefix_prompt:
+                row.texts = [
+                    f"{SyntheticPromptGenerator.get_random_prefix_prompt()} {prompt}"
+                    for prompt in row.texts
+                ]
 
     def _generate_images(self) -> List[str]:
         """
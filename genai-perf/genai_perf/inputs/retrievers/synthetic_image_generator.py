@@ -32,7 +32,6 @@ from typing import Optional
 
 from genai_perf import utils
 from genai_perf.inputs.input_constants import ImageFormat
-from PIL import Image
 
 
 class SyntheticImageGenerator:
@@ -68,6 +67,9 @@ class SyntheticImageGenerator:
     @classmethod
     def _sample_source_image(cls):
         """Sample one image among the source images."""
+        # Lazy import for vision related endpoints
+        from PIL import Image
+
         filepath = Path(__file__).parent.resolve() / "source_images" / "*"
         filenames = glob.glob(str(filepath))
         return Image.open(random.choice(filenames))
@@ -12,23 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import pathlib
 import random
-from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+import numpy as np
+from genai_perf.config.input.config_defaults import TokenizerDefaults
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.inputs.input_constants import DEFAULT_CORPUS_FILE
 from genai_perf.logging import logging
+from genai_perf.tokenized_corpus_cache import (
+    TokenizedCorpusCache,
+    load_tokenized_corpus,
+    tokenize_corpus,
+)
 from genai_perf.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
 
 
 class SyntheticPromptGenerator:
-    _tokenized_corpus = None
+    _tokenized_corpus: Optional[np.ndarray] = None
     _corpus_length = 0
+    _corpus_file: Optional[pathlib.Path] = None
+    _corpus_cache: Optional[TokenizedCorpusCache] = None
     _prefix_prompts: List[str] = []
     logger = logging.getLogger(__name__)
     _cache: Dict[int, List[int]] = {}
@@ -68,39 +75,155 @@ class SyntheticPromptGenerator:
         return cls._generate_prompt(tokenizer, num_prompt_tokens)
 
     @classmethod
-    def _initialize_corpus(
-        cls, tokenizer: Tokenizer, corpus_file: str = DEFAULT_CORPUS_FILE
-    ) -> None:
+    def create_synthetic_prompts(
+        cls,
+        tokenizer: Tokenizer,
+        num_prompts: int,
+        prompt_tokens_mean: int = 550,
+        prompt_tokens_stddev: int = 250,
+        rng: Optional[np.random.Generator] = None,
+        batch_size: int = TokenizerDefaults.BATCH_SIZE,
+    ) -> List[str]:
         """
-        Load and tokenize the corpus once, storing it for reuse.
+        Generate a batch of synthetic prompts.
+
+        The lengths and start offsets of all the prompts are sampled at once,
+        and the prompts are decoded batch_size at a time.
 
         Args:
-            tokenizer: Tokenizer for tokenizing the corpus.
+            tokenizer: Tokenizer instance.
+            num_prompts: Number of prompts to generate.
+            prompt_tokens_mean: Mean number of tokens in the prompts.
+            prompt_tokens_stddev: Standard deviation for the number of tokens in the prompts.
+            rng: The random generator to sample the prompts with. Defaults to
+                one seeded from the random module.
+            batch_size: Number of prompts decoded together.
+
+        Returns:
+            The synthetic prompts as strings.
+        """
+        if cls._tokenized_corpus is None:
+            cls._initialize_corpus(tokenizer)
+        if not cls._corpus_length:
+            raise ValueError("Tokenized corpus is not initialized.")
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+
+        lengths = rng.normal(prompt_tokens_mean, prompt_tokens_stddev, num_prompts)
+        lengths = np.maximum(lengths, 0).astype(np.int64)
+        if num_prompts and lengths.max() > cls._corpus_length:
+            logger.warning(
+                f"Requested prompt length {lengths.max()} is longer than the corpus. "
+                f"Returning prompts of at most length {cls._corpus_length}."
+            )
+            lengths = np.minimum(lengths, cls._corpus_length)
+        starts = rng.integers(cls._corpus_length, size=num_prompts)
+
+        prompts: List[str] = []
+        for i in range(0, num_prompts, batch_size):
+            prompts += tokenizer.batch_decode(
+                cls._gather_prompt_tokens(
+                    starts[i : i + batch_size], lengths[i : i + batch_size]
+                )
+            )
+        return prompts
+
+    @classmethod
+    def _gather_prompt_tokens(
+        cls, starts: np.ndarray, lengths: np.ndarray
+    ) -> List[List[int]]:
+        """
+        Return the tokens of the prompts of the given lengths starting at the
+        given offsets of the corpus, wrapping around its end.
+
+        Raises:
+            ValueError: If the tokenized corpus is not initialized
         """
-        corpus_path = pathlib.Path(__file__).parent / corpus_file
+        if cls._tokenized_corpus is None or not cls._corpus_length:
+            raise ValueError("Tokenized corpus is not initialized.")
 
-        with open(corpus_path, "r") as f:
-            lines = f.readlines()
+        ends = np.cumsum(lengths)
+        total = int(ends[-1]) if len(ends) else 0
+        positions = np.arange(total) - np.repeat(ends - lengths, lengths)
+        indices = (np.repeat(starts, lengths) + positions) % cls._corpus_length
+        tokens = cls._tokenized_corpus[indices].tolist()
 
-        def tokenize_chunk(chunk):
-            cleaned_text = " ".join(line.strip() for line in chunk if line.strip())
-            tokens = tokenizer.encode(cleaned_text)
-            return tokens
+        bounds = [0] + ends.tolist()
+        return [tokens[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
 
-        num_threads = os.cpu_count()
-        if num_threads is None:
-            num_threads = 4
-        chunk_size = len(lines) // num_threads
-        chunks = [lines[i : i + chunk_size] for i in range(0, len(lines), chunk_size)]
+    @classmethod
+    def set_corpus_cache(cls, corpus_cache: Optional[TokenizedCorpusCache]) -> None:
+        """
+        Set the persistent cache of the tokenized corpus, if any.
 
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            tokenized_chunks = list(executor.map(tokenize_chunk, chunks))
+        Args:
+            corpus_cache: The cache the tokenized corpus is loaded from, or
+                saved to once tokenized.
+        """
+        cls._corpus_cache = corpus_cache
 
-        cls._tokenized_corpus = [token for chunk in tokenized_chunks for token in chunk]
-        cls._corpus_length = len(cls._tokenized_corpus)
+    @classmethod
+    def set_corpus_file(cls, corpus_file: Optional[pathlib.Path]) -> None:
+        """
+        Set the corpus the prompts are sampled from, if not the default one.
+
+        Args:
+            corpus_file: A text file, or a .npy file of the int32 tokens of
+                a corpus written by the tokenize-corpus subcommand.
+        """
+        if corpus_file != cls._corpus_file:
+            cls._corpus_file = corpus_file
+            cls._tokenized_corpus = None
+            cls._corpus_length = 0
+            cls._cache = {}
 
     @classmethod
-    def _generate_prompt_tokens(cls, num_tokens: int) -> List[int]:
+    def _initialize_corpus(
+        cls, tokenizer: Tokenizer, corpus_file: Optional[str] = None
+    ) -> None:
+        """
+        Load and tokenize the corpus once, storing it for reuse.
+
+        A text corpus is read and tokenized in batches. A .npy corpus
+        already holds the tokens, which are memory-mapped instead. When a corpus cache is set, the tokens of a text corpus are
+        memory-mapped from the cache if the corpus was already tokenized by
+        the same tokenizer, and saved to the cache otherwise.
+
+        Args:
+            tokenizer: Tokenizer for tokenizing the corpus.
+            corpus_file: The corpus to use instead of the one set with
+                set_corpus_file or the default one.
+        """
+        if corpus_file is not None:
+            corpus_path = pathlib.Path(__file__).parent / corpus_file
+        elif cls._corpus_file is not None:
+            corpus_path = pathlib.Path(cls._corpus_file)
+        else:
+            corpus_path = pathlib.Path(__file__).parent / DEFAULT_CORPUS_FILE
+
+        tokenized_corpus = None
+        if corpus_path.suffix == ".npy":
+            tokenized_corpus = load_tokenized_corpus(
+                corpus_path, tokenizer.get_identifier()
+            )
+        elif cls._corpus_cache is not None:
+            tokenized_corpus = cls._corpus_cache.load(
+                corpus_path, tokenizer.get_identifier()
+            )
+        if tokenized_corpus is None:
+            tokenized_corpus = tokenize_corpus(tokenizer, corpus_path)
+            if not len(tokenized_corpus):
+                raise GenAIPerfException(f"The corpus {corpus_path} has no tokens.")
+            if cls._corpus_cache is not None:
+                tokenized_corpus = cls._corpus_cache.save(
+                    corpus_path, tokenizer.get_identifier(), tokenized_corpus
+                )
+
+        cls._tokenized_corpus = tokenized_corpus
+        cls._corpus_length = len(tokenized_corpus)
+
+    @classmethod
+    def _generate_prompt_tokens(cls, num_tokens: int) -> np.ndarray:
         """
         Generate a prompt containing exactly `num_tokens` using the preloaded tokenized corpus.
 
@@ -108,12 +231,13 @@ class SyntheticPromptGenerator:
             num_tokens: Number of tokens required in the prompt.
 
         Returns:
-            A synthetic prompt of tokens.
+            A synthetic prompt of tokens, as a view of the corpus unless it
+            wraps around the end of the corpus.
 
         Raises:
             ValueError: If the tokenized corpus is not initialized
         """
-        if not cls._tokenized_corpus:
+        if cls._tokenized_corpus is None or not cls._corpus_length:
             raise ValueError("Tokenized corpus is not initialized.")
         if num_tokens > cls._corpus_length:
             logger.warning(
@@ -126,7 +250,9 @@ class SyntheticPromptGenerator:
         end_idx = start_idx + num_tokens
         prompt_tokens = cls._tokenized_corpus[start_idx:end_idx]
         if end_idx > cls._corpus_length:
-            prompt_tokens += cls._tokenized_corpus[: end_idx - cls._corpus_length]
+            prompt_tokens = np.concatenate(
+                (prompt_tokens, cls._tokenized_corpus[: end_idx - cls._corpus_length])
+            )
 
         return prompt_tokens
 
@@ -146,7 +272,7 @@ class SyntheticPromptGenerator:
             ValueError: If the tokenized corpus is not initialized
         """
 
-        return tokenizer.decode(cls._generate_prompt_tokens(num_tokens))
+        return tokenizer.decode(cls._generate_prompt_tokens(num_tokens).tolist())
 
     @classmethod
     def _generate_prompt_with_token_reuse(
@@ -191,7 +317,7 @@ class SyntheticPromptGenerator:
                 # To ensure that the prompt doesn't merge chunks, we pop the last token
                 # and insert the bos token at the beginning. Length is maintained and
                 # the prompt generates the expected number of tokens.
-                prompt_tokens = cls._generate_prompt_tokens(size_to_use)
+                prompt_tokens = cls._generate_prompt_tokens(size_to_use).tolist()
                 prompt_tokens.pop(0)
                 prompt_tokens.insert(0, tokenizer.bos_token_id())
                 cls._cache[hash_index] = prompt_tokens
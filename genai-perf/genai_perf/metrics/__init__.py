@@ -25,8 +25,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from genai_perf.metrics.image_retrieval_metrics import ImageRetrievalMetrics
-from genai_perf.metrics.llm_metrics import LLMMetrics
-from genai_perf.metrics.metrics import MetricMetadata, Metrics
+from genai_perf.metrics.llm_metrics import LLMMetrics, RaggedArray
+from genai_perf.metrics.metrics import MetricColumn, MetricMetadata, Metrics
 from genai_perf.metrics.statistics import Statistics
+from genai_perf.metrics.steady_state import SteadyStateWindow, find_steady_state_window
 from genai_perf.metrics.telemetry_metrics import TelemetryMetrics
 from genai_perf.metrics.telemetry_statistics import TelemetryStatistics
+from genai_perf.metrics.timeline import Timeline
@@ -28,7 +28,8 @@
 
 from typing import List, Union
 
-from genai_perf.metrics.metrics import MetricMetadata, Metrics
+import numpy as np
+from genai_perf.metrics.metrics import MetricColumn, MetricMetadata, Metrics
 
 
 class ImageRetrievalMetrics(Metrics):
@@ -46,6 +47,9 @@ class ImageRetrievalMetrics(Metrics):
         IMAGE_RETRIEVAL_REQUEST_THOUGHPUT_METRICS + IMAGE_RETRIEVAL_REQUEST_TIME_METRICS
     )
 
+    image_throughputs = MetricColumn(np.float64)
+    image_latencies = MetricColumn(np.float64)
+
     def __init__(
         self,
         request_throughputs: List[float] = [],
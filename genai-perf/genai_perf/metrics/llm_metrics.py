@@ -26,9 +26,53 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Sequence, Union
 
-from genai_perf.metrics.metrics import MetricMetadata, Metrics
+import numpy as np
+from genai_perf.metrics.metrics import MetricColumn, MetricMetadata, Metrics
+
+
+class RaggedArray:
+    """A list of variable length integer sequences stored as a flat array of
+    values and an array of offsets, where row i is
+    values[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, values: Sequence[int], offsets: Sequence[int]) -> None:
+        self.values = np.asarray(values, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+    @classmethod
+    def from_lists(cls, rows: Sequence[Sequence[int]]) -> "RaggedArray":
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(row) for row in rows])
+        values = [value for row in rows for value in row]
+        return cls(values, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self)
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for start, end in zip(self.offsets[:-1], self.offsets[1:]):
+            yield self.values[start:end]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RaggedArray):
+            return np.array_equal(self.values, other.values) and np.array_equal(
+                self.offsets, other.offsets
+            )
+        return NotImplemented
+
+    def lengths(self) -> np.ndarray:
+        """Returns the length of each row."""
+        return np.diff(self.offsets)
+
+    def to_lists(self) -> List[List[int]]:
+        return [row.tolist() for row in self]
 
 
 class LLMMetrics(Metrics):
@@ -60,6 +104,14 @@ class LLMMetrics(Metrics):
         MetricMetadata("output_token_throughput", "tokens/sec"),
     ]
 
+    time_to_first_tokens = MetricColumn(np.int64)
+    time_to_second_tokens = MetricColumn(np.int64)
+    inter_token_latencies = MetricColumn(np.int64)
+    output_token_throughputs = MetricColumn(np.float64)
+    output_token_throughputs_per_user = MetricColumn(np.float64)
+    output_sequence_lengths = MetricColumn(np.int32)
+    input_sequence_lengths = MetricColumn(np.int32)
+
     def __init__(
         self,
         request_throughputs: List[float] = [],
@@ -71,7 +123,7 @@ class LLMMetrics(Metrics):
         output_token_throughputs_per_user: List[float] = [],
         output_sequence_lengths: List[int] = [],
         input_sequence_lengths: List[int] = [],
-        chunked_inter_token_latencies: List[List[int]] = [[]],
+        chunked_inter_token_latencies: Union[List[List[int]], RaggedArray] = [[]],
         request_goodputs: Union[List[float], None] = [],
     ) -> None:
         super().__init__(request_throughputs, request_latencies, request_goodputs)
@@ -85,6 +137,10 @@ class LLMMetrics(Metrics):
 
         # Keeping chunked ITL (old) as a WAR to preserve visualization.
         # Excluded from data.
+        if not isinstance(chunked_inter_token_latencies, RaggedArray):
+            chunked_inter_token_latencies = RaggedArray.from_lists(
+                chunked_inter_token_latencies
+            )
         self._chunked_inter_token_latencies = chunked_inter_token_latencies
 
         # add base name mapping
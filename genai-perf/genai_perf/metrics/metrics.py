@@ -27,7 +27,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from dataclasses import dataclass
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
 
 
 @dataclass
@@ -36,8 +38,51 @@ class MetricMetadata:
     unit: str
 
 
+class MetricColumn:
+    """A descriptor that stores a per-request metric as a typed NumPy array.
+
+    Any sequence (list, array.array, ndarray) can be assigned to the metric.
+    Integer values are stored with the dtype of the column, while float values
+    are kept as float64 so that they are never truncated. Reading the metric
+    returns a list for backward compatibility, which is converted once and
+    cached until the metric is assigned again, so changing the list does not
+    change the metric. Use Metrics.arrays to access the underlying arrays
+    without any conversion.
+    """
+
+    def __init__(self, dtype: Any) -> None:
+        self._dtype = dtype
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        if self._name not in obj._lists:
+            array = obj._arrays[self._name]
+            obj._lists[self._name] = None if array is None else array.tolist()
+        return obj._lists[self._name]
+
+    def __set__(self, obj: Any, value: Optional[Sequence]) -> None:
+        obj._arrays[self._name] = self.to_array(value)
+        obj._lists.pop(self._name, None)
+
+    def to_array(self, value: Optional[Sequence]) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        array = np.asarray(value)
+        if array.dtype.kind in "biu" or array.size == 0:
+            array = array.astype(self._dtype, copy=False)
+        return array
+
+
 class Metrics:
-    """A base class that contains common request level metrics."""
+    """A base class that contains common request level metrics.
+
+    The per-request metrics are stored as typed NumPy arrays (see
+    MetricColumn).
+    """
 
     REQUEST_TIME_METRICS = [
         MetricMetadata("request_latency", "ms"),
@@ -54,16 +99,29 @@ class Metrics:
         MetricMetadata("request_count", "count"),
     ]
 
+    request_throughputs = MetricColumn(np.float64)
+    request_latencies = MetricColumn(np.int64)
+    request_goodputs = MetricColumn(np.float64)
+    request_count = MetricColumn(np.int64)
+
     def __init__(
         self,
         request_throughputs: List[float] = [],
         request_latencies: List[int] = [],
         request_goodputs: Union[List[float], None] = [],
     ) -> None:
+        self._arrays: Dict[str, Optional[np.ndarray]] = {}
+        # The lists returned when reading the metrics, see MetricColumn
+        self._lists: Dict[str, Optional[List]] = {}
         self.request_throughputs = request_throughputs
         self.request_latencies = request_latencies
         self.request_goodputs = request_goodputs
         self.request_count = [len(request_latencies)]
+        # The goodput of each SLO profile, keyed by the profile name
+        self.request_goodputs_by_profile: Dict[str, List[float]] = {}
+        # The index of the request of each value of the metrics that only
+        # some of the requests have
+        self._request_indices: Dict[str, np.ndarray] = {}
         self._base_names = {
             "request_throughputs": "request_throughput",
             "request_latencies": "request_latency",
@@ -73,9 +131,8 @@ class Metrics:
 
     def __repr__(self):
         attr_strs = []
-        for k, v in self.__dict__.items():
-            if not k.startswith("_"):
-                attr_strs.append(f"{k}={v}")
+        for k, v in self.data.items():
+            attr_strs.append(f"{k}={v}")
         return f"Metrics({','.join(attr_strs)})"
 
     @property
@@ -96,8 +153,58 @@ class Metrics:
 
     @property
     def data(self) -> dict:
-        """Returns all the metrics."""
-        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        """Returns all the per-request metrics as lists.
+
+        Only the metric columns are included. The other attributes, such as
+        request_goodputs_by_profile, are not per-request metrics and are read
+        from the attributes directly.
+        """
+        return {name: getattr(self, name) for name in self._arrays}
+
+    @property
+    def arrays(self) -> Dict[str, Optional[np.ndarray]]:
+        """Returns all the metrics as NumPy arrays."""
+        return dict(self._arrays)
+
+    def set_request_indices(self, metric_name: str, indices: Sequence[int]) -> None:
+        """Sets the index of the request of each value of a metric that is
+        not recorded for every request."""
+        self._request_indices[metric_name] = np.asarray(indices, dtype=np.int64)
+
+    def get_request_aligned_arrays(
+        self, metric_names: Sequence[str]
+    ) -> Dict[str, np.ndarray]:
+        """Returns the values of the per-request metrics as float arrays with
+        one entry per request, which is NaN for the requests without a value
+        of the metric.
+
+        The metrics with request indices are placed at those indices, and the
+        other metrics are aligned by position.
+        """
+        arrays = {
+            name: np.asarray(self._arrays[name], dtype=np.float64)
+            for name in metric_names
+        }
+        num_requests = len(self._arrays["request_latencies"])
+        if num_requests == 0:
+            num_requests = max(
+                [
+                    len(values)
+                    for name, values in arrays.items()
+                    if name not in self._request_indices
+                ],
+                default=0,
+            )
+
+        aligned = {}
+        for name, values in arrays.items():
+            column = np.full(num_requests, np.nan)
+            if name in self._request_indices:
+                column[self._request_indices[name]] = values
+            else:
+                column[: len(values)] = values[:num_requests]
+            aligned[name] = column
+        return aligned
 
     def get_base_name(self, metric_name: str) -> str:
         """Returns singular name of a given metric."""
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    A mergeable summary of the distribution of a metric, from which the
+    quantiles are estimated within a relative error (DDSketch).
+
+    The positive values are counted in logarithmic buckets, where bucket i
+    holds the values in (gamma^(i-1), gamma^i] with
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy), so that the
+    middle of a bucket is within relative_accuracy of any of its values. The
+    zero and negative values are counted separately as zero. The sketch also
+    keeps the exact count, sum, sum of squares, min and max of the values.
+
+    Two sketches with the same relative accuracy are merged by adding their
+    bucket counts, which gives the same sketch as the one of all their values.
+    """
+
+    DEFAULT_RELATIVE_ACCURACY = 0.01
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("The relative accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+
+        self.count = 0
+        self.sum = 0.0
+        self.sum_of_squares = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.zero_count = 0
+        # The count of bucket offset + i is at index i
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Sequence[float],
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> "QuantileSketch":
+        sketch = cls(relative_accuracy)
+        data = np.asarray(values, dtype=np.float64)
+        if data.size == 0:
+            return sketch
+
+        sketch.count = int(data.size)
+        sketch.sum = float(np.sum(data))
+        sketch.sum_of_squares = float(np.sum(data * data))
+        sketch.min = float(np.min(data))
+        sketch.max = float(np.max(data))
+
+        positive = data[data > 0]
+        sketch.zero_count = sketch.count - int(positive.size)
+        if positive.size:
+            indices = np.ceil(np.log(positive) / sketch._log_gamma).astype(np.int64)
+            sketch.offset = int(indices.min())
+            sketch.counts = np.bincount(indices - sketch.offset)
+        return sketch
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable["QuantileSketch"]) -> "QuantileSketch":
+        sketches = list(sketches)
+        if not sketches:
+            raise ValueError("There are no sketches to merge.")
+        merged = cls(sketches[0].relative_accuracy)
+        for sketch in sketches:
+            merged.merge(sketch)
+        return merged
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the values summarized by the other sketch to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                "Cannot merge sketches with different relative accuracies "
+                f"({self.relative_accuracy} and {other.relative_accuracy})."
+            )
+
+        if other.counts.size:
+            if not self.counts.size:
+                self.offset, self.counts = other.offset, other.counts.copy()
+            else:
+                offset = min(self.offset, other.offset)
+                end = max(
+                    self.offset + self.counts.size, other.offset + other.counts.size
+                )
+                counts = np.zeros(end - offset, dtype=np.int64)
+                counts[self.offset - offset :][: self.counts.size] += self.counts
+                counts[other.offset - offset :][: other.counts.size] += other.counts
+                self.offset, self.counts = offset, counts
+
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_of_squares += other.sum_of_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zero_count += other.zero_count
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count
+
+    @property
+    def std(self) -> float:
+        variance = self.sum_of_squares / self.count - self.mean**2
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def percentiles(self, percentiles: Sequence[float]) -> np.ndarray:
+        """Estimate the percentiles, between 0 and 100, of the values.
+
+        The rank of each percentile is the one of numpy's linear method, and
+        its value is the middle of the bucket holding that rank, clipped to
+        the min and max.
+        """
+        if self.count == 0:
+            raise ValueError("Cannot estimate the percentiles of an empty sketch.")
+
+        ranks = np.asarray(percentiles, dtype=np.float64) / 100 * (self.count - 1)
+        cumulative_counts = self.zero_count + np.cumsum(self.counts)
+        buckets = np.searchsorted(cumulative_counts, ranks, side="right")
+        buckets = np.minimum(buckets, max(self.counts.size - 1, 0))
+        values = 2 * self._gamma ** (self.offset + buckets) / (self._gamma + 1)
+        values = np.where(ranks < self.zero_count, 0.0, values)
+        return np.clip(values, self.min, self.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "sum_of_squares": self.sum_of_squares,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self.zero_count,
+            "offset": self.offset,
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data["relative_accuracy"])
+        sketch.count = int(data["count"])
+        sketch.sum = float(data["sum"])
+        sketch.sum_of_squares = float(data["sum_of_squares"])
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        sketch.zero_count = int(data["zero_count"])
+        sketch.offset = int(data["offset"])
+        sketch.counts = np.asarray(data["counts"], dtype=np.int64)
+        return sketch
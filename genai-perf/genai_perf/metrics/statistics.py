@@ -27,23 +27,32 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from collections import defaultdict
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.metrics.metrics import Metrics
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 from genai_perf.metrics.telemetry_metrics import TelemetryMetrics
 from genai_perf.record.record import RecordType
 from genai_perf.types import PerfRecords
 
 
+DEFAULT_PERCENTILES = [25, 50, 75, 90, 95, 99]
+
+
+def get_percentile_label(percentile: float) -> str:
+    """Return the label of a percentile statistic, such as p99 or p99.9."""
+    return f"p{percentile:g}"
+
+
 class Statistics:
     """A class that aggregates various statistics from given metrics class.
 
     The Statistics class goes through each metric in the metrics class and
     calculates several statistics such as:
       - average (arithmetic mean)
-      - percentiles (p25, p50, p75, p90, p95, p99)
+      - percentiles (p25, p50, p75, p90, p95, p99 by default)
       - minimum & maximum
       - standard deviation
     The class will store each calculated statistics as part of its attribute.
@@ -51,62 +60,110 @@ class Statistics:
     Example:
 
       >>> metrics = LLMMetrics(request_throughputs=[2, 4])
-      >>> stats = Statistics(metrics)
+      >>> stats = Statistics(metrics, percentiles=[50, 99, 99.9])
       >>> print(stats.avg_request_throughput)  # output: 3
     """
 
-    def __init__(self, metrics: Union[Metrics, TelemetryMetrics]):
+    def __init__(
+        self,
+        metrics: Union[Metrics, TelemetryMetrics],
+        percentiles: Optional[List[float]] = None,
+    ):
         # iterate through Metrics to calculate statistics and set attributes
         self._metrics = metrics
         self._stats_dict: Dict = defaultdict(dict)
-        for attr, data in metrics.data.items():
-            if self._should_skip(data, attr):
+        self._percentiles = sorted(
+            set(DEFAULT_PERCENTILES if percentiles is None else percentiles)
+        )
+        # consume the metric arrays directly instead of converting lists
+        all_data = metrics.arrays if isinstance(metrics, Metrics) else metrics.data
+        for attr, data in all_data.items():
+            if data is None:
                 continue
 
             # TelemetryMetrics does not have get_base_name method
-            if hasattr(metrics, "get_base_name"):
-                attr = metrics.get_base_name(attr)
-                self._add_units(attr)
-                self._stats_dict[attr]["avg"] = self._calculate_mean(data)
-                if not self._is_system_metric(attr):
-                    percentile_results = self._calculate_percentiles(data)
-                    for (
-                        percentile_label,
-                        percentile_value,
-                    ) in percentile_results.items():
-                        self._stats_dict[attr][percentile_label] = percentile_value
-                    min, max = self._calculate_minmax(data)
-                    self._stats_dict[attr]["min"] = min
-                    self._stats_dict[attr]["max"] = max
-                    self._stats_dict[attr]["std"] = self._calculate_std(data)
-
-    def _should_skip(self, data: List[Union[int, float]], attr: str) -> bool:
+            if not hasattr(metrics, "get_base_name"):
+                continue
+            if self._should_skip(data, attr):
+                continue
+
+            attr = metrics.get_base_name(attr)
+            self._add_units(attr)
+            data = np.asarray(data, dtype=np.float64)
+            avg = self._calculate_mean(data)
+            self._stats_dict[attr]["avg"] = avg
+            if not self._is_system_metric(attr):
+                self._stats_dict[attr].update(self._calculate_distribution(data, avg))
+
+    @classmethod
+    def from_sketches(
+        cls,
+        metrics: Metrics,
+        sketches: Dict[str, QuantileSketch],
+        percentiles: Optional[List[float]] = None,
+    ) -> "Statistics":
+        """Create the statistics of the metrics, where the statistics of the
+        request metrics are estimated from their sketches, keyed by the metric
+        name, instead of their values."""
+        statistics = cls(metrics, percentiles)
+        for attr, sketch in sketches.items():
+            if sketch.count == 0:
+                continue
+            statistics._add_units(attr)
+            statistics._stats_dict[attr]["avg"] = sketch.mean
+            values = sketch.percentiles(statistics._percentiles)
+            for percentile, value in zip(statistics._percentiles, values):
+                statistics._stats_dict[attr][get_percentile_label(percentile)] = float(
+                    value
+                )
+            statistics._stats_dict[attr]["min"] = sketch.min
+            statistics._stats_dict[attr]["max"] = sketch.max
+            statistics._stats_dict[attr]["std"] = sketch.std
+
+        # Keep the order of the metrics of the statistics of their values
+        order = [metrics.get_base_name(attr) for attr in metrics.arrays]
+        statistics._stats_dict = defaultdict(
+            dict,
+            sorted(
+                statistics._stats_dict.items(),
+                key=lambda item: (
+                    order.index(item[0]) if item[0] in order else len(order)
+                ),
+            ),
+        )
+        return statistics
+
+    def _should_skip(self, data: Union[np.ndarray, List], attr: str) -> bool:
         """Checks if some metrics should be skipped."""
         # No data points
         if len(data) == 0:
             return True
         # Skip ITL when non-streaming (all zero)
-        elif attr == "inter_token_latencies" and sum(data) == 0:
+        elif attr == "inter_token_latencies" and np.sum(data) == 0:
             return True
         return False
 
-    def _calculate_mean(self, data: List[Union[int, float]]) -> float:
+    def _calculate_mean(self, data: np.ndarray) -> float:
         avg = np.mean(data)
         return float(avg)
 
-    def _calculate_percentiles(self, data: List[Union[int, float]]) -> Dict[str, float]:
-        percentiles = [25, 50, 75, 90, 95, 99]
-        percentile_labels = [f"p{p}" for p in percentiles]
-        percentile_values = [float(np.percentile(data, p)) for p in percentiles]
-        return dict(zip(percentile_labels, percentile_values))
-
-    def _calculate_minmax(self, data: List[Union[int, float]]) -> Tuple[float, float]:
-        min, max = np.min(data), np.max(data)
-        return (float(min), float(max))
+    def _calculate_distribution(self, data: np.ndarray, avg: float) -> Dict[str, float]:
+        """Return the percentiles, min, max and standard deviation of the data.
 
-    def _calculate_std(self, data: List[Union[int, float]]) -> float:
-        std = np.std(data)
-        return float(std)
+        All the percentiles, along with the min and max as the 0th and 100th
+        percentiles, are selected by a single partition of the data, and the
+        standard deviation reuses the mean instead of computing it again.
+        """
+        values = np.percentile(data, [0, *self._percentiles, 100])
+        distribution = {
+            get_percentile_label(p): float(v)
+            for p, v in zip(self._percentiles, values[1:-1])
+        }
+        distribution["min"] = float(values[0])
+        distribution["max"] = float(values[-1])
+        deviations = data - avg
+        distribution["std"] = float(np.sqrt(np.mean(deviations * deviations)))
+        return distribution
 
     def scale_data(self, factor: float = 1 / 1e6) -> None:
         """Scale the time-based metrics by the factor."""
@@ -151,6 +208,11 @@ class Statistics:
         """Return the underlying metrics used to calculate the statistics."""
         return self._metrics
 
+    @property
+    def percentiles(self) -> List[float]:
+        """Return the percentiles calculated for each metric."""
+        return self._percentiles
+
     @property
     def stats_dict(self) -> Dict:
         return self._stats_dict
@@ -184,9 +246,7 @@ class Statistics:
                 metric_name = metric_base_name + "_" + metric_post_name
 
                 try:
-                    new_record = RecordType.get_all_record_types()[metric_name](
-                        metric_value
-                    )
+                    new_record = RecordType.get(metric_name)(metric_value)
                 except KeyError:
                     raise GenAIPerfException(
                         f"{metric_name} is not a valid Record tag."
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+# The largest number of buckets whose completions are compared to check the
+# stability of the throughput
+MAX_THROUGHPUT_BUCKETS = 20
+
+
+@dataclass
+class SteadyStateWindow:
+    """The steady state of an experiment and the requests fully inside it."""
+
+    start: int
+    end: int
+    num_requests: int
+    num_trimmed_requests: int
+
+    @property
+    def duration(self) -> float:
+        """The duration of the window in seconds."""
+        return (self.end - self.start) / 1e9
+
+    def contains(self, start: int, end: int) -> bool:
+        return self.start <= start and end <= self.end
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "num_requests": self.num_requests,
+            "num_trimmed_requests": self.num_trimmed_requests,
+        }
+
+
+def find_steady_state_window(
+    request_timestamps: Sequence[int],
+    last_response_timestamps: Sequence[int],
+    tolerance: float,
+) -> Optional[SteadyStateWindow]:
+    """
+    Find the window of an experiment in which the load is steady, without the
+    ramp-up while the requests fill the concurrency slots and the drain at the
+    end, or None if there is no such window.
+
+    The window first spans the time in which the number of in-flight requests
+    is within the tolerance of its median level, weighted by time. Its
+    edges are then trimmed to the buckets whose number of completed requests
+    is within the tolerance of the median bucket. The buckets are made large
+    enough that the random variation of their completions stays within the
+    tolerance.
+    """
+    req = np.asarray(request_timestamps, dtype=np.int64)
+    last = np.asarray(last_response_timestamps, dtype=np.int64)
+    if len(req) < 2:
+        return None
+
+    # The number of in-flight requests after each request start or end
+    times = np.concatenate((req, last))
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    in_flight = np.cumsum(
+        np.concatenate((np.ones(len(req)), -np.ones(len(last))))[order]
+    )
+
+    # The in-flight level held for at least half of the experiment
+    durations = np.diff(times)
+    levels = np.argsort(in_flight[:-1], kind="stable")
+    weights = np.cumsum(durations[levels])
+    if weights[-1] == 0:
+        return None
+    plateau = in_flight[:-1][levels][np.searchsorted(weights, weights[-1] / 2)]
+    # Runs idle for most of the time, such as sparse request rates, have no
+    # plateau to detect
+    if plateau <= 0:
+        return None
+
+    steady = np.flatnonzero(in_flight >= (1 - tolerance) * plateau)
+    # The number of in-flight requests is back to zero after the last event
+    start, end = times[steady[0]], times[min(steady[-1] + 1, len(times) - 1)]
+
+    # Trim the edges whose throughput is not stable yet
+    completed = last[(last > start) & (last <= end)]
+    num_buckets = int(len(completed) * tolerance**2 / 4)
+    num_buckets = min(max(num_buckets, 1), MAX_THROUGHPUT_BUCKETS)
+    edges = start + np.round(np.linspace(0, end - start, num_buckets + 1))
+    edges = edges.astype(np.int64)
+    counts = np.diff(np.searchsorted(np.sort(completed), edges, side="right"))
+    stable = np.flatnonzero(counts >= (1 - tolerance) * np.median(counts))
+    start, end = int(edges[stable[0]]), int(edges[stable[-1] + 1])
+
+    inside = (req >= start) & (last <= end)
+    num_inside = int(inside.sum())
+    if num_inside < 2:
+        return None
+    return SteadyStateWindow(start, end, num_inside, len(req) - num_inside)
@@ -27,8 +27,9 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List
+from typing import Any, DefaultDict, Dict, List, Optional
 
+import numpy as np
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.metrics.statistics import Statistics
 from genai_perf.metrics.telemetry_metrics import TelemetryMetrics
@@ -39,42 +40,30 @@ from genai_perf.types import GpuRecords
 class TelemetryStatistics:
     """A class that aggregates various statistics from telemetry metrics class."""
 
-    def __init__(self, metrics: TelemetryMetrics):
+    def __init__(
+        self,
+        metrics: TelemetryMetrics,
+        percentiles: Optional[List[float]] = None,
+    ):
         self._metrics = metrics
         self._stats_dict: DefaultDict[str, Any] = defaultdict(lambda: defaultdict(dict))
-        self._statistics = Statistics(metrics)
+        self._statistics = Statistics(metrics, percentiles)
 
         self._add_units()
         for attr, data in self._metrics.data.items():
             if self._should_skip(data):
                 continue
 
-            gpu_index = None
-            gpu_data = None
-
             for gpu_index, gpu_data in data.items():
-                self._stats_dict[attr][gpu_index]["avg"] = (
-                    self._statistics._calculate_mean(gpu_data)
-                )
-                if not self._is_constant_metric(attr):
-                    if gpu_data is None or gpu_index is None:
-                        continue
+                if gpu_data is None or gpu_index is None:
+                    continue
 
-                    percentile_results = self._statistics._calculate_percentiles(
-                        gpu_data
-                    )
-                    for (
-                        percentile_label,
-                        percentile_value,
-                    ) in percentile_results.items():
-                        self._stats_dict[attr][gpu_index][
-                            percentile_label
-                        ] = percentile_value
-                    min, max = self._statistics._calculate_minmax(gpu_data)
-                    self._stats_dict[attr][gpu_index]["min"] = min
-                    self._stats_dict[attr][gpu_index]["max"] = max
-                    self._stats_dict[attr][gpu_index]["std"] = (
-                        self._statistics._calculate_std(gpu_data)
+                gpu_data = np.asarray(gpu_data, dtype=np.float64)
+                avg = self._statistics._calculate_mean(gpu_data)
+                self._stats_dict[attr][gpu_index]["avg"] = avg
+                if not self._is_constant_metric(attr):
+                    self._stats_dict[attr][gpu_index].update(
+                        self._statistics._calculate_distribution(gpu_data, avg)
                     )
 
     def scale_data(self) -> None:
@@ -111,9 +100,7 @@ class TelemetryStatistics:
                     metric_name = metric_base_name + "_" + metric_post_name
 
                     try:
-                        new_record = RecordType.get_all_record_types()[metric_name](
-                            metric_value, gpu_id
-                        )
+                        new_record = RecordType.get(metric_name)(metric_value, gpu_id)
                     except KeyError:
                         raise GenAIPerfException(
                             f"{metric_name} is not a valid Record tag."
@@ -135,6 +122,11 @@ class TelemetryStatistics:
     def _is_constant_metric(self, attr: str) -> bool:
         return attr in ["gpu_power_limit", "total_gpu_memory"]
 
+    @property
+    def percentiles(self) -> List[float]:
+        """Return the percentiles calculated for each GPU metric."""
+        return self._statistics.percentiles
+
     @property
     def stats_dict(self) -> Dict[str, Any]:
         return self._stats_dict
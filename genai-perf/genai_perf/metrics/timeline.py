@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def _interval_integral(
+    starts: np.ndarray, ends: np.ndarray, rates: np.ndarray, times: np.ndarray
+) -> np.ndarray:
+    """Return, for each time t, the sum over the intervals of
+    rate * length([start, end] intersected with (-inf, t]).
+
+    Each interval contributes rate * (t - start) once it has started and
+    loses rate * (t - end) once it has ended, so the sums are computed from
+    the prefix sums of the intervals sorted by start and by end.
+    """
+
+    def ramp(points: np.ndarray) -> np.ndarray:
+        order = np.argsort(points, kind="stable")
+        points = points[order]
+        rate_sums = np.concatenate(([0.0], np.cumsum(rates[order])))
+        moment_sums = np.concatenate(([0.0], np.cumsum(rates[order] * points)))
+        count = np.searchsorted(points, times, side="right")
+        return rate_sums[count] * times - moment_sums[count]
+
+    return ramp(starts) - ramp(ends)
+
+
+class Timeline:
+    """
+    The request and token throughput, in-flight requests and rolling latency
+    percentiles of an experiment over time.
+
+    The experiment is split into buckets of bucket_size seconds. When the
+    profile export has the window boundaries of the measurements, each
+    measurement window is split separately, so that no bucket spans two
+    windows, and the last bucket of a window may be shorter. Otherwise the
+    buckets span from the first request to the last response.
+
+    The output tokens of a request are counted as one token at the first
+    response and the rest spread evenly until the last response, since the
+    parsed requests do not keep the time of every token. The latency
+    percentiles of a bucket are computed over the requests that got their
+    first (TTFT) or last (ITL) response in the rolling_window seconds up to
+    the end of the bucket.
+    """
+
+    PERCENTILES = [50, 90, 99]
+
+    COLUMNS = [
+        "window",
+        "start",
+        "end",
+        "request_throughput",
+        "output_token_throughput",
+        "in_flight_requests",
+        "time_to_first_token_p50",
+        "time_to_first_token_p90",
+        "time_to_first_token_p99",
+        "inter_token_latency_p50",
+        "inter_token_latency_p90",
+        "inter_token_latency_p99",
+    ]
+
+    UNITS = {
+        "start": "s",
+        "end": "s",
+        "request_throughput": "requests/sec",
+        "output_token_throughput": "tokens/sec",
+        "in_flight_requests": "requests",
+        "time_to_first_token": "ms",
+        "inter_token_latency": "ms",
+    }
+
+    def __init__(
+        self,
+        request_timestamps: Sequence[int],
+        first_response_timestamps: Sequence[int],
+        last_response_timestamps: Sequence[int],
+        num_responses: Sequence[int],
+        output_sequence_lengths: Sequence[int],
+        bucket_size: float,
+        rolling_window: float,
+        window_boundaries: Optional[Sequence[int]] = None,
+    ) -> None:
+        if bucket_size <= 0:
+            raise ValueError("The timeline bucket size must be positive.")
+        self.bucket_size = bucket_size
+        self.rolling_window = rolling_window
+
+        req = np.asarray(request_timestamps, dtype=np.int64)
+        first = np.asarray(first_response_timestamps, dtype=np.int64)
+        last = np.asarray(last_response_timestamps, dtype=np.int64)
+        num_responses = np.asarray(num_responses, dtype=np.int64)
+        osl = np.asarray(output_sequence_lengths, dtype=np.float64)
+
+        if window_boundaries is not None and len(window_boundaries) > 1:
+            boundaries = np.asarray(window_boundaries, dtype=np.int64)
+        elif len(req):
+            boundaries = np.array([req.min(), last.max()], dtype=np.int64)
+        else:
+            boundaries = np.zeros(0, dtype=np.int64)
+        origin = boundaries[0] if len(boundaries) else 0
+
+        # All the times are in seconds relative to the start of the timeline
+        def seconds(timestamps: np.ndarray) -> np.ndarray:
+            return (timestamps - origin) / 1e9
+
+        window, starts, ends = self._create_buckets(seconds(boundaries))
+        req_s, first_s, last_s = seconds(req), seconds(first), seconds(last)
+        widths = ends - starts
+
+        columns: Dict[str, np.ndarray] = {
+            "window": window,
+            "start": starts,
+            "end": ends,
+        }
+
+        # A request completes in the bucket of its last response
+        last_sorted = np.sort(last_s)
+        completed = np.searchsorted(last_sorted, ends, side="right")
+        completed -= np.searchsorted(last_sorted, starts, side="right")
+        columns["request_throughput"] = completed / widths
+
+        # One token at the first response, the rest spread until the last one
+        streamed = last_s > first_s
+        rest = np.where(streamed & (osl > 1), osl - 1, 0.0)
+        first_tokens = osl - rest
+        order = np.argsort(first_s, kind="stable")
+        token_sums = np.concatenate(([0.0], np.cumsum(first_tokens[order])))
+        at_first = token_sums[np.searchsorted(first_s[order], ends, side="right")]
+        at_first -= token_sums[np.searchsorted(first_s[order], starts, side="right")]
+        rates = np.divide(
+            rest, last_s - first_s, out=np.zeros_like(rest), where=streamed
+        )
+        spread = _interval_integral(first_s, last_s, rates, ends)
+        spread -= _interval_integral(first_s, last_s, rates, starts)
+        columns["output_token_throughput"] = (at_first + spread) / widths
+
+        # The average number of requests waiting for their last response
+        ones = np.ones(len(req_s))
+        in_flight = _interval_integral(req_s, last_s, ones, ends)
+        in_flight -= _interval_integral(req_s, last_s, ones, starts)
+        columns["in_flight_requests"] = in_flight / widths
+
+        ttft = (first - req) / 1e6
+        has_itl = (num_responses > 1) & (osl > 1)
+        itl = np.round((last - first)[has_itl] / (osl[has_itl] - 1)) / 1e6
+        self._add_rolling_percentiles(
+            columns, "time_to_first_token", first_s, ttft, ends
+        )
+        self._add_rolling_percentiles(
+            columns, "inter_token_latency", last_s[has_itl], itl, ends
+        )
+
+        self.columns = columns
+
+    def _create_buckets(self, boundaries: np.ndarray) -> Sequence[np.ndarray]:
+        windows: List[np.ndarray] = []
+        starts: List[np.ndarray] = []
+        ends: List[np.ndarray] = []
+        for index, (start, end) in enumerate(zip(boundaries[:-1], boundaries[1:])):
+            if end <= start:
+                continue
+            # Avoid a sliver of a last bucket from the floating point error
+            num_buckets = max(1, int(np.ceil((end - start) / self.bucket_size - 1e-9)))
+            edges = start + self.bucket_size * np.arange(num_buckets)
+            starts.append(edges)
+            ends.append(np.append(edges[1:], end))
+            windows.append(np.full(len(edges), index))
+        if not starts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)
+        return np.concatenate(windows), np.concatenate(starts), np.concatenate(ends)
+
+    def _add_rolling_percentiles(
+        self,
+        columns: Dict[str, np.ndarray],
+        metric: str,
+        times: np.ndarray,
+        values: np.ndarray,
+        ends: np.ndarray,
+    ) -> None:
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+        lows = np.searchsorted(times, ends - self.rolling_window, side="right")
+        highs = np.searchsorted(times, ends, side="right")
+
+        percentiles = np.full((len(ends), len(self.PERCENTILES)), np.nan)
+        for i, (low, high) in enumerate(zip(lows, highs)):
+            if high > low:
+                percentiles[i] = np.percentile(values[low:high], self.PERCENTILES)
+        for j, p in enumerate(self.PERCENTILES):
+            columns[f"{metric}_p{p}"] = percentiles[:, j]
+
+    def __len__(self) -> int:
+        return len(self.columns["start"])
+
+    def get_unit(self, column: str) -> str:
+        for name, unit in self.UNITS.items():
+            if column.startswith(name):
+                return unit
+        return ""
+
+    def to_rows(self) -> List[List[Any]]:
+        """Return the buckets as rows of the COLUMNS, with None for the
+        percentiles of buckets without any request."""
+        columns = [self.columns[name].tolist() for name in self.COLUMNS]
+        return [
+            [None if value != value else value for value in row]
+            for row in zip(*columns)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bucket_size": self.bucket_size,
+            "rolling_window": self.rolling_window,
+            "units": {name: self.get_unit(name) for name in self.COLUMNS[1:]},
+            "buckets": [dict(zip(self.COLUMNS, row)) for row in self.to_rows()],
+        }
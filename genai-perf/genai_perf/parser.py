@@ -25,26 +25,36 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import argparse
+import importlib
 import sys
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 import genai_perf.logging as logging
 import genai_perf.utils as utils
 from genai_perf.config.endpoint_config import endpoint_type_map
 from genai_perf.inputs import input_constants as ic
-from genai_perf.subcommand.analyze import analyze_handler
-from genai_perf.subcommand.config import config_handler
-from genai_perf.subcommand.process_export_files import process_export_files_handler
-from genai_perf.subcommand.profile import profile_handler
-from genai_perf.subcommand.template import template_handler
 
 from . import __version__
 
 logger = logging.getLogger(__name__)
 
 
+def _subcommand_handler(module_name: str, handler_name: str) -> Callable:
+    """
+    Returns a handler that imports its subcommand module when it is called,
+    so that parsing the CLI does not import the dependencies of every
+    subcommand (e.g. the plots of profile)
+    """
+
+    def handler(config, extra_args):
+        module = importlib.import_module(f"genai_perf.subcommand.{module_name}")
+        return getattr(module, handler_name)(config, extra_args)
+
+    return handler
+
+
 def _parse_goodput(values):
     constraints = {}
     try:
@@ -62,18 +72,44 @@ def _parse_goodput(values):
     return constraints
 
 
+def _parse_goodput_profiles(values):
+    profiles = {}
+    for profile, *constraints in values:
+        if not constraints:
+            raise argparse.ArgumentTypeError(
+                f"Invalid format found for goodput profile '{profile}'. "
+                f"The expected format is a profile name followed by one or "
+                f"more 'key:value' goodput constraints."
+            )
+        profiles[profile] = _parse_goodput(constraints)
+    return profiles
+
+
+def _check_goodput_constraints(constraints):
+    for target_metric, target_val in constraints.items():
+        if target_val < 0:
+            raise ValueError(
+                f"Invalid value found, {target_metric}: {target_val}. "
+                f"The goodput constraint value should be non-negative. "
+            )
+
+
 def _check_goodput_args(args):
     """
     Parse and check goodput args
     """
     if args.goodput:
         args.goodput = _parse_goodput(args.goodput)
-        for target_metric, target_val in args.goodput.items():
-            if target_val < 0:
-                raise ValueError(
-                    f"Invalid value found, {target_metric}: {target_val}. "
-                    f"The goodput constraint value should be non-negative. "
-                )
+        _check_goodput_constraints(args.goodput)
+    if args.goodput_profile:
+        args.goodput_profile = _parse_goodput_profiles(args.goodput_profile)
+        for constraints in args.goodput_profile.values():
+            _check_goodput_constraints(constraints)
+    if args.slo_attainment and len(args.slo_attainment) > 2:
+        raise ValueError(
+            "The SLO attainment takes one or two metrics, "
+            f"but {len(args.slo_attainment)} were provided."
+        )
     return args
 
 
@@ -178,6 +214,36 @@ def positive_integer(value: str) -> int:
     return int_value
 
 
+def positive_float(value: str) -> float:
+    try:
+        float_value = float(value)
+        if float_value <= 0:
+            raise argparse.ArgumentTypeError("The value must be greater than zero.")
+    except ValueError:
+        raise argparse.ArgumentTypeError("The value must be a number.")
+    return float_value
+
+
+def unit_fraction(value: str) -> float:
+    try:
+        float_value = float(value)
+        if not 0 < float_value < 1:
+            raise argparse.ArgumentTypeError("The value must be between 0 and 1.")
+    except ValueError:
+        raise argparse.ArgumentTypeError("The value must be a number.")
+    return float_value
+
+
+def percentile(value: str) -> float:
+    try:
+        float_value = float(value)
+        if not 0 < float_value < 100:
+            raise argparse.ArgumentTypeError("The value must be between 0 and 100.")
+    except ValueError:
+        raise argparse.ArgumentTypeError("The value must be a number.")
+    return float_value
+
+
 ### Parsers ###
 
 
@@ -269,6 +335,25 @@ def _add_template_args(parser):
     )
 
 
+def _add_tokenize_corpus_args(parser):
+    tokenize_corpus_group = parser.add_argument_group("Tokenize Corpus")
+
+    tokenize_corpus_group.add_argument(
+        "--corpus",
+        type=Path,
+        required=True,
+        help="The text file of the corpus to tokenize.",
+    )
+
+    tokenize_corpus_group.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="The .npy file the int32 tokens of the corpus are written to. "
+        "Defaults to the corpus file with a .npy suffix.",
+    )
+
+
 def _add_config_args(parser):
     config_group = parser.add_argument_group("Config")
 
@@ -436,6 +521,36 @@ def _add_input_args(parser):
         "Multiple key:value pairs can be provided, separated by spaces. ",
     )
 
+    input_group.add_argument(
+        "--goodput-profile",
+        action="append",
+        nargs="+",
+        metavar=("NAME", "KEY:VALUE"),
+        help="An option to provide a named set of goodput constraints, "
+        "such as 'interactive time_to_first_token:200' or "
+        "'batch request_latency:10000'. The constraints have the same format "
+        "as --goodput. You can repeat this flag for multiple profiles, which "
+        "are evaluated together and reported next to each other.",
+    )
+
+    input_group.add_argument(
+        "--slo-attainment",
+        nargs="+",
+        metavar="METRIC",
+        help="One or two metrics, such as 'time_to_first_token "
+        "inter_token_latency', to compute the fraction of requests and the "
+        "goodput that meet each threshold on a grid of thresholds. "
+        "The SLO attainment is exported in json and csv formats, and plotted "
+        "when generating plots.",
+    )
+
+    input_group.add_argument(
+        "--slo-attainment-grid-size",
+        type=positive_integer,
+        help="The number of thresholds of each SLO attainment metric, spread "
+        "evenly between the lowest and the highest value of the metric.",
+    )
+
     input_group.add_argument(
         "--header",
         "-H",
@@ -536,6 +651,15 @@ def _add_input_args(parser):
         help=f"The standard deviation of number of tokens in the generated prompts when using synthetic data.",
     )
 
+    input_group.add_argument(
+        "--synthetic-input-tokens-corpus",
+        type=Path,
+        help="The corpus the synthetic prompts are sampled from, either a text "
+        "file or a .npy file written by the tokenize-corpus subcommand. The "
+        "tokens of a .npy corpus are memory-mapped instead of tokenizing the "
+        "corpus again. The corpus bundled with GenAI-Perf is used by default.",
+    )
+
     input_group.add_argument(
         "--prefix-prompt-length",
         type=int,
@@ -577,6 +701,21 @@ def _add_output_args(parser):
         action="store_true",
         help="An option to enable the generation of plots.",
     )
+    output_group.add_argument(
+        "--plot-static-images",
+        action="store_true",
+        help="An option to export the plots as jpeg images in addition to "
+        "html. Exporting the images is much slower, so by default only the "
+        "html plots are generated.",
+    )
+    output_group.add_argument(
+        "--plot-max-points",
+        type=positive_integer,
+        help="The maximum number of points of each run drawn in the per-token "
+        "scatter plots. Above it, the points are sampled at evenly spaced "
+        "percentiles of the latencies at each token position, which keeps "
+        "the distribution and the tail latencies of every position.",
+    )
     output_group.add_argument(
         "--profile-export-file",
         type=Path,
@@ -587,6 +726,69 @@ def _add_output_args(parser):
         "export file is profile_export.json, the genai-perf file will be "
         "exported to profile_export_genai_perf.csv.",
     )
+    output_group.add_argument(
+        "--stream-profile-export",
+        action="store_true",
+        help="An option to parse the profile export file one request at a "
+        "time instead of loading the whole file in memory. This keeps the "
+        "memory usage bounded when processing very large profile exports.",
+    )
+    output_group.add_argument(
+        "--num-parse-workers",
+        type=positive_integer,
+        help="The number of worker processes used to parse the requests of "
+        "the profile export file. Each worker loads its own copy of the "
+        "tokenizer. A value of 1 parses the requests serially.",
+    )
+    output_group.add_argument(
+        "--cache-parsed-metrics",
+        action="store_true",
+        help="An option to save the per-request metrics parsed from the "
+        "profile export file in a Parquet sidecar next to it. Later runs "
+        "that parse the same export with the same tokenizer read the sidecar "
+        "instead.",
+    )
+    output_group.add_argument(
+        "--export-timeline",
+        action="store_true",
+        help="An option to export the request and output token throughput, "
+        "the in-flight requests and rolling latency percentiles of each "
+        "time bucket of the profile to <profile_export_file>_genai_perf_timeline"
+        ".json and .csv.",
+    )
+    output_group.add_argument(
+        "--timeline-bucket-size",
+        type=positive_float,
+        help="The duration of each bucket of the timeline in seconds.",
+    )
+    output_group.add_argument(
+        "--timeline-rolling-window",
+        type=positive_float,
+        help="The duration in seconds of the trailing window over which the "
+        "latency percentiles of each bucket of the timeline are computed.",
+    )
+    output_group.add_argument(
+        "--steady-state-detection",
+        action="store_true",
+        help="An option to detect the steady state of each experiment from "
+        "the in-flight requests and the throughput over time, and compute the "
+        "metrics only over the requests fully inside it. This trims the "
+        "ramp-up and the drain of the load from the metrics.",
+    )
+    output_group.add_argument(
+        "--steady-state-tolerance",
+        type=unit_fraction,
+        help="The relative variation of the in-flight requests and the "
+        "throughput allowed in the steady state, between 0 and 1.",
+    )
+    output_group.add_argument(
+        "--percentiles",
+        type=percentile,
+        nargs="+",
+        help="The percentiles of each metric to report in the outputs, such "
+        "as '50 90 99 99.9 99.99'. The percentiles other than p25, p50, p75, "
+        "p90, p95 and p99 are also shown in the console.",
+    )
 
 
 def _add_process_export_files_args(parser):
@@ -726,6 +928,66 @@ def _add_tokenizer_args(parser):
         "for repositories you trust. This is only necessary for custom "
         "tokenizers stored in HuggingFace Hub. ",
     )
+    tokenizer_group.add_argument(
+        "--tokenizer-batch-size",
+        type=positive_integer,
+        help="The number of texts tokenized together when counting the input "
+        "and output tokens of the requests in the profile export file, and the "
+        "number of synthetic prompts decoded together. Larger batches make "
+        "better use of the fast tokenizers.",
+    )
+    tokenizer_group.add_argument(
+        "--tokenizer-count-cache-dir",
+        type=Path,
+        help="The directory of a persistent cache of the token counts of the "
+        "prompts and responses. The token counts are reused across runs with "
+        "the same tokenizer name and revision. The cache is disabled by "
+        "default.",
+    )
+    tokenizer_group.add_argument(
+        "--tokenizer-count-cache-size",
+        type=positive_integer,
+        help="The maximum number of texts kept in the token count cache. The "
+        "least recently used texts are evicted first.",
+    )
+    tokenizer_group.add_argument(
+        "--tokenizer-corpus-cache-dir",
+        type=Path,
+        help="The directory of a persistent cache of the tokenized corpus of "
+        "the synthetic prompts. The corpus is tokenized once for each "
+        "tokenizer name and revision, and later runs memory-map the tokens "
+        "instead of tokenizing the corpus again. The cache is disabled by "
+        "default.",
+    )
+    tokenizer_group.add_argument(
+        "--tokenizer-output-token-accounting",
+        type=str,
+        choices=utils.get_enum_names(ic.OutputTokenAccounting),
+        help="How the output tokens of each response chunk are counted. prefix "
+        "tokenizes each chunk separately behind a fixed prefix token. offsets "
+        "tokenizes the full output of a request once and assigns each token to "
+        "the chunk that completes it, using the token offsets. offsets requires "
+        "a fast tokenizer.",
+    )
+    tokenizer_group.add_argument(
+        "--tokenizer-backend",
+        type=str,
+        choices=utils.get_enum_names(ic.TokenizerBackend),
+        help="The library that loads and runs the tokenizer. transformers "
+        "loads it with AutoTokenizer. tokenizers loads the tokenizer.json of "
+        "the tokenizer directly with the tokenizers library, which starts "
+        "faster and uses less memory. Tokenizers without a tokenizer.json or "
+        "that need --tokenizer-trust-remote-code are loaded with transformers.",
+    )
+    tokenizer_group.add_argument(
+        "--use-server-token-counts",
+        action="store_true",
+        help="Take the input and output sequence lengths from the token usage "
+        "reported by OpenAI compatible servers instead of tokenizing the "
+        "prompts and responses. The tokenizer is only loaded for the requests "
+        "whose responses do not report the usage. Streaming requests ask for "
+        "the usage with stream_options.include_usage.",
+    )
 
 
 def _parse_template_args(subparsers) -> argparse.ArgumentParser:
@@ -735,10 +997,25 @@ def _parse_template_args(subparsers) -> argparse.ArgumentParser:
     )
     _add_template_args(template)
     _add_other_args(template)
-    template.set_defaults(func=template_handler)
+    template.set_defaults(func=_subcommand_handler("template", "template_handler"))
     return template
 
 
+def _parse_tokenize_corpus_args(subparsers) -> argparse.ArgumentParser:
+    tokenize_corpus = subparsers.add_parser(
+        ic.Subcommand.TOKENIZE_CORPUS.value,
+        description="Subcommand to tokenize a corpus once into a .npy file that "
+        "is memory-mapped by --synthetic-input-tokens-corpus.",
+    )
+    _add_tokenize_corpus_args(tokenize_corpus)
+    _add_tokenizer_args(tokenize_corpus)
+    _add_other_args(tokenize_corpus)
+    tokenize_corpus.set_defaults(
+        func=_subcommand_handler("tokenize_corpus", "tokenize_corpus_handler")
+    )
+    return tokenize_corpus
+
+
 def _parse_profile_args(subparsers) -> argparse.ArgumentParser:
     profile = subparsers.add_parser(
         ic.Subcommand.PROFILE.value,
@@ -753,7 +1030,7 @@ def _parse_profile_args(subparsers) -> argparse.ArgumentParser:
     _add_profile_args(profile)
     _add_session_args(profile)
     _add_tokenizer_args(profile)
-    profile.set_defaults(func=profile_handler)
+    profile.set_defaults(func=_subcommand_handler("profile", "profile_handler"))
     return profile
 
 
@@ -773,7 +1050,7 @@ def _parse_analyze_args(subparsers) -> argparse.ArgumentParser:
     _add_session_args(analyze)
     _add_tokenizer_args(analyze)
 
-    analyze.set_defaults(func=analyze_handler)
+    analyze.set_defaults(func=_subcommand_handler("analyze", "analyze_handler"))
     return analyze
 
 
@@ -796,7 +1073,7 @@ def _parse_config_args(subparsers) -> argparse.ArgumentParser:
     _add_session_args(config)
     _add_tokenizer_args(config)
 
-    config.set_defaults(func=config_handler)
+    config.set_defaults(func=_subcommand_handler("config", "config_handler"))
     return config
 
 
@@ -808,7 +1085,9 @@ def _parse_process_export_files_args(subparsers) -> argparse.ArgumentParser:
     _add_process_export_files_args(process_export_files)
     _add_output_args(process_export_files)
     _add_other_args(process_export_files)
-    process_export_files.set_defaults(func=process_export_files_handler)
+    process_export_files.set_defaults(
+        func=_subcommand_handler("process_export_files", "process_export_files_handler")
+    )
     return process_export_files
 
 
@@ -837,6 +1116,7 @@ def init_parsers():
     _ = _parse_analyze_args(subparsers)
     _ = _parse_template_args(subparsers)
     _ = _parse_process_export_files_args(subparsers)
+    _ = _parse_tokenize_corpus_args(subparsers)
     subparsers.required = False
 
     return parser
@@ -869,6 +1149,8 @@ def refine_args(
         pass
     elif args.subcommand == ic.Subcommand.PROCESS.value:
         pass
+    elif args.subcommand == ic.Subcommand.TOKENIZE_CORPUS.value:
+        pass
     else:
         raise ValueError(f"Unknown subcommand: {args.subcommand}")
 
@@ -37,10 +37,15 @@ from plotly.graph_objects import Figure
 class BasePlot:
     """
     Base class for plots
+
+    The plots are always written as html. The static jpeg images are only
+    written when static_images is set, since exporting them starts a
+    headless browser through kaleido, which is much slower.
     """
 
-    def __init__(self, data: List[ProfileRunData]) -> None:
+    def __init__(self, data: List[ProfileRunData], static_images: bool = True) -> None:
         self._profile_data = data
+        self._static_images = static_images
 
     def create_plot(
         self,
@@ -70,6 +75,13 @@ class BasePlot:
         filepath = output_dir / f"{file}.gzip"
         df.to_parquet(filepath, compression="gzip")
 
+    def _generate_graph_files(
+        self, fig: Figure, output_dir: Path, filename_root: str
+    ) -> None:
+        self._generate_graph_file(fig, output_dir, filename_root + ".html")
+        if self._static_images:
+            self._generate_graph_file(fig, output_dir, filename_root + ".jpeg")
+
     def _generate_graph_file(self, fig: Figure, output_dir: Path, file: str) -> None:
         if file.endswith("jpeg"):
             filepath = output_dir / f"{file}"
@@ -25,21 +25,74 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Sequence, Union
 
+import numpy as np
 import plotly.graph_objects as go
 from genai_perf.plots.base_plot import BasePlot
 from genai_perf.plots.plot_config import ProfileRunData
 
 
+@dataclass
+class BoxSummary:
+    q1: float
+    median: float
+    mean: float
+    q3: float
+    lowerfence: float
+    upperfence: float
+    points: np.ndarray
+    all_points: bool
+
+
+def summarize_box(values: Sequence[Union[int, float]], max_points: int) -> BoxSummary:
+    """
+    Computes the quartiles and the whiskers of a box plot the same way as
+    plotly, with the points to draw: all of them if there are at most
+    max_points, otherwise at most max_points of the outliers, evenly spaced in
+    sorted order so that the extremes are kept.
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+
+    if len(values) <= max_points:
+        points, all_points = values, True
+    else:
+        outliers = values[(values < inside[0]) | (values > inside[-1])]
+        if len(outliers) > max_points:
+            indices = np.linspace(0, len(outliers) - 1, max_points).round()
+            outliers = outliers[np.unique(indices.astype(np.int64))]
+        points, all_points = outliers, False
+
+    return BoxSummary(
+        q1=float(q1),
+        median=float(median),
+        mean=float(values.mean()),
+        q3=float(q3),
+        lowerfence=float(inside[0]),
+        upperfence=float(inside[-1]),
+        points=points,
+        all_points=all_points,
+    )
+
+
 class BoxPlot(BasePlot):
     """
     Generate a box plot in jpeg and html format.
+
+    The quartiles and whiskers are computed before plotting, and only the
+    summary with at most MAX_POINTS points is embedded in the plot, so the
+    plot size does not grow with the number of requests.
     """
 
-    def __init__(self, data: List[ProfileRunData]) -> None:
-        super().__init__(data)
+    MAX_POINTS = 1000
+
+    def __init__(self, data: List[ProfileRunData], static_images: bool = True) -> None:
+        super().__init__(data, static_images)
 
     def create_plot(
         self,
@@ -53,7 +106,7 @@ class BoxPlot(BasePlot):
     ) -> None:
         fig = go.Figure()
         for pd in self._profile_data:
-            fig.add_trace(go.Box(y=pd.y_metric, name=pd.name))
+            fig.add_trace(self._create_box(pd))
 
         # Update layout and axis labels
         fig.update_layout(
@@ -65,7 +118,6 @@ class BoxPlot(BasePlot):
             width=width,
             height=height,
         )
-        fig.update_traces(boxpoints="all")
         fig.update_xaxes(title_text=x_label, showticklabels=False)
         fig.update_yaxes(title_text=y_label)
 
@@ -73,5 +125,22 @@ class BoxPlot(BasePlot):
         df = self._create_dataframe(x_label, y_label)
         self._generate_parquet(df, output_dir, filename_root)
 
-        self._generate_graph_file(fig, output_dir, filename_root + ".html")
-        self._generate_graph_file(fig, output_dir, filename_root + ".jpeg")
+        self._generate_graph_files(fig, output_dir, filename_root)
+
+    def _create_box(self, prd: ProfileRunData) -> go.Box:
+        if len(prd.y_metric) == 0:
+            return go.Box(y=[], name=prd.name, boxpoints="all")
+
+        summary = summarize_box(prd.y_metric, self.MAX_POINTS)
+        return go.Box(
+            x=[prd.name],
+            y=[summary.points],
+            q1=[summary.q1],
+            median=[summary.median],
+            mean=[summary.mean],
+            q3=[summary.q3],
+            lowerfence=[summary.lowerfence],
+            upperfence=[summary.upperfence],
+            name=prd.name,
+            boxpoints="all" if summary.all_points else "outliers",
+        )
@@ -26,21 +26,64 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from pathlib import Path
-from typing import List
+from typing import List, Sequence, Tuple, Union
 
+import numpy as np
 import plotly.graph_objects as go
 from genai_perf.plots.base_plot import BasePlot
 from genai_perf.plots.plot_config import ProfileRunData
 from plotly.subplots import make_subplots
 
 
+def _bin_edges(values: np.ndarray, max_bins: int) -> np.ndarray:
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > max_bins:
+        edges = np.linspace(values.min(), values.max(), max_bins + 1)
+
+    # Give the bins of integer values, such as the sequence lengths, a whole
+    # width and edges halfway between two integers, so that each bin covers
+    # the same number of integers
+    if np.all(values == np.round(values)):
+        size = max(1.0, np.ceil(edges[1] - edges[0]))
+        start = values.min() - 0.5
+        num_bins = int(np.ceil((values.max() + 0.5 - start) / size))
+        edges = start + size * np.arange(num_bins + 1)
+    return edges
+
+
+def bin_histogram2d(
+    x: Sequence[Union[int, float]],
+    y: Sequence[Union[int, float]],
+    max_bins: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the centers of the x and y bins of a 2D histogram of at most
+    about max_bins bins per axis, and the counts of the bins indexed by
+    [y bin, x bin] as expected by a plotly heat map.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_edges = _bin_edges(x, max_bins)
+    y_edges = _bin_edges(y, max_bins)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    return x_centers, y_centers, counts.T
+
+
 class HeatMap(BasePlot):
     """
     Generate a heat map in jpeg and html format.
+
+    The requests are binned before plotting, and only the counts of at most
+    about MAX_BINS bins per axis are embedded in the plot, so the plot size
+    does not grow with the number of requests.
     """
 
-    def __init__(self, data: List[ProfileRunData]) -> None:
-        super().__init__(data)
+    MAX_BINS = 100
+
+    def __init__(self, data: List[ProfileRunData], static_images: bool = True) -> None:
+        super().__init__(data, static_images)
 
     def create_plot(
         self,
@@ -69,12 +112,7 @@ class HeatMap(BasePlot):
         )
 
         for index, prd in enumerate(self._profile_data):
-            hm = go.Histogram2d(
-                x=prd.x_metric,
-                y=prd.y_metric,
-                coloraxis="coloraxis",
-                name=prd.name,
-            )
+            hm = self._create_heat_map(prd)
 
             # Calculate the location where the figure should be added in the subplot
             c_row = int(index / n_cols) + 1
@@ -96,5 +134,17 @@ class HeatMap(BasePlot):
         self._generate_parquet(df, output_dir, filename_root)
 
         # self._generate_parquet(df, filename_root)
-        self._generate_graph_file(fig, output_dir, filename_root + ".html")
-        self._generate_graph_file(fig, output_dir, filename_root + ".jpeg")
+        self._generate_graph_files(fig, output_dir, filename_root)
+
+    def _create_heat_map(self, prd: ProfileRunData) -> go.Heatmap:
+        if len(prd.x_metric) == 0 or len(prd.y_metric) == 0:
+            return go.Heatmap(z=[], coloraxis="coloraxis", name=prd.name)
+
+        x, y, counts = bin_histogram2d(prd.x_metric, prd.y_metric, self.MAX_BINS)
+        return go.Heatmap(
+            x=x,
+            y=y,
+            z=counts,
+            coloraxis="coloraxis",
+            name=prd.name,
+        )
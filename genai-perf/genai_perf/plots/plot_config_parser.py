@@ -26,9 +26,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import genai_perf.logging as logging
+import numpy as np
 
 # Skip type checking to avoid mypy error
 # Issue: https://github.com/python/mypy/issues/10632
@@ -37,17 +38,89 @@ from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.metrics import Statistics
 from genai_perf.plots.plot_config import PlotConfig, PlotType, ProfileRunData
 from genai_perf.profile_data_parser import LLMProfileDataParser
-from genai_perf.tokenizer import get_tokenizer
+from genai_perf.token_count_cache import get_token_count_cache
+from genai_perf.tokenizer import Tokenizer, get_tokenizer
 from genai_perf.utils import load_yaml, scale
 
 logger = logging.getLogger(__name__)
 
+# The percentiles of the values at each position always kept when sampling
+TAIL_PERCENTILES = np.array([90, 99, 99.9])
+
+
+def downsample_by_position(
+    positions: np.ndarray, values: np.ndarray, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns about max_points of the (position, value) pairs, keeping the
+    distribution and the tail of the values at each position.
+
+    Each position keeps a share of max_points proportional to its number of
+    values, but at least its minimum and maximum values. The kept values are
+    the ones at evenly spaced percentiles of the sorted values of the
+    position, so each one stands for an equal band of percentiles, along
+    with the ones at the TAIL_PERCENTILES.
+    """
+    if len(positions) <= max_points:
+        return positions, values
+
+    # The values sorted by position, then by value. The stable sort of the
+    # positions is a much faster radix sort when they fit in 16 bits.
+    order = np.argsort(values)
+    sort_keys = positions[order]
+    if sort_keys.min() >= 0 and sort_keys.max() <= np.iinfo(np.uint16).max:
+        sort_keys = sort_keys.astype(np.uint16)
+    order = order[np.argsort(sort_keys, kind="stable")]
+    counts = np.bincount(positions - sort_keys.min())
+    group_sizes = counts[counts > 0]
+    group_starts = np.cumsum(group_sizes) - group_sizes
+
+    quotas = group_sizes * max_points // len(positions)
+    quotas = np.clip(quotas, np.minimum(group_sizes, 2), group_sizes)
+
+    # The index of each kept point within the quota of its position
+    sample_groups = np.repeat(np.arange(len(quotas)), quotas)
+    sample_index = np.arange(quotas.sum()) - np.repeat(
+        np.cumsum(quotas) - quotas, quotas
+    )
+    sizes = group_sizes[sample_groups]
+    steps = np.maximum(quotas[sample_groups] - 1, 1)
+    ranks = np.round(sample_index * (sizes - 1) / steps).astype(np.int64)
+
+    tail_ranks = np.outer(group_sizes - 1, TAIL_PERCENTILES / 100).round()
+    kept = np.unique(
+        np.concatenate(
+            [
+                group_starts[sample_groups] + ranks,
+                (group_starts[:, None] + tail_ranks.astype(np.int64)).ravel(),
+            ]
+        )
+    )
+    kept = order[kept]
+    return positions[kept], values[kept]
+
 
 class PlotConfigParser:
-    """Parses YAML configuration file to generate PlotConfigs."""
+    """Parses YAML configuration file to generate PlotConfigs.
 
-    def __init__(self, filename: Path) -> None:
+    Each profile export path is parsed at most once, with one tokenizer
+    shared by all the paths, however many plots use it. The statistics of
+    the paths already parsed, such as the ones of the profile that was just
+    run, and its tokenizer can be given to skip parsing them again.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        statistics: Optional[Dict[Path, Statistics]] = None,
+        tokenizer: Optional[Tokenizer] = None,
+    ) -> None:
         self._filename = filename
+        self._statistics: Dict[Path, Statistics] = {
+            self._get_path_key(filepath): stats
+            for filepath, stats in (statistics or {}).items()
+        }
+        self._tokenizer = tokenizer
 
     def generate_configs(
         self,
@@ -66,11 +139,18 @@ class PlotConfigParser:
             profile_data: List[ProfileRunData] = []
             for filepath in file_config["paths"]:
                 stats = self._get_statistics(filepath, config)
+                if self._is_token_position_plot(file_config):
+                    x_metric, y_metric = self._get_token_position_metrics(
+                        stats, config.output.plot_max_points
+                    )
+                else:
+                    x_metric = self._get_metric(stats, file_config["x_metric"])
+                    y_metric = self._get_metric(stats, file_config["y_metric"])
                 profile_data.append(
                     ProfileRunData(
                         name=self._get_run_name(Path(filepath)),
-                        x_metric=self._get_metric(stats, file_config["x_metric"]),
-                        y_metric=self._get_metric(stats, file_config["y_metric"]),
+                        x_metric=x_metric,
+                        y_metric=y_metric,
                     )
                 )
 
@@ -95,8 +175,23 @@ class PlotConfigParser:
         config: ConfigCommand,
     ) -> Statistics:
         """Extract a single profile run data."""
+        key = self._get_path_key(filepath)
+        if key not in self._statistics:
+            self._statistics[key] = self._parse_statistics(Path(filepath), config)
+        return self._statistics[key]
+
+    def _parse_statistics(self, filepath: Path, config: ConfigCommand) -> Statistics:
+        if self._tokenizer is None:
+            self._tokenizer = get_tokenizer(config)
+
         data_parser = LLMProfileDataParser(
-            filename=Path(filepath), tokenizer=get_tokenizer(config)
+            filename=filepath,
+            tokenizer=self._tokenizer,
+            tokenizer_batch_size=config.tokenizer.batch_size,
+            token_count_cache=get_token_count_cache(config, self._tokenizer),
+            cache_parsed_metrics=config.output.cache_parsed_metrics,
+            output_token_accounting=config.tokenizer.output_token_accounting,
+            use_server_token_counts=config.tokenizer.use_server_token_counts,
         )
         load_info = data_parser.get_profile_load_info()
 
@@ -106,35 +201,62 @@ class PlotConfigParser:
         stats = data_parser.get_statistics(infer_mode, load_level)
         return stats
 
+    @staticmethod
+    def _get_path_key(filepath: Union[str, Path]) -> Path:
+        return Path(filepath).resolve()
+
     def _get_run_name(self, filepath: Path) -> str:
         """Construct a profile run name."""
         if filepath.parent.name:
             return filepath.parent.name + "/" + filepath.stem
         return filepath.stem
 
-    def _get_metric(self, stats: Statistics, name: str) -> List[Union[int, float]]:
+    def _get_metric(
+        self, stats: Statistics, name: str
+    ) -> Union[List[Union[int, float]], np.ndarray]:
         if not name:  # no metric
             return []
         elif name == "inter_token_latencies":
-            itls = stats.metrics.data[name]
-            return [scale(x, (1 / 1e6)) for x in itls]  # ns to ms
+            itls = stats.metrics.arrays[name]
+            return scale(itls, (1 / 1e6))  # ns to ms
         elif name == "token_positions":
             chunked_itls = getattr(stats.metrics, "_chunked_inter_token_latencies")
-            token_positions: List[Union[int, float]] = []
-            for request_itls in chunked_itls:
-                token_positions += list(range(1, len(request_itls) + 1))
-            return token_positions
+            # 1, 2, ..., n for each request with n chunk latencies
+            lengths = chunked_itls.lengths()
+            row_starts = np.repeat(chunked_itls.offsets[:-1], lengths)
+            return np.arange(1, lengths.sum() + 1) - row_starts
         elif name == "time_to_first_tokens":
-            ttfts = stats.metrics.data[name]
-            return [scale(x, (1 / 1e6)) for x in ttfts]  # ns to ms
+            ttfts = stats.metrics.arrays[name]
+            return scale(ttfts, (1 / 1e6))  # ns to ms
         elif name == "time_to_second_tokens":
-            ttsts = stats.metrics.data[name]
-            return [scale(x, (1 / 1e6)) for x in ttsts]  # ns to ms
+            ttsts = stats.metrics.arrays[name]
+            return scale(ttsts, (1 / 1e6))  # ns to ms
         elif name == "request_latencies":
-            req_latencies = stats.metrics.data[name]
-            return [scale(x, (1 / 1e6)) for x in req_latencies]  # ns to ms
+            req_latencies = stats.metrics.arrays[name]
+            return scale(req_latencies, (1 / 1e6))  # ns to ms
+
+        return stats.metrics.arrays[name]
 
-        return stats.metrics.data[name]
+    @staticmethod
+    def _is_token_position_plot(file_config: Dict) -> bool:
+        return (
+            file_config["x_metric"] == "token_positions"
+            and file_config["y_metric"] == "inter_token_latencies"
+        )
+
+    def _get_token_position_metrics(
+        self, stats: Statistics, max_points: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the position and the latency of every output token, or about
+        max_points of them sampled at each position by percentile.
+        """
+        chunked_itls = getattr(stats.metrics, "_chunked_inter_token_latencies")
+        positions = self._get_metric(stats, "token_positions")
+        positions, itls = downsample_by_position(
+            positions, chunked_itls.values, max_points
+        )
+        return positions, itls / 1e6  # ns to ms
 
     def _get_plot_type(self, plot_type: str) -> PlotType:
         """Returns the plot type as PlotType object."""
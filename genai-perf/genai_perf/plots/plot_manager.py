@@ -25,7 +25,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
 
 import genai_perf.logging as logging
 from genai_perf.plots.box_plot import BoxPlot
@@ -36,52 +38,111 @@ from genai_perf.plots.scatter_plot import ScatterPlot
 logger = logging.getLogger(__name__)
 
 
+def _init_plot_worker() -> None:
+    """
+    Starts one kaleido server in the worker process, which is reused by all the
+    static images exported by the worker instead of starting a headless
+    browser for each image.
+    """
+    import multiprocessing.util
+
+    try:
+        import kaleido
+
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError):
+        # Older kaleido versions start their own server on first use
+        return
+
+    # The pool workers exit without running the atexit handlers
+    multiprocessing.util.Finalize(
+        None,
+        kaleido.stop_sync_server,
+        kwargs={"silence_warnings": True},
+        exitpriority=0,
+    )
+
+
+def _generate_filename(title: str) -> str:
+    filename = "_".join(title.lower().split())
+    return filename
+
+
+def _generate_plot(plot_config: PlotConfig, static_images: bool) -> None:
+    if plot_config.type == PlotType.BOX:
+        bp = BoxPlot(plot_config.data, static_images)
+        bp.create_plot(
+            graph_title=plot_config.title,
+            x_label=plot_config.x_label,
+            width=plot_config.width,
+            height=plot_config.height,
+            filename_root=_generate_filename(plot_config.title),
+            output_dir=plot_config.output,
+        )
+
+    elif plot_config.type == PlotType.HEATMAP:
+        hm = HeatMap(plot_config.data, static_images)
+        hm.create_plot(
+            graph_title=plot_config.title,
+            x_label=plot_config.x_label,
+            y_label=plot_config.y_label,
+            width=plot_config.width,
+            height=plot_config.height,
+            filename_root=_generate_filename(plot_config.title),
+            output_dir=plot_config.output,
+        )
+
+    elif plot_config.type == PlotType.SCATTER:
+        sp = ScatterPlot(plot_config.data, static_images)
+        sp.create_plot(
+            graph_title=plot_config.title,
+            x_label=plot_config.x_label,
+            y_label=plot_config.y_label,
+            width=plot_config.width,
+            height=plot_config.height,
+            filename_root=_generate_filename(plot_config.title),
+            output_dir=plot_config.output,
+        )
+
+
 class PlotManager:
     """
     Manage details around plots generated
+
+    The plots are rendered in a pool of worker processes, each rendering whole
+    plots, so the output is the same as rendering them serially. The static
+    jpeg images are only exported when static_images is set.
     """
 
-    def __init__(self, plot_configs: List[PlotConfig]) -> None:
+    def __init__(
+        self,
+        plot_configs: List[PlotConfig],
+        static_images: bool = False,
+        num_workers: Optional[int] = None,
+    ) -> None:
         self._plot_configs = plot_configs
-
-    def _generate_filename(self, title: str) -> str:
-        filename = "_".join(title.lower().split())
-        return filename
+        self._static_images = static_images
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self._num_workers = max(1, min(num_workers, len(plot_configs)))
 
     def generate_plots(self) -> None:
-        for plot_config in self._plot_configs:
-            logger.info(f"Generating '{plot_config.title}' plot")
-            if plot_config.type == PlotType.BOX:
-                bp = BoxPlot(plot_config.data)
-                bp.create_plot(
-                    graph_title=plot_config.title,
-                    x_label=plot_config.x_label,
-                    width=plot_config.width,
-                    height=plot_config.height,
-                    filename_root=self._generate_filename(plot_config.title),
-                    output_dir=plot_config.output,
-                )
-
-            elif plot_config.type == PlotType.HEATMAP:
-                hm = HeatMap(plot_config.data)
-                hm.create_plot(
-                    graph_title=plot_config.title,
-                    x_label=plot_config.x_label,
-                    y_label=plot_config.y_label,
-                    width=plot_config.width,
-                    height=plot_config.height,
-                    filename_root=self._generate_filename(plot_config.title),
-                    output_dir=plot_config.output,
-                )
+        if self._num_workers == 1:
+            for plot_config in self._plot_configs:
+                logger.info(f"Generating '{plot_config.title}' plot")
+                _generate_plot(plot_config, self._static_images)
+            return
 
-            elif plot_config.type == PlotType.SCATTER:
-                sp = ScatterPlot(plot_config.data)
-                sp.create_plot(
-                    graph_title=plot_config.title,
-                    x_label=plot_config.x_label,
-                    y_label=plot_config.y_label,
-                    width=plot_config.width,
-                    height=plot_config.height,
-                    filename_root=self._generate_filename(plot_config.title),
-                    output_dir=plot_config.output,
+        with ProcessPoolExecutor(
+            max_workers=self._num_workers,
+            initializer=_init_plot_worker if self._static_images else None,
+        ) as executor:
+            futures = []
+            for plot_config in self._plot_configs:
+                logger.info(f"Generating '{plot_config.title}' plot")
+                futures.append(
+                    executor.submit(_generate_plot, plot_config, self._static_images)
                 )
+            # Raise the first error of the workers, if any
+            for future in futures:
+                future.result()
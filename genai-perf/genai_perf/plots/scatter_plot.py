@@ -38,8 +38,8 @@ class ScatterPlot(BasePlot):
     Generate a scatter plot in jpeg and html format.
     """
 
-    def __init__(self, data: List[ProfileRunData]) -> None:
-        super().__init__(data)
+    def __init__(self, data: List[ProfileRunData], static_images: bool = True) -> None:
+        super().__init__(data, static_images)
 
     def create_plot(
         self,
@@ -78,5 +78,4 @@ class ScatterPlot(BasePlot):
         df = self._create_dataframe(x_label, y_label)
         self._generate_parquet(df, output_dir, filename_root)
 
-        self._generate_graph_file(fig, output_dir, filename_root + ".html")
-        self._generate_graph_file(fig, output_dir, filename_root + ".jpeg")
+        self._generate_graph_files(fig, output_dir, filename_root)
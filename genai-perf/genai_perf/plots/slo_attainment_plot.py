@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+from genai_perf.goodput_calculator import SLOAttainment
+from genai_perf.plots.base_plot import BasePlot
+
+
+class SLOAttainmentPlot(BasePlot):
+    """
+    Generate a plot of the SLO attainment in jpeg and html format.
+
+    The fraction of the requests meeting the SLO is plotted as a line against
+    the thresholds of a single metric, or as a heat map against the
+    thresholds of two metrics. The goodput is shown when hovering.
+    """
+
+    def __init__(
+        self, slo_attainment: SLOAttainment, static_images: bool = True
+    ) -> None:
+        super().__init__([], static_images)
+        self._slo_attainment = slo_attainment
+
+    def create_plot(
+        self,
+        graph_title: str = "",
+        x_label: str = "",
+        y_label: str = "",
+        width: int = 700,
+        height: int = 450,
+        filename_root: str = "",
+        output_dir: Path = Path(""),
+    ) -> None:
+        attainment = self._slo_attainment
+        x_name = attainment.slo_names[0]
+        x_label = x_label or self._get_label(x_name)
+        x = attainment.thresholds[x_name]
+        goodput_unit = attainment.get_unit("goodput")
+
+        if len(attainment.slo_names) == 1:
+            y_label = y_label or "Fraction of Requests"
+            trace = go.Scatter(
+                x=x,
+                y=attainment.fractions,
+                customdata=attainment.goodputs,
+                mode="lines+markers",
+                hovertemplate=f"{x_label}: %{{x}}<br>{y_label}: %{{y:.3f}}"
+                f"<br>Goodput: %{{customdata:.2f}} {goodput_unit}<extra></extra>",
+            )
+        else:
+            y_name = attainment.slo_names[1]
+            y_label = y_label or self._get_label(y_name)
+            # The heat map rows are the thresholds of the second metric
+            trace = go.Heatmap(
+                x=x,
+                y=attainment.thresholds[y_name],
+                z=attainment.fractions.T,
+                customdata=attainment.goodputs.T,
+                colorbar={"title": "Fraction"},
+                hovertemplate=f"{x_label}: %{{x}}<br>{y_label}: %{{y}}"
+                f"<br>Fraction: %{{z:.3f}}"
+                f"<br>Goodput: %{{customdata:.2f}} {goodput_unit}<extra></extra>",
+            )
+
+        fig = go.Figure(trace)
+        fig.update_layout(
+            title={
+                "text": f"{graph_title}",
+                "xanchor": "center",
+                "x": 0.5,
+            },
+            width=width,
+            height=height,
+        )
+        fig.update_xaxes(title_text=f"{x_label}")
+        fig.update_yaxes(title_text=f"{y_label}")
+
+        # Save dataframe as parquet file
+        df = self._create_dataframe(x_label, y_label)
+        self._generate_parquet(df, output_dir, filename_root)
+
+        self._generate_graph_files(fig, output_dir, filename_root)
+
+    def _create_dataframe(self, x_label: str, y_label: str) -> pd.DataFrame:
+        attainment = self._slo_attainment
+        return pd.DataFrame(attainment.to_rows(), columns=attainment.columns)
+
+    def _get_label(self, name: str) -> str:
+        unit = self._slo_attainment.get_unit(name)
+        label = name.replace("_", " ").title()
+        return f"{label} ({unit})" if unit else label
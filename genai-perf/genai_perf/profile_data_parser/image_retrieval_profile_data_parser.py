@@ -26,9 +26,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from array import array
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List
 
+from genai_perf.config.input.config_defaults import InputDefaults, OutputDefaults
 from genai_perf.metrics import ImageRetrievalMetrics
 from genai_perf.profile_data_parser.profile_data_parser import ProfileDataParser
 from genai_perf.utils import load_json_str
@@ -43,17 +45,32 @@ class ImageRetrievalProfileDataParser(ProfileDataParser):
         self,
         filename: Path,
         goodput_constraints: Dict[str, float] = {},
+        stream_profile_export: bool = False,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
+        slo_attainment: List[str] = [],
+        slo_attainment_grid_size: int = InputDefaults.SLO_ATTAINMENT_GRID_SIZE,
+        percentiles: List[float] = OutputDefaults.PERCENTILES,
     ) -> None:
-        super().__init__(filename, goodput_constraints)
+        super().__init__(
+            filename,
+            goodput_constraints,
+            stream_profile_export,
+            goodput_profiles,
+            slo_attainment,
+            slo_attainment_grid_size,
+            percentiles,
+        )
 
-    def _parse_requests(self, requests: dict) -> ImageRetrievalMetrics:
+    def _parse_requests(self, requests: Iterable[dict]) -> ImageRetrievalMetrics:
         """Parse each request in profile data to extract core metrics."""
         min_req_timestamp, max_res_timestamp = float("inf"), 0
-        request_latencies = []
-        image_throughputs = []
-        image_latencies = []
+        request_latencies = array("q")
+        image_throughputs = array("d")
+        image_latencies = array("d")
+        num_requests = 0
 
         for request in requests:
+            num_requests += 1
             req_timestamp = request["timestamp"]
             res_timestamps = request["response_timestamps"]
             req_inputs = request["request_inputs"]
@@ -79,7 +96,7 @@ class ImageRetrievalProfileDataParser(ProfileDataParser):
 
         # request throughput
         benchmark_duration = (max_res_timestamp - min_req_timestamp) / 1e9  # to seconds
-        request_throughputs = [len(requests) / benchmark_duration]
+        request_throughputs = [num_requests / benchmark_duration]
 
         image_metric = ImageRetrievalMetrics(
             request_throughputs,
@@ -88,8 +105,7 @@ class ImageRetrievalProfileDataParser(ProfileDataParser):
             image_latencies,
         )
 
-        if self._goodput_constraints:
-            goodput_val = self._calculate_goodput(benchmark_duration, image_metric)
-            image_metric.request_goodputs = goodput_val
+        self._add_goodput(benchmark_duration, image_metric)
+        self._add_slo_attainment(benchmark_duration, image_metric)
 
         return image_metric
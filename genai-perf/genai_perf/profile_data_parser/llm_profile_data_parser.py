@@ -26,20 +26,52 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from collections import defaultdict
-from functools import lru_cache
+import os
+from array import array
+from bisect import bisect_right
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Dict, List, NoReturn, Tuple, TypeAlias
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Tuple,
+    TypeAlias,
+    Union,
+)
 
-import orjson
-from genai_perf.constants import DEFAULT_LRU_CACHE_SIZE, EMPTY_RESPONSE_TOKEN
+from genai_perf.config.input.config_defaults import (
+    InputDefaults,
+    OutputDefaults,
+    TokenizerDefaults,
+)
+from genai_perf.constants import EMPTY_RESPONSE_TOKEN
 from genai_perf.exceptions import GenAIPerfException
+from genai_perf.inputs.input_constants import OutputTokenAccounting
 from genai_perf.logging import logging
-from genai_perf.metrics import LLMMetrics, Statistics
+from genai_perf.metrics import (
+    LLMMetrics,
+    RaggedArray,
+    Statistics,
+    SteadyStateWindow,
+    Timeline,
+    find_steady_state_window,
+)
+from genai_perf.profile_data_parser.parsed_metrics_cache import ParsedMetricsCache
 from genai_perf.profile_data_parser.profile_data_parser import (
     ProfileDataParser,
     ResponseFormat,
 )
+from genai_perf.token_count_cache import TokenCountCache
 from genai_perf.tokenizer import Tokenizer
 from genai_perf.utils import (
     load_json_str,
@@ -53,6 +85,60 @@ logger = logging.getLogger(__name__)
 
 SessionMetrics: TypeAlias = Dict[str, Dict[str, List[float | int]]]
 
+# The number of requests whose texts are tokenized together, which is also the
+# number of requests sent to a worker process at a time when parsing the
+# requests in parallel.
+PARSE_SHARD_SIZE = 256
+
+
+class ParsedRequest(NamedTuple):
+    """The values extracted from a single request that the LLM metrics are
+    computed from."""
+
+    req_timestamp: int
+    first_res_timestamp: int
+    second_res_timestamp: Optional[int]
+    last_res_timestamp: int
+    num_responses: int
+    input_sequence_length: int
+    output_sequence_length: int
+    chunked_inter_token_latency: List[int]
+    session_id: Optional[str]
+
+
+class CachedRequests:
+    """The requests of an experiment loaded from the parsed metrics sidecar,
+    which are already parsed."""
+
+    def __init__(self, num_requests: int, parsed_requests: List[ParsedRequest]) -> None:
+        self._num_requests = num_requests
+        self.parsed_requests = parsed_requests
+
+    def __len__(self) -> int:
+        return self._num_requests
+
+
+# The parser used by each worker process, set by _init_parse_worker.
+_worker_parser: Optional["LLMProfileDataParser"] = None
+
+
+def _init_parse_worker(parser: "LLMProfileDataParser") -> None:
+    global _worker_parser
+    # The requests are already parsed in parallel across the workers, so
+    # avoid oversubscribing the cores with the tokenizer threads.
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    _worker_parser = parser
+
+
+def _parse_request_shard(
+    requests: List[dict],
+) -> Tuple[List[Optional[ParsedRequest]], Tuple[int, int]]:
+    assert _worker_parser is not None
+    parsed_requests = _worker_parser._parse_request_batch(requests)
+    # hand the token count cache statistics back to the main process
+    cache = _worker_parser._token_count_cache
+    return parsed_requests, cache.pop_stats() if cache else (0, 0)
+
 
 class LLMProfileDataParser(ProfileDataParser):
     """A class that calculates and aggregates all the LLM performance statistics
@@ -62,6 +148,18 @@ class LLMProfileDataParser(ProfileDataParser):
     core LLM performance metrics, and calculates summary statistics for each
     different Perf Analyzer runs/experiments.
 
+    When num_parse_workers is greater than one, the requests are split into
+    shards that are parsed in a pool of worker processes, each with its own
+    tokenizer. The results are identical to parsing the requests serially.
+
+    When a token_count_cache is given, the token counts of the texts are
+    looked up in the persistent cache before tokenizing them, and the new
+    counts are added to the cache.
+
+    When cache_parsed_metrics is set, the parsed requests are saved in a
+    Parquet sidecar next to the profile export file, and later loads of the
+    same export with the same tokenizer read the sidecar instead.
+
     Example:
 
       >>> ... # run Perf Analyzer with concurrency level 10
@@ -84,101 +182,275 @@ class LLMProfileDataParser(ProfileDataParser):
         filename: Path,
         tokenizer: Tokenizer,
         goodput_constraints: Dict[str, float] = {},
+        stream_profile_export: bool = False,
+        num_parse_workers: int = 1,
+        tokenizer_batch_size: int = TokenizerDefaults.BATCH_SIZE,
+        token_count_cache: Optional[TokenCountCache] = None,
+        cache_parsed_metrics: bool = False,
+        output_token_accounting: OutputTokenAccounting = TokenizerDefaults.OUTPUT_TOKEN_ACCOUNTING,
+        use_server_token_counts: bool = False,
+        export_timeline: bool = False,
+        timeline_bucket_size: float = OutputDefaults.TIMELINE_BUCKET_SIZE,
+        timeline_rolling_window: float = OutputDefaults.TIMELINE_ROLLING_WINDOW,
+        steady_state_detection: bool = False,
+        steady_state_tolerance: float = OutputDefaults.STEADY_STATE_TOLERANCE,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
+        slo_attainment: List[str] = [],
+        slo_attainment_grid_size: int = InputDefaults.SLO_ATTAINMENT_GRID_SIZE,
+        percentiles: List[float] = OutputDefaults.PERCENTILES,
     ) -> None:
         self._tokenizer = tokenizer
+        self._tokenizer_batch_size = tokenizer_batch_size
+        self._use_server_token_counts = use_server_token_counts
+        if (
+            output_token_accounting == OutputTokenAccounting.OFFSETS
+            and not tokenizer.is_fast()
+        ):
+            logger.warning(
+                "The tokenizer does not support token offsets. "
+                "Falling back to the prefix output token accounting."
+            )
+            output_token_accounting = OutputTokenAccounting.PREFIX
+        self._output_token_accounting = output_token_accounting
+        self._token_count_cache = token_count_cache
+        self._cache_parsed_metrics = cache_parsed_metrics
+        self._parsed_metrics_cache: Optional[ParsedMetricsCache] = None
         self._session_metrics: SessionMetrics = defaultdict(lambda: defaultdict(list))
-        super().__init__(filename, goodput_constraints)
+        self._num_parse_workers = num_parse_workers
+        self._export_timeline = export_timeline
+        self._timeline_bucket_size = timeline_bucket_size
+        self._timeline_rolling_window = timeline_rolling_window
+        self._timeline_requests: Optional[List[ParsedRequest]] = None
+        self._steady_state_detection = steady_state_detection
+        self._steady_state_tolerance = steady_state_tolerance
+        self._steady_state_window: Optional[SteadyStateWindow] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        super().__init__(
+            filename,
+            goodput_constraints,
+            stream_profile_export,
+            goodput_profiles,
+            slo_attainment,
+            slo_attainment_grid_size,
+            percentiles,
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the state needed to parse individual requests is sent to the
+        # worker processes.
+        state = self.__dict__.copy()
+        for key in [
+            "_profile_results",
+            "_session_metrics",
+            "_session_statistics",
+            "_timelines",
+            "_timeline_requests",
+            "_steady_state_windows",
+            "_steady_state_window",
+            "_slo_attainments",
+            "_slo_attainment",
+        ]:
+            state.pop(key, None)
+        state["_executor"] = None
+        state["_parsed_metrics_cache"] = None
+        return state
+
+    def _load_profile_data(self, filename: Path, stream_profile_export: bool) -> None:
+        if not self._cache_parsed_metrics:
+            super()._load_profile_data(filename, stream_profile_export)
+            return
+
+        tokenizer_id = self._tokenizer.get_identifier()
+        if self._output_token_accounting == OutputTokenAccounting.OFFSETS:
+            tokenizer_id += ":offsets"
+        if self._use_server_token_counts:
+            tokenizer_id += ":usage"
+        cache = ParsedMetricsCache(filename, tokenizer_id)
+        cached = cache.load()
+        if cached is not None:
+            profile, experiments = cached
+            self._service_kind = profile["service_kind"]
+            if profile["response_format"] is not None:
+                self._response_format = ResponseFormat[profile["response_format"]]
+            self._parse_profile_data(
+                {
+                    "experiments": [
+                        {
+                            "experiment": experiment,
+                            "requests": CachedRequests(
+                                num_requests, [ParsedRequest._make(r) for r in rows]
+                            ),
+                            "window_boundaries": window_boundaries,
+                        }
+                        for experiment, num_requests, window_boundaries, rows in experiments
+                    ]
+                }
+            )
+            return
+
+        self._parsed_metrics_cache = cache
+        try:
+            super()._load_profile_data(filename, stream_profile_export)
+        finally:
+            self._parsed_metrics_cache = None
+        response_format = getattr(self, "_response_format", None)
+        cache.save(
+            {
+                "service_kind": self._service_kind,
+                "response_format": response_format and response_format.name,
+            }
+        )
 
     def _parse_profile_data(self, data: dict) -> None:
         """Parse through the entire profile data to collect statistics."""
         self._profile_results = {}
-        for experiment in data["experiments"]:
-            infer_mode = experiment["experiment"]["mode"]
-            load_level = experiment["experiment"]["value"]
-            requests = experiment["requests"]
+        with self._start_parse_workers():
+            for experiment in data["experiments"]:
+                infer_mode = experiment["experiment"]["mode"]
+                load_level = experiment["experiment"]["value"]
+                requests = experiment["requests"]
+
+                if self._parsed_metrics_cache is not None:
+                    self._parsed_metrics_cache.add_experiment(
+                        experiment["experiment"],
+                        len(requests),
+                        experiment.get("window_boundaries"),
+                    )
+                llm_metrics = self._parse_requests(requests)
 
-            llm_metrics = self._parse_requests(requests)
+                if self._export_timeline:
+                    timeline = self._create_timeline(
+                        experiment.get("window_boundaries")
+                    )
+                    self._timelines[(infer_mode, str(load_level))] = timeline
+                if self._steady_state_window is not None:
+                    self._steady_state_windows[(infer_mode, str(load_level))] = (
+                        self._steady_state_window
+                    )
+                if self._slo_attainment is not None:
+                    self._slo_attainments[(infer_mode, str(load_level))] = (
+                        self._slo_attainment
+                    )
+
+                # aggregate and calculate statistics
+                statistics = Statistics(llm_metrics, self._percentiles)
+                self._profile_results[(infer_mode, str(load_level))] = statistics
 
-            # aggregate and calculate statistics
-            statistics = Statistics(llm_metrics)
-            self._profile_results[(infer_mode, str(load_level))] = statistics
+                # calculate per-session statistics
+                for session_id, session_metric in self._session_metrics.items():
+                    metrics = LLMMetrics.from_dict(session_metric)
+                    self._session_statistics[session_id] = Statistics(
+                        metrics, self._percentiles
+                    )
 
-            # calculate per-session statistics
-            for session_id, session_metric in self._session_metrics.items():
-                metrics = LLMMetrics.from_dict(session_metric)
-                self._session_statistics[session_id] = Statistics(metrics)
+        if self._token_count_cache is not None:
+            self._token_count_cache.close()
+
+    @contextmanager
+    def _start_parse_workers(self) -> Iterator[None]:
+        """Start the worker processes that parse the requests, if enabled.
+
+        Each worker gets its own copy of the parser, including the tokenizer.
+        """
+        if self._num_parse_workers <= 1:
+            yield
+            return
+
+        logger.info(f"Parsing requests with {self._num_parse_workers} processes.")
+        with ProcessPoolExecutor(
+            max_workers=self._num_parse_workers,
+            initializer=_init_parse_worker,
+            initargs=(self,),
+        ) as executor:
+            self._executor = executor
+            try:
+                yield
+            finally:
+                self._executor = None
 
     def _parse_requests(self, requests: dict) -> LLMMetrics:
         """Parse each requests in profile export data to extract key metrics."""
         min_req_timestamp, max_res_timestamp = float("inf"), 0
-        request_latencies: List[int] = []
-        time_to_first_tokens: List[int] = []
-        time_to_second_tokens: List[int] = []
-        inter_token_latencies: List[int] = []
-        output_token_throughputs_per_user: List[float] = []
-        input_sequence_lengths: List[int] = []
-        output_sequence_lengths: List[int] = []
-        chunked_inter_token_latency: List[int] = []
-        chunked_inter_token_latencies: List[List[int]] = []
-
-        logger.info(f"Parsing total {len(requests)} requests.")
-        for request in tqdm(
-            requests,
+        # Typed growable buffers, handed over to LLMMetrics without copying
+        request_latencies = array("q")
+        time_to_first_tokens = array("q")
+        time_to_second_tokens = array("q")
+        inter_token_latencies = array("q")
+        output_token_throughputs_per_user = array("d")
+        # the request of each TTST and ITL, which only some requests have
+        ttst_request_indices = array("q")
+        itl_request_indices = array("q")
+        input_sequence_lengths = array("i")
+        output_sequence_lengths = array("i")
+        # ragged chunk latencies as a flat array of values and row offsets
+        chunked_itl_values = array("q")
+        chunked_itl_offsets = array("q", [0])
+
+        # Cache frequently used appends
+        request_latencies_append = request_latencies.append
+        ttft_list_append = time_to_first_tokens.append
+        ttst_list_append = time_to_second_tokens.append
+        itl_append = inter_token_latencies.append
+        tps_user_append = output_token_throughputs_per_user.append
+        in_len_append = input_sequence_lengths.append
+        out_len_append = output_sequence_lengths.append
+        chunked_itls_extend = chunked_itl_values.extend
+        chunked_offsets_append = chunked_itl_offsets.append
+
+        parsed_requests = self._iter_parsed_requests(requests)
+        if self._parsed_metrics_cache is not None:
+            parsed_requests = self._parsed_metrics_cache.record(parsed_requests)
+
+        num_requests = len(requests)
+        logger.info(f"Parsing total {num_requests} requests.")
+        parsed_requests = tqdm(
+            parsed_requests,
             desc="Progress: ",
             unit="requests",
-            total=len(requests),
-            miniters=len(requests) // 100,
-        ):
-            req_timestamp = request["timestamp"]
-            req_inputs = request["request_inputs"]
-            res_timestamps = request["response_timestamps"]
-            res_outputs = request["response_outputs"]
-
-            self._preprocess_response(res_timestamps, res_outputs)
+            total=num_requests,
+            miniters=num_requests // 100,
+        )
+        if self._export_timeline or self._steady_state_detection:
+            parsed_requests = self._select_requests(parsed_requests)
+            if self._steady_state_window is not None:
+                # the throughput is measured over the steady state only
+                requests = parsed_requests
 
+        for parsed_request in parsed_requests:
             # Skip requests with empty response. This happens sometimes when the
             # model returns a single response with empty string.
-            if not res_timestamps:
+            if parsed_request is None:
                 continue
 
-            # Cache length
-            num_responses = len(res_timestamps)
-
-            # Cache frequently used appends
-            request_latencies_append = request_latencies.append
-            ttft_list_append = time_to_first_tokens.append
-            ttst_list_append = time_to_second_tokens.append
-            itl_append = inter_token_latencies.append
-            tps_user_append = output_token_throughputs_per_user.append
-            in_len_append = input_sequence_lengths.append
-            out_len_append = output_sequence_lengths.append
-            chunked_itls_append = chunked_inter_token_latencies.append
+            req_timestamp = parsed_request.req_timestamp
+            num_responses = parsed_request.num_responses
+            first_res_timestamp = parsed_request.first_res_timestamp
+            last_res_timestamp = parsed_request.last_res_timestamp
 
             # track entire benchmark duration
             min_req_timestamp = min(min_req_timestamp, req_timestamp)
-            max_res_timestamp = max(max_res_timestamp, res_timestamps[-1])
+            max_res_timestamp = max(max_res_timestamp, last_res_timestamp)
 
             # request latencies
-            req_latency_ns = res_timestamps[-1] - req_timestamp
+            req_latency_ns = last_res_timestamp - req_timestamp
             request_latencies_append(req_latency_ns)  # nanosec
 
             # time to first token
-            ttft = res_timestamps[0] - req_timestamp
+            ttft = first_res_timestamp - req_timestamp
             ttft_list_append(ttft)
 
             # time to second token (if available)
             if num_responses > 1:
-                ttst = res_timestamps[1] - res_timestamps[0]
+                ttst = parsed_request.second_res_timestamp - first_res_timestamp
                 ttst_list_append(ttst)
+                ttst_request_indices.append(len(request_latencies) - 1)
 
             # number of input tokens
-            input_seq_len = self._get_input_token_count(req_inputs)
+            input_seq_len = parsed_request.input_sequence_length
             in_len_append(input_seq_len)
 
             # number of output tokens
-            output_token_counts, total_output_token = self._get_output_token_counts(
-                res_outputs
-            )
+            total_output_token = parsed_request.output_sequence_length
             out_len_append(total_output_token)
 
             if num_responses > 1 and total_output_token > 1:
@@ -191,26 +463,14 @@ class LLMProfileDataParser(ProfileDataParser):
                 # output token throughput per user (TPS/user)
                 inter_token_latency_s = inter_token_latency / 1e9
                 tps_user_append(1 / inter_token_latency_s)
+                itl_request_indices.append(len(request_latencies) - 1)
 
-            # The new ITL calculation above loses all token-level ITL information
-            # and as a result breaks ITL vs token position visualization. Keep
-            # the old version of inter token latency as a WAR to preserve the
-            # visualization.
-            chunked_inter_token_latency = []
-            for (t1, _), (t2, n2) in self._pairwise(
-                zip(res_timestamps, output_token_counts)
-            ):
-                # TMA-1676: handle empty first/last responses
-                # if the latter response has zero token (e.g. empty string),
-                # then set it default to one for the sake of inter token latency
-                # calculation and to avoid divide by zero.
-                num_token = 1 if n2 == 0 else n2
-                chunked_inter_token_latency.append(round((t2 - t1) / num_token))
-            chunked_itls_append(chunked_inter_token_latency)
+            chunked_itls_extend(parsed_request.chunked_inter_token_latency)
+            chunked_offsets_append(len(chunked_itl_values))
 
             # (per-session) calculate llm metrics
-            if "session_id" in req_inputs:
-                session_metric = self._session_metrics[req_inputs["session_id"]]
+            if parsed_request.session_id is not None:
+                session_metric = self._session_metrics[parsed_request.session_id]
                 session_metric["request_latencies"].append(req_latency_ns)
                 session_metric["time_to_first_tokens"].append(ttft)
                 if num_responses > 1:
@@ -224,7 +484,10 @@ class LLMProfileDataParser(ProfileDataParser):
                 session_metric["output_sequence_lengths"].append(total_output_token)
                 # collect request and last response timestamps each session
                 session_metric["req_timestamps"].append(req_timestamp)
-                session_metric["last_res_timestamps"].append(res_timestamps[-1])
+                session_metric["last_res_timestamps"].append(last_res_timestamp)
+
+        if self._token_count_cache is not None:
+            self._token_count_cache.log_stats()
 
         # request & output token throughput
         benchmark_duration = (max_res_timestamp - min_req_timestamp) / 1e9  # to seconds
@@ -244,17 +507,276 @@ class LLMProfileDataParser(ProfileDataParser):
             output_token_throughputs_per_user,
             output_sequence_lengths,
             input_sequence_lengths,
-            chunked_inter_token_latencies,
+            RaggedArray(chunked_itl_values, chunked_itl_offsets),
+        )
+        llm_metrics.set_request_indices("time_to_second_tokens", ttst_request_indices)
+        llm_metrics.set_request_indices("inter_token_latencies", itl_request_indices)
+        llm_metrics.set_request_indices(
+            "output_token_throughputs_per_user", itl_request_indices
         )
 
         self._postprocess_session_metrics()
 
-        if self._goodput_constraints:
-            goodput_val = self._calculate_goodput(benchmark_duration, llm_metrics)
-            llm_metrics.request_goodputs = goodput_val
+        self._add_goodput(benchmark_duration, llm_metrics)
+        self._add_slo_attainment(benchmark_duration, llm_metrics)
 
         return llm_metrics
 
+    def _iter_parsed_requests(
+        self, requests: Union[Iterable[dict], CachedRequests]
+    ) -> Iterator[Optional[ParsedRequest]]:
+        """Parse the requests, in order, serially or in the worker processes."""
+        if isinstance(requests, CachedRequests):
+            yield from requests.parsed_requests
+            return
+
+        if self._executor is None:
+            request_iter = iter(requests)
+            while shard := list(islice(request_iter, PARSE_SHARD_SIZE)):
+                yield from self._parse_request_batch(shard)
+            return
+
+        # Bound the number of shards in flight so that streamed requests are
+        # not all read in memory ahead of the workers.
+        max_pending = 2 * self._num_parse_workers
+        pending: Deque[Future] = deque()
+        request_iter = iter(requests)
+        while shard := list(islice(request_iter, PARSE_SHARD_SIZE)):
+            pending.append(self._executor.submit(_parse_request_shard, shard))
+            if len(pending) >= max_pending:
+                yield from self._get_shard_result(pending.popleft())
+        while pending:
+            yield from self._get_shard_result(pending.popleft())
+
+    def _get_shard_result(self, future: Future) -> List[Optional[ParsedRequest]]:
+        parsed_requests, (cache_hits, cache_misses) = future.result()
+        if self._token_count_cache is not None:
+            self._token_count_cache.hits += cache_hits
+            self._token_count_cache.misses += cache_misses
+        return parsed_requests
+
+    def _parse_request_batch(
+        self, requests: List[dict]
+    ) -> List[Optional[ParsedRequest]]:
+        """Extract the response timestamps and token counts of the requests.
+
+        The texts of all the requests are collected first and then tokenized
+        together in large batches, which is much faster than tokenizing them
+        request by request. The token counts are then scattered back to each
+        request. Requests with no response left after preprocessing are
+        returned as None.
+
+        With the offsets output token accounting, the full output of each
+        request is tokenized once with its token offsets instead, and the
+        tokens are split across the responses by _split_output_tokens.
+
+        With server token counts enabled, the requests whose responses report
+        the token usage are not tokenized at all.
+        """
+        use_offsets = self._output_token_accounting == OutputTokenAccounting.OFFSETS
+        # unique texts to tokenize, mapped to their index in the token counts
+        texts: Dict[str, int] = {}
+        # unique full outputs to tokenize with their token offsets
+        full_texts: Dict[str, int] = {}
+        parsed_requests: List[Optional[ParsedRequest]] = []
+        # the requests left to tokenize, with their index in parsed_requests
+        pending_requests: List[Tuple[int, dict, List[int], int, List[int], int]] = []
+        for request in requests:
+            req_inputs = request["request_inputs"]
+            res_timestamps = request["response_timestamps"]
+            res_outputs = request["response_outputs"]
+
+            if self._service_kind != "triton_c_api":
+                res_timestamps, output_texts = self._get_response_texts(
+                    res_timestamps, res_outputs
+                )
+
+            if not res_timestamps:
+                parsed_requests.append(None)
+                continue
+
+            if self._service_kind == "triton_c_api":
+                # no tokenizer required
+                parsed_requests.append(
+                    self._create_parsed_request(
+                        request,
+                        res_timestamps,
+                        len(req_inputs["input_ids"]),
+                        *self._get_output_token_counts(res_outputs),
+                    )
+                )
+                continue
+
+            if self._use_server_token_counts:
+                usage = self._get_server_token_counts(res_outputs)
+                if usage is not None:
+                    input_seq_len, total_output_token = usage
+                    parsed_requests.append(
+                        self._create_parsed_request(
+                            request,
+                            res_timestamps,
+                            input_seq_len,
+                            self._spread_output_tokens(
+                                total_output_token, len(res_timestamps)
+                            ),
+                            total_output_token,
+                        )
+                    )
+                    continue
+
+            input_index = texts.setdefault(self._get_input_text(req_inputs), len(texts))
+            if use_offsets:
+                # the end offset of each response in the full output
+                output_indices = list(accumulate(map(len, output_texts)))
+                full_text_index = full_texts.setdefault(
+                    "".join(output_texts), len(full_texts)
+                )
+            else:
+                # Exclamation mark forces tokenizers to use consistent prefix
+                output_indices = [
+                    texts.setdefault("!" + text, len(texts)) for text in output_texts
+                ]
+                full_text_index = texts.setdefault("".join(output_texts), len(texts))
+            pending_requests.append(
+                (
+                    len(parsed_requests),
+                    request,
+                    res_timestamps,
+                    input_index,
+                    output_indices,
+                    full_text_index,
+                )
+            )
+            parsed_requests.append(None)
+
+        if not pending_requests:
+            # avoid loading the tokenizer if no request needs it
+            return parsed_requests
+
+        token_counts = self._count_tokens(list(texts))
+        token_end_offsets = self._get_token_end_offsets(list(full_texts))
+
+        for (
+            i,
+            request,
+            res_timestamps,
+            input_index,
+            output_indices,
+            full_text_index,
+        ) in pending_requests:
+            if use_offsets:
+                token_ends = token_end_offsets[full_text_index]
+                output_token_counts = self._split_output_tokens(
+                    token_ends, output_indices
+                )
+                total_output_token = len(token_ends)
+            else:
+                # skip the token of the exclamation mark prefix
+                output_token_counts = [
+                    max(token_counts[j] - 1, 0) for j in output_indices
+                ]
+                total_output_token = token_counts[full_text_index]
+            parsed_requests[i] = self._create_parsed_request(
+                request,
+                res_timestamps,
+                token_counts[input_index],
+                output_token_counts,
+                total_output_token,
+            )
+        return parsed_requests
+
+    def _create_parsed_request(
+        self,
+        request: dict,
+        res_timestamps: List[int],
+        input_seq_len: int,
+        output_token_counts: List[int],
+        total_output_token: int,
+    ) -> ParsedRequest:
+        # The new ITL calculation above loses all token-level ITL information
+        # and as a result breaks ITL vs token position visualization. Keep
+        # the old version of inter token latency as a WAR to preserve the
+        # visualization.
+        chunked_inter_token_latency = []
+        for (t1, _), (t2, n2) in self._pairwise(
+            zip(res_timestamps, output_token_counts)
+        ):
+            # TMA-1676: handle empty first/last responses
+            # if the latter response has zero token (e.g. empty string),
+            # then set it default to one for the sake of inter token latency
+            # calculation and to avoid divide by zero.
+            num_token = 1 if n2 == 0 else n2
+            chunked_inter_token_latency.append(round((t2 - t1) / num_token))
+
+        return ParsedRequest(
+            req_timestamp=request["timestamp"],
+            first_res_timestamp=res_timestamps[0],
+            second_res_timestamp=(
+                res_timestamps[1] if len(res_timestamps) > 1 else None
+            ),
+            last_res_timestamp=res_timestamps[-1],
+            num_responses=len(res_timestamps),
+            input_sequence_length=input_seq_len,
+            output_sequence_length=total_output_token,
+            chunked_inter_token_latency=chunked_inter_token_latency,
+            session_id=request["request_inputs"].get("session_id"),
+        )
+
+    def _select_requests(
+        self, parsed_requests: Iterable[Optional[ParsedRequest]]
+    ) -> List[ParsedRequest]:
+        """Return the parsed requests that the metrics are computed from.
+
+        All the requests are kept for the timeline, but only the requests fully
+        inside the steady state window are selected, if it is detected.
+        """
+        selected = [r for r in parsed_requests if r is not None]
+        if self._export_timeline:
+            self._timeline_requests = selected
+
+        self._steady_state_window = None
+        if not self._steady_state_detection:
+            return selected
+
+        window = find_steady_state_window(
+            [r.req_timestamp for r in selected],
+            [r.last_res_timestamp for r in selected],
+            self._steady_state_tolerance,
+        )
+        if window is None:
+            logger.warning(
+                "No steady state was detected. The metrics include all the requests."
+            )
+            return selected
+
+        logger.info(
+            f"Detected a steady state of {window.duration:.2f} seconds. "
+            f"Trimmed {window.num_trimmed_requests} requests outside of it."
+        )
+        self._steady_state_window = window
+        return [
+            r
+            for r in selected
+            if window.contains(r.req_timestamp, r.last_res_timestamp)
+        ]
+
+    def _create_timeline(self, window_boundaries: Optional[List[int]]) -> Timeline:
+        """Create the timeline of the requests parsed last."""
+        assert self._timeline_requests is not None
+        requests = self._timeline_requests
+        self._timeline_requests = None
+
+        return Timeline(
+            request_timestamps=[r.req_timestamp for r in requests],
+            first_response_timestamps=[r.first_res_timestamp for r in requests],
+            last_response_timestamps=[r.last_res_timestamp for r in requests],
+            num_responses=[r.num_responses for r in requests],
+            output_sequence_lengths=[r.output_sequence_length for r in requests],
+            bucket_size=self._timeline_bucket_size,
+            rolling_window=self._timeline_rolling_window,
+            window_boundaries=window_boundaries,
+        )
+
     def _calculate_throughput_metrics(
         self,
         requests: dict,
@@ -286,108 +808,195 @@ class LLMProfileDataParser(ProfileDataParser):
         iterable = list(iterable)
         return zip(iterable, iterable[1:])
 
-    def _preprocess_response(
+    def _get_response_texts(
         self, res_timestamps: List[int], res_outputs: List[Dict[str, str]]
-    ) -> None:
-        """Helper function to preprocess responses of a request."""
+    ) -> Tuple[List[int], List[str]]:
+        """Return the timestamps and texts of the responses of a request."""
         if (
             self._service_kind == "openai"
             and "huggingface" not in self._response_format.name.lower()
         ):
-            # Sometimes streamed chunks are returned in a splintered fashion.
-            # This forces a merge with the previous chunk if error detected.
-            for i in reversed(range(1, len(res_outputs))):
-                response = res_outputs[i]["response"]
-
-                # skip non-data events
-                if not_data_sse_field(response):
-                    continue
+            return self._frame_sse_responses(
+                res_timestamps, [out["response"] for out in res_outputs]
+            )
+        return res_timestamps, self._get_output_texts(res_outputs)
+
+    def _frame_sse_responses(
+        self, res_timestamps: List[int], responses: List[str]
+    ) -> Tuple[List[int], List[str]]:
+        """Reassemble the SSE events of a streamed request in a single pass.
+
+        Each SSE event is decoded exactly once into its text. Responses
+        without any content are dropped along with their timestamps. The
+        finish reason of the events is not kept, since the token counts and
+        latencies only need the timestamps and texts, and the last response
+        with content already marks the end of the output.
+        """
+        # Sometimes streamed chunks are returned in a splintered fashion. The
+        # head of a response up to its first 'data: ' prefix belongs to the
+        # end of the previous response.
+        splits = [0] * len(responses)
+        for i in range(1, len(responses)):
+            response = responses[i]
+
+            # skip the responses that start a new SSE event
+            if response.startswith("data: ") or not_data_sse_field(response):
+                continue
 
-                if not response.startswith("data: "):
-                    prefix_idx = response.find("data: ")
-                    if "data: " not in res_outputs[i - 1]["response"]:
-                        raise GenAIPerfException(
-                            "Detected a splintered SSE response but the "
-                            "previous response does not contain proper SSE "
-                            "prefix to continue the fix."
-                        )
+            if "data: " not in responses[i - 1]:
+                raise GenAIPerfException(
+                    "Detected a splintered SSE response but the "
+                    "previous response does not contain proper SSE "
+                    "prefix to continue the fix."
+                )
+            prefix_idx = response.find("data: ")
+            splits[i] = len(response) if prefix_idx == -1 else prefix_idx
+
+        timestamps: List[int] = []
+        texts: List[str] = []
+        last = len(responses) - 1
+        for i, response in enumerate(responses):
+            if splits[i]:
+                response = response[splits[i] :]
+            if i < last and splits[i + 1]:
+                response += responses[i + 1][: splits[i + 1]]
+
+            text = self._extract_sse_text(response)
+            if text:
+                timestamps.append(res_timestamps[i])
+                texts.append(text)
+        return timestamps, texts
+
+    def _extract_sse_text(self, response: str) -> str:
+        """Extract the text of a response, which may hold multiple SSE events.
+
+        PA sometimes receives multiple SSE responses at once (as a single
+        response). Their texts are merged into a single text.
+        """
+        events = response.strip().split("\n\n")
+
+        # Check if any error event occurred.
+        for event in events:
+            if sse_error_occurred(event):
+                raise GenAIPerfException(
+                    f"Detected an error event in the SSE response: {event}"
+                )
 
-                    # When 'data: ' prefix is not found in the current
-                    # response, append it with the previous response
-                    # (assuming that the prev response contains it).
-                    if prefix_idx == -1:
-                        res_outputs[i - 1]["response"] += response
-                        res_outputs[i]["response"] = ""
-                    else:
-                        res_outputs[i - 1]["response"] += response[0:prefix_idx]
-                        res_outputs[i]["response"] = response[prefix_idx:]
-
-            # PA sometimes receives multiple SSE responses at once (as a single
-            # response). Handle these responses by merging into a single response.
-            for i in range(len(res_outputs)):
-                responses = res_outputs[i]["response"].strip().split("\n\n")
-
-                # Check if any error event occurred.
-                for r in responses:
-                    if sse_error_occurred(r):
-                        raise GenAIPerfException(
-                            f"Detected an error event in the SSE response: {r}"
-                        )
+        if len(events) == 1:
+            return self._extract_text_output(events[0])
+        if self._response_format == ResponseFormat.TRITON_GENERATE:
+            return "".join(self._extract_generate_text_output(e) for e in events)
+        return "".join(self._extract_text_output(e) for e in events)
 
-                if len(responses) > 1:
-                    data = load_json_str(remove_sse_prefix(responses[0]))
-                    if self._response_format == ResponseFormat.TRITON_GENERATE:
-                        merged_text = "".join(
-                            [self._extract_generate_text_output(r) for r in responses]
-                        )
-                        data["text_output"] = merged_text
-                    elif self._response_format == ResponseFormat.HUGGINGFACE_GENERATE:
-                        merged_text = "".join(
-                            [
-                                self._extract_huggingface_generate_text_output(r)
-                                for r in responses
-                            ]
-                        )
-                        if isinstance(data, list) and len(data) > 0:
-                            data[0]["generated_text"] = merged_text  # type: ignore
-                    else:
-                        merged_text = "".join(
-                            [self._extract_text_output(r) for r in responses]
-                        )
-                        if self._response_format == ResponseFormat.OPENAI_COMPLETIONS:
-                            data["choices"][0]["text"] = merged_text
-                        else:
-                            data["choices"][0]["delta"]["content"] = merged_text
-                    res_outputs[i] = {"response": orjson.dumps(data).decode("utf-8")}
-                elif self._is_empty_response(responses[0]):
-                    res_outputs[i]["response"] = ""
-
-            # Remove responses without any content
-            indices_to_remove = []
-            for idx, out in enumerate(res_outputs):
-                if not out["response"] or self._is_empty_response(out["response"]):
-                    indices_to_remove.append(idx)
-            indices_to_remove.sort(reverse=True)
-            for index in indices_to_remove:
-                res_timestamps.pop(index)
-                res_outputs.pop(index)
-
-    def _get_input_token_count(self, req_inputs: dict) -> int:
-        """Deserialize the request input and return tokenized inputs."""
+    def _get_input_text(self, req_inputs: dict) -> str:
+        """Return the text of the request input to tokenize."""
         if self._service_kind == "triton":
-            input_text = req_inputs["text_input"]
-        elif self._service_kind == "triton_c_api":
-            return len(req_inputs["input_ids"])  # no tokenizer required
+            return req_inputs["text_input"]
         elif self._service_kind == "openai":
-            input_text = self._get_input_payload(req_inputs)
+            return self._get_input_payload(req_inputs)
         else:
             raise ValueError(f"Unknown service kind: '{self._service_kind}'.")
 
-        return self._cached_encode(input_text)
-
-    @lru_cache(maxsize=DEFAULT_LRU_CACHE_SIZE)
-    def _cached_encode(self, text: str) -> int:
-        return len(self._tokenizer.encode(text))
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        """Return the number of tokens of each text, using the token count
+        cache if enabled."""
+        if self._token_count_cache is None:
+            return self._tokenize_texts(texts)
+
+        token_counts = self._token_count_cache.get(texts)
+        missing = [i for i, count in enumerate(token_counts) if count is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            missing_counts = self._tokenize_texts(missing_texts)
+            self._token_count_cache.put(missing_texts, missing_counts)
+            for i, count in zip(missing, missing_counts):
+                token_counts[i] = count
+        return token_counts  # type: ignore
+
+    def _tokenize_texts(self, texts: List[str]) -> List[int]:
+        """Return the number of tokens of each text, tokenizing the texts in
+        batches of tokenizer_batch_size."""
+        token_counts: List[int] = []
+        batch_size = self._tokenizer_batch_size
+        for i in range(0, len(texts), batch_size):
+            encoded = self._tokenizer(texts[i : i + batch_size])
+            input_ids: List[List[int]] = encoded["input_ids"]  # type: ignore
+            token_counts += [len(ids) for ids in input_ids]
+        return token_counts
+
+    def _get_token_end_offsets(self, texts: List[str]) -> List[List[int]]:
+        """Return the end offset of each token of each text, tokenizing the
+        texts in batches of tokenizer_batch_size."""
+        token_end_offsets: List[List[int]] = []
+        batch_size = self._tokenizer_batch_size
+        for i in range(0, len(texts), batch_size):
+            encoded = self._tokenizer(
+                texts[i : i + batch_size], return_offsets_mapping=True
+            )
+            token_end_offsets += [
+                [end for _, end in offsets] for offsets in encoded["offset_mapping"]
+            ]
+        return token_end_offsets
+
+    @staticmethod
+    def _split_output_tokens(
+        token_ends: List[int], response_ends: List[int]
+    ) -> List[int]:
+        """Return the number of output tokens of each response.
+
+        Each token of the full output is assigned to the response that
+        completes it, which is the first response ending at or after the end
+        offset of the token.
+        """
+        token_counts = []
+        num_tokens = 0
+        for response_end in response_ends:
+            end = bisect_right(token_ends, response_end, num_tokens)
+            token_counts.append(end - num_tokens)
+            num_tokens = end
+        return token_counts
+
+    def _get_server_token_counts(
+        self, res_outputs: List[Dict[str, str]]
+    ) -> Optional[Tuple[int, int]]:
+        """Return the prompt and completion token counts reported by the
+        server in the usage block of the responses, if any.
+
+        The usage is found in the response body of non-streaming requests,
+        and in the last chunk of streaming requests when the request sets
+        stream_options.include_usage. Only the OpenAI formats report it.
+        """
+        if self._service_kind != "openai" or (
+            "huggingface" in self._response_format.name.lower()
+        ):
+            return None
+
+        # The usage block can be splintered across the last responses
+        stream = "".join(out["response"] for out in res_outputs)
+        usage_idx = stream.rfind('"usage"')
+        if usage_idx == -1:
+            return None
+        start = stream.rfind("data:", 0, usage_idx)
+        end = stream.find("\n\n", usage_idx)
+        event = stream[0 if start == -1 else start : None if end == -1 else end]
+        usage = load_json_str(remove_sse_prefix(event.strip())).get("usage")
+        if not usage:
+            return None
+
+        prompt_tokens = usage.get("prompt_tokens")
+        completion_tokens = usage.get("completion_tokens")
+        if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+            return None
+        return prompt_tokens, completion_tokens
+
+    def _spread_output_tokens(self, num_tokens: int, num_responses: int) -> List[int]:
+        """Spread the output tokens evenly across the responses, as the
+        server only reports the total number of output tokens."""
+        tokens_per_response, remainder = divmod(num_tokens, num_responses)
+        return [
+            tokens_per_response + (1 if i < remainder else 0)
+            for i in range(num_responses)
+        ]
 
     def _get_input_payload(self, req_inputs: dict) -> str:
         """Deserialize the request input payload."""
@@ -409,9 +1018,7 @@ class LLMProfileDataParser(ProfileDataParser):
     def _get_output_token_counts(
         self, res_outputs: List[Dict]
     ) -> Tuple[List[int], int]:
-        if self._service_kind == "triton":
-            output_texts = [r["text_output"] for r in res_outputs]
-        elif self._service_kind == "triton_c_api":
+        if self._service_kind == "triton_c_api":
             token_ids = []
             for r in res_outputs:
                 if isinstance(r["output_ids"], list):
@@ -421,49 +1028,28 @@ class LLMProfileDataParser(ProfileDataParser):
                 else:
                     token_ids.append(EMPTY_RESPONSE_TOKEN)
             return token_ids, len(token_ids)
-        elif self._service_kind == "openai":
-            output_texts = [
-                self._extract_text_output(r["response"]) for r in res_outputs
-            ]
-        else:
-            raise ValueError(f"Unknown service kind: '{self._service_kind}'.")
 
-        full_text_token_count = self._cached_encode("".join(output_texts))
-        output_token_counts = self._get_output_token_counts_batch(output_texts)
-        return output_token_counts, full_text_token_count
+        output_texts = self._get_output_texts(res_outputs)
+        if self._output_token_accounting == OutputTokenAccounting.OFFSETS:
+            [token_ends] = self._get_token_end_offsets(["".join(output_texts)])
+            response_ends = list(accumulate(map(len, output_texts)))
+            return self._split_output_tokens(token_ends, response_ends), len(token_ends)
 
-    def _get_output_token_counts_batch(self, texts: List[str]) -> List[int]:
         # Exclamation mark forces tokenizers to use consistent prefix
-        forced_texts = ["!" + t for t in texts]
-        encoded = self._tokenizer(forced_texts)
-        input_ids: List[List[int]] = encoded["input_ids"]  # type: ignore
-        return [len(ids[1:]) for ids in input_ids]
+        token_counts = self._count_tokens(
+            ["!" + text for text in output_texts] + ["".join(output_texts)]
+        )
+        output_token_counts = [max(count - 1, 0) for count in token_counts[:-1]]
+        return output_token_counts, token_counts[-1]
 
-    def _get_tensorrtllm_engine_token_counts(
-        self, res_outputs: List[Dict]
-    ) -> Tuple[List[int], int]:
-        token_ids = []
-        for r in res_outputs:
-            if isinstance(r["output_ids"], list):
-                token_ids += r["output_ids"]
-            elif isinstance(r["output_ids"], int):
-                token_ids.append(r["output_ids"])
-            else:
-                # for the empty first/last responses
-                token_ids.append(EMPTY_RESPONSE_TOKEN)
-        return token_ids, len(token_ids)
-
-    def _get_triton_output_tokens(self, res_outputs: List[Dict]) -> List[str]:
-        """Return a list of Triton response texts."""
-        return [r["text_output"] for r in res_outputs]
-
-    def _get_text_output_tokens(self, res_outputs: List[Dict]) -> List[str]:
-        """Return a list of LLM response texts."""
-        output_texts = []
-        for output in res_outputs:
-            text = self._extract_text_output(output["response"])
-            output_texts.append(text)
-        return output_texts
+    def _get_output_texts(self, res_outputs: List[Dict]) -> List[str]:
+        """Return the texts of the responses to tokenize."""
+        if self._service_kind == "triton":
+            return [r["text_output"] for r in res_outputs]
+        elif self._service_kind == "openai":
+            return [self._extract_text_output(r["response"]) for r in res_outputs]
+        else:
+            raise ValueError(f"Unknown service kind: '{self._service_kind}'.")
 
     def _extract_text_output(self, response: str) -> str:
         """Extract text output based on response format."""
@@ -474,27 +1060,20 @@ class LLMProfileDataParser(ProfileDataParser):
         if response == "[DONE]":
             return ""
 
-        # Use a mapping to select the appropriate extraction method
-        extraction_methods = {
-            ResponseFormat.TRITON_GENERATE: self._extract_generate_text_output,
-            ResponseFormat.HUGGINGFACE_GENERATE: self._extract_huggingface_generate_text_output,
-            ResponseFormat.OPENAI_CHAT_COMPLETIONS: self._extract_openai_chat_text_output,
-            ResponseFormat.OPENAI_COMPLETIONS: self._extract_openai_completion_text_output,
-            ResponseFormat.OPENAI_MULTIMODAL: self._extract_openai_chat_text_output,
-        }
-        extract_method = extraction_methods.get(
-            self._response_format, self._throw_unknown_response_format_error
-        )
-        return extract_method(response)
-
-    def _get_response_output_tokens(self, output_texts: List[str]) -> List[List[int]]:
-        """Return a list of response output tokens."""
-        # Exclamation mark trick forces the llama tokenization to consistently
-        # start each output with a specific token which allows us to safely skip
-        # the first token of every tokenized output and get only the ones that
-        # are returned by the model
-        encodings = self._tokenizer(["!" + txt for txt in output_texts])
-        return [out[1:] for out in encodings.data["input_ids"]]
+        response_format = self._response_format
+        if (
+            response_format == ResponseFormat.OPENAI_CHAT_COMPLETIONS
+            or response_format == ResponseFormat.OPENAI_MULTIMODAL
+        ):
+            return self._extract_openai_chat_text_output(response)
+        elif response_format == ResponseFormat.OPENAI_COMPLETIONS:
+            return self._extract_openai_completion_text_output(response)
+        elif response_format == ResponseFormat.TRITON_GENERATE:
+            return self._extract_generate_text_output(response)
+        elif response_format == ResponseFormat.HUGGINGFACE_GENERATE:
+            return self._extract_huggingface_generate_text_output(response)
+        else:
+            self._throw_unknown_response_format_error(response)
 
     def _extract_huggingface_generate_text_output(self, response: str) -> str:
         data = load_json_str(response)
@@ -515,7 +1094,11 @@ class LLMProfileDataParser(ProfileDataParser):
 
     def _extract_openai_chat_text_output(self, response: str) -> str:
         data = load_json_str(response)
-        completions = data.get("choices", [{}])[0]
+        choices = data.get("choices", [{}])
+        if not choices:
+            # usage-only chunk of a stream with stream_options.include_usage
+            return ""
+        completions = choices[0]
 
         obj_type = data.get("object")
         if not obj_type:
@@ -533,7 +1116,11 @@ class LLMProfileDataParser(ProfileDataParser):
     def _extract_openai_completion_text_output(self, response: str) -> str:
         """Extract text from OpenAI completion response."""
         data = load_json_str(response)
-        completions = data["choices"][0]  # type: ignore
+        choices = data["choices"]  # type: ignore
+        if not choices:
+            # usage-only chunk of a stream with stream_options.include_usage
+            return ""
+        completions = choices[0]
 
         obj_type = data.get("object")
         if not obj_type:
@@ -561,8 +1148,3 @@ class LLMProfileDataParser(ProfileDataParser):
             return response
         data = load_json_str(response)
         return data["text_output"]
-
-    def _is_empty_response(self, response: str) -> bool:
-        """Returns true if the response is an LLM response with no content (or empty content)"""
-        text = self._extract_text_output(response)
-        return not bool(text)
@@ -26,10 +26,17 @@
 
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple, TypeAlias
+from typing import Dict, List, Optional, Tuple, TypeAlias
 
+from genai_perf.config.input.config_defaults import (
+    InputDefaults,
+    OutputDefaults,
+    TokenizerDefaults,
+)
+from genai_perf.inputs.input_constants import OutputTokenAccounting
 from genai_perf.logging import logging
 from genai_perf.profile_data_parser.llm_profile_data_parser import LLMProfileDataParser
+from genai_perf.token_count_cache import TokenCountCache
 from genai_perf.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
@@ -47,6 +54,22 @@ class MergedProfileParser(LLMProfileDataParser):
     - tokenizer (Tokenizer): The tokenizer used for processing text data.
     - throughput_metrics_dict (Dict[str, List[float]]): A dictionary containing throughput metrics for requests and outputs.
     - goodput_constraints (Dict[str, float], optional): Constraints for goodput calculation. Defaults to an empty dictionary.
+    - stream_profile_export (bool, optional): Parse the merged file one request at a time. Defaults to False.
+    - num_parse_workers (int, optional): The number of processes used to parse the requests. Defaults to 1.
+    - tokenizer_batch_size (int, optional): The number of texts tokenized together. Defaults to 1024.
+    - token_count_cache (TokenCountCache, optional): The persistent cache of token counts. Defaults to None.
+    - cache_parsed_metrics (bool, optional): Save the parsed requests in a sidecar next to the merged file. Defaults to False.
+    - output_token_accounting (OutputTokenAccounting, optional): How the output tokens of each response are counted. Defaults to prefix.
+    - use_server_token_counts (bool, optional): Take the token counts from the usage reported by the server. Defaults to False.
+    - export_timeline (bool, optional): Compute the timeline of each experiment. Defaults to False.
+    - timeline_bucket_size (float, optional): The duration of each bucket of the timeline in seconds. Defaults to 1.0.
+    - timeline_rolling_window (float, optional): The duration of the window of the rolling latency percentiles in seconds. Defaults to 5.0.
+    - steady_state_detection (bool, optional): Compute the metrics only over the steady state of each experiment. Defaults to False.
+    - steady_state_tolerance (float, optional): The relative variation of the load allowed in the steady state. Defaults to 0.1.
+    - goodput_profiles (Dict[str, Dict[str, float]], optional): The goodput constraints of each named SLO profile. Defaults to an empty dictionary.
+    - slo_attainment (List[str], optional): One or two metrics to compute the SLO attainment of. Defaults to an empty list.
+    - slo_attainment_grid_size (int, optional): The number of thresholds of each SLO attainment metric. Defaults to 20.
+    - percentiles (List[float], optional): The percentiles of each metric. Defaults to p25, p50, p75, p90, p95 and p99.
     """
 
     def __init__(
@@ -55,10 +78,46 @@ class MergedProfileParser(LLMProfileDataParser):
         tokenizer: Tokenizer,
         throughput_metrics_dict: Dict[str, List[float]],
         goodput_constraints: Dict[str, float] = {},
+        stream_profile_export: bool = False,
+        num_parse_workers: int = 1,
+        tokenizer_batch_size: int = TokenizerDefaults.BATCH_SIZE,
+        token_count_cache: Optional[TokenCountCache] = None,
+        cache_parsed_metrics: bool = False,
+        output_token_accounting: OutputTokenAccounting = TokenizerDefaults.OUTPUT_TOKEN_ACCOUNTING,
+        use_server_token_counts: bool = False,
+        export_timeline: bool = False,
+        timeline_bucket_size: float = OutputDefaults.TIMELINE_BUCKET_SIZE,
+        timeline_rolling_window: float = OutputDefaults.TIMELINE_ROLLING_WINDOW,
+        steady_state_detection: bool = False,
+        steady_state_tolerance: float = OutputDefaults.STEADY_STATE_TOLERANCE,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
+        slo_attainment: List[str] = [],
+        slo_attainment_grid_size: int = InputDefaults.SLO_ATTAINMENT_GRID_SIZE,
+        percentiles: List[float] = OutputDefaults.PERCENTILES,
     ) -> None:
         self._throughput_metrics_dict = throughput_metrics_dict
         self._session_metrics: SessionMetrics = defaultdict(lambda: defaultdict(list))
-        super().__init__(filename, tokenizer, goodput_constraints)
+        super().__init__(
+            filename,
+            tokenizer,
+            goodput_constraints,
+            stream_profile_export,
+            num_parse_workers,
+            tokenizer_batch_size,
+            token_count_cache,
+            cache_parsed_metrics,
+            output_token_accounting,
+            use_server_token_counts,
+            export_timeline,
+            timeline_bucket_size,
+            timeline_rolling_window,
+            steady_state_detection,
+            steady_state_tolerance,
+            goodput_profiles,
+            slo_attainment,
+            slo_attainment_grid_size,
+            percentiles,
+        )
 
     def _calculate_throughput_metrics(
         self,
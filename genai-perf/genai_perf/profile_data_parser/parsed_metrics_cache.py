@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import hashlib
+import os
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+from genai_perf.logging import logging
+
+logger = logging.getLogger(__name__)
+
+PARSED_METRICS_SUFFIX = ".metrics.parquet"
+
+# Bump when the parsed request columns or the way they are computed change,
+# so that the sidecars written by older versions are parsed again.
+PARSED_METRICS_VERSION = 2
+
+# The columns of a parsed request, in the order of the record fields.
+PARSED_REQUEST_COLUMNS = (
+    "req_timestamp",
+    "first_res_timestamp",
+    "second_res_timestamp",
+    "last_res_timestamp",
+    "num_responses",
+    "input_sequence_length",
+    "output_sequence_length",
+    "chunked_inter_token_latency",
+    "session_id",
+)
+
+
+def get_parsed_metrics_path(filename: Path) -> Path:
+    """Return the path of the sidecar of a profile export file."""
+    return filename.with_suffix(PARSED_METRICS_SUFFIX)
+
+
+def hash_file(filename: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the hash of the content of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _ExperimentColumns:
+    """Growable buffers of the parsed request columns of one experiment."""
+
+    def __init__(
+        self,
+        experiment: Dict[str, Any],
+        num_requests: int,
+        window_boundaries: Optional[List[int]],
+    ) -> None:
+        self.experiment = experiment
+        self.num_requests = num_requests
+        self.window_boundaries = window_boundaries
+        self.timestamps = [array("q") for _ in range(3)]
+        self.second_res_timestamps = array("q")
+        self.has_second_response: List[bool] = []
+        self.num_responses = array("i")
+        self.sequence_lengths = [array("q"), array("q")]
+        self.itl_values = array("q")
+        self.itl_offsets = array("q", [0])
+        self.session_ids: List[Optional[str]] = []
+
+    def append(self, row: Sequence[Any]) -> None:
+        (
+            req_timestamp,
+            first_res_timestamp,
+            second_res_timestamp,
+            last_res_timestamp,
+            num_responses,
+            input_sequence_length,
+            output_sequence_length,
+            chunked_inter_token_latency,
+            session_id,
+        ) = row
+        self.timestamps[0].append(req_timestamp)
+        self.timestamps[1].append(first_res_timestamp)
+        self.timestamps[2].append(last_res_timestamp)
+        self.has_second_response.append(second_res_timestamp is not None)
+        self.second_res_timestamps.append(second_res_timestamp or 0)
+        self.num_responses.append(num_responses)
+        self.sequence_lengths[0].append(input_sequence_length)
+        self.sequence_lengths[1].append(output_sequence_length)
+        self.itl_values.extend(chunked_inter_token_latency)
+        self.itl_offsets.append(len(self.itl_values))
+        self.session_ids.append(session_id)
+
+    def to_table(self) -> Any:
+        import pyarrow as pa
+
+        def int_array(values: array, type: Any = pa.int64()) -> Any:
+            return pa.array(np.frombuffer(values, dtype=values.typecode), type=type)
+
+        columns = [
+            int_array(self.timestamps[0]),
+            int_array(self.timestamps[1]),
+            pa.array(
+                np.frombuffer(self.second_res_timestamps, dtype="q"),
+                mask=~np.array(self.has_second_response, dtype=bool),
+            ),
+            int_array(self.timestamps[2]),
+            int_array(self.num_responses, pa.int32()),
+            int_array(self.sequence_lengths[0]),
+            int_array(self.sequence_lengths[1]),
+            pa.LargeListArray.from_arrays(
+                int_array(self.itl_offsets), int_array(self.itl_values)
+            ),
+            pa.array(self.session_ids, type=pa.string()),
+        ]
+        return pa.Table.from_arrays(columns, names=list(PARSED_REQUEST_COLUMNS))
+
+
+class ParsedMetricsCache:
+    """
+    A columnar sidecar of the parsed requests of a profile export file.
+
+    The sidecar is a Parquet file next to the profile export that holds the
+    per-request columns extracted from each experiment, so that later loads
+    of the same export skip the JSON decoding and tokenization. It is only
+    used if it was written from the same export content, by the same
+    tokenizer and with the same version of the columns.
+    """
+
+    def __init__(self, filename: Path, tokenizer_id: str) -> None:
+        self._filename = Path(filename)
+        self._path = get_parsed_metrics_path(self._filename)
+        self._tokenizer_id = tokenizer_id
+        self._experiments: List[_ExperimentColumns] = []
+
+    def load(
+        self,
+    ) -> Optional[
+        Tuple[
+            Dict[str, Any],
+            List[Tuple[Dict[str, Any], int, Optional[List[int]], List[Tuple]]],
+        ]
+    ]:
+        """
+        Return the profile metadata and, for each experiment, the experiment
+        info, the number of requests, the window boundaries and the parsed
+        request rows, or None if there is no valid sidecar for the profile
+        export.
+        """
+        if not self._path.exists():
+            return None
+
+        import pyarrow.parquet as pq
+
+        try:
+            schema_metadata = pq.read_schema(self._path).metadata or {}
+            metadata = orjson.loads(schema_metadata[b"genai_perf"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parsed metrics '{self._path}': {e}")
+            return None
+        if not self._is_valid(metadata):
+            logger.info(f"Parsed metrics '{self._path}' are out of date.")
+            return None
+
+        logger.info(f"Loading parsed metrics from '{self._path}'")
+        table = pq.read_table(self._path)
+        columns = [table.column(name).to_pylist() for name in PARSED_REQUEST_COLUMNS]
+        rows = list(zip(*columns))
+
+        experiments = []
+        start = 0
+        for experiment in metadata["experiments"]:
+            end = start + experiment["num_rows"]
+            experiments.append(
+                (
+                    experiment["experiment"],
+                    experiment["num_requests"],
+                    experiment["window_boundaries"],
+                    rows[start:end],
+                )
+            )
+            start = end
+        return metadata["profile"], experiments
+
+    def add_experiment(
+        self,
+        experiment: Dict[str, Any],
+        num_requests: int,
+        window_boundaries: Optional[List[int]] = None,
+    ) -> None:
+        """Start recording the parsed requests of a new experiment."""
+        self._experiments.append(
+            _ExperimentColumns(experiment, num_requests, window_boundaries)
+        )
+
+    def record(self, rows: Iterable[Optional[Sequence[Any]]]) -> Iterator:
+        """Pass the parsed request rows through, recording them in the
+        current experiment."""
+        columns = self._experiments[-1]
+        for row in rows:
+            if row is not None:
+                columns.append(row)
+            yield row
+
+    def save(self, profile: Dict[str, Any]) -> None:
+        """Write the recorded experiments to the sidecar."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        tables = [columns.to_table() for columns in self._experiments]
+        metadata = {
+            **self._get_key(),
+            "profile": profile,
+            "experiments": [
+                {
+                    "experiment": columns.experiment,
+                    "num_requests": columns.num_requests,
+                    "window_boundaries": columns.window_boundaries,
+                    "num_rows": table.num_rows,
+                }
+                for columns, table in zip(self._experiments, tables)
+            ],
+        }
+        table = pa.concat_tables(tables).replace_schema_metadata(
+            {"genai_perf": orjson.dumps(metadata)}
+        )
+
+        # Write to a temporary file first so that readers never see a
+        # partially written sidecar.
+        tmp_path = self._path.with_name(self._path.name + f".{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning(f"Failed to write parsed metrics '{self._path}': {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        logger.info(f"Saved parsed metrics to '{self._path}'")
+        self._experiments = []
+
+    def _get_key(self) -> Dict[str, Any]:
+        return {
+            "version": PARSED_METRICS_VERSION,
+            "tokenizer": self._tokenizer_id,
+            "source_size": self._filename.stat().st_size,
+            "source_hash": hash_file(self._filename),
+        }
+
+    def _is_valid(self, metadata: Dict[str, Any]) -> bool:
+        # Compare the cheap fields first to avoid hashing the export
+        if (
+            metadata.get("version") != PARSED_METRICS_VERSION
+            or metadata.get("tokenizer") != self._tokenizer_id
+            or metadata.get("source_size") != self._filename.stat().st_size
+        ):
+            return False
+        return metadata.get("source_hash") == hash_file(self._filename)
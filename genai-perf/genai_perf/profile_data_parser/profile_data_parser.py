@@ -26,13 +26,17 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from array import array
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from genai_perf.config.input.config_defaults import InputDefaults, OutputDefaults
 from genai_perf.goodput_calculator.llm_goodput_calculator import LLMGoodputCalculator
+from genai_perf.goodput_calculator.slo_attainment import SLOAttainment
 from genai_perf.logging import logging
-from genai_perf.metrics import Metrics, Statistics
+from genai_perf.metrics import Metrics, Statistics, SteadyStateWindow, Timeline
+from genai_perf.profile_data_parser.profile_export_reader import ProfileExportReader
 from genai_perf.utils import load_json
 
 logger = logging.getLogger(__name__)
@@ -54,19 +58,46 @@ class ResponseFormat(Enum):
 class ProfileDataParser:
     """Base profile data parser class that reads the profile data JSON file to
     extract core metrics and calculate various performance statistics.
+
+    When stream_profile_export is set, the requests are decoded from the file
+    and parsed one at a time instead of loading the whole file in memory,
+    which keeps the peak memory usage independent of the export size.
     """
 
     def __init__(
         self,
         filename: Path,
         goodput_constraints: Dict[str, float] = {},
+        stream_profile_export: bool = False,
+        goodput_profiles: Dict[str, Dict[str, float]] = {},
+        slo_attainment: List[str] = [],
+        slo_attainment_grid_size: int = InputDefaults.SLO_ATTAINMENT_GRID_SIZE,
+        percentiles: List[float] = OutputDefaults.PERCENTILES,
     ) -> None:
         self._goodput_constraints = goodput_constraints
+        self._goodput_profiles = goodput_profiles
+        self._slo_attainment_metrics = slo_attainment
+        self._slo_attainment_grid_size = slo_attainment_grid_size
+        self._percentiles = percentiles
+        self._slo_attainment: Optional[SLOAttainment] = None
+        self._slo_attainments: Dict[Tuple[str, str], SLOAttainment] = {}
         self._session_statistics: Dict[str, Statistics] = {}
-        logger.info("Loading response data from '%s'", str(filename))
-        data = load_json(filename)
-        self._get_profile_metadata(data)
-        self._parse_profile_data(data)
+        self._timelines: Dict[Tuple[str, str], Timeline] = {}
+        self._steady_state_windows: Dict[Tuple[str, str], SteadyStateWindow] = {}
+        self._load_profile_data(filename, stream_profile_export)
+
+    def _load_profile_data(self, filename: Path, stream_profile_export: bool) -> None:
+        """Read the profile export file and parse its experiments."""
+        if stream_profile_export:
+            logger.info("Streaming response data from '%s'", str(filename))
+            reader = ProfileExportReader(filename)
+            self._get_profile_metadata(reader.get_metadata())
+            self._parse_profile_data({"experiments": reader.iter_experiments()})
+        else:
+            logger.info("Loading response data from '%s'", str(filename))
+            data = load_json(filename)
+            self._get_profile_metadata(data)
+            self._parse_profile_data(data)
 
     def _get_profile_metadata(self, data: dict) -> None:
         self._service_kind = data["service_kind"]
@@ -136,17 +167,26 @@ class ProfileDataParser:
             requests = experiment["requests"]
 
             metrics = self._parse_requests(requests)
+            if self._slo_attainment is not None:
+                self._slo_attainments[(infer_mode, str(load_level))] = (
+                    self._slo_attainment
+                )
 
             # aggregate and calculate statistics
-            statistics = Statistics(metrics)
+            statistics = Statistics(metrics, self._percentiles)
             self._profile_results[(infer_mode, str(load_level))] = statistics
 
-    def _parse_requests(self, requests: dict) -> Metrics:
-        """Parse each request in profile data to extract core metrics."""
+    def _parse_requests(self, requests: Iterable[dict]) -> Metrics:
+        """Parse each request in profile data to extract core metrics.
+
+        The requests are iterated only once, so they can be streamed.
+        """
         min_req_timestamp, max_res_timestamp = float("inf"), 0
-        request_latencies = []
+        request_latencies = array("q")
+        num_requests = 0
 
         for request in requests:
+            num_requests += 1
             req_timestamp = request["timestamp"]
             res_timestamps = request["response_timestamps"]
 
@@ -160,32 +200,50 @@ class ProfileDataParser:
 
         # request throughput
         benchmark_duration = (max_res_timestamp - min_req_timestamp) / 1e9  # to seconds
-        request_throughputs = [len(requests) / benchmark_duration]
+        request_throughputs = [num_requests / benchmark_duration]
 
         metric = Metrics(
             request_throughputs,
             request_latencies,
         )
 
-        if self._goodput_constraints:
-            goodput_val = self._calculate_goodput(benchmark_duration, metric)
-            metric.request_goodputs = goodput_val
+        self._add_goodput(benchmark_duration, metric)
+        self._add_slo_attainment(benchmark_duration, metric)
 
         return metric
 
-    def _calculate_goodput(
-        self,
-        benchmark_duration: float,
-        metric: Metrics,
-    ) -> Optional[List[float]]:
+    def _add_goodput(self, benchmark_duration: float, metric: Metrics) -> None:
+        """Add the goodput of the constraints and of each SLO profile."""
+        if not self._goodput_constraints and not self._goodput_profiles:
+            return
+
         llm_goodput_calculator = LLMGoodputCalculator(
             self._goodput_constraints,
             metric,
             benchmark_duration,
+            self._goodput_profiles,
         )
 
         llm_goodput_calculator.compute()
-        return llm_goodput_calculator.goodput
+        if self._goodput_constraints:
+            metric.request_goodputs = llm_goodput_calculator.goodput
+        metric.request_goodputs_by_profile = llm_goodput_calculator.goodputs_by_profile
+
+    def _add_slo_attainment(self, benchmark_duration: float, metric: Metrics) -> None:
+        """Compute the SLO attainment of the requests, if enabled."""
+        self._slo_attainment = None
+        if not self._slo_attainment_metrics:
+            return
+
+        try:
+            self._slo_attainment = SLOAttainment(
+                self._slo_attainment_metrics,
+                metric,
+                benchmark_duration,
+                self._slo_attainment_grid_size,
+            )
+        except ValueError as e:
+            logger.warning(f"Skipping the SLO attainment: {e}")
 
     def get_statistics(self, infer_mode: str, load_level: str) -> Statistics:
         """Return profile statistics if it exists."""
@@ -197,6 +255,22 @@ class ProfileDataParser:
         """Return session statistics."""
         return self._session_statistics
 
+    def get_timeline(self, infer_mode: str, load_level: str) -> Optional[Timeline]:
+        """Return the profile timeline if it was computed."""
+        return self._timelines.get((infer_mode, load_level))
+
+    def get_steady_state_window(
+        self, infer_mode: str, load_level: str
+    ) -> Optional[SteadyStateWindow]:
+        """Return the steady state window of the profile if it was detected."""
+        return self._steady_state_windows.get((infer_mode, load_level))
+
+    def get_slo_attainment(
+        self, infer_mode: str, load_level: str
+    ) -> Optional[SLOAttainment]:
+        """Return the SLO attainment of the profile if it was computed."""
+        return self._slo_attainments.get((infer_mode, load_level))
+
     def get_profile_load_info(self) -> List[Tuple[str, str]]:
         """Return available (infer_mode, load_level) tuple keys."""
         return [k for k, _ in self._profile_results.items()]
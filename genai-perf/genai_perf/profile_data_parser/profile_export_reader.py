@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import re
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+import orjson
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.logging import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_CHUNK_SIZE = 1 << 22  # 4 MiB
+
+# Matches a JSON string once its escape sequences have been masked (see
+# _mask_escapes), which is much faster than handling the escapes in the regex.
+_STRING = rb'"[^"]*"'
+
+# A complete JSON string, a bracket, or a lone quote (an unterminated string
+# that continues past the end of the buffer).
+_TOKEN_PATTERN = re.compile(_STRING + rb'|[{}\[\]]|"')
+
+# Maximum nesting depth of the objects/arrays matched by _VALUE_PATTERN. The
+# requests in a profile export are nested 3-4 levels deep.
+_MAX_VALUE_PATTERN_DEPTH = 6
+
+
+def _build_value_pattern(depth: int) -> "re.Pattern[bytes]":
+    """Build a pattern matching a complete object or array nested up to depth
+    levels, which lets the regex engine find the end of a value in one call."""
+    content = rb'(?:[^"{}\[\]]|' + _STRING + rb")*"
+    for _ in range(depth - 1):
+        content = (
+            rb'(?:[^"{}\[\]]|'
+            + _STRING
+            + rb"|\{"
+            + content
+            + rb"\}|\["
+            + content
+            + rb"\])*"
+        )
+    return re.compile(rb"\{" + content + rb"\}|\[" + content + rb"\]")
+
+
+_VALUE_PATTERN = _build_value_pattern(_MAX_VALUE_PATTERN_DEPTH)
+_SCALAR_END_PATTERN = re.compile(rb"[\s,\]}]")
+_WHITESPACE = b" \t\r\n"
+
+
+def _mask_escapes(buf: bytes) -> bytes:
+    """Replace the escaped backslashes and quotes with same-length filler so
+    that every remaining quote delimits a string. Offsets are preserved."""
+    return buf.replace(b"\\\\", b"__").replace(b'\\"', b"__")
+
+
+class _JsonScanner:
+    """A minimal pull-based JSON scanner over a binary file.
+
+    The scanner only understands enough of the JSON grammar to walk through
+    objects and arrays and to slice out the raw bytes of a single value, which
+    are then decoded with orjson. The read buffer only ever holds the value
+    that is currently being scanned, so memory usage is bounded by the size of
+    the largest individual value that gets decoded rather than the file size.
+
+    Value boundaries are searched in a copy of the buffer with the escape
+    sequences masked, while the values are sliced from the raw buffer.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buf = b""
+        self._masked_buf = b""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, keep_from: Optional[int] = None) -> int:
+        """Read the next chunk, discarding already consumed bytes.
+
+        Returns the offset by which the buffer positions were shifted.
+        """
+        if self._eof:
+            raise GenAIPerfException("Unexpected end of the profile export file.")
+
+        start = self._pos if keep_from is None else min(keep_from, self._pos)
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+        self._buf = self._buf[start:] + chunk
+        # Re-mask the carried over bytes too, since an escape sequence can be
+        # split across two chunks. Masking is idempotent.
+        self._masked_buf = _mask_escapes(self._masked_buf[start:] + chunk)
+        self._pos -= start
+        return start
+
+    def _peek(self) -> bytes:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos : self._pos + 1]
+            if self._eof:
+                return b""
+            self._fill()
+
+    def _expect(self, char: bytes) -> None:
+        if self._peek() != char:
+            raise GenAIPerfException(
+                f"Malformed profile export file: expected '{char.decode()}' but "
+                f"found '{self._peek().decode(errors='replace')}'."
+            )
+        self._pos += 1
+
+    def read_raw_value(self) -> bytes:
+        """Return the raw bytes of the next JSON value and advance past it."""
+        char = self._peek()
+        start = self._pos
+        if char not in (b"{", b"[", b'"'):
+            while True:
+                match = _SCALAR_END_PATTERN.search(self._buf, self._pos)
+                if match or self._eof:
+                    end = match.start() if match else len(self._buf)
+                    self._pos = end
+                    return self._buf[start:end]
+                start -= self._fill(keep_from=start)
+
+        # fast path: the value is fully buffered and not nested too deeply
+        match = _VALUE_PATTERN.match(self._masked_buf, self._pos)
+        if match is not None:
+            self._pos = match.end()
+            return self._buf[start : self._pos]
+
+        depth = 0
+        while True:
+            match = _TOKEN_PATTERN.search(self._masked_buf, self._pos)
+            if match is None or match.group() == b'"' and not self._eof:
+                # Either nothing left in the buffer or a string continues past
+                # its end. Resume from the last complete token.
+                if match is not None:
+                    self._pos = match.start()
+                else:
+                    self._pos = len(self._buf)
+                start -= self._fill(keep_from=start)
+                continue
+
+            token = match.group()
+            self._pos = match.end()
+            if token in (b"{", b"["):
+                depth += 1
+            elif token in (b"}", b"]"):
+                depth -= 1
+            if depth == 0:
+                return self._buf[start : self._pos]
+
+    def read_value(self) -> Any:
+        return orjson.loads(self.read_raw_value())
+
+    def skip_value(self) -> None:
+        self.read_raw_value()
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Yield the keys of the next JSON object.
+
+        The caller is responsible for consuming the value of each key before
+        requesting the next one.
+        """
+        self._expect(b"{")
+        if self._peek() == b"}":
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != b'"':
+                self._expect(b'"')
+            key = self.read_value()
+            self._expect(b":")
+            yield key
+            if self._peek() == b",":
+                self._pos += 1
+            else:
+                self._expect(b"}")
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield the index of each element of the next JSON array.
+
+        The caller is responsible for consuming each element before requesting
+        the next one.
+        """
+        self._expect(b"[")
+        if self._peek() == b"]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._peek() == b",":
+                self._pos += 1
+            else:
+                self._expect(b"]")
+                return
+
+
+class RequestStream:
+    """A sized, single-pass iterable over the requests of one experiment.
+
+    Each request is decoded from the profile export file only when it is
+    requested and is not retained afterwards, so consumers must process the
+    requests in a single pass.
+    """
+
+    def __init__(self, requests: Iterator[Dict[str, Any]], num_requests: int):
+        self._requests = requests
+        self._num_requests = num_requests
+
+    def __len__(self) -> int:
+        return self._num_requests
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._requests
+
+
+class ProfileExportReader:
+    """Reads a Perf Analyzer profile export file incrementally.
+
+    Perf Analyzer writes the top-level metadata (service kind, endpoint, ...)
+    after the experiments, so the file is read in two passes:
+      1. a lightweight scan that collects the metadata, the experiment
+         descriptors, the number of requests per experiment and the first
+         request of each experiment (used to detect the response format)
+      2. a streaming pass that decodes one request at a time
+
+    Example:
+
+      >>> reader = ProfileExportReader(Path("profile_export.json"))
+      >>> metadata = reader.get_metadata()
+      >>> for experiment in reader.iter_experiments():
+      >>>     for request in experiment["requests"]:
+      >>>         ...
+    """
+
+    def __init__(
+        self, filename: Path, chunk_size: int = DEFAULT_READ_CHUNK_SIZE
+    ) -> None:
+        self._filename = filename
+        self._chunk_size = chunk_size
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._num_requests: List[int] = []
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Return the profile export data without the full request lists.
+
+        Each experiment only contains its first request.
+        """
+        if self._metadata is None:
+            self._metadata = self._scan_metadata()
+        return self._metadata
+
+    def iter_experiments(self) -> Iterator[Dict[str, Any]]:
+        """Yield each experiment with its requests as a RequestStream.
+
+        The requests of an experiment must be consumed before advancing to the
+        next experiment. Any requests left unconsumed are skipped.
+        """
+        experiments = self.get_metadata()["experiments"]
+        with open(self._filename, "rb") as f:
+            scanner = _JsonScanner(f, self._chunk_size)
+            for key in scanner.iter_object_keys():
+                if key != "experiments":
+                    scanner.skip_value()
+                    continue
+                for index in scanner.iter_array():
+                    for experiment_key in scanner.iter_object_keys():
+                        if experiment_key != "requests":
+                            scanner.skip_value()
+                            continue
+                        requests = self._iter_requests(scanner)
+                        yield {
+                            **experiments[index],
+                            "requests": RequestStream(
+                                requests, self._num_requests[index]
+                            ),
+                        }
+                        # skip whatever the consumer did not read
+                        for _ in requests:
+                            pass
+
+    def _iter_requests(self, scanner: _JsonScanner) -> Iterator[Dict[str, Any]]:
+        for _ in scanner.iter_array():
+            yield scanner.read_value()
+
+    def _scan_metadata(self) -> Dict[str, Any]:
+        logger.info("Scanning profile export file '%s'", str(self._filename))
+        metadata: Dict[str, Any] = {}
+        experiments: List[Dict[str, Any]] = []
+        with open(self._filename, "rb") as f:
+            scanner = _JsonScanner(f, self._chunk_size)
+            for key in scanner.iter_object_keys():
+                if key != "experiments":
+                    metadata[key] = scanner.read_value()
+                    continue
+                for _ in scanner.iter_array():
+                    experiments.append(self._scan_experiment(scanner))
+        metadata["experiments"] = experiments
+        return metadata
+
+    def _scan_experiment(self, scanner: _JsonScanner) -> Dict[str, Any]:
+        experiment: Dict[str, Any] = {}
+        num_requests = 0
+        for key in scanner.iter_object_keys():
+            if key != "requests":
+                experiment[key] = scanner.read_value()
+                continue
+            experiment["requests"] = []
+            for index in scanner.iter_array():
+                if index == 0:
+                    experiment["requests"].append(scanner.read_value())
+                else:
+                    scanner.skip_value()
+                num_requests += 1
+        self._num_requests.append(num_requests)
+        return experiment
@@ -14,10 +14,11 @@
 
 import importlib
 import os
+import re
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from statistics import mean
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.types import RecordValue
@@ -39,6 +40,18 @@ class RecordType(ABCMeta):
 
     record_types: Dict[str, "RecordType"] = {}
 
+    # The record types of the percentiles without a module of their own,
+    # kept apart so that record_types has one record type per module
+    percentile_record_types: Dict[str, "RecordType"] = {}
+
+    # Whether the modules of all the record types have been imported,
+    # so that a tag missing from record_types has no module
+    all_record_types_imported = False
+
+    PERCENTILE_TAG_PATTERN = re.compile(
+        r"^(?P<base_tag>\w+)_p(?P<percentile>\d+(?:\.\d+)?)$"
+    )
+
     def __new__(cls, name, base, namespace):
         """
         This function is called upon declaration of any classes of type
@@ -65,13 +78,76 @@ class RecordType(ABCMeta):
         The class of type RecordType corresponding to the tag
         """
 
-        if tag not in cls.record_types:
+        if tag in cls.percentile_record_types:
+            return cls.percentile_record_types[tag]
+
+        if tag in cls.record_types:
+            return cls.record_types[tag]
+
+        if cls.all_record_types_imported:
+            percentile_record_type = cls._create_percentile_record_type(tag)
+            if percentile_record_type is not None:
+                return percentile_record_type
+        else:
             try:
                 importlib.import_module("genai_perf.record.types.%s" % tag)
             except ImportError as e:
+                percentile_record_type = cls._create_percentile_record_type(tag)
+                if percentile_record_type is not None:
+                    return percentile_record_type
                 print(e)
         return cls.record_types[tag]
 
+    @classmethod
+    def _create_percentile_record_type(cls, tag: str) -> Optional["RecordType"]:
+        """
+        Creates the record type of a percentile that has no module of its
+        own, such as p99.9, from the p99 record type of the same metric
+
+        Returns
+        -------
+        The new class of type RecordType, or None if the tag is not
+        a percentile of a metric with percentile records
+        """
+
+        match = cls.PERCENTILE_TAG_PATTERN.match(tag)
+        if match is None:
+            return None
+
+        template_tag = f"{match['base_tag']}_p99"
+        if template_tag not in cls.record_types and not cls.all_record_types_imported:
+            try:
+                importlib.import_module(f"genai_perf.record.types.{template_tag}")
+            except ImportError:
+                return None
+        template = cls.record_types.get(template_tag)
+        if template is None:
+            return None
+
+        label = f"p{match['percentile']}"
+        header = template.header().replace("p99", label, 1)
+
+        def percentile_header(_, aggregation_tag=False) -> str:
+            return header
+
+        name = template.__name__.replace(
+            "P99", "P" + match["percentile"].replace(".", "_")
+        )
+        # Bypass the registration in record_types of RecordType.__new__
+        percentile_record_type = super().__new__(
+            cls,
+            name,
+            template.__bases__,
+            {
+                "__module__": template.__module__,
+                "__doc__": f"A record for {label} of the {match['base_tag']} metric",
+                "tag": tag,
+                "header": classmethod(percentile_header),
+            },
+        )
+        cls.percentile_record_types[tag] = percentile_record_type
+        return percentile_record_type
+
     @classmethod
     def get_all_record_types(cls) -> Dict[str, "RecordType"]:
         """
@@ -83,6 +159,9 @@ class RecordType(ABCMeta):
             metaclass
         """
 
+        if cls.all_record_types_imported:
+            return cls.record_types
+
         type_module_directory = os.path.join(
             globals()["__spec__"].origin.rsplit("/", 1)[0], "types"
         )
@@ -92,6 +171,7 @@ class RecordType(ABCMeta):
                     importlib.import_module(f"genai_perf.record.types.{filename[:-3]}")
                 except AttributeError:
                     raise GenAIPerfException("Error retrieving all record types")
+        cls.all_record_types_imported = True
         return cls.record_types
 
 
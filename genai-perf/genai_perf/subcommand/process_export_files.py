@@ -26,18 +26,24 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import genai_perf.logging as logging
 from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.export_data.output_reporter import OutputReporter
+from genai_perf.metrics import LLMMetrics, Statistics
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 from genai_perf.metrics.telemetry_statistics import TelemetryStatistics
 from genai_perf.metrics.telemetry_stats_aggregator import TelemetryStatsAggregator
 from genai_perf.profile_data_parser.merged_profile_parser import MergedProfileParser
 from genai_perf.subcommand.subcommand import Subcommand
+from genai_perf.token_count_cache import get_token_count_cache
 from genai_perf.types import ModelObjectiveParameters
 
+logger = logging.getLogger(__name__)
+
 
 def process_export_files_handler(
     config: ConfigCommand, extra_args: Optional[List[str]] = None
@@ -72,6 +78,10 @@ class ProcessExportFiles(Subcommand):
         self._telemetry_dicts: List[Dict[str, Any]] = []
         self._input_config: Dict[str, Any] = {}
         self._next_start_timestamp = 0
+        self._request_counts: List[int] = []
+        self._sketch_dicts: List[Dict[str, Any]] = []
+        self._has_sessions = False
+        self._merged_statistics: Optional[Statistics] = None
 
     def process_export_files(self) -> None:
         self._parse_input_directory(self._config.process.input_path)
@@ -82,11 +92,15 @@ class ProcessExportFiles(Subcommand):
         objectives = self._create_objectives_based_on_stimulus()
         perf_analyzer_config = self._create_perf_analyzer_config(objectives)
 
-        self._create_tokenizer()
-        self._create_artifact_directory(perf_analyzer_config)
+        if self._can_merge_sketches():
+            self._create_artifact_directory(perf_analyzer_config)
+            self._set_merged_statistics()
+        else:
+            self._create_tokenizer()
+            self._create_artifact_directory(perf_analyzer_config)
 
-        self._create_merged_profile_export_file(perf_analyzer_config)
-        self._set_data_parser(perf_analyzer_config)
+            self._create_merged_profile_export_file(perf_analyzer_config)
+            self._set_data_parser(perf_analyzer_config)
         self._set_telemetry_aggregator()
 
         self._add_output_to_artifact_directory(perf_analyzer_config, objectives)
@@ -95,7 +109,10 @@ class ProcessExportFiles(Subcommand):
         """
         Parse the input directory to find all valid subdirectories containing profile export files.
         Calls respective functions for parsing PA and GAP profile export files.
+        The PA profile export files are skipped when the GAP profile export
+        files have the sketches of the metrics to merge instead.
         """
+        profile_files: List[Tuple[Path, Path]] = []
         for subdir in input_directory.iterdir():
             if not subdir.is_dir():
                 continue
@@ -109,8 +126,14 @@ class ProcessExportFiles(Subcommand):
             )
 
             if pa_profile_file and gap_profile_file:
+                profile_files.append((pa_profile_file, gap_profile_file))
+
+        for _, gap_profile_file in profile_files:
+            self._process_gap_profile_file(gap_profile_file)
+
+        if not self._can_merge_sketches():
+            for pa_profile_file, _ in profile_files:
                 self._process_pa_profile_file(pa_profile_file)
-                self._process_gap_profile_file(gap_profile_file)
 
     def _process_pa_profile_file(self, pa_profile_file: Path) -> None:
         """
@@ -160,6 +183,13 @@ class ProcessExportFiles(Subcommand):
                         self._throughput_metrics_dict[metric].append(
                             gap_profile_data[metric]["avg"]
                         )
+                if "request_count" in gap_profile_data:
+                    self._request_counts.append(
+                        gap_profile_data["request_count"]["avg"]
+                    )
+                if "sketches" in gap_profile_data:
+                    self._sketch_dicts.append(gap_profile_data["sketches"])
+                self._has_sessions |= bool(gap_profile_data.get("sessions"))
                 telemetry_stats = gap_profile_data.get("telemetry_stats", {})
                 if telemetry_stats:
                     self._telemetry_dicts.append(telemetry_stats)
@@ -172,6 +202,58 @@ class ProcessExportFiles(Subcommand):
         except Exception as e:
             raise GenAIPerfException(f"Unexpected error: {e}")
 
+    def _can_merge_sketches(self) -> bool:
+        """
+        Whether the metrics can be merged from the sketches of the GAP profile
+        export files, without parsing the requests of the PA profile exports.
+        The goodput, SLO attainment, sessions, timeline and steady state all
+        need the requests.
+        """
+        num_profiles = len(self._throughput_metrics_dict["request_throughput"])
+        if not self._sketch_dicts or len(self._sketch_dicts) != num_profiles:
+            return False
+
+        input_config = self._input_config.get("input", {})
+        return not (
+            input_config.get("goodput")
+            or input_config.get("goodput_profiles")
+            or input_config.get("slo_attainment")
+            or self._has_sessions
+            or self._config.output.export_timeline
+            or self._config.output.steady_state_detection
+        )
+
+    def _set_merged_statistics(self) -> None:
+        """
+        Merges the sketches of every GAP profile export file into the
+        statistics of all the requests.
+        """
+        logger.info(
+            f"Merging the metric sketches of {len(self._sketch_dicts)} profiles"
+        )
+        metric_names = {name for sketches in self._sketch_dicts for name in sketches}
+        sketches = {
+            name: QuantileSketch.merge_all(
+                QuantileSketch.from_dict(sketch_dicts[name])
+                for sketch_dicts in self._sketch_dicts
+                if name in sketch_dicts
+            )
+            for name in metric_names
+        }
+
+        metrics = LLMMetrics(
+            request_throughputs=[
+                sum(self._throughput_metrics_dict["request_throughput"])
+            ],
+            output_token_throughputs=[
+                sum(self._throughput_metrics_dict["output_token_throughput"])
+            ],
+        )
+        metrics.request_count = [int(sum(self._request_counts))]
+        self._merged_statistics = Statistics.from_sketches(
+            metrics, sketches, self._config.output.percentiles
+        )
+
     def _update_config_from_profile_data(self) -> None:
         """
         Handles uninitialized config fields by loading them from profile data.
@@ -240,6 +322,24 @@ class ProcessExportFiles(Subcommand):
             tokenizer=self._tokenizer,  # type: ignore
             throughput_metrics_dict=self._throughput_metrics_dict,
             goodput_constraints=self._config.input.goodput,
+            goodput_profiles=self._config.input.goodput_profiles or {},
+            slo_attainment=self._config.input.slo_attainment,
+            slo_attainment_grid_size=self._config.input.slo_attainment_grid_size,
+            percentiles=self._config.output.percentiles,
+            stream_profile_export=self._config.output.stream_profile_export,
+            num_parse_workers=self._config.output.num_parse_workers,
+            tokenizer_batch_size=self._config.tokenizer.batch_size,
+            token_count_cache=get_token_count_cache(
+                self._config, self._tokenizer  # type: ignore
+            ),
+            cache_parsed_metrics=self._config.output.cache_parsed_metrics,
+            output_token_accounting=self._config.tokenizer.output_token_accounting,
+            use_server_token_counts=self._config.tokenizer.use_server_token_counts,
+            export_timeline=self._config.output.export_timeline,
+            timeline_bucket_size=self._config.output.timeline_bucket_size,
+            timeline_rolling_window=self._config.output.timeline_rolling_window,
+            steady_state_detection=self._config.output.steady_state_detection,
+            steady_state_tolerance=self._config.output.steady_state_tolerance,
         )
 
     def _set_telemetry_aggregator(self) -> None:
@@ -248,6 +348,24 @@ class ProcessExportFiles(Subcommand):
     def _create_telemetry_stats(self) -> TelemetryStatistics:
         return self._telemetry_aggregator.get_telemetry_stats()
 
+    def _create_perf_stats(
+        self,
+        perf_analyzer_config: PerfAnalyzerConfig,
+        objectives: ModelObjectiveParameters,
+    ) -> Statistics:
+        if self._merged_statistics is not None:
+            return self._merged_statistics
+        return super()._create_perf_stats(perf_analyzer_config, objectives)
+
+    def _create_session_stats(
+        self,
+        perf_analyzer_config: PerfAnalyzerConfig,
+        objectives: ModelObjectiveParameters,
+    ) -> Dict[str, Statistics]:
+        if self._merged_statistics is not None:
+            return {}
+        return super()._create_session_stats(perf_analyzer_config, objectives)
+
     def _add_output_to_artifact_directory(
         self,
         perf_analyzer_config: PerfAnalyzerConfig,
@@ -256,10 +374,18 @@ class ProcessExportFiles(Subcommand):
         perf_stats = self._create_perf_stats(perf_analyzer_config, objectives)
         telemetry_stats = self._create_telemetry_stats()
         session_stats = self._create_session_stats(perf_analyzer_config, objectives)
+        timeline = self._create_timeline(perf_analyzer_config, objectives)
+        steady_state_window = self._create_steady_state_window(
+            perf_analyzer_config, objectives
+        )
+        slo_attainment = self._create_slo_attainment(perf_analyzer_config, objectives)
         OutputReporter(
             perf_stats,
             telemetry_stats,
             self._config,
             perf_analyzer_config,
             session_stats,
+            timeline,
+            steady_state_window,
+            slo_attainment,
         ).report_output()
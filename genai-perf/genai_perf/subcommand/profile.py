@@ -24,15 +24,19 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
+import genai_perf.logging as logging
 from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.export_data.output_reporter import OutputReporter
-from genai_perf.plots.plot_config_parser import PlotConfigParser
-from genai_perf.plots.plot_manager import PlotManager
+from genai_perf.metrics import Statistics
+from genai_perf.profile_data_parser import LLMProfileDataParser
 from genai_perf.subcommand.subcommand import Subcommand
 
+logger = logging.getLogger(__name__)
+
 
 ###########################################################################
 # Profile Handler
@@ -58,6 +62,7 @@ class Profile(Subcommand):
 
     def __init__(self, config: ConfigCommand, extra_args: Optional[List[str]]) -> None:
         super().__init__(config, extra_args)
+        self._profile_export_file: Path = config.output.profile_export_file
 
     def profile(self) -> None:
         """
@@ -66,6 +71,7 @@ class Profile(Subcommand):
         objectives = self._create_objectives_based_on_stimulus()
         genai_perf_config = self._create_genai_perf_config(objectives)
         perf_analyzer_config = self._create_perf_analyzer_config(objectives)
+        self._profile_export_file = perf_analyzer_config.get_profile_export_file()
 
         if self._is_config_present_in_results(genai_perf_config, perf_analyzer_config):
             self._found_config_in_checkpoint(
@@ -89,13 +95,64 @@ class Profile(Subcommand):
             self._add_output_to_artifact_directory(perf_analyzer_config, objectives)
 
     def create_plots(self) -> None:
+        # Lazy import since the plots need pandas and plotly
+        from genai_perf.plots.plot_config_parser import PlotConfigParser
+        from genai_perf.plots.plot_manager import PlotManager
+
         # TMA-1911: support plots CLI option
         plot_dir = self._config.output.artifact_directory / "plots"
         PlotConfigParser.create_init_yaml_config(
-            filenames=[self._config.output.profile_export_file],  # single run
+            filenames=[self._profile_export_file],  # single run
             output_dir=plot_dir,
         )
-        config_parser = PlotConfigParser(plot_dir / "config.yaml")
+        config_parser = PlotConfigParser(
+            plot_dir / "config.yaml",
+            statistics=self._get_plot_statistics(),
+            tokenizer=self._tokenizer,
+        )
         plot_configs = config_parser.generate_configs(self._config)
-        plot_manager = PlotManager(plot_configs)
+        plot_manager = PlotManager(
+            plot_configs, static_images=self._config.output.plot_static_images
+        )
         plot_manager.generate_plots()
+        self._create_slo_attainment_plots(plot_dir)
+
+    def _get_plot_statistics(self) -> Dict[Path, Statistics]:
+        """
+        Returns the statistics of the profile export that was just parsed,
+        so that the plots do not parse it again
+        """
+        if not isinstance(self._data_parser, LLMProfileDataParser):
+            return {}
+
+        load_info = self._data_parser.get_profile_load_info()
+        if len(load_info) != 1:
+            return {}
+        infer_mode, load_level = load_info[0]
+        return {
+            self._profile_export_file: self._data_parser.get_statistics(
+                infer_mode, load_level
+            )
+        }
+
+    def _create_slo_attainment_plots(self, plot_dir: Path) -> None:
+        if not self._config.input.slo_attainment or self._data_parser is None:
+            return
+
+        from genai_perf.plots.slo_attainment_plot import SLOAttainmentPlot
+
+        for infer_mode, load_level in self._data_parser.get_profile_load_info():
+            slo_attainment = self._data_parser.get_slo_attainment(
+                infer_mode, load_level
+            )
+            if slo_attainment is None:
+                continue
+
+            logger.info("Generating 'SLO Attainment' plot")
+            SLOAttainmentPlot(
+                slo_attainment, static_images=self._config.output.plot_static_images
+            ).create_plot(
+                graph_title="SLO Attainment",
+                filename_root="slo_attainment",
+                output_dir=plot_dir,
+            )
@@ -30,11 +30,12 @@ from genai_perf.config.run.run_config import RunConfig
 from genai_perf.constants import DEFAULT_TRITON_METRICS_URL
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.export_data.output_reporter import OutputReporter
+from genai_perf.goodput_calculator import SLOAttainment
 from genai_perf.inputs.input_constants import OutputFormat, PromptSource
 from genai_perf.inputs.inputs import Inputs
 from genai_perf.inputs.inputs_config import InputsConfig
 from genai_perf.measurements.run_config_measurement import RunConfigMeasurement
-from genai_perf.metrics import Statistics
+from genai_perf.metrics import Statistics, SteadyStateWindow, Timeline
 from genai_perf.metrics.telemetry_metrics import TelemetryMetrics
 from genai_perf.metrics.telemetry_statistics import TelemetryStatistics
 from genai_perf.profile_data_parser import (
@@ -46,6 +47,7 @@ from genai_perf.telemetry_data.triton_telemetry_data_collector import (
     TelemetryDataCollector,
     TritonTelemetryDataCollector,
 )
+from genai_perf.token_count_cache import get_token_count_cache
 from genai_perf.tokenizer import Tokenizer, get_tokenizer
 from genai_perf.types import GpuRecords, ModelObjectiveParameters, PerfRecords
 from genai_perf.utils import remove_file
@@ -271,7 +273,9 @@ class Subcommand:
     def _create_merged_telemetry_stats(self) -> TelemetryStatistics:
         telemetry_metrics_list = self._create_telemetry_metrics_list()
         merged_telemetry_metrics = self._merge_telemetry_metrics(telemetry_metrics_list)
-        telemetry_stats = TelemetryStatistics(merged_telemetry_metrics)
+        telemetry_stats = TelemetryStatistics(
+            merged_telemetry_metrics, self._config.output.percentiles
+        )
 
         return telemetry_stats
 
@@ -345,6 +349,45 @@ class Subcommand:
 
         return session_stats
 
+    def _create_timeline(
+        self,
+        perf_analyzer_config: PerfAnalyzerConfig,
+        objectives: ModelObjectiveParameters,
+    ) -> Optional[Timeline]:
+        if not self._config.output.export_timeline:
+            return None
+
+        infer_mode, load_level = self._determine_infer_mode_and_load_level(objectives)
+        timeline = self._data_parser.get_timeline(infer_mode, load_level)  # type: ignore
+
+        return timeline
+
+    def _create_steady_state_window(
+        self,
+        perf_analyzer_config: PerfAnalyzerConfig,
+        objectives: ModelObjectiveParameters,
+    ) -> Optional[SteadyStateWindow]:
+        if not self._config.output.steady_state_detection:
+            return None
+
+        infer_mode, load_level = self._determine_infer_mode_and_load_level(objectives)
+        window = self._data_parser.get_steady_state_window(infer_mode, load_level)  # type: ignore
+
+        return window
+
+    def _create_slo_attainment(
+        self,
+        perf_analyzer_config: PerfAnalyzerConfig,
+        objectives: ModelObjectiveParameters,
+    ) -> Optional[SLOAttainment]:
+        if not self._config.input.slo_attainment:
+            return None
+
+        infer_mode, load_level = self._determine_infer_mode_and_load_level(objectives)
+        slo_attainment = self._data_parser.get_slo_attainment(infer_mode, load_level)  # type: ignore
+
+        return slo_attainment
+
     ###########################################################################
     # Metrics/Statistics Methods
     ###########################################################################
@@ -356,6 +399,11 @@ class Subcommand:
             return ProfileDataParser(
                 perf_analyzer_config.get_profile_export_file(),
                 goodput_constraints=self._config.input.goodput,
+                goodput_profiles=self._config.input.goodput_profiles or {},
+                slo_attainment=self._config.input.slo_attainment,
+                slo_attainment_grid_size=self._config.input.slo_attainment_grid_size,
+                percentiles=self._config.output.percentiles,
+                stream_profile_export=self._config.output.stream_profile_export,
             )
         elif self._config.endpoint.type in [
             "embeddings",
@@ -366,17 +414,45 @@ class Subcommand:
             return ProfileDataParser(
                 perf_analyzer_config.get_profile_export_file(),
                 goodput_constraints=self._config.input.goodput,
+                goodput_profiles=self._config.input.goodput_profiles or {},
+                slo_attainment=self._config.input.slo_attainment,
+                slo_attainment_grid_size=self._config.input.slo_attainment_grid_size,
+                percentiles=self._config.output.percentiles,
+                stream_profile_export=self._config.output.stream_profile_export,
             )
         elif self._config.endpoint.type == "image_retrieval":
             return ImageRetrievalProfileDataParser(
                 perf_analyzer_config.get_profile_export_file(),
                 goodput_constraints=self._config.input.goodput,
+                goodput_profiles=self._config.input.goodput_profiles or {},
+                slo_attainment=self._config.input.slo_attainment,
+                slo_attainment_grid_size=self._config.input.slo_attainment_grid_size,
+                percentiles=self._config.output.percentiles,
+                stream_profile_export=self._config.output.stream_profile_export,
             )
         else:
             return LLMProfileDataParser(
                 filename=perf_analyzer_config.get_profile_export_file(),
                 tokenizer=self._tokenizer,  # type: ignore
                 goodput_constraints=self._config.input.goodput,
+                goodput_profiles=self._config.input.goodput_profiles or {},
+                slo_attainment=self._config.input.slo_attainment,
+                slo_attainment_grid_size=self._config.input.slo_attainment_grid_size,
+                percentiles=self._config.output.percentiles,
+                stream_profile_export=self._config.output.stream_profile_export,
+                num_parse_workers=self._config.output.num_parse_workers,
+                tokenizer_batch_size=self._config.tokenizer.batch_size,
+                token_count_cache=get_token_count_cache(
+                    self._config, self._tokenizer  # type: ignore
+                ),
+                cache_parsed_metrics=self._config.output.cache_parsed_metrics,
+                output_token_accounting=self._config.tokenizer.output_token_accounting,
+                use_server_token_counts=self._config.tokenizer.use_server_token_counts,
+                export_timeline=self._config.output.export_timeline,
+                timeline_bucket_size=self._config.output.timeline_bucket_size,
+                timeline_rolling_window=self._config.output.timeline_rolling_window,
+                steady_state_detection=self._config.output.steady_state_detection,
+                steady_state_tolerance=self._config.output.steady_state_tolerance,
             )
 
     def _merge_telemetry_metrics(
@@ -421,6 +497,11 @@ class Subcommand:
         perf_stats = self._create_perf_stats(perf_analyzer_config, objectives)
         merged_telemetry_stats = self._create_merged_telemetry_stats()
         session_stats = self._create_session_stats(perf_analyzer_config, objectives)
+        timeline = self._create_timeline(perf_analyzer_config, objectives)
+        steady_state_window = self._create_steady_state_window(
+            perf_analyzer_config, objectives
+        )
+        slo_attainment = self._create_slo_attainment(perf_analyzer_config, objectives)
 
         OutputReporter(
             perf_stats,
@@ -428,6 +509,9 @@ class Subcommand:
             self._config,
             perf_analyzer_config,
             session_stats,
+            timeline,
+            steady_state_window,
+            slo_attainment,
         ).report_output()
 
     ###########################################################################
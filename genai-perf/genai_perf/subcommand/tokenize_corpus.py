@@ -0,0 +1,60 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import List, Optional
+
+import genai_perf.logging as logging
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.tokenized_corpus_cache import write_tokenized_corpus
+from genai_perf.tokenizer import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+
+def tokenize_corpus_handler(
+    config: ConfigCommand, extra_args: Optional[List[str]] = None
+) -> None:
+    """
+    Handles `tokenize-corpus` subcommand workflow
+    """
+    if not config.tokenizer.name:
+        raise GenAIPerfException(
+            "The tokenize-corpus subcommand requires --tokenizer, which must "
+            "match the tokenizer of the model that is profiled."
+        )
+
+    tokenizer = get_tokenizer(config)
+    num_tokens = write_tokenized_corpus(
+        tokenizer,
+        config.input.synthetic_tokens.corpus,
+        config.tokenized_corpus_filename,
+        config.tokenizer.batch_size,
+    )
+    logger.info(
+        f"Wrote the {num_tokens} tokens of {config.input.synthetic_tokens.corpus} "
+        f"to {config.tokenized_corpus_filename}"
+    )
@@ -32,7 +32,6 @@ from abc import ABC, abstractmethod
 from threading import Event, Thread
 from typing import Optional
 
-import requests
 from genai_perf.metrics import TelemetryMetrics, TelemetryStatistics
 
 
@@ -47,6 +46,9 @@ class TelemetryDataCollector(ABC):
         self._thread: Optional[Thread] = None
 
     def is_url_reachable(self) -> bool:
+        # Lazy import since only the telemetry collection needs requests
+        import requests
+
         timeout_seconds = 5
         if self._server_metrics_url:
             try:
@@ -77,6 +79,8 @@ class TelemetryDataCollector(ABC):
         return telemetry_stats
 
     def _fetch_metrics(self) -> str:
+        import requests
+
         response = requests.get(self._server_metrics_url, timeout=5)
         response.raise_for_status()
         return response.text
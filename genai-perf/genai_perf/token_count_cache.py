@@ -0,0 +1,242 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.logging import logging
+
+if TYPE_CHECKING:
+    from genai_perf.tokenizer import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+TOKEN_COUNT_CACHE_FILE = "token_counts.sqlite3"
+
+# Bump when the way the token counts are computed changes, so that the
+# counts cached by older versions are not reused.
+TOKEN_COUNT_CACHE_VERSION = 1
+
+# Once full, the cache evicts this fraction of its entries at a time, so that
+# the entries are only counted again after that many new texts.
+_EVICTION_FRACTION = 0.1
+
+# Stay below the SQLite limit on the number of host parameters in a query.
+_MAX_QUERY_PARAMS = 500
+
+
+class TokenCountCache:
+    """
+    A persistent cache of the number of tokens of a text, shared across runs.
+
+    The token counts are stored in a SQLite database, keyed by the identity
+    of the tokenizer and the hash of the text. The least recently used
+    entries are evicted once the cache holds more than max_entries texts.
+    The tokenizer identity may be given as a function, which is only called
+    once the cache is used, so that a lazy tokenizer is not loaded just to
+    create the cache.
+    The cache can be pickled, so that each worker process opens its own
+    connection to the same database.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        tokenizer_id: Union[str, Callable[[], str]],
+        max_entries: int,
+    ) -> None:
+        self._path = Path(path)
+        self._tokenizer_id_source = tokenizer_id
+        self._key: Optional[str] = None
+        self._max_entries = max_entries
+        self._connection: Optional[sqlite3.Connection] = None
+        self._num_entries = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+    @property
+    def _tokenizer_id(self) -> str:
+        if self._key is None:
+            tokenizer_id = self._tokenizer_id_source
+            if callable(tokenizer_id):
+                tokenizer_id = tokenizer_id()
+            self._key = f"v{TOKEN_COUNT_CACHE_VERSION}:{tokenizer_id}"
+        return self._key
+
+    def get(self, texts: Sequence[str]) -> List[Optional[int]]:
+        """
+        Return the cached token count of each text, or None if not cached.
+        """
+        connection = self._connect()
+        hashes = [self._hash(text) for text in texts]
+        cached: Dict[bytes, int] = {}
+        now = int(time.time())
+        with connection:
+            for i in range(0, len(hashes), _MAX_QUERY_PARAMS):
+                chunk = hashes[i : i + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    "SELECT text_hash, token_count FROM token_counts "
+                    f"WHERE tokenizer = ? AND text_hash IN ({placeholders})",
+                    (self._tokenizer_id, *chunk),
+                ).fetchall()
+                if rows:
+                    placeholders = ",".join("?" * len(rows))
+                    connection.execute(
+                        "UPDATE token_counts SET last_used = ? "
+                        f"WHERE tokenizer = ? AND text_hash IN ({placeholders})",
+                        (now, self._tokenizer_id, *(h for h, _ in rows)),
+                    )
+                cached.update(rows)
+
+        token_counts = [cached.get(h) for h in hashes]
+        num_hits = len(token_counts) - token_counts.count(None)
+        self.hits += num_hits
+        self.misses += len(token_counts) - num_hits
+        return token_counts
+
+    def put(self, texts: Sequence[str], token_counts: Sequence[int]) -> None:
+        """
+        Store the token count of each text, evicting the least recently
+        used entries if the cache grows beyond max_entries.
+        """
+        connection = self._connect()
+        now = int(time.time())
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO token_counts VALUES (?, ?, ?, ?)",
+                (
+                    (self._tokenizer_id, self._hash(text), count, now)
+                    for text, count in zip(texts, token_counts)
+                ),
+            )
+        self._num_entries += len(texts)
+        if self._num_entries > self._max_entries:
+            self._evict()
+
+    def pop_stats(self) -> Tuple[int, int]:
+        """
+        Return the number of hits and misses since the last call.
+        """
+        stats = (self.hits, self.misses)
+        self.hits, self.misses = 0, 0
+        return stats
+
+    def log_stats(self) -> None:
+        hits, misses = self.pop_stats()
+        total = hits + misses
+        if total:
+            logger.info(
+                f"Token count cache: {hits} hits, {misses} misses "
+                f"({hits / total:.1%} hit rate) in {self._path}"
+            )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Wait for the other processes sharing the cache to finish writing
+            connection = sqlite3.connect(self._path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS token_counts ("
+                    "tokenizer TEXT NOT NULL, "
+                    "text_hash BLOB NOT NULL, "
+                    "token_count INTEGER NOT NULL, "
+                    "last_used INTEGER NOT NULL, "
+                    "PRIMARY KEY (tokenizer, text_hash)) WITHOUT ROWID"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS token_counts_last_used "
+                    "ON token_counts (last_used)"
+                )
+            self._connection = connection
+            self._num_entries = self._count_entries()
+        return self._connection
+
+    def _count_entries(self) -> int:
+        assert self._connection is not None
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM token_counts"
+        ).fetchone()
+        return count
+
+    def _evict(self) -> None:
+        # The entry count is only an estimate when the cache is shared with
+        # other processes, so count the entries again before evicting.
+        connection = self._connect()
+        num_entries = self._count_entries()
+        if num_entries > self._max_entries:
+            # Evict down to a low-water mark below max_entries
+            low_water_mark = self._max_entries - int(
+                self._max_entries * _EVICTION_FRACTION
+            )
+            num_evicted = num_entries - low_water_mark
+            with connection:
+                connection.execute(
+                    "DELETE FROM token_counts WHERE (tokenizer, text_hash) IN "
+                    "(SELECT tokenizer, text_hash FROM token_counts "
+                    "ORDER BY last_used LIMIT ?)",
+                    (num_evicted,),
+                )
+            logger.debug(f"Evicted {num_evicted} entries from the token count cache")
+            num_entries = low_water_mark
+        self._num_entries = num_entries
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+
+def get_token_count_cache(
+    config: ConfigCommand, tokenizer: "Tokenizer"
+) -> Optional[TokenCountCache]:
+    """
+    Return the token count cache for the tokenizer, if enabled
+    """
+    if config.tokenizer.count_cache_dir is None:
+        return None
+
+    return TokenCountCache(
+        Path(config.tokenizer.count_cache_dir) / TOKEN_COUNT_CACHE_FILE,
+        tokenizer_id=tokenizer.get_identifier,
+        max_entries=config.tokenizer.count_cache_size,
+    )
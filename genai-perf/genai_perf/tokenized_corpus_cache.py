@@ -0,0 +1,244 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.config.input.config_defaults import TokenizerDefaults
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.logging import logging
+from genai_perf.tokenizer import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+# Bump when the way the corpus is tokenized changes, so that the tokens
+# cached by older versions are not reused.
+TOKENIZED_CORPUS_CACHE_VERSION = 2
+
+# The size of the blocks read when hashing the corpus file
+_HASH_BLOCK_SIZE = 1 << 20
+
+# The number of lines of a corpus file joined into each tokenized text
+CORPUS_LINES_PER_TEXT = 100
+
+
+def get_tokenizer_info_path(path: Path) -> Path:
+    """
+    Return the path of the file recording the tokenizer of a corpus written
+    by write_tokenized_corpus
+    """
+    path = Path(path)
+    return path.with_name(f"{path.name}.json")
+
+
+def load_tokenized_corpus(path: Path, tokenizer_id: Optional[str] = None) -> np.ndarray:
+    """
+    Return the tokens of a corpus written by write_tokenized_corpus,
+    memory-mapped read-only.
+
+    When tokenizer_id is given, it must match the tokenizer that wrote the
+    corpus, since the tokens of another tokenizer decode into nonsense.
+    """
+    tokens = np.load(path, mmap_mode="r")
+    if tokens.ndim != 1 or tokens.dtype != np.int32:
+        raise GenAIPerfException(
+            f"{path} is not a tokenized corpus: expected a one dimensional int32 "
+            f"array but got a {tokens.ndim} dimensional {tokens.dtype} array."
+        )
+    if len(tokens) == 0:
+        raise GenAIPerfException(f"The tokenized corpus {path} has no tokens.")
+
+    if tokenizer_id is not None:
+        info_path = get_tokenizer_info_path(path)
+        if not info_path.exists():
+            logger.warning(
+                f"Cannot check that {path} was tokenized with {tokenizer_id}, "
+                f"since {info_path} does not exist."
+            )
+        else:
+            with open(info_path, "r") as f:
+                corpus_tokenizer_id = json.load(f).get("tokenizer")
+            if corpus_tokenizer_id != tokenizer_id:
+                raise GenAIPerfException(
+                    f"{path} was tokenized with {corpus_tokenizer_id}, but the "
+                    f"tokenizer is {tokenizer_id}. Run tokenize-corpus again "
+                    "with the tokenizer of the profiled model."
+                )
+    return tokens
+
+
+def tokenize_corpus(
+    tokenizer: Tokenizer,
+    corpus_path: Path,
+    batch_size: int = TokenizerDefaults.BATCH_SIZE,
+) -> np.ndarray:
+    """
+    Return the tokens of a text corpus as an int32 array, tokenizing the
+    corpus in batches while it is read.
+    """
+    batches = list(_tokenize_corpus_batches(tokenizer, corpus_path, batch_size))
+    return np.concatenate(batches) if batches else np.zeros(0, dtype=np.int32)
+
+
+def write_tokenized_corpus(
+    tokenizer: Tokenizer,
+    corpus_path: Path,
+    output_path: Path,
+    batch_size: int = TokenizerDefaults.BATCH_SIZE,
+) -> int:
+    """
+    Tokenize a text corpus and write its tokens to output_path as an int32
+    .npy array, returning the number of tokens. The identifier of the
+    tokenizer is recorded next to it, in the file named by
+    get_tokenizer_info_path.
+
+    The tokens of each batch are appended to a temporary file as they come,
+    so the memory use does not grow with the size of the corpus.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    num_tokens = 0
+    with tempfile.TemporaryFile(dir=output_path.parent) as raw_file:
+        for tokens in _tokenize_corpus_batches(tokenizer, corpus_path, batch_size):
+            tokens.tofile(raw_file)
+            num_tokens += len(tokens)
+        raw_file.flush()
+
+        if num_tokens:
+            _save_atomically(output_path, np.memmap(raw_file, dtype=np.int32, mode="r"))
+        else:
+            _save_atomically(output_path, np.zeros(0, dtype=np.int32))
+
+    with open(get_tokenizer_info_path(output_path), "w") as f:
+        json.dump({"tokenizer": tokenizer.get_identifier()}, f)
+    return num_tokens
+
+
+def _tokenize_corpus_batches(
+    tokenizer: Tokenizer, corpus_path: Path, batch_size: int
+) -> Iterator[np.ndarray]:
+    """
+    Yield the tokens of batches of texts of CORPUS_LINES_PER_TEXT lines of
+    the corpus, read one line at a time.
+    """
+    texts: List[str] = []
+    lines: List[str] = []
+    with open(corpus_path, "r") as f:
+        for line in f:
+            if line.strip():
+                lines.append(line.strip())
+            if len(lines) == CORPUS_LINES_PER_TEXT:
+                texts.append(" ".join(lines))
+                lines = []
+            if len(texts) == batch_size:
+                yield _tokenize_texts(tokenizer, texts)
+                texts = []
+    if lines:
+        texts.append(" ".join(lines))
+    if texts:
+        yield _tokenize_texts(tokenizer, texts)
+
+
+def _tokenize_texts(tokenizer: Tokenizer, texts: List[str]) -> np.ndarray:
+    input_ids = tokenizer(texts)["input_ids"]
+    return np.fromiter(
+        (token for ids in input_ids for token in ids),
+        dtype=np.int32,
+        count=sum(len(ids) for ids in input_ids),
+    )
+
+
+def _save_atomically(path: Path, tokens: np.ndarray) -> None:
+    # Write to a temporary file first, so that the processes reading the
+    # file never see a partially written array.
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, tokens)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class TokenizedCorpusCache:
+    """
+    A persistent cache of the tokens of a text corpus, shared across runs.
+
+    The tokens of each corpus are stored as an int32 NumPy array in a .npy
+    file, named after the identity of the tokenizer and the hash of the
+    corpus file. Later runs memory-map the file instead of tokenizing the
+    corpus again, so the processes using the same corpus share its pages.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = Path(cache_dir)
+
+    def get_path(self, corpus_path: Path, tokenizer_id: str) -> Path:
+        """
+        Return the path of the cached tokens of the corpus
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"v{TOKENIZED_CORPUS_CACHE_VERSION}:{tokenizer_id}:".encode())
+        with open(corpus_path, "rb") as f:
+            while block := f.read(_HASH_BLOCK_SIZE):
+                key.update(block)
+        return self._cache_dir / f"corpus-{key.hexdigest()}.npy"
+
+    def load(self, corpus_path: Path, tokenizer_id: str) -> Optional[np.ndarray]:
+        """
+        Return the cached tokens of the corpus memory-mapped read-only, or
+        None if not cached.
+        """
+        path = self.get_path(corpus_path, tokenizer_id)
+        if not path.exists():
+            return None
+
+        try:
+            tokens = load_tokenized_corpus(path)
+        except (OSError, ValueError, GenAIPerfException) as e:
+            logger.warning(f"Ignoring the invalid tokenized corpus {path}: {e}")
+            return None
+        logger.info(f"Loaded the tokenized corpus from {path}")
+        return tokens
+
+    def save(
+        self, corpus_path: Path, tokenizer_id: str, tokens: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Store the tokens of the corpus and return them memory-mapped.
+        """
+        path = self.get_path(corpus_path, tokenizer_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _save_atomically(path, np.asarray(tokens, dtype=np.int32))
+        logger.info(f"Saved the tokenized corpus to {path}")
+        return load_tokenized_corpus(path)
+
+
+def get_tokenized_corpus_cache(
+    config: ConfigCommand,
+) -> Optional[TokenizedCorpusCache]:
+    """
+    Return the tokenized corpus cache, if enabled
+    """
+    if config.tokenizer.corpus_cache_dir is None:
+        return None
+
+    return TokenizedCorpusCache(Path(config.tokenizer.corpus_cache_dir))
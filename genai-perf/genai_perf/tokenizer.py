@@ -14,15 +14,157 @@
 
 import contextlib
 import io
-from typing import TYPE_CHECKING, List
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 # Use TYPE_CHECKING to import BatchEncoding only during static type checks
 if TYPE_CHECKING:
     from transformers import BatchEncoding
 
 
+import genai_perf.logging as logging
 from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.config.input.config_defaults import TokenizerDefaults
 from genai_perf.exceptions import GenAIPerfException
+from genai_perf.inputs.input_constants import TokenizerBackend
+
+logger = logging.getLogger(__name__)
+
+
+class FastBatchEncoding:
+    """
+    The token ids, and optionally the token offsets, of a batch of texts,
+    indexed like the BatchEncoding of transformers
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+
+class FastTokenizer:
+    """
+    A tokenizer loaded from a tokenizer.json with the tokenizers library,
+    without importing transformers.
+
+    It covers the encode, decode, batched calls and special token ids that
+    genai-perf uses. Any other attribute, such as apply_chat_template, is
+    taken from the transformers tokenizer returned by load_fallback, which is
+    only loaded on its first use.
+    """
+
+    # The replacements of clean_up_tokenization in transformers
+    CLEAN_UP_REPLACEMENTS = [
+        (" .", "."),
+        (" ?", "?"),
+        (" !", "!"),
+        (" ,", ","),
+        (" ' ", "'"),
+        (" n't", "n't"),
+        (" 'm", "'m"),
+        (" 's", "'s"),
+        (" 've", "'ve"),
+        (" 're", "'re"),
+    ]
+
+    def __init__(
+        self,
+        tokenizer_file: Path,
+        config: Dict[str, Any],
+        load_fallback: Callable[[], Any],
+    ) -> None:
+        from tokenizers import Tokenizer as RustTokenizer
+
+        self._tokenizer = RustTokenizer.from_file(str(tokenizer_file))
+        self._clean_up_tokenization_spaces = config.get(
+            "clean_up_tokenization_spaces", False
+        )
+        self.bos_token_id = self._get_token_id(config.get("bos_token"))
+        self.eos_token_id = self._get_token_id(config.get("eos_token"))
+        self.is_fast = True
+        self._load_fallback = load_fallback
+        self._fallback: Optional[Any] = None
+
+    def _get_token_id(self, token: Any) -> Optional[int]:
+        # The special tokens of the tokenizer config are either the token
+        # or a dict of the token and its properties
+        if isinstance(token, dict):
+            token = token.get("content")
+        if not isinstance(token, str):
+            return None
+        return self._tokenizer.token_to_id(token)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        if self._fallback is None:
+            logger.debug(f"Loading the transformers tokenizer for '{name}'")
+            self._fallback = self._load_fallback()
+        return getattr(self._fallback, name)
+
+    def __call__(
+        self,
+        text,
+        add_special_tokens: bool = True,
+        return_offsets_mapping: bool = False,
+    ) -> FastBatchEncoding:
+        if isinstance(text, str):
+            encodings = [
+                self._tokenizer.encode(text, add_special_tokens=add_special_tokens)
+            ]
+        else:
+            encodings = self._tokenizer.encode_batch(
+                list(text), add_special_tokens=add_special_tokens
+            )
+
+        data: Dict[str, Any] = {"input_ids": [e.ids for e in encodings]}
+        if return_offsets_mapping:
+            data["offset_mapping"] = [e.offsets for e in encodings]
+        if isinstance(text, str):
+            data = {key: value[0] for key, value in data.items()}
+        return FastBatchEncoding(data)
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> List[int]:
+        return self._tokenizer.encode(text, add_special_tokens=add_special_tokens).ids
+
+    def decode(
+        self,
+        token_ids: List[int],
+        skip_special_tokens: bool = False,
+        clean_up_tokenization_spaces: Optional[bool] = None,
+    ) -> str:
+        text = self._tokenizer.decode(
+            list(token_ids), skip_special_tokens=skip_special_tokens
+        )
+        return self._clean_up(text, clean_up_tokenization_spaces)
+
+    def batch_decode(
+        self,
+        sequences: List[List[int]],
+        skip_special_tokens: bool = False,
+        clean_up_tokenization_spaces: Optional[bool] = None,
+    ) -> List[str]:
+        texts = self._tokenizer.decode_batch(
+            [list(token_ids) for token_ids in sequences],
+            skip_special_tokens=skip_special_tokens,
+        )
+        return [self._clean_up(text, clean_up_tokenization_spaces) for text in texts]
+
+    def _clean_up(self, text: str, clean_up_tokenization_spaces: Optional[bool]) -> str:
+        if clean_up_tokenization_spaces is None:
+            clean_up_tokenization_spaces = self._clean_up_tokenization_spaces
+        if clean_up_tokenization_spaces:
+            for old, new in self.CLEAN_UP_REPLACEMENTS:
+                text = text.replace(old, new)
+        return text
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(vocab_size={self._tokenizer.get_vocab_size()})"
 
 
 class Tokenizer:
@@ -39,11 +181,102 @@ class Tokenizer:
         self._call_args = {"add_special_tokens": False}
         self._encode_args = {"add_special_tokens": False}
         self._decode_args = {"skip_special_tokens": True}
+        self._name = ""
+        self._revision = ""
+        self._trust_remote_code = False
+        self._backend = TokenizerDefaults.BACKEND
+
+    def __getattr__(self, name: str) -> Any:
+        # Load a lazily set tokenizer on its first use
+        if name == "_tokenizer" and self.__dict__.get("_name"):
+            self._load_tokenizer()
+            return self.__dict__["_tokenizer"]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
-    def set_tokenizer(self, name: str, trust_remote_code: bool, revision: str) -> None:
+    def set_tokenizer(
+        self,
+        name: str,
+        trust_remote_code: bool,
+        revision: str,
+        lazy: bool = False,
+        backend: TokenizerBackend = TokenizerDefaults.BACKEND,
+    ) -> None:
         """
-        Downloading the tokenizer from Huggingface.co or local filesystem
+        Downloading the tokenizer from Huggingface.co or local filesystem.
+        A lazy tokenizer is only downloaded when it is first used.
         """
+        self._name = name
+        self._revision = revision
+        self._trust_remote_code = trust_remote_code
+        self._backend = backend
+        if not lazy:
+            self._load_tokenizer()
+
+    def _load_tokenizer(self) -> None:
+        if self._backend == TokenizerBackend.TOKENIZERS:
+            if self._trust_remote_code:
+                logger.info(
+                    "Loading the tokenizer with transformers, since it needs "
+                    "trust_remote_code"
+                )
+            else:
+                tokenizer = self._load_fast_tokenizer()
+                if tokenizer is not None:
+                    self._tokenizer = tokenizer
+                    self._loaded_backend = TokenizerBackend.TOKENIZERS
+                    return
+        self._tokenizer = self._load_transformers_tokenizer()
+        self._loaded_backend = TokenizerBackend.TRANSFORMERS
+
+    def _load_fast_tokenizer(self) -> Optional[FastTokenizer]:
+        """
+        Load the tokenizer.json of the tokenizer, from its directory or from
+        the Huggingface cache, with the tokenizers library.
+
+        Returns
+        -------
+        The FastTokenizer, or None if the tokenizer has no tokenizer.json
+        """
+        try:
+            if Path(self._name).is_dir():
+                tokenizer_file = Path(self._name) / "tokenizer.json"
+                config_file: Optional[Path] = Path(self._name) / "tokenizer_config.json"
+                if not tokenizer_file.is_file():
+                    raise FileNotFoundError(tokenizer_file)
+            else:
+                from huggingface_hub import hf_hub_download
+
+                tokenizer_file = Path(
+                    hf_hub_download(
+                        self._name, "tokenizer.json", revision=self._revision
+                    )
+                )
+                try:
+                    config_file = Path(
+                        hf_hub_download(
+                            self._name, "tokenizer_config.json", revision=self._revision
+                        )
+                    )
+                except Exception:
+                    config_file = None
+
+            config: Dict[str, Any] = {}
+            if config_file is not None and config_file.is_file():
+                with open(config_file, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+            return FastTokenizer(
+                tokenizer_file, config, self._load_transformers_tokenizer
+            )
+        except Exception as e:
+            logger.info(
+                f"Loading the tokenizer with transformers, since its "
+                f"tokenizer.json could not be loaded: {e}"
+            )
+            return None
+
+    def _load_transformers_tokenizer(self) -> Any:
         try:
             # Silence tokenizer warning on import and first use
             with contextlib.redirect_stdout(
@@ -54,11 +287,13 @@ class Tokenizer:
 
                 token_logger.set_verbosity_error()
                 tokenizer = AutoTokenizer.from_pretrained(
-                    name, trust_remote_code=trust_remote_code, revision=revision
+                    self._name,
+                    trust_remote_code=self._trust_remote_code,
+                    revision=self._revision,
                 )
         except Exception as e:
             raise GenAIPerfException(e)
-        self._tokenizer = tokenizer
+        return tokenizer
 
     def __call__(self, text, **kwargs) -> "BatchEncoding":
         return self._tokenizer(text, **{**self._call_args, **kwargs})
@@ -69,9 +304,34 @@ class Tokenizer:
     def decode(self, token_ids, **kwargs) -> str:
         return self._tokenizer.decode(token_ids, **{**self._decode_args, **kwargs})
 
+    def batch_decode(self, sequences, **kwargs) -> List[str]:
+        return self._tokenizer.batch_decode(
+            sequences, **{**self._decode_args, **kwargs}
+        )
+
     def bos_token_id(self) -> int:
         return self._tokenizer.bos_token_id
 
+    def is_fast(self) -> bool:
+        """
+        Return whether the tokenizer is a fast (Rust) tokenizer, which
+        supports returning the token offsets
+        """
+        return getattr(self._tokenizer, "is_fast", False)
+
+    def get_identifier(self) -> str:
+        """
+        Return the name, revision and loaded backend that identify the
+        tokenizer. The backends may count tokens differently, and the
+        tokenizers backend falls back to transformers, so the backend is
+        the one that was loaded, which loads a lazy tokenizer.
+        """
+        if not self._name:
+            return f"{self._name}@{self._revision}"
+        if "_tokenizer" not in self.__dict__:
+            self._load_tokenizer()
+        return f"{self._name}@{self._revision}:{self._loaded_backend.name.lower()}"
+
     def __repr__(self) -> str:
         return self._tokenizer.__repr__()
 
@@ -92,6 +352,9 @@ def get_tokenizer(config: ConfigCommand) -> Tokenizer:
         config.tokenizer.name,
         config.tokenizer.trust_remote_code,
         config.tokenizer.revision,
+        # The server token counts may make the tokenizer unnecessary
+        lazy=config.tokenizer.use_server_token_counts,
+        backend=config.tokenizer.backend,
     )
 
     return tokenizer
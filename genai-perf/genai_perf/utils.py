@@ -27,7 +27,7 @@
 import random
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
 import genai_perf.logging as logging
 import orjson
@@ -35,12 +35,15 @@ import orjson
 # Skip type checking to avoid mypy error
 # Issue: https://github.com/python/mypy/issues/10632
 import yaml  # type: ignore
-from PIL import Image
+
+# Use TYPE_CHECKING to import PIL only during static type checks
+if TYPE_CHECKING:
+    from PIL import Image
 
 logger = logging.getLogger(__name__)
 
 
-def encode_image(img: Image, format: str):
+def encode_image(img: "Image", format: str):
     """Encodes an image into base64 encoding."""
     # Lazy import for vision related endpoints
     import base64
@@ -40,7 +40,10 @@ from genai_perf.inputs.input_constants import (
     ImageFormat,
     ModelSelectionStrategy,
     OutputFormat,
+    OutputTokenAccounting,
     PromptSource,
+    Subcommand,
+    TokenizerBackend,
 )
 from genai_perf.subcommand.common import get_extra_inputs_as_dict
 
@@ -289,6 +292,16 @@ class TestCLIArguments:
                 {"measurement_interval": 100},
                 {"perf_analyzer.measurement.num": 100},
             ),
+            (
+                ["--plot-static-images"],
+                {"plot_static_images": True},
+                {"output.plot_static_images": True},
+            ),
+            (
+                ["--plot-max-points", "1000"],
+                {"plot_max_points": 1000},
+                {"output.plot_max_points": 1000},
+            ),
             (
                 ["--profile-export-file", "test.json"],
                 {"profile_export_file": Path("test.json")},
@@ -376,6 +389,81 @@ class TestCLIArguments:
                 {"stability_percentage": 99.5},
                 {"perf_analyzer.stability_percentage": 99.5},
             ),
+            (
+                ["--tokenizer-batch-size", "64"],
+                {"tokenizer_batch_size": 64},
+                {"tokenizer.batch_size": 64},
+            ),
+            (
+                ["--tokenizer-count-cache-dir", "cache"],
+                {"tokenizer_count_cache_dir": Path("cache")},
+                {"tokenizer.count_cache_dir": Path("cache")},
+            ),
+            (
+                ["--tokenizer-count-cache-size", "1000"],
+                {"tokenizer_count_cache_size": 1000},
+                {"tokenizer.count_cache_size": 1000},
+            ),
+            (
+                ["--tokenizer-corpus-cache-dir", "corpus_cache"],
+                {"tokenizer_corpus_cache_dir": Path("corpus_cache")},
+                {"tokenizer.corpus_cache_dir": Path("corpus_cache")},
+            ),
+            (
+                ["--tokenizer-output-token-accounting", "offsets"],
+                {"tokenizer_output_token_accounting": "offsets"},
+                {"tokenizer.output_token_accounting": OutputTokenAccounting.OFFSETS},
+            ),
+            (
+                ["--tokenizer-backend", "tokenizers"],
+                {"tokenizer_backend": "tokenizers"},
+                {"tokenizer.backend": TokenizerBackend.TOKENIZERS},
+            ),
+            (
+                ["--use-server-token-counts"],
+                {"use_server_token_counts": True},
+                {"tokenizer.use_server_token_counts": True},
+            ),
+            (
+                ["--num-parse-workers", "4"],
+                {"num_parse_workers": 4},
+                {"output.num_parse_workers": 4},
+            ),
+            (
+                ["--stream-profile-export"],
+                {"stream_profile_export": True},
+                {"output.stream_profile_export": True},
+            ),
+            (
+                ["--cache-parsed-metrics"],
+                {"cache_parsed_metrics": True},
+                {"output.cache_parsed_metrics": True},
+            ),
+            (
+                ["--export-timeline"],
+                {"export_timeline": True},
+                {"output.export_timeline": True},
+            ),
+            (
+                ["--timeline-bucket-size", "0.5"],
+                {"timeline_bucket_size": 0.5},
+                {"output.timeline_bucket_size": 0.5},
+            ),
+            (
+                ["--timeline-rolling-window", "10"],
+                {"timeline_rolling_window": 10.0},
+                {"output.timeline_rolling_window": 10.0},
+            ),
+            (
+                ["--steady-state-detection"],
+                {"steady_state_detection": True},
+                {"output.steady_state_detection": True},
+            ),
+            (
+                ["--steady-state-tolerance", "0.2"],
+                {"steady_state_tolerance": 0.2},
+                {"output.steady_state_tolerance": 0.2},
+            ),
             (
                 ["--streaming"],
                 {"streaming": True},
@@ -396,6 +484,11 @@ class TestCLIArguments:
                 {"synthetic_input_tokens_stddev": 7},
                 {"input.synthetic_tokens.stddev": 7},
             ),
+            (
+                ["--synthetic-input-tokens-corpus", "corpus.npy"],
+                {"synthetic_input_tokens_corpus": Path("corpus.npy")},
+                {"input.synthetic_tokens.corpus": Path("corpus.npy")},
+            ),
             (
                 ["--prefix-prompt-length", "6"],
                 {"prefix_prompt_length": 6},
@@ -484,6 +577,59 @@ class TestCLIArguments:
                     }
                 },
             ),
+            (
+                [
+                    "--goodput-profile",
+                    "interactive",
+                    "time_to_first_token:200",
+                    "inter_token_latency:20",
+                    "--goodput-profile",
+                    "batch",
+                    "request_latency:10000",
+                ],
+                {
+                    "goodput_profile": {
+                        "interactive": {
+                            "time_to_first_token": 200,
+                            "inter_token_latency": 20,
+                        },
+                        "batch": {"request_latency": 10000},
+                    }
+                },
+                {
+                    "input.goodput_profiles": {
+                        "interactive": {
+                            "time_to_first_token": 200,
+                            "inter_token_latency": 20,
+                        },
+                        "batch": {"request_latency": 10000},
+                    }
+                },
+            ),
+            (
+                [
+                    "--slo-attainment",
+                    "time_to_first_token",
+                    "inter_token_latency",
+                ],
+                {"slo_attainment": ["time_to_first_token", "inter_token_latency"]},
+                {
+                    "input.slo_attainment": [
+                        "time_to_first_token",
+                        "inter_token_latency",
+                    ]
+                },
+            ),
+            (
+                ["--slo-attainment-grid-size", "10"],
+                {"slo_attainment_grid_size": 10},
+                {"input.slo_attainment_grid_size": 10},
+            ),
+            (
+                ["--percentiles", "50", "99", "99.9", "99.99"],
+                {"percentiles": [50, 99, 99.9, 99.99]},
+                {"output.percentiles": [50, 99, 99.9, 99.99]},
+            ),
         ],
     )
     def test_non_file_flags_parsed(
@@ -665,6 +811,19 @@ class TestCLIArguments:
         captured = capsys.readouterr()
         assert expected_output in captured.err
 
+    @pytest.mark.parametrize("percentile", ["0", "100", "p99"])
+    def test_invalid_percentile(self, monkeypatch, capsys, percentile):
+        monkeypatch.setattr(
+            "sys.argv", self.base_args + ["--percentiles", "99", percentile]
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            parser.parse_args()
+
+        assert excinfo.value.code != 0
+        captured = capsys.readouterr()
+        assert "argument --percentiles" in captured.err
+
     def test_model_not_provided(self, monkeypatch, capsys):
         monkeypatch.setattr("sys.argv", ["genai-perf", "profile"])
         expected_error_message = "Required field model_names is not set"
@@ -714,6 +873,34 @@ class TestCLIArguments:
         config = CreateConfig.create(args)
         assert config.template_filename == Path("custom_template.yaml")
 
+    @pytest.mark.parametrize(
+        "output_args, expected_filename",
+        [
+            ([], Path("corpus.npy")),
+            (["--output", "tokens.npy"], Path("tokens.npy")),
+        ],
+    )
+    def test_tokenize_corpus(self, monkeypatch, output_args, expected_filename):
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "genai-perf",
+                "tokenize-corpus",
+                "--corpus",
+                "corpus.txt",
+                "--tokenizer",
+                "gpt2",
+            ]
+            + output_args,
+        )
+
+        args, _ = parser.parse_args()
+        config = CreateConfig.create(args)
+        assert config.subcommand == Subcommand.TOKENIZE_CORPUS
+        assert config.input.synthetic_tokens.corpus == Path("corpus.txt")
+        assert config.tokenized_corpus_filename == expected_filename
+        assert config.tokenizer.name == "gpt2"
+
     @pytest.mark.parametrize(
         "args, expected_error_message",
         [
@@ -979,6 +1166,19 @@ class TestCLIArguments:
                 ["--goodput", "time_to_first_token:-1"],
                 "Invalid value found, time_to_first_token: -1.0. The goodput constraint value should be non-negative. ",
             ),
+            (
+                ["--goodput-profile", "batch", "request_latency:-1"],
+                "Invalid value found, request_latency: -1.0. The goodput constraint value should be non-negative. ",
+            ),
+            (
+                [
+                    "--slo-attainment",
+                    "time_to_first_token",
+                    "inter_token_latency",
+                    "request_latency",
+                ],
+                "The SLO attainment takes one or two metrics, but 3 were provided.",
+            ),
         ],
     )
     def test_goodput_args_warning(self, monkeypatch, args, expected_error_message):
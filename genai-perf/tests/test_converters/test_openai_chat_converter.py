@@ -389,3 +389,37 @@ class TestOpenAIChatCompletionsConverter:
         }
 
         assert result == expected_result
+
+    def test_convert_with_server_token_counts(self):
+        generic_dataset = self.create_generic_dataset([{"text": "text input one"}])
+
+        config = ConfigCommand({"model_name": "test_model"})
+        config.endpoint.model_selection_strategy = ModelSelectionStrategy.ROUND_ROBIN
+        config.endpoint.output_format = OutputFormat.OPENAI_CHAT_COMPLETIONS
+        config.endpoint.streaming = True
+        config.tokenizer.use_server_token_counts = True
+
+        chat_converter = OpenAIChatCompletionsConverter(config)
+        result = chat_converter.convert(generic_dataset)
+
+        expected_result = {
+            "data": [
+                {
+                    "payload": [
+                        {
+                            "messages": [
+                                {
+                                    "role": "user",
+                                    "content": "text input one",
+                                }
+                            ],
+                            "model": "test_model",
+                            "stream": True,
+                            "stream_options": {"include_usage": True},
+                        }
+                    ]
+                },
+            ]
+        }
+
+        assert result == expected_result
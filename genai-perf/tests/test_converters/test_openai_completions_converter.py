@@ -228,6 +228,45 @@ class TestOpenAICompletionsConverter:
 
         assert result == expected_result
 
+    def test_convert_with_server_token_counts(self):
+        generic_dataset = self.create_generic_dataset()
+
+        config = ConfigCommand({"model_name": "test_model"})
+        config.endpoint.model_selection_strategy = ModelSelectionStrategy.ROUND_ROBIN
+        config.endpoint.output_format = OutputFormat.OPENAI_COMPLETIONS
+        config.endpoint.streaming = True
+        config.tokenizer.use_server_token_counts = True
+
+        completions_converter = OpenAICompletionsConverter(config)
+        result = completions_converter.convert(generic_dataset)
+
+        expected_result = {
+            "data": [
+                {
+                    "payload": [
+                        {
+                            "prompt": ["text input one"],
+                            "model": "test_model",
+                            "stream": True,
+                            "stream_options": {"include_usage": True},
+                        }
+                    ]
+                },
+                {
+                    "payload": [
+                        {
+                            "prompt": ["text input two"],
+                            "model": "test_model",
+                            "stream": True,
+                            "stream_options": {"include_usage": True},
+                        }
+                    ]
+                },
+            ]
+        }
+
+        assert result == expected_result
+
     def test_convert_with_multiple_models(self):
         generic_dataset = self.create_generic_dataset()
 
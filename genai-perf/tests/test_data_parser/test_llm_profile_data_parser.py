@@ -24,6 +24,8 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import copy
+import json
 from pathlib import Path
 from typing import cast
 from unittest.mock import patch
@@ -31,11 +33,13 @@ from unittest.mock import patch
 import pytest
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.exceptions import GenAIPerfException
+from genai_perf.inputs.input_constants import OutputTokenAccounting
 from genai_perf.metrics import LLMMetrics
 from genai_perf.metrics.statistics import Statistics
 from genai_perf.profile_data_parser import LLMProfileDataParser
 from genai_perf.profile_data_parser.profile_data_parser import ResponseFormat
-from genai_perf.tokenizer import get_tokenizer
+from genai_perf.token_count_cache import get_token_count_cache
+from genai_perf.tokenizer import Tokenizer, get_empty_tokenizer, get_tokenizer
 from tests.test_utils import check_statistics, ns_to_sec
 
 
@@ -920,6 +924,68 @@ class TestLLMProfileDataParser:
         assert total_output_token == 9
         assert total_output_token != sum(output_token_counts)
 
+    @pytest.mark.parametrize(
+        "profile_data,res_outputs",
+        [
+            (
+                openai_profile_data,
+                [
+                    {
+                        "response": f'data: {{"choices":[{{"delta":{{"content":"{text}"}}}}],"object":"chat.completion.chunk"}}\n\n'
+                    }
+                    for text in ["Ad", "idas", " Orig", "inals", " are", " now", ""]
+                ],
+            ),
+            (
+                triton_profile_data,
+                [
+                    {"text_output": text}
+                    for text in ["Ad", "idas", " Orig", "inals", " are", " now", ""]
+                ],
+            ),
+        ],
+    )
+    def test_output_token_counts_with_offsets(self, profile_data, res_outputs) -> None:
+        """Check that the offsets accounting splits the tokens of the full
+        output across the responses."""
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
+        tokenizer = get_tokenizer(config)
+
+        counts = {}
+        for accounting in OutputTokenAccounting:
+            with patch(
+                "genai_perf.profile_data_parser.profile_data_parser.load_json",
+                return_value=copy.deepcopy(profile_data),
+            ):
+                pd = LLMProfileDataParser(
+                    filename=Path("profile_export.json"),
+                    tokenizer=tokenizer,
+                    output_token_accounting=accounting,
+                )
+            counts[accounting] = pd._get_output_token_counts(res_outputs)
+
+        output_token_counts, total_output_token = counts[OutputTokenAccounting.OFFSETS]
+        assert total_output_token == counts[OutputTokenAccounting.PREFIX][1]
+        assert len(output_token_counts) == len(res_outputs)
+        assert sum(output_token_counts) == total_output_token
+        assert output_token_counts[-1] == 0
+
+    @pytest.mark.parametrize(
+        "token_ends,response_ends,expected",
+        [
+            ([2, 4, 9], [2, 4, 9], [1, 1, 1]),
+            # a token spanning two responses belongs to the one completing it
+            ([3, 6, 9], [2, 4, 9], [0, 1, 2]),
+            # empty responses get no tokens
+            ([2, 4], [2, 2, 4, 4], [1, 0, 1, 0]),
+            ([], [0, 0], [0, 0]),
+        ],
+    )
+    def test_split_output_tokens(self, token_ends, response_ends, expected) -> None:
+        split = LLMProfileDataParser._split_output_tokens(token_ends, response_ends)
+        assert split == expected
+
     empty_profile_data = {
         "service_kind": "openai",
         "endpoint": "v1/chat/completions",
@@ -968,7 +1034,7 @@ class TestLLMProfileDataParser:
         )
 
     @pytest.mark.parametrize(
-        "profile_data, res_outputs, expected_response",
+        "profile_data, res_outputs, expected_text",
         [
             # OpenAI Completions
             (
@@ -983,7 +1049,7 @@ class TestLLMProfileDataParser:
                     },
                     {"response": "data: [DONE]\n\n"},
                 ],
-                '{"object":"text_completion","model":"test_model","choices":[{"text":"abc1234helloworld"}]}',
+                "abc1234helloworld",
             ),
             # OpenAI Chat Completions
             (
@@ -998,12 +1064,12 @@ class TestLLMProfileDataParser:
                     },
                     {"response": "data: [DONE]\n\n"},
                 ],
-                '{"choices":[{"delta":{"content":"abc1234helloworld"}}],"object":"chat.completion.chunk"}',
+                "abc1234helloworld",
             ),
         ],
     )
     def test_merged_sse_responses(
-        self, profile_data, res_outputs, expected_response
+        self, profile_data, res_outputs, expected_text
     ) -> None:
         """Test merging the multiple sse responses."""
         with patch(
@@ -1019,11 +1085,12 @@ class TestLLMProfileDataParser:
             )
 
         res_timestamps = [i for i in range(len(res_outputs))]
-        pd._preprocess_response(res_timestamps, res_outputs)
-        assert res_outputs[0]["response"] == expected_response
+        res_timestamps, texts = pd._get_response_texts(res_timestamps, res_outputs)
+        assert res_timestamps == [0]
+        assert texts == [expected_text]
 
     @pytest.mark.parametrize(
-        "profile_data, res_outputs, expected_responses",
+        "profile_data, res_outputs, expected_timestamps, expected_texts",
         [
             # OpenAI Completions
             (
@@ -1045,11 +1112,8 @@ class TestLLMProfileDataParser:
                     },
                     {"response": "data: [DONE]\n\n"},
                 ],
-                [
-                    'data: {"object":"text_completion","model":"test_model","choices":[{"text":"abc"}]}\n\n',
-                    'data: {"object":"text_completion","model":"test_model","choices":[{"text":"1234"}]}\n\n',
-                    'data: {"object":"text_completion","model":"test_model","choices":[{"text":"helloworld"}]}\n\n',
-                ],
+                [0, 2, 3],
+                ["abc", "1234", "helloworld"],
             ),
             # OpenAI Chat Completions
             (
@@ -1071,16 +1135,13 @@ class TestLLMProfileDataParser:
                     },
                     {"response": "data: [DONE]\n\n"},
                 ],
-                [
-                    'data: {"object":"chat.completion.chunk","choices":[{"delta":{"content":"abc"}}],"model":"test_model"}\n\n',
-                    'data: {"object":"chat.completion.chunk","choices":[{"delta":{"content":"123"}}],"model":"test_model"}\n\n',
-                    'data: {"object":"chat.completion.chunk","choices":[{"delta":{"content":"hello"}}],"model":"test_model"}\n\n',
-                ],
+                [0, 2, 3],
+                ["abc", "123", "hello"],
             ),
         ],
     )
     def test_splintered_sse_responses(
-        self, profile_data, res_outputs, expected_responses
+        self, profile_data, res_outputs, expected_timestamps, expected_texts
     ) -> None:
         """Check if the parser handles splintered SSE responses."""
         with patch(
@@ -1096,11 +1157,10 @@ class TestLLMProfileDataParser:
             )
 
         res_timestamps = [i for i in range(len(res_outputs))]
-        pd._preprocess_response(res_timestamps, res_outputs)
+        res_timestamps, texts = pd._get_response_texts(res_timestamps, res_outputs)
 
-        assert len(res_outputs) == len(expected_responses)
-        for out, expected_response in zip(res_outputs, expected_responses):
-            assert out["response"] == expected_response
+        assert res_timestamps == expected_timestamps
+        assert texts == expected_texts
 
     @patch(
         "genai_perf.profile_data_parser.profile_data_parser.load_json",
@@ -1134,11 +1194,6 @@ class TestLLMProfileDataParser:
         ]
         res_timestamps = [i for i in range(len(res_outputs))]
 
-        expected_responses = [
-            'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"token_id":4477,"role":"assistant","content":"Hello "}}],"model":"meta-llama"}\n\n',
-            'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"token_id":4477,"role":"assistant","content":"world!"}}],"model":"meta-llama"}\n\n',
-        ]
-
         config = ConfigCommand({"model_name": "test_model"})
         config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
         tokenizer = get_tokenizer(config)
@@ -1147,11 +1202,10 @@ class TestLLMProfileDataParser:
             tokenizer=tokenizer,
         )
 
-        pd._preprocess_response(res_timestamps, res_outputs)
+        res_timestamps, texts = pd._get_response_texts(res_timestamps, res_outputs)
 
-        assert len(res_outputs) == 2 and len(res_timestamps) == 2
-        assert res_outputs[0]["response"] == expected_responses[0]
-        assert res_outputs[1]["response"] == expected_responses[1]
+        assert res_timestamps == [2, 5]
+        assert texts == ["Hello ", "world!"]
 
     @pytest.mark.parametrize(
         "res_outputs",
@@ -1193,7 +1247,7 @@ class TestLLMProfileDataParser:
 
         with pytest.raises(GenAIPerfException) as excinfo:
             res_timestamps = [i for i in range(len(res_outputs))]
-            pd._preprocess_response(res_timestamps, res_outputs)
+            pd._get_response_texts(res_timestamps, res_outputs)
 
         expected_error_msg = "Detected an error event in the SSE response: event: error: some error occurred."
         assert str(excinfo.value) == expected_error_msg
@@ -1212,7 +1266,6 @@ class TestLLMProfileDataParser:
                 "response": '{"id":"1","object":"chat.completion","created":2,"model":"hf-internal-testing/llama-tokenizer","choices":[{"index":0,"message":{"role":"assistant","content":"A friend of mine, who is also a cook, writes a blog.","tool_calls":[]},"logprobs":null,"finish_reason":"length","stop_reason":null}],"usage":{"prompt_tokens":47,"total_tokens":1024,"completion_tokens":977}}'
             },
         ]
-        expected_response = '{"id":"1","object":"chat.completion","created":2,"model":"hf-internal-testing/llama-tokenizer","choices":[{"index":0,"message":{"role":"assistant","content":"A friend of mine, who is also a cook, writes a blog.","tool_calls":[]},"logprobs":null,"finish_reason":"length","stop_reason":null}],"usage":{"prompt_tokens":47,"total_tokens":1024,"completion_tokens":977}}'
 
         config = ConfigCommand({"model_name": "test_model"})
         config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
@@ -1222,8 +1275,9 @@ class TestLLMProfileDataParser:
             tokenizer=tokenizer,
         )
 
-        pd._preprocess_response(res_timestamps, res_outputs)
-        assert res_outputs[0]["response"] == expected_response
+        res_timestamps, texts = pd._get_response_texts(res_timestamps, res_outputs)
+        assert res_timestamps == [0]
+        assert texts == ["A friend of mine, who is also a cook, writes a blog."]
 
     ###############################
     # SESSION MODE
@@ -1356,6 +1410,359 @@ class TestLLMProfileDataParser:
         session_metrics = pd._session_metrics
         assert session_metrics == {}
 
+    ###############################
+    # PARALLEL PARSING
+    ###############################
+
+    @pytest.mark.parametrize(
+        "profile_data", [openai_profile_data, session_profile_data]
+    )
+    def test_parallel_parsing(self, profile_data) -> None:
+        """Check that parsing the requests in worker processes gives the same
+        results as parsing them serially."""
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
+        tokenizer = get_tokenizer(config)
+
+        parsers = []
+        for num_parse_workers in [1, 2]:
+            with patch(
+                "genai_perf.profile_data_parser.profile_data_parser.load_json",
+                return_value=copy.deepcopy(profile_data),
+            ), patch(
+                "genai_perf.profile_data_parser.llm_profile_data_parser.PARSE_SHARD_SIZE",
+                1,
+            ):
+                parsers.append(
+                    LLMProfileDataParser(
+                        filename=Path("profile_export.json"),
+                        tokenizer=tokenizer,
+                        num_parse_workers=num_parse_workers,
+                    )
+                )
+        serial, parallel = parsers
+
+        assert parallel.get_profile_load_info() == serial.get_profile_load_info()
+        for infer_mode, load_level in serial.get_profile_load_info():
+            expected = serial.get_statistics(infer_mode, load_level)
+            actual = parallel.get_statistics(infer_mode, load_level)
+            assert actual.metrics.data == expected.metrics.data
+            assert actual.stats_dict == expected.stats_dict
+        assert parallel._session_metrics == serial._session_metrics
+
+    ###############################
+    # TOKEN COUNT CACHE
+    ###############################
+
+    def test_token_count_cache(self, tmp_path) -> None:
+        """Check that the token counts are reused from the persistent cache
+        without changing the results."""
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
+        config.tokenizer.count_cache_dir = tmp_path
+        tokenizer = get_tokenizer(config)
+
+        parsers, caches = [], []
+        for _ in range(2):
+            cache = get_token_count_cache(config, tokenizer)
+            with patch(
+                "genai_perf.profile_data_parser.profile_data_parser.load_json",
+                return_value=copy.deepcopy(self.openai_profile_data),
+            ), patch.object(cache, "log_stats", lambda: None):
+                parsers.append(
+                    LLMProfileDataParser(
+                        filename=Path("profile_export.json"),
+                        tokenizer=tokenizer,
+                        token_count_cache=cache,
+                    )
+                )
+            caches.append(cache)
+        first, second = parsers
+
+        assert caches[0].misses > 0
+        assert caches[1].misses == 0
+        assert caches[1].hits == caches[0].hits + caches[0].misses
+        for infer_mode, load_level in first.get_profile_load_info():
+            expected = first.get_statistics(infer_mode, load_level)
+            actual = second.get_statistics(infer_mode, load_level)
+            assert actual.stats_dict == expected.stats_dict
+
+    ###############################
+    # PARSED METRICS CACHE
+    ###############################
+
+    @pytest.mark.parametrize(
+        "profile_data", [openai_profile_data, session_profile_data]
+    )
+    def test_cache_parsed_metrics(self, profile_data, tmp_path) -> None:
+        """Check that the parsed metrics sidecar is reused on the next load
+        of the same profile export without changing the results."""
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
+        tokenizer = get_tokenizer(config)
+        filename = tmp_path / "profile_export.json"
+        filename.write_text(json.dumps(profile_data))
+
+        parsers = []
+        for cache_parsed_metrics in [False, True, True]:
+            with patch(
+                "genai_perf.profile_data_parser.profile_data_parser.load_json",
+                return_value=copy.deepcopy(profile_data),
+            ) as mock_json:
+                parsers.append(
+                    LLMProfileDataParser(
+                        filename=filename,
+                        tokenizer=tokenizer,
+                        cache_parsed_metrics=cache_parsed_metrics,
+                    )
+                )
+        uncached, _, cached = parsers
+
+        # The last load reads the sidecar instead of the profile export
+        mock_json.assert_not_called()
+        assert (tmp_path / "profile_export.metrics.parquet").exists()
+        assert cached.get_profile_load_info() == uncached.get_profile_load_info()
+        for infer_mode, load_level in uncached.get_profile_load_info():
+            expected = uncached.get_statistics(infer_mode, load_level)
+            actual = cached.get_statistics(infer_mode, load_level)
+            assert actual.metrics.data == expected.metrics.data
+            assert actual.stats_dict == expected.stats_dict
+        assert cached._session_metrics == uncached._session_metrics
+
+    ###############################
+    # SERVER TOKEN COUNTS
+    ###############################
+
+    usage_profile_data = {
+        "service_kind": "openai",
+        "endpoint": "v1/chat/completions",
+        "experiments": [
+            {
+                "experiment": {
+                    "mode": "concurrency",
+                    "value": 10,
+                },
+                "requests": [
+                    {
+                        "timestamp": 1,
+                        "request_inputs": {
+                            "payload": '{"messages":[{"role":"user","content":"This is test"}],"model":"llama-2-7b","stream":true,"stream_options":{"include_usage":true}}',
+                        },
+                        # the usage chunk has no choices and is splintered
+                        "response_timestamps": [3, 5, 8, 12, 13, 14],
+                        "response_outputs": [
+                            {
+                                "response": 'data: {"id":"abc","object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"I"}}],"usage":null}\n\n'
+                            },
+                            {
+                                "response": 'data: {"id":"abc","object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":" like"}}],"usage":null}\n\n'
+                            },
+                            {
+                                "response": 'data: {"id":"abc","object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":" dogs"}}],"usage":null}\n\n'
+                            },
+                            {
+                                "response": 'data: {"id":"abc","object":"chat.completion.chunk","choices":[],"usage":{"prompt_tokens":10,'
+                            },
+                            {
+                                "response": '"completion_tokens":4,"total_tokens":14}}\n\n'
+                            },
+                            {"response": "data: [DONE]\n\n"},
+                        ],
+                    },
+                    {
+                        "timestamp": 2,
+                        "request_inputs": {
+                            "payload": '{"messages":[{"role":"user","content":"This is test too"}],"model":"llama-2-7b"}',
+                        },
+                        "response_timestamps": [6],
+                        "response_outputs": [
+                            {
+                                "response": '{"id":"abc","object":"chat.completion","choices":[{"index":0,"message":{"role":"assistant","content":"I don\'t cook food"}}],"usage":{"prompt_tokens":7,"completion_tokens":5,"total_tokens":12}}'
+                            },
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+
+    @patch(
+        "genai_perf.profile_data_parser.profile_data_parser.load_json",
+        return_value=usage_profile_data,
+    )
+    def test_server_token_counts(self, mock_json) -> None:
+        """Check that the token counts reported by the server are used
+        without loading the tokenizer."""
+        tokenizer = Tokenizer()
+        tokenizer.set_tokenizer("unavailable/tokenizer", False, "main", lazy=True)
+        pd = LLMProfileDataParser(
+            filename=Path("openai_profile_export.json"),
+            tokenizer=tokenizer,
+            use_server_token_counts=True,
+        )
+
+        statistics = pd.get_statistics(infer_mode="concurrency", load_level="10")
+        metrics = cast(LLMMetrics, statistics.metrics)
+        assert metrics.input_sequence_lengths == [10, 7]
+        assert metrics.output_sequence_lengths == [4, 5]
+        # the 4 output tokens are spread across the 3 responses with content
+        assert metrics._chunked_inter_token_latencies.to_lists() == [[2, 3], []]
+        assert "_tokenizer" not in tokenizer.__dict__
+
+    @patch(
+        "genai_perf.profile_data_parser.profile_data_parser.load_json",
+        return_value=openai_profile_data,
+    )
+    def test_server_token_counts_fallback(self, mock_json) -> None:
+        """Check that the requests without usage are tokenized."""
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.name = "hf-internal-testing/llama-tokenizer"
+        tokenizer = get_tokenizer(config)
+
+        statistics = []
+        for use_server_token_counts in [False, True]:
+            pd = LLMProfileDataParser(
+                filename=Path("openai_profile_export.json"),
+                tokenizer=tokenizer,
+                use_server_token_counts=use_server_token_counts,
+            )
+            statistics.append(
+                pd.get_statistics(infer_mode="concurrency", load_level="10")
+            )
+
+        assert statistics[1].stats_dict == statistics[0].stats_dict
+
+    @pytest.mark.parametrize(
+        "num_tokens,num_responses,expected",
+        [
+            (4, 3, [2, 1, 1]),
+            (6, 3, [2, 2, 2]),
+            (1, 3, [1, 0, 0]),
+            (0, 2, [0, 0]),
+        ],
+    )
+    @patch(
+        "genai_perf.profile_data_parser.profile_data_parser.load_json",
+        return_value=usage_profile_data,
+    )
+    def test_spread_output_tokens(
+        self, mock_json, num_tokens, num_responses, expected
+    ) -> None:
+        pd = LLMProfileDataParser(
+            filename=Path("openai_profile_export.json"),
+            tokenizer=get_empty_tokenizer(),
+            use_server_token_counts=True,
+        )
+        assert pd._spread_output_tokens(num_tokens, num_responses) == expected
+
+    # Two concurrency slots sending requests of 10ns, the second one starting
+    # 5ns late, so there is a single request in flight for the first and last 5ns
+    ramp_profile_data = {
+        "service_kind": "openai",
+        "endpoint": "v1/chat/completions",
+        "experiments": [
+            {
+                "experiment": {
+                    "mode": "concurrency",
+                    "value": 2,
+                },
+                "requests": [
+                    {
+                        "timestamp": start,
+                        "request_inputs": {
+                            "payload": '{"messages":[{"role":"user","content":"This is test"}],"model":"llama-2-7b"}',
+                        },
+                        "response_timestamps": [start + 10],
+                        "response_outputs": [
+                            {
+                                "response": '{"id":"abc","object":"chat.completion","choices":[{"index":0,"message":{"role":"assistant","content":"I like dogs"}}],"usage":{"prompt_tokens":4,"completion_tokens":3,"total_tokens":7}}'
+                            },
+                        ],
+                    }
+                    for start in sorted(
+                        list(range(0, 100, 10)) + list(range(5, 100, 10))
+                    )
+                ],
+            },
+        ],
+    }
+
+    @patch(
+        "genai_perf.profile_data_parser.profile_data_parser.load_json",
+        return_value=ramp_profile_data,
+    )
+    def test_steady_state_detection(self, mock_json) -> None:
+        """Check that the requests outside of the steady state are trimmed from
+        the metrics, but not from the timeline."""
+        tokenizer = Tokenizer()
+        tokenizer.set_tokenizer("unavailable/tokenizer", False, "main", lazy=True)
+        pd = LLMProfileDataParser(
+            filename=Path("openai_profile_export.json"),
+            tokenizer=tokenizer,
+            use_server_token_counts=True,
+            export_timeline=True,
+            steady_state_detection=True,
+        )
+
+        window = pd.get_steady_state_window(infer_mode="concurrency", load_level="2")
+        assert window is not None
+        assert (window.start, window.end) == (5, 100)
+        assert (window.num_requests, window.num_trimmed_requests) == (18, 2)
+
+        statistics = pd.get_statistics(infer_mode="concurrency", load_level="2")
+        metrics = cast(LLMMetrics, statistics.metrics)
+        assert len(metrics.request_latencies) == 18
+        # 18 requests from 5ns to 100ns
+        assert metrics.request_throughputs == [pytest.approx(18 / ns_to_sec(95))]
+
+        timeline = pd.get_timeline(infer_mode="concurrency", load_level="2")
+        assert timeline is not None
+        widths = timeline.columns["end"] - timeline.columns["start"]
+        completed = (timeline.columns["request_throughput"] * widths).sum()
+        assert completed == pytest.approx(20)
+
+    @patch(
+        "genai_perf.profile_data_parser.profile_data_parser.load_json",
+        return_value={
+            **usage_profile_data,
+            "experiments": [
+                {
+                    **usage_profile_data["experiments"][0],
+                    "window_boundaries": [0, 7, 15],
+                }
+            ],
+        },
+    )
+    def test_timeline(self, mock_json) -> None:
+        """Check the timeline of the requests over the measurement windows."""
+        tokenizer = Tokenizer()
+        tokenizer.set_tokenizer("unavailable/tokenizer", False, "main", lazy=True)
+        pd = LLMProfileDataParser(
+            filename=Path("openai_profile_export.json"),
+            tokenizer=tokenizer,
+            use_server_token_counts=True,
+            export_timeline=True,
+            timeline_bucket_size=ns_to_sec(4),
+            timeline_rolling_window=ns_to_sec(5),
+        )
+
+        timeline = pd.get_timeline(infer_mode="concurrency", load_level="10")
+        assert timeline is not None
+        columns = timeline.columns
+        widths = columns["end"] - columns["start"]
+        assert columns["window"].tolist() == [0, 0, 1, 1]
+        assert columns["start"] == pytest.approx([ns_to_sec(t) for t in [0, 4, 7, 11]])
+        # request 2 ends at 6ns and request 1 at its last content response at 8ns
+        assert columns["request_throughput"] * widths == pytest.approx([0, 1, 1, 0])
+        assert (columns["output_token_throughput"] * widths).sum() == pytest.approx(9)
+
+        pd = LLMProfileDataParser(
+            filename=Path("openai_profile_export.json"),
+            tokenizer=tokenizer,
+            use_server_token_counts=True,
+        )
+        assert pd.get_timeline(infer_mode="concurrency", load_level="10") is None
+
     ###############################
     # COMMON FUNCTIONALITY
     ###############################
@@ -1414,30 +1821,6 @@ class TestLLMProfileDataParser:
         else:
             assert parser._extract_text_output(response_text) == expected
 
-    @pytest.mark.parametrize(
-        "response_format, response_text, expected_is_empty",
-        [
-            (
-                ResponseFormat.OPENAI_CHAT_COMPLETIONS,
-                '{"object":"chat.completion","choices":[{"message":{"content":"Hello"}}]}',
-                False,
-            ),
-            (ResponseFormat.OPENAI_CHAT_COMPLETIONS, "", True),
-            (ResponseFormat.OPENAI_CHAT_COMPLETIONS, "data: [DONE]", True),
-            (ResponseFormat.OPENAI_CHAT_COMPLETIONS, ": ping", True),
-            (
-                ResponseFormat.HUGGINGFACE_GENERATE,
-                '[{"generated_text":"Hello"}]',
-                False,
-            ),
-            (ResponseFormat.HUGGINGFACE_GENERATE, "[]", True),
-        ],
-    )
-    def test_is_empty_response(self, response_format, response_text, expected_is_empty):
-        parser = LLMProfileDataParser.__new__(LLMProfileDataParser)
-        parser._response_format = response_format
-        assert parser._is_empty_response(response_text) == expected_is_empty
-
     ###############################
     # HUGGINGFACE GENERATE
     ###############################
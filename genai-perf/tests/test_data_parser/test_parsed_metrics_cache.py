@@ -0,0 +1,100 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+
+from genai_perf.profile_data_parser.parsed_metrics_cache import (
+    ParsedMetricsCache,
+    get_parsed_metrics_path,
+)
+
+EXPERIMENT = {"mode": "concurrency", "value": 4}
+
+ROWS = [
+    (1, 3, 5, 8, 3, 10, 4, [2, 3], "session-a"),
+    (2, 4, None, 4, 1, 7, 1, [], None),
+    (3, 6, 7, 12, 4, 12, 6, [1, 2, 3], "session-a"),
+]
+
+
+def _write_cache(filename, tokenizer_id="gpt2@main"):
+    cache = ParsedMetricsCache(filename, tokenizer_id)
+    cache.add_experiment(EXPERIMENT, 4, [0, 6, 12])
+    # A request that failed to parse is passed through but not recorded
+    assert list(cache.record(ROWS[:2] + [None])) == ROWS[:2] + [None]
+    cache.add_experiment({"mode": "request_rate", "value": 1.0}, 1)
+    assert list(cache.record(ROWS[2:])) == ROWS[2:]
+    cache.save({"service_kind": "openai", "response_format": "CHAT_COMPLETIONS"})
+
+
+class TestParsedMetricsCache:
+    def test_load_without_sidecar(self, tmp_path):
+        filename = tmp_path / "profile_export.json"
+        filename.write_text("{}")
+        assert ParsedMetricsCache(filename, "gpt2@main").load() is None
+
+    def test_save_and_load(self, tmp_path):
+        filename = tmp_path / "profile_export.json"
+        filename.write_text("{}")
+        _write_cache(filename)
+
+        assert get_parsed_metrics_path(filename).exists()
+        assert not any(p.suffix == ".tmp" for p in tmp_path.iterdir())
+
+        profile, experiments = ParsedMetricsCache(filename, "gpt2@main").load()
+        assert profile == {
+            "service_kind": "openai",
+            "response_format": "CHAT_COMPLETIONS",
+        }
+        assert experiments == [
+            (EXPERIMENT, 4, [0, 6, 12], ROWS[:2]),
+            ({"mode": "request_rate", "value": 1.0}, 1, None, ROWS[2:]),
+        ]
+
+    def test_invalidated_by_tokenizer(self, tmp_path):
+        filename = tmp_path / "profile_export.json"
+        filename.write_text("{}")
+        _write_cache(filename)
+
+        assert ParsedMetricsCache(filename, "gpt2@v2").load() is None
+
+    def test_invalidated_by_export_content(self, tmp_path):
+        filename = tmp_path / "profile_export.json"
+        filename.write_text('{"a": 1}')
+        _write_cache(filename)
+
+        # Same size and modification time, different content
+        stat = filename.stat()
+        filename.write_text('{"a": 2}')
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert ParsedMetricsCache(filename, "gpt2@main").load() is None
+
+    def test_ignores_unreadable_sidecar(self, tmp_path):
+        filename = tmp_path / "profile_export.json"
+        filename.write_text("{}")
+        get_parsed_metrics_path(filename).write_bytes(b"not parquet")
+
+        assert ParsedMetricsCache(filename, "gpt2@main").load() is None
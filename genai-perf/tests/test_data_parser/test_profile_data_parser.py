@@ -162,6 +162,75 @@ class TestProfileDataParser:
         assert stats_dict["request_throughput"]["avg"] == pytest.approx(5e8)  # type: ignore
         assert stats_dict["request_goodput"]["avg"] == pytest.approx(2.5e8)  # type: ignore
 
+    def test_embedding_goodput_profiles(
+        self, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        """Compute the goodput of each SLO profile without goodput constraints.
+
+        Metrics
+        * request latencies
+            - [2, 3]
+        * request goodputs
+            - interactive: [1 / (5e-9 - 1e-9)] = [2.5e8]
+            - batch: [2 / (5e-9 - 1e-9)] = [5e8]
+        """
+        pd = ProfileDataParser(
+            filename=Path("embedding_profile_export.json"),
+            goodput_profiles={
+                "interactive": {"request_latency": 2.5e-6},  # ms
+                "batch": {"request_latency": 3e-6},  # ms
+            },
+        )
+
+        stats = pd.get_statistics(infer_mode="concurrency", load_level="10")
+        metrics = stats.metrics
+        assert isinstance(metrics, Metrics)
+
+        assert metrics.request_goodputs == []
+        assert "request_goodput" not in stats.stats_dict
+        assert metrics.request_goodputs_by_profile == {
+            "interactive": [pytest.approx(2.5e8)],
+            "batch": [pytest.approx(5e8)],
+        }
+
+    def test_embedding_slo_attainment(
+        self, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        """Compute the SLO attainment of the request latency.
+
+        Metrics
+        * request latencies
+            - [2, 3]
+        * thresholds
+            - [2e-6, 3e-6] ms
+        """
+        pd = ProfileDataParser(
+            filename=Path("embedding_profile_export.json"),
+            slo_attainment=["request_latency"],
+            slo_attainment_grid_size=2,
+        )
+
+        slo_attainment = pd.get_slo_attainment(
+            infer_mode="concurrency", load_level="10"
+        )
+        assert slo_attainment is not None
+        assert slo_attainment.thresholds["request_latency"].tolist() == [
+            pytest.approx(2e-6),
+            pytest.approx(3e-6),
+        ]
+        assert slo_attainment.fractions.tolist() == [0.5, 1.0]
+        assert slo_attainment.goodputs.tolist() == [
+            pytest.approx(2.5e8),
+            pytest.approx(5e8),
+        ]
+
+    def test_embedding_slo_attainment_disabled(
+        self, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        pd = ProfileDataParser(filename=Path("embedding_profile_export.json"))
+
+        assert pd.get_slo_attainment(infer_mode="concurrency", load_level="10") is None
+
     # ================================================
     # RANKINGS API
     # ================================================
@@ -0,0 +1,129 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+from pathlib import Path
+
+import pytest
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.profile_data_parser import ProfileDataParser
+from genai_perf.profile_data_parser.profile_export_reader import ProfileExportReader
+
+
+def _make_request(i: int) -> dict:
+    return {
+        "timestamp": i,
+        "request_inputs": {"payload": '{"input":"text \\"%d\\" \\\\"}' % i},
+        "response_timestamps": [i + 2],
+        "response_outputs": [
+            {"response": '{"data": [{"embedding": [%d, [{}], "]}["]}]}' % i}
+        ],
+    }
+
+
+class TestProfileExportReader:
+    profile_data = {
+        "experiments": [
+            {
+                "experiment": {"mode": "concurrency", "value": 10},
+                "requests": [_make_request(i) for i in range(1, 4)],
+            },
+            {
+                "experiment": {"mode": "request_rate", "value": 2.0},
+                "requests": [_make_request(i) for i in range(10, 15)],
+            },
+        ],
+        "version": "\\",
+        "service_kind": "openai",
+        "endpoint": "v1/embeddings",
+    }
+
+    @pytest.fixture
+    def export_file(self, tmp_path: Path) -> Path:
+        filename = tmp_path / "profile_export.json"
+        filename.write_text(json.dumps(self.profile_data, indent=2))
+        return filename
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 22])
+    def test_get_metadata(self, export_file: Path, chunk_size: int) -> None:
+        reader = ProfileExportReader(export_file, chunk_size=chunk_size)
+        metadata = reader.get_metadata()
+
+        assert metadata["version"] == "\\"
+        assert metadata["service_kind"] == "openai"
+        assert metadata["endpoint"] == "v1/embeddings"
+        assert len(metadata["experiments"]) == 2
+        for experiment, expected in zip(
+            metadata["experiments"], self.profile_data["experiments"]
+        ):
+            assert experiment["experiment"] == expected["experiment"]
+            assert experiment["requests"] == expected["requests"][:1]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 22])
+    def test_iter_experiments(self, export_file: Path, chunk_size: int) -> None:
+        reader = ProfileExportReader(export_file, chunk_size=chunk_size)
+
+        experiments = []
+        for experiment in reader.iter_experiments():
+            assert len(experiment["requests"]) == len(
+                self.profile_data["experiments"][len(experiments)]["requests"]
+            )
+            experiments.append({**experiment, "requests": list(experiment["requests"])})
+
+        assert experiments == self.profile_data["experiments"]
+
+    def test_iter_experiments_skips_unconsumed_requests(
+        self, export_file: Path
+    ) -> None:
+        reader = ProfileExportReader(export_file, chunk_size=16)
+
+        first_requests = [
+            next(iter(experiment["requests"]))
+            for experiment in reader.iter_experiments()
+        ]
+
+        assert first_requests == [
+            experiment["requests"][0] for experiment in self.profile_data["experiments"]
+        ]
+
+    def test_truncated_file(self, tmp_path: Path) -> None:
+        filename = tmp_path / "profile_export.json"
+        filename.write_text(json.dumps(self.profile_data)[:-100])
+        reader = ProfileExportReader(filename, chunk_size=64)
+
+        with pytest.raises(GenAIPerfException):
+            reader.get_metadata()
+
+    def test_stream_profile_export(self, export_file: Path) -> None:
+        loaded = ProfileDataParser(filename=export_file)
+        streamed = ProfileDataParser(filename=export_file, stream_profile_export=True)
+
+        assert streamed.get_profile_load_info() == loaded.get_profile_load_info()
+        for infer_mode, load_level in loaded.get_profile_load_info():
+            expected = loaded.get_statistics(infer_mode, load_level)
+            actual = streamed.get_statistics(infer_mode, load_level)
+            assert actual.metrics.data == expected.metrics.data
+            assert actual.stats_dict == expected.stats_dict
@@ -197,6 +197,49 @@ class TestConsoleExporter:
         returned_data = capsys.readouterr().out
         assert expected_content in returned_data
 
+    def test_configured_percentiles(self, monkeypatch, capsys) -> None:
+        argv = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "model_name",
+            "--endpoint-type",
+            "embeddings",
+            "--percentiles",
+            "50",
+            "90",
+            "99",
+            "99.9",
+        ]
+        monkeypatch.setattr("sys.argv", argv)
+        args, _ = parser.parse_args()
+        config = ConfigCommand({"model_name": "model_name"})
+        config = CreateConfig._add_cli_options_to_config(config, args)
+
+        metrics = Metrics(
+            request_throughputs=[123],
+            request_latencies=[4, 5, 6],
+        )
+        stats = Statistics(metrics=metrics, percentiles=config.output.percentiles)
+
+        exporter_config = create_default_exporter_config(
+            stats=stats.stats_dict, metrics=stats.metrics, config=config
+        )
+
+        exporter = ConsoleExporter(exporter_config)
+        exporter.export(width=100)  # fix width for consistent output
+
+        # p99.9 is added and p75, which was not calculated, is removed
+        expected_content = (
+            "┃                    Statistic ┃    avg ┃  min ┃  max ┃ p99.9 ┃  p99 ┃  p90 ┃\n"
+            "┡━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━╇━━━━━━━━╇━━━━━━╇━━━━━━╇━━━━━━━╇━━━━━━╇━━━━━━┩\n"
+            "│         Request Latency (ms) │   5.00 │ 4.00 │ 6.00 │  6.00 │ 5.98 │ 5.80 │\n"
+            "│ Request Throughput (per sec) │ 123.00 │  N/A │  N/A │   N/A │  N/A │  N/A │\n"
+        )
+
+        returned_data = capsys.readouterr().out
+        assert expected_content in returned_data
+
     def test_valid_goodput(self, monkeypatch, capsys) -> None:
         argv = [
             "genai-perf",
@@ -320,6 +363,53 @@ class TestConsoleExporter:
         returned_data = capsys.readouterr().out
         assert expected_content in returned_data
 
+    def test_goodput_profiles(self, monkeypatch, capsys) -> None:
+        argv = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "model_name",
+            "--endpoint-type",
+            "chat",
+            "--goodput-profile",
+            "chat",
+            "request_latency:100",
+            "--goodput-profile",
+            "batch",
+            "request_latency:1000",
+        ]
+        monkeypatch.setattr("sys.argv", argv)
+        args, _ = parser.parse_args()
+        config = ConfigCommand({"model_name": "model_name"})
+        config = CreateConfig._add_cli_options_to_config(config, args)
+
+        metrics = LLMMetrics(
+            request_throughputs=[123],
+            request_latencies=[4, 5, 6],
+            output_token_throughputs=[456],
+            output_sequence_lengths=[1, 2, 3],
+            input_sequence_lengths=[5, 6, 7],
+        )
+        metrics.request_goodputs_by_profile = {"chat": [50], "batch": [100]}
+        stats = Statistics(metrics=metrics)
+
+        assert isinstance(stats.metrics, Metrics)
+        exporter_config = create_default_exporter_config(
+            stats=stats.stats_dict, metrics=stats.metrics, config=config
+        )
+
+        exporter = ConsoleExporter(exporter_config)
+        exporter.export(width=100)  # fix width for consistent output
+
+        expected_content = (
+            "│         Request Throughput (per sec) │ 123.00 │  N/A │  N/A │  N/A │  N/A │  N/A │\n"
+            "│     Request Goodput [chat] (per sec) │  50.00 │  N/A │  N/A │  N/A │  N/A │  N/A │\n"
+            "│    Request Goodput [batch] (per sec) │ 100.00 │  N/A │  N/A │  N/A │  N/A │  N/A │\n"
+            "│                Request Count (count) │   3.00 │  N/A │  N/A │  N/A │  N/A │  N/A │\n"
+        )
+        returned_data = capsys.readouterr().out
+        assert expected_content in returned_data
+
     @patch(
         "genai_perf.export_data.console_exporter.ConsoleExporter._construct_table",
         return_value=None,
@@ -232,6 +232,45 @@ class TestCsvExporter:
         returned_data = [data for _, data in mock_read_write]
         assert returned_data == expected_content
 
+    def test_configured_percentiles_csv_output(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        argv = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "model_name",
+            "--endpoint-type",
+            "embeddings",
+            "--percentiles",
+            "50",
+            "99",
+            "99.9",
+        ]
+        monkeypatch.setattr("sys.argv", argv)
+        args, _ = parser.parse_args()
+        config = ConfigCommand({"model_name": "model_name"})
+        config = CreateConfig._add_cli_options_to_config(config, args)
+
+        metrics = Metrics(
+            request_throughputs=[123],
+            request_latencies=[4, 5, 6],
+        )
+        stats = Statistics(metrics=metrics, percentiles=config.output.percentiles)
+
+        exporter_config = create_default_exporter_config(
+            stats=stats.stats_dict, metrics=stats.metrics, config=config
+        )
+
+        exporter = CsvExporter(exporter_config)
+        exporter.export()
+
+        returned_data = [data for _, data in mock_read_write]
+        assert returned_data[:2] == [
+            "Metric,avg,min,max,p99.9,p99,p50\r\n",
+            "Request Latency (ms),5.00,4.00,6.00,6.00,5.98,5.00\r\n",
+        ]
+
     def test_valid_goodput_csv_output(
         self, monkeypatch, mock_read_write: pytest.MonkeyPatch
     ) -> None:
@@ -283,6 +322,59 @@ class TestCsvExporter:
 
         assert returned_data[-2] == expected_content
 
+    def test_goodput_profiles_csv_output(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        argv = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "model_name",
+            "--endpoint-type",
+            "chat",
+            "--goodput",
+            "request_latency:100",
+            "--goodput-profile",
+            "batch",
+            "request_latency:1000",
+        ]
+        monkeypatch.setattr("sys.argv", argv)
+        args, _ = parser.parse_args()
+        config = ConfigCommand({"model_name": "model_name"})
+        config = CreateConfig._add_cli_options_to_config(config, args)
+
+        metrics = LLMMetrics(
+            request_throughputs=[123],
+            request_latencies=[4, 5, 6],
+            output_token_throughputs=[456],
+            output_sequence_lengths=[1, 2, 3],
+            input_sequence_lengths=[5, 6, 7],
+            request_goodputs=[100],
+        )
+        metrics.request_goodputs_by_profile = {"batch": [120]}
+        stats = Statistics(metrics=metrics)
+
+        assert isinstance(stats.metrics, Metrics)
+        exporter_config = create_default_exporter_config(
+            stats=stats.stats_dict, metrics=stats.metrics, config=config
+        )
+
+        exporter = CsvExporter(exporter_config)
+        exporter.export()
+
+        expected_filename = "profile_export_genai_perf.csv"
+        returned_data = [
+            data
+            for filename, data in mock_read_write
+            if os.path.basename(filename) == expected_filename
+        ]
+
+        assert returned_data[-3:] == [
+            "Request Goodput (per sec),100.00\r\n",
+            "Request Goodput [batch] (per sec),120.00\r\n",
+            "Request Count (count),3.00\r\n",
+        ]
+
     def test_invalid_goodput_csv_output(
         self, monkeypatch, mock_read_write: pytest.MonkeyPatch
     ) -> None:
@@ -33,6 +33,8 @@ from genai_perf.export_data.console_exporter import ConsoleExporter
 from genai_perf.export_data.csv_exporter import CsvExporter
 from genai_perf.export_data.exporter_config import ExporterConfig
 from genai_perf.export_data.json_exporter import JsonExporter
+from genai_perf.export_data.slo_attainment_exporter import SLOAttainmentExporter
+from genai_perf.export_data.timeline_exporter import TimelineExporter
 from genai_perf.inputs.input_constants import ModelSelectionStrategy, Subcommand
 from genai_perf.subcommand.common import get_extra_inputs_as_dict
 from tests.test_utils import create_default_exporter_config
@@ -75,3 +77,13 @@ class TestOutputReporter:
     def test_return_console_exporter(self) -> None:
         exporter_list = self.f.create_data_exporters(self.exporter_config)
         assert any(isinstance(exporter, ConsoleExporter) for exporter in exporter_list)
+
+    def test_return_timeline_exporter(self) -> None:
+        exporter_list = self.f.create_data_exporters(self.exporter_config)
+        assert any(isinstance(exporter, TimelineExporter) for exporter in exporter_list)
+
+    def test_return_slo_attainment_exporter(self) -> None:
+        exporter_list = self.f.create_data_exporters(self.exporter_config)
+        assert any(
+            isinstance(exporter, SLOAttainmentExporter) for exporter in exporter_list
+        )
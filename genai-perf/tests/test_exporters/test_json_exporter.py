@@ -32,6 +32,8 @@ import genai_perf.parser as parser
 import pytest
 from genai_perf.config.input.create_config import CreateConfig
 from genai_perf.export_data.json_exporter import JsonExporter
+from genai_perf.metrics import Metrics, SteadyStateWindow
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 from genai_perf.subcommand.common import get_extra_inputs_as_dict
 from tests.test_utils import create_default_exporter_config
 
@@ -235,6 +237,43 @@ class TestJsonExporter:
         }
         assert json_output == goodput_stats
 
+    def test_generate_json_goodput_profiles(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        cli_cmd = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "test_model",
+            "--endpoint-type",
+            "chat",
+            "--goodput-profile",
+            "interactive",
+            "time_to_first_token:200",
+            "inter_token_latency:20",
+            "--goodput-profile",
+            "batch",
+            "request_latency:10000",
+        ]
+        metrics = Metrics()
+        metrics.request_goodputs_by_profile = {"interactive": [1.5], "batch": [4.0]}
+        json_exporter = self.create_json_exporter(
+            monkeypatch, cli_cmd, stats={}, metrics=metrics
+        )
+        json_exporter.export()
+
+        _, data = next(iter(mock_read_write))
+        json_output = json.loads(data)
+
+        assert json_output["input_config"]["input"]["goodput_profiles"] == {
+            "interactive": {"time_to_first_token": 200.0, "inter_token_latency": 20.0},
+            "batch": {"request_latency": 10000.0},
+        }
+        assert json_output["request_goodput_profiles"] == {
+            "interactive": {"unit": "requests/sec", "avg": 1.5},
+            "batch": {"unit": "requests/sec", "avg": 4.0},
+        }
+
     def test_generate_json_telemetry_stats(
         self, monkeypatch, mock_read_write: pytest.MonkeyPatch
     ) -> None:
@@ -324,3 +363,89 @@ class TestJsonExporter:
 
         assert "sessions" in json_output
         assert json_output["sessions"] == session_stats
+
+    def test_generate_json_steady_state_window(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        cli_cmd = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "test_model",
+            "--endpoint-type",
+            "chat",
+            "--steady-state-detection",
+        ]
+        json_exporter = self.create_json_exporter(
+            monkeypatch,
+            cli_cmd,
+            stats={},
+            steady_state_window=SteadyStateWindow(
+                start=2_000_000_000,
+                end=12_000_000_000,
+                num_requests=95,
+                num_trimmed_requests=5,
+            ),
+        )
+        json_exporter.export()
+
+        _, data = next(iter(mock_read_write))
+        json_output = json.loads(data)
+
+        assert json_output["steady_state_window"] == {
+            "start": 2_000_000_000,
+            "end": 12_000_000_000,
+            "duration": 10.0,
+            "num_requests": 95,
+            "num_trimmed_requests": 5,
+        }
+
+    def test_generate_json_sketches(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        cli_cmd = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "test_model",
+            "--endpoint-type",
+            "chat",
+        ]
+        metrics = Metrics(
+            request_throughputs=[10.0], request_latencies=[5_000_000, 7_000_000]
+        )
+        json_exporter = self.create_json_exporter(
+            monkeypatch,
+            cli_cmd,
+            stats={"request_latency": {"unit": "ms", "avg": 6.0}},
+            metrics=metrics,
+        )
+        json_exporter.export()
+
+        _, data = next(iter(mock_read_write))
+        json_output = json.loads(data)
+
+        assert list(json_output["sketches"]) == ["request_latency"]
+        sketch = QuantileSketch.from_dict(json_output["sketches"]["request_latency"])
+        assert sketch.count == 2
+        assert sketch.min == 5_000_000
+        assert sketch.max == 7_000_000
+
+    def test_generate_json_without_sketches(
+        self, monkeypatch, mock_read_write: pytest.MonkeyPatch
+    ) -> None:
+        cli_cmd = [
+            "genai-perf",
+            "profile",
+            "-m",
+            "test_model",
+            "--endpoint-type",
+            "chat",
+        ]
+        json_exporter = self.create_json_exporter(monkeypatch, cli_cmd, stats={})
+        json_exporter.export()
+
+        _, data = next(iter(mock_read_write))
+        json_output = json.loads(data)
+
+        assert "sketches" not in json_output
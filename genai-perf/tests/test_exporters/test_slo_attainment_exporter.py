@@ -0,0 +1,115 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import json
+from io import StringIO
+from typing import Any, List, Tuple
+
+import pytest
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.export_data.slo_attainment_exporter import SLOAttainmentExporter
+from genai_perf.goodput_calculator import SLOAttainment
+from genai_perf.metrics import LLMMetrics
+from tests.test_utils import create_default_exporter_config
+
+
+class TestSLOAttainmentExporter:
+    @pytest.fixture
+    def mock_read_write(self, monkeypatch: pytest.MonkeyPatch) -> List[Tuple[str, str]]:
+        """
+        This function will mock the open function for specific files.
+        """
+
+        written_data = []
+
+        def custom_open(filename, *args, **kwargs):
+            def write(self: Any, content: str) -> int:
+                written_data.append((str(filename), content))
+                return len(content)
+
+            tmp_file = StringIO()
+            tmp_file.write = write.__get__(tmp_file)
+            return tmp_file
+
+        monkeypatch.setattr("builtins.open", custom_open)
+
+        return written_data
+
+    @pytest.fixture
+    def slo_attainment(self) -> SLOAttainment:
+        metrics = LLMMetrics(
+            time_to_first_tokens=[1_000_000, 2_000_000, 3_000_000],  # 1, 2, 3 ms
+            inter_token_latencies=[3_000_000, 1_000_000, 2_000_000],  # 3, 1, 2 ms
+        )
+        return SLOAttainment(
+            ["time_to_first_token", "inter_token_latency"],
+            metrics,
+            benchmark_duration=2.0,
+            grid_size=3,
+        )
+
+    def test_export(self, mock_read_write, slo_attainment: SLOAttainment) -> None:
+        config = ConfigCommand({"model_name": "test_model"})
+        exporter_config = create_default_exporter_config(
+            config=config, slo_attainment=slo_attainment
+        )
+
+        SLOAttainmentExporter(exporter_config).export()
+
+        files = dict(mock_read_write)
+        assert len(files) == 2
+        json_file = next(f for f in files if f.endswith(".json"))
+        csv_file = next(f for f in files if f.endswith(".csv"))
+        assert json_file.endswith("profile_export_genai_perf_slo_attainment.json")
+        assert csv_file.endswith("profile_export_genai_perf_slo_attainment.csv")
+
+        data = json.loads(files[json_file])
+        assert data["num_requests"] == 3
+        assert data["slos"][0] == {
+            "name": "time_to_first_token",
+            "unit": "ms",
+            "thresholds": [1.0, 2.0, 3.0],
+        }
+        assert data["fractions"][2][2] == 1.0
+        assert data["goodputs"][1][2] == 1.0
+
+        csv_lines = "".join(
+            content for filename, content in mock_read_write if filename == csv_file
+        ).splitlines()
+        assert csv_lines[0] == (
+            "time_to_first_token (ms),inter_token_latency (ms),"
+            "fraction,goodput (requests/sec)"
+        )
+        assert len(csv_lines) == 1 + 9
+        assert csv_lines[-1] == "3.0,3.0,1.0,1.5"
+
+    def test_export_without_slo_attainment(self, mock_read_write) -> None:
+        exporter_config = create_default_exporter_config()
+
+        SLOAttainmentExporter(exporter_config).export()
+
+        assert mock_read_write == []
@@ -0,0 +1,109 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+from io import StringIO
+from typing import Any, List, Tuple
+
+import pytest
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.export_data.timeline_exporter import TimelineExporter
+from genai_perf.metrics import Timeline
+from tests.test_utils import create_default_exporter_config
+
+S = 1_000_000_000  # nanoseconds per second
+
+
+class TestTimelineExporter:
+    @pytest.fixture
+    def mock_read_write(self, monkeypatch: pytest.MonkeyPatch) -> List[Tuple[str, str]]:
+        """
+        This function will mock the open function for specific files.
+        """
+
+        written_data = []
+
+        def custom_open(filename, *args, **kwargs):
+            def write(self: Any, content: str) -> int:
+                written_data.append((str(filename), content))
+                return len(content)
+
+            tmp_file = StringIO()
+            tmp_file.write = write.__get__(tmp_file)
+            return tmp_file
+
+        monkeypatch.setattr("builtins.open", custom_open)
+
+        return written_data
+
+    @pytest.fixture
+    def timeline(self) -> Timeline:
+        return Timeline(
+            request_timestamps=[0, S],
+            first_response_timestamps=[S // 10, S + S // 5],
+            last_response_timestamps=[S, 2 * S],
+            num_responses=[1, 1],
+            output_sequence_lengths=[1, 1],
+            bucket_size=1.0,
+            rolling_window=1.0,
+        )
+
+    def test_export(self, mock_read_write, timeline: Timeline) -> None:
+        config = ConfigCommand({"model_name": "test_model"})
+        exporter_config = create_default_exporter_config(
+            config=config, timeline=timeline
+        )
+
+        TimelineExporter(exporter_config).export()
+
+        files = dict(mock_read_write)
+        assert len(files) == 2
+        json_file = next(f for f in files if f.endswith(".json"))
+        csv_file = next(f for f in files if f.endswith(".csv"))
+        assert json_file.endswith("profile_export_genai_perf_timeline.json")
+        assert csv_file.endswith("profile_export_genai_perf_timeline.csv")
+
+        data = json.loads(files[json_file])
+        assert data["units"]["output_token_throughput"] == "tokens/sec"
+        assert [bucket["start"] for bucket in data["buckets"]] == [0.0, 1.0]
+        assert data["buckets"][0]["time_to_first_token_p50"] == pytest.approx(100)
+        assert data["buckets"][1]["inter_token_latency_p50"] is None
+
+        csv_lines = "".join(
+            content for filename, content in mock_read_write if filename == csv_file
+        ).splitlines()
+        assert csv_lines[0].startswith(
+            "window,start (s),end (s),request_throughput (requests/sec),"
+        )
+        assert csv_lines[1].startswith("0,0.0,1.0,1.0,1.0,1.0,100.0")
+        assert csv_lines[2].endswith(",,,")
+
+    def test_export_without_timeline(self, mock_read_write) -> None:
+        exporter_config = create_default_exporter_config()
+
+        TimelineExporter(exporter_config).export()
+
+        assert mock_read_write == []
@@ -0,0 +1,80 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Importing the CLI takes about 0.15s, the budget leaves room for slow machines
+IMPORT_TIME_BUDGET = 2.0
+
+# The dependencies that only some code paths need, such as the plots with
+# --generate-plots, or the images and audio of multi-modal inputs
+DEFERRED_MODULES = [
+    "jinja2",
+    "numpy",
+    "pandas",
+    "PIL.Image",
+    "plotly",
+    "requests",
+    "soundfile",
+    "transformers",
+]
+
+
+def _import_in_subprocess(module: str):
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start, "
+        "'modules': list(sys.modules)}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestImportTime:
+    def test_import_main_within_budget(self) -> None:
+        result = _import_in_subprocess("genai_perf.main")
+
+        assert result["seconds"] < IMPORT_TIME_BUDGET
+
+    @pytest.mark.parametrize("module", ["genai_perf.main", "genai_perf.parser"])
+    def test_heavy_dependencies_are_deferred(self, module: str) -> None:
+        modules = set(_import_in_subprocess(module)["modules"])
+
+        assert [name for name in DEFERRED_MODULES if name in modules] == []
+
+    def test_profile_defers_plots(self) -> None:
+        modules = set(_import_in_subprocess("genai_perf.subcommand.profile")["modules"])
+
+        assert "pandas" not in modules
+        assert "plotly" not in modules
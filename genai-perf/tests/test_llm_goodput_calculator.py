@@ -144,3 +144,81 @@ class TestLLMGoodputCalculator:
         assert gc_2.goodput is None
         gc_2.compute()
         assert gc_2.goodput == [0.0]
+
+    def test_compute_pairs_metrics_by_request(self) -> None:
+        # the second request has a single response and no ITL
+        test_llm_metrics = LLMMetrics(
+            request_latencies=[5, 5, 5],
+            time_to_first_tokens=[1, 3, 1],
+            inter_token_latencies=[4, 1],
+        )
+        test_llm_metrics.set_request_indices("inter_token_latencies", [0, 2])
+
+        gc = LLMGoodputCalculator(
+            goodput_constraints={
+                "time_to_first_token": 2e-6,  # ms
+                "inter_token_latency": 2e-6,  # ms
+            },
+            metric=test_llm_metrics,
+            benchmark_duration=self.TEST_BENCHMARK_DURATION,
+        )
+        gc.compute()
+        # only the third request meets both SLOs
+        assert gc.goodput == [0.1]
+
+    def test_compute_goodput_profiles(self) -> None:
+        """
+        LLMMetrics
+        * time to first tokens: [2, 5, 8]
+        * inter token latencies: [1, 3, 2]
+        * output token throughputs per user: [1/2e-9, 1/4e-9, 1/1e-9]
+
+        Request good counts according to each constraint set:
+            - goodput constraints (time_to_first_token <= 6): 2
+            - interactive (time_to_first_token <= 3, inter_token_latency <= 2): 1
+            - batch (output_token_throughput_per_user >= 0.4e9): 2
+            - invalid: a metric that does not exist
+        """
+        test_llm_metrics = LLMMetrics(
+            time_to_first_tokens=[2, 5, 8],
+            inter_token_latencies=[1, 3, 2],
+            output_token_throughputs_per_user=[
+                1 / ns_to_sec(2),
+                1 / ns_to_sec(4),
+                1 / ns_to_sec(1),
+            ],
+        )
+
+        gc = LLMGoodputCalculator(
+            goodput_constraints={"time_to_first_token": 6e-6},  # ms
+            metric=test_llm_metrics,
+            benchmark_duration=self.TEST_BENCHMARK_DURATION,
+            goodput_profiles={
+                "interactive": {
+                    "time_to_first_token": 3e-6,  # ms
+                    "inter_token_latency": 2e-6,  # ms
+                },
+                "batch": {"output_token_throughput_per_user": 0.4e9},  # s
+                "invalid": {"hello1234": 1},
+            },
+        )
+        assert gc.goodputs_by_profile == {}
+        gc.compute()
+        assert gc.goodput == [0.2]
+        assert gc.goodputs_by_profile == {
+            "interactive": [0.1],
+            "batch": [0.2],
+            "invalid": LLMGoodputCalculator.INVALID_GOODPUT,
+        }
+
+    def test_compute_goodput_profiles_only(self) -> None:
+        gc = LLMGoodputCalculator(
+            goodput_constraints={},
+            metric=self.TEST_METRIC,
+            benchmark_duration=self.TEST_BENCHMARK_DURATION,
+            goodput_profiles={"strict": self.TEST_GOODPUT_CONSTRAINTS},
+        )
+
+        gc.compute()
+        assert gc.goodput is None
+        assert gc.goodputs_by_profile == {"strict": [0.1]}
@@ -24,8 +24,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import numpy as np
 import pytest
-from genai_perf.metrics import LLMMetrics
+from genai_perf.metrics import LLMMetrics, RaggedArray
 
 
 class TestLLMMetrics:
@@ -155,3 +156,28 @@ class TestLLMMetrics:
         assert metrics.get_base_name("request_goodputs") == "request_goodput"
         with pytest.raises(KeyError):
             metrics.get_base_name("hello1234")
+
+    def test_llm_metrics_chunked_inter_token_latencies(self) -> None:
+        """Test that the chunked ITLs are stored as a ragged array."""
+        metrics = LLMMetrics(
+            request_latencies=[3, 44, 5],
+            chunked_inter_token_latencies=[[1, 2, 3], [], [4, 5]],
+        )
+        chunked_itls = metrics._chunked_inter_token_latencies
+        assert isinstance(chunked_itls, RaggedArray)
+        assert len(chunked_itls) == 3
+        assert chunked_itls.values.tolist() == [1, 2, 3, 4, 5]
+        assert chunked_itls.offsets.tolist() == [0, 3, 3, 5]
+        assert chunked_itls.lengths().tolist() == [3, 0, 2]
+        assert chunked_itls[-1].tolist() == [4, 5]
+        assert chunked_itls.to_lists() == [[1, 2, 3], [], [4, 5]]
+        assert chunked_itls == RaggedArray([1, 2, 3, 4, 5], [0, 3, 3, 5])
+
+    def test_llm_metrics_token_count_dtype(self) -> None:
+        metrics = LLMMetrics(
+            output_sequence_lengths=[3, 4],
+            input_sequence_lengths=[12, 34],
+        )
+        assert metrics.arrays["output_sequence_lengths"].dtype == np.int32
+        assert metrics.arrays["input_sequence_lengths"].dtype == np.int32
+        assert metrics.input_sequence_lengths == [12, 34]
@@ -24,8 +24,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from array import array
+
+import numpy as np
 import pytest
-from genai_perf.metrics import Metrics
+from genai_perf.metrics import LLMMetrics, Metrics
 
 
 class TestMetrics:
@@ -72,3 +75,66 @@ class TestMetrics:
         assert metrics.get_base_name("request_count") == "request_count"
         with pytest.raises(KeyError):
             metrics.get_base_name("hello1234")
+
+    def test_metrics_arrays(self) -> None:
+        """Test that the metrics are stored as typed arrays."""
+        metrics = Metrics(
+            request_throughputs=[10],
+            request_latencies=array("q", [3, 44]),
+            request_goodputs=None,
+        )
+        arrays = metrics.arrays
+        assert list(arrays) == [
+            "request_throughputs",
+            "request_latencies",
+            "request_goodputs",
+            "request_count",
+        ]
+        assert arrays["request_throughputs"].dtype == np.float64
+        assert arrays["request_latencies"].dtype == np.int64
+        assert arrays["request_goodputs"] is None
+        assert arrays["request_count"].tolist() == [2]
+
+        # the attributes are still readable and assignable as lists
+        assert metrics.request_latencies == [3, 44]
+        metrics.request_goodputs = [9.88]
+        assert metrics.data["request_goodputs"] == [9.88]
+
+    def test_metrics_lists_are_cached(self) -> None:
+        """Test that reading a metric converts its array to a list only once."""
+        metrics = Metrics(request_latencies=[3, 44])
+        latencies = metrics.request_latencies
+        assert metrics.request_latencies is latencies
+        assert metrics.data["request_latencies"] is latencies
+
+        # assigning the metric invalidates the cached list
+        metrics.request_latencies = [5]
+        assert metrics.request_latencies == [5]
+        assert latencies == [3, 44]
+
+    def test_metrics_data_only_has_columns(self) -> None:
+        metrics = Metrics(request_latencies=[3, 44])
+        metrics.request_goodputs_by_profile = {"strict": [1.0]}
+        assert "request_goodputs_by_profile" not in metrics.data
+        assert list(metrics.data) == list(metrics.arrays)
+
+    def test_metrics_request_aligned_arrays(self) -> None:
+        """Test that the metrics of only some requests are aligned by request."""
+        metrics = LLMMetrics(
+            request_latencies=[5, 6, 7],
+            time_to_first_tokens=[1, 2, 3],
+            inter_token_latencies=[4, 9],
+        )
+        metrics.set_request_indices("inter_token_latencies", [0, 2])
+        arrays = metrics.get_request_aligned_arrays(
+            ["time_to_first_tokens", "inter_token_latencies"]
+        )
+        assert arrays["time_to_first_tokens"].tolist() == [1.0, 2.0, 3.0]
+        assert np.array_equal(
+            arrays["inter_token_latencies"], [4.0, np.nan, 9.0], equal_nan=True
+        )
+
+    def test_metrics_float_values_are_not_truncated(self) -> None:
+        metrics = Metrics(request_latencies=[1.5, 2.5])
+        assert metrics.arrays["request_latencies"].dtype == np.float64
+        assert metrics.request_latencies == [1.5, 2.5]
@@ -0,0 +1,104 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+
+import numpy as np
+import pytest
+from genai_perf.metrics.quantile_sketch import QuantileSketch
+
+PERCENTILES = [1, 25, 50, 75, 90, 95, 99]
+
+
+class TestQuantileSketch:
+    def test_percentiles_within_relative_accuracy(self) -> None:
+        values = np.random.default_rng(0).lognormal(3, 1, 10_000)
+
+        sketch = QuantileSketch.from_values(values)
+
+        expected = np.percentile(values, PERCENTILES)
+        actual = sketch.percentiles(PERCENTILES)
+        assert np.all(np.abs(actual - expected) <= 0.01 * expected)
+        assert sketch.count == 10_000
+        assert sketch.min == values.min()
+        assert sketch.max == values.max()
+        assert sketch.mean == pytest.approx(values.mean())
+        assert sketch.std == pytest.approx(values.std())
+
+    def test_merge_equals_sketch_of_all_values(self) -> None:
+        rng = np.random.default_rng(1)
+        parts = [rng.exponential(scale, 1000) for scale in (1, 100, 10_000)]
+
+        merged = QuantileSketch.merge_all(
+            QuantileSketch.from_values(part) for part in parts
+        )
+        expected = QuantileSketch.from_values(np.concatenate(parts))
+
+        assert merged.count == expected.count
+        assert merged.offset == expected.offset
+        np.testing.assert_array_equal(merged.counts, expected.counts)
+        assert merged.min == expected.min
+        assert merged.max == expected.max
+        assert merged.sum == pytest.approx(expected.sum)
+        np.testing.assert_allclose(
+            merged.percentiles(PERCENTILES), expected.percentiles(PERCENTILES)
+        )
+
+    def test_merge_empty_sketch(self) -> None:
+        sketch = QuantileSketch.from_values([1, 2, 3])
+
+        sketch.merge(QuantileSketch())
+
+        assert sketch.count == 3
+        assert sketch.min == 1
+        assert sketch.max == 3
+
+    def test_zero_values(self) -> None:
+        sketch = QuantileSketch.from_values([0, 0, 0, 10])
+
+        assert sketch.zero_count == 3
+        np.testing.assert_allclose(sketch.percentiles([0, 50, 100]), [0, 0, 10])
+
+    def test_to_dict_round_trip(self) -> None:
+        sketch = QuantileSketch.from_values([0, 1.5, 20, 300])
+
+        data = json.loads(json.dumps(sketch.to_dict()))
+        restored = QuantileSketch.from_dict(data)
+
+        assert restored.to_dict() == sketch.to_dict()
+        np.testing.assert_array_equal(
+            restored.percentiles(PERCENTILES), sketch.percentiles(PERCENTILES)
+        )
+
+    def test_merge_different_relative_accuracy(self) -> None:
+        sketch = QuantileSketch(relative_accuracy=0.01)
+
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(relative_accuracy=0.02))
+
+    def test_percentiles_of_empty_sketch(self) -> None:
+        with pytest.raises(ValueError):
+            QuantileSketch().percentiles([50])
@@ -0,0 +1,96 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+from genai_perf.metrics import SteadyStateWindow, find_steady_state_window
+
+S = 1_000_000_000  # nanoseconds per second
+
+
+def _concurrency_run(slot_starts, num_requests, latency):
+    """Return the request and last response timestamps of a run in which each
+    concurrency slot sends its next request when the previous one ends."""
+    free = list(slot_starts)
+    req, last = [], []
+    for _ in range(num_requests):
+        slot = int(np.argmin(free))
+        req.append(free[slot])
+        last.append(free[slot] + latency)
+        free[slot] += latency
+    return req, last
+
+
+class TestSteadyState:
+    def test_trims_ramp_up_and_drain(self) -> None:
+        # The second slot starts 5s late and the first one ends 5s early
+        req, last = _concurrency_run([0, 5 * S], 20, 10 * S)
+
+        window = find_steady_state_window(req, last, tolerance=0.1)
+
+        assert window == SteadyStateWindow(
+            start=5 * S, end=100 * S, num_requests=18, num_trimmed_requests=2
+        )
+        assert window.duration == 95.0
+        assert window.contains(5 * S, 15 * S)
+        assert not window.contains(0, 10 * S)
+
+    def test_trims_unstable_throughput(self) -> None:
+        # The in-flight requests are steady, but the throughput of the first
+        # 10s is low because no request has completed yet
+        rng = np.random.default_rng(0)
+        req = rng.uniform(0, 100, 4000)
+        latency = np.where(req < 10, 10, 1)
+        req, last = (req * S).astype(np.int64), ((req + latency) * S).astype(np.int64)
+
+        window = find_steady_state_window(req, last, tolerance=0.2)
+
+        assert window is not None
+        assert window.start / S == pytest.approx(10, abs=5)
+        assert window.end / S == pytest.approx(101, abs=1)
+
+    def test_no_steady_state(self) -> None:
+        assert find_steady_state_window([0], [S], tolerance=0.1) is None
+        # All the requests overlap the edges of the steady state
+        req, last = [0, S, 2 * S], [10 * S, 11 * S, 12 * S]
+        assert find_steady_state_window(req, last, tolerance=0.1) is None
+
+    def test_low_load(self) -> None:
+        # The requests rarely overlap, so no request is in flight most of
+        # the time
+        req = [i * 1000 for i in range(20)]
+        last = [r + 100 for r in req]
+        assert find_steady_state_window(req, last, tolerance=0.1) is None
+
+    def test_to_dict(self) -> None:
+        window = SteadyStateWindow(S, 3 * S, 10, 2)
+        assert window.to_dict() == {
+            "start": S,
+            "end": 3 * S,
+            "duration": 2.0,
+            "num_requests": 10,
+            "num_trimmed_requests": 2,
+        }
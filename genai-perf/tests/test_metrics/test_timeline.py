@@ -0,0 +1,125 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+from genai_perf.metrics import Timeline
+
+S = 1_000_000_000  # nanoseconds per second
+
+# Three requests of 10, 3 and 5 output tokens:
+#  - 0.0s to 1.0s, first response at 0.1s, 4 responses
+#  - 0.5s to 2.0s, first response at 1.0s, 2 responses
+#  - 2.0s to 3.0s, first response at 2.1s, 5 responses
+REQUESTS = {
+    "request_timestamps": [0, S // 2, 2 * S],
+    "first_response_timestamps": [S // 10, S, 2 * S + S // 10],
+    "last_response_timestamps": [S, 2 * S, 3 * S],
+    "num_responses": [4, 2, 5],
+    "output_sequence_lengths": [10, 3, 5],
+}
+
+
+class TestTimeline:
+    def test_buckets(self) -> None:
+        timeline = Timeline(**REQUESTS, bucket_size=1.0, rolling_window=5.0)
+
+        columns = timeline.columns
+        assert len(timeline) == 3
+        assert columns["window"].tolist() == [0, 0, 0]
+        assert columns["start"].tolist() == [0.0, 1.0, 2.0]
+        assert columns["end"].tolist() == [1.0, 2.0, 3.0]
+        assert columns["request_throughput"].tolist() == [1.0, 1.0, 1.0]
+        # 10 tokens of the first request and the first token of the second one,
+        # then the 2 remaining tokens of the second request
+        assert columns["output_token_throughput"] == pytest.approx([11.0, 2.0, 5.0])
+        assert columns["in_flight_requests"] == pytest.approx([1.5, 1.0, 1.0])
+        assert columns["time_to_first_token_p50"] == pytest.approx([300, 300, 100])
+        assert columns["inter_token_latency_p50"] == pytest.approx([100, 300, 225])
+
+    def test_window_boundaries(self) -> None:
+        timeline = Timeline(
+            **REQUESTS,
+            bucket_size=1.0,
+            rolling_window=1.0,
+            window_boundaries=[0, 3 * S // 2, 3 * S],
+        )
+
+        columns = timeline.columns
+        # The last bucket of each window is cut at the window boundary
+        assert columns["window"].tolist() == [0, 0, 1, 1]
+        assert columns["start"].tolist() == [0.0, 1.0, 1.5, 2.5]
+        assert columns["end"].tolist() == [1.0, 1.5, 2.5, 3.0]
+        assert columns["request_throughput"].tolist() == [1.0, 0.0, 1.0, 2.0]
+        assert columns["output_token_throughput"] == pytest.approx(
+            [11.0, 2.0, 34 / 9, 40 / 9]
+        )
+        assert columns["inter_token_latency_p50"] == pytest.approx([100, 100, 500, 225])
+
+    def test_total_output_tokens(self) -> None:
+        rng = np.random.default_rng(0)
+        req = np.sort(rng.integers(0, 60 * S, 1000))
+        first = req + rng.integers(S // 100, S, 1000)
+        last = first + rng.integers(0, 10 * S, 1000)
+        osl = rng.integers(1, 500, 1000)
+
+        timeline = Timeline(req, first, last, np.full(1000, 8), osl, 0.7, 5.0)
+
+        columns = timeline.columns
+        widths = columns["end"] - columns["start"]
+        total_tokens = (columns["output_token_throughput"] * widths).sum()
+        assert total_tokens == pytest.approx(osl.sum())
+        total_requests = (columns["request_throughput"] * widths).sum()
+        assert total_requests == pytest.approx(1000)
+        latency = (last - req).sum() / S
+        assert (columns["in_flight_requests"] * widths).sum() == pytest.approx(latency)
+
+    def test_to_dict(self) -> None:
+        timeline = Timeline(
+            **REQUESTS,
+            bucket_size=1.0,
+            rolling_window=0.2,
+            window_boundaries=[0, 3 * S // 2, 3 * S],
+        )
+
+        data = timeline.to_dict()
+        assert data["bucket_size"] == 1.0
+        assert data["units"]["request_throughput"] == "requests/sec"
+        assert data["units"]["inter_token_latency_p99"] == "ms"
+        assert len(data["buckets"]) == 4
+        assert data["buckets"][2]["window"] == 1
+        # buckets without any request have no percentiles
+        assert data["buckets"][1]["inter_token_latency_p50"] is None
+        assert data["buckets"][1]["time_to_first_token_p50"] is None
+
+    def test_no_requests(self) -> None:
+        timeline = Timeline([], [], [], [], [], bucket_size=1.0, rolling_window=5.0)
+        assert len(timeline) == 0
+        assert timeline.to_dict()["buckets"] == []
+
+    def test_invalid_bucket_size(self) -> None:
+        with pytest.raises(ValueError):
+            Timeline(**REQUESTS, bucket_size=0, rolling_window=5.0)
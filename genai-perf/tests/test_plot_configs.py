@@ -25,13 +25,21 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
 
 # Skip type checking to avoid mypy error
 # Issue: https://github.com/python/mypy/issues/10632
 import yaml  # type: ignore
 from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.metrics import LLMMetrics, Statistics
 from genai_perf.plots.plot_config import PlotType
-from genai_perf.plots.plot_config_parser import PlotConfigParser
+from genai_perf.plots.plot_config_parser import (
+    PlotConfigParser,
+    downsample_by_position,
+)
 
 
 class TestPlotConfigParser:
@@ -65,6 +73,21 @@ class TestPlotConfigParser:
       output: test_output_2
     """
 
+    token_position_yaml = """
+    plot1:
+      title: Token-to-Token Latency vs Output Token Position
+      x_metric: token_positions
+      y_metric: inter_token_latencies
+      x_label: Output Token Position
+      y_label: Token-to-Token Latency (ms)
+      width: 700
+      height: 450
+      type: scatter
+      paths:
+        - run1/concurrency1.json
+      output: test_output
+    """
+
     def test_generate_configs(self, monkeypatch) -> None:
         monkeypatch.setattr(
             "genai_perf.plots.plot_config_parser.load_yaml",
@@ -112,3 +135,139 @@ class TestPlotConfigParser:
         assert prd.name == "run4/concurrency1"
         assert prd.x_metric == [1, 2, 3]
         assert prd.y_metric == [1, 2, 3]
+
+    def test_generate_configs_parses_each_path_once(self, monkeypatch) -> None:
+        file_configs = yaml.safe_load(self.yaml_config)
+        # Every plot uses the same two runs
+        for file_config in file_configs.values():
+            file_config["paths"] = [
+                "run1/concurrency32.json",
+                "run2/concurrency32.json",
+            ]
+        monkeypatch.setattr(
+            "genai_perf.plots.plot_config_parser.load_yaml", lambda _: file_configs
+        )
+        monkeypatch.setattr(PlotConfigParser, "_get_metric", lambda *_: [1, 2, 3])
+
+        # The statistics of run1 are already in memory
+        run1_stats = MagicMock()
+        config_parser = PlotConfigParser(
+            Path("test_config.yaml"),
+            statistics={Path("run1/concurrency32.json"): run1_stats},
+        )
+        config = ConfigCommand({"model_name": "test_model"})
+        with patch(
+            "genai_perf.plots.plot_config_parser.get_tokenizer"
+        ) as mock_get_tokenizer, patch(
+            "genai_perf.plots.plot_config_parser.LLMProfileDataParser"
+        ) as mock_data_parser:
+            mock_data_parser.return_value.get_profile_load_info.return_value = [
+                ("concurrency", "32")
+            ]
+            plot_configs = config_parser.generate_configs(config)
+
+        assert len(plot_configs) == 2
+        mock_get_tokenizer.assert_called_once()
+        mock_data_parser.assert_called_once()
+        assert mock_data_parser.call_args.kwargs["filename"] == Path(
+            "run2/concurrency32.json"
+        )
+        assert config_parser._get_statistics("run1/concurrency32.json", config) is (
+            run1_stats
+        )
+
+    def test_generate_configs_uses_given_tokenizer(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            "genai_perf.plots.plot_config_parser.load_yaml",
+            lambda _: yaml.safe_load(self.yaml_config),
+        )
+        monkeypatch.setattr(PlotConfigParser, "_get_metric", lambda *_: [1, 2, 3])
+
+        tokenizer = MagicMock()
+        config_parser = PlotConfigParser(Path("test_config.yaml"), tokenizer=tokenizer)
+        config = ConfigCommand({"model_name": "test_model"})
+        with patch(
+            "genai_perf.plots.plot_config_parser.get_tokenizer"
+        ) as mock_get_tokenizer, patch(
+            "genai_perf.plots.plot_config_parser.LLMProfileDataParser"
+        ) as mock_data_parser:
+            mock_data_parser.return_value.get_profile_load_info.return_value = [
+                ("concurrency", "32")
+            ]
+            config_parser.generate_configs(config)
+
+        mock_get_tokenizer.assert_not_called()
+        # One parse for each of the four distinct paths
+        assert mock_data_parser.call_count == 4
+        for call in mock_data_parser.call_args_list:
+            assert call.kwargs["tokenizer"] is tokenizer
+
+    def test_generate_configs_token_positions(self, monkeypatch) -> None:
+        file_configs = yaml.safe_load(self.token_position_yaml)
+        monkeypatch.setattr(
+            "genai_perf.plots.plot_config_parser.load_yaml", lambda _: file_configs
+        )
+        metrics = LLMMetrics(
+            inter_token_latencies=[2_000_000, 0, 5_000_000],
+            chunked_inter_token_latencies=[
+                [1_000_000, 2_000_000, 3_000_000],
+                [],
+                [4_000_000, 5_000_000],
+            ],
+        )
+        config_parser = PlotConfigParser(
+            Path("test_config.yaml"),
+            statistics={Path("run1/concurrency1.json"): Statistics(metrics)},
+        )
+        config = ConfigCommand({"model_name": "test_model"})
+
+        (plot_config,) = config_parser.generate_configs(config)
+
+        prd = plot_config.data[0]
+        # one point for each token latency, in ms
+        assert list(prd.x_metric) == [1, 2, 3, 1, 2]
+        assert list(prd.y_metric) == [1, 2, 3, 4, 5]
+
+        config.output.plot_max_points = 4
+        (plot_config,) = config_parser.generate_configs(config)
+
+        prd = plot_config.data[0]
+        # the minimum and maximum of each position are kept
+        assert sorted(zip(prd.x_metric, prd.y_metric)) == [
+            (1, 1),
+            (1, 4),
+            (2, 2),
+            (2, 5),
+            (3, 3),
+        ]
+
+
+class TestDownsampleByPosition:
+    def test_keeps_points_under_budget(self) -> None:
+        positions = np.array([1, 2, 1])
+        values = np.array([3, 2, 1])
+
+        x, y = downsample_by_position(positions, values, max_points=3)
+
+        assert x is positions and y is values
+
+    def test_keeps_distribution_and_tail_of_each_position(self) -> None:
+        rng = np.random.default_rng(0)
+        positions = np.repeat([1, 2, 3], [60_000, 30_000, 10_000])
+        values = rng.lognormal(size=len(positions))
+
+        x, y = downsample_by_position(positions, values, max_points=1000)
+
+        assert 1000 <= len(x) <= 1000 + 3 * 3
+        for position, share in [(1, 0.6), (2, 0.3), (3, 0.1)]:
+            all_values = values[positions == position]
+            kept = y[x == position]
+            assert len(kept) == pytest.approx(1000 * share, abs=3)
+            assert kept.min() == all_values.min()
+            assert kept.max() == all_values.max()
+            assert np.median(kept) == pytest.approx(np.median(all_values), rel=0.05)
+            # the values at the tail percentiles are kept exactly
+            sorted_values = np.sort(all_values)
+            for percentile in [90, 99, 99.9]:
+                rank = round(percentile / 100 * (len(all_values) - 1))
+                assert sorted_values[rank] in kept
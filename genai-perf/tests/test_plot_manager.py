@@ -0,0 +1,128 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from genai_perf.plots import plot_manager
+from genai_perf.plots.box_plot import BoxPlot
+from genai_perf.plots.plot_config import PlotConfig, PlotType, ProfileRunData
+from genai_perf.plots.plot_manager import PlotManager
+
+
+def create_plot_config(title: str, type: PlotType, output: Path) -> PlotConfig:
+    return PlotConfig(
+        title=title,
+        data=[ProfileRunData(name="run1", x_metric=[1, 2, 3], y_metric=[4, 5, 6])],
+        x_label="x",
+        y_label="y",
+        width=700,
+        height=450,
+        type=type,
+        output=output,
+    )
+
+
+class TestPlotManager:
+    @pytest.mark.parametrize(
+        "num_configs, num_workers, expected_workers",
+        [(0, None, 1), (1, None, 1), (3, 8, 3), (3, 2, 2), (3, 0, 1)],
+    )
+    def test_num_workers(self, num_configs, num_workers, expected_workers):
+        configs = [
+            create_plot_config(f"plot {i}", PlotType.BOX, Path("")) for i in range(3)
+        ][:num_configs]
+        plot_manager = PlotManager(configs, num_workers=num_workers)
+        assert plot_manager._num_workers == expected_workers
+
+    @patch("genai_perf.plots.plot_manager.ProcessPoolExecutor")
+    @patch("genai_perf.plots.plot_manager.BoxPlot")
+    def test_generate_plots_serially(self, mock_box_plot, mock_executor):
+        config = create_plot_config("Request Latency", PlotType.BOX, Path("plots"))
+
+        PlotManager([config]).generate_plots()
+
+        mock_executor.assert_not_called()
+        mock_box_plot.assert_called_once_with(config.data, False)
+        kwargs = mock_box_plot.return_value.create_plot.call_args.kwargs
+        assert kwargs["filename_root"] == "request_latency"
+        assert kwargs["output_dir"] == Path("plots")
+
+    def test_generate_plots_in_pool(self, tmp_path):
+        configs = [
+            create_plot_config("Box Plot", PlotType.BOX, tmp_path),
+            create_plot_config("Heat Map", PlotType.HEATMAP, tmp_path),
+            create_plot_config("Scatter Plot", PlotType.SCATTER, tmp_path),
+        ]
+
+        PlotManager(configs, num_workers=2).generate_plots()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "box_plot.gzip",
+            "box_plot.html",
+            "heat_map.gzip",
+            "heat_map.html",
+            "scatter_plot.gzip",
+            "scatter_plot.html",
+        ]
+
+    def test_generate_plots_in_pool_raises_worker_error(self, tmp_path):
+        configs = [
+            create_plot_config("Box Plot", PlotType.BOX, tmp_path / "missing"),
+            create_plot_config("Scatter Plot", PlotType.SCATTER, tmp_path),
+        ]
+
+        with pytest.raises(OSError):
+            PlotManager(configs, num_workers=2).generate_plots()
+
+    @patch("multiprocessing.util.Finalize")
+    def test_init_plot_worker_starts_kaleido_once(self, mock_finalize):
+        mock_kaleido = MagicMock()
+        with patch.dict("sys.modules", {"kaleido": mock_kaleido}):
+            plot_manager._init_plot_worker()
+
+        mock_kaleido.start_sync_server.assert_called_once_with(silence_warnings=True)
+        mock_finalize.assert_called_once()
+        assert mock_finalize.call_args.args[1] is mock_kaleido.stop_sync_server
+
+
+class TestStaticImages:
+    @pytest.mark.parametrize(
+        "static_images, expected_files",
+        [
+            (False, ["plot.html"]),
+            (True, ["plot.html", "plot.jpeg"]),
+        ],
+    )
+    def test_generate_graph_files(self, static_images, expected_files):
+        box_plot = BoxPlot([], static_images)
+        with patch.object(box_plot, "_generate_graph_file") as mock_generate:
+            box_plot._generate_graph_files(MagicMock(), Path(""), "plot")
+
+        assert [call.args[2] for call in mock_generate.call_args_list] == (
+            expected_files
+        )
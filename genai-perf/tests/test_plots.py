@@ -0,0 +1,115 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+from genai_perf.plots.box_plot import BoxPlot, summarize_box
+from genai_perf.plots.heat_map import HeatMap, bin_histogram2d
+from genai_perf.plots.plot_config import ProfileRunData
+
+
+class TestBoxPlot:
+    def test_summarize_box_with_all_points(self):
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 100]
+
+        summary = summarize_box(values, max_points=10)
+
+        assert (summary.q1, summary.median, summary.q3) == (3, 5, 7)
+        assert summary.mean == pytest.approx(136 / 9)
+        # the whiskers stop at the last points within 1.5 IQR of the box
+        assert (summary.lowerfence, summary.upperfence) == (1, 8)
+        assert summary.all_points
+        assert summary.points.tolist() == sorted(values)
+
+    def test_summarize_box_samples_outliers(self):
+        values = np.concatenate([np.arange(1000), np.arange(10_000, 10_100)])
+
+        summary = summarize_box(values, max_points=10)
+
+        assert not summary.all_points
+        assert len(summary.points) == 10
+        assert summary.points.min() == 10_000
+        assert summary.points.max() == 10_099
+        assert summary.upperfence == 999
+
+    def test_create_box_embeds_summary(self):
+        data = ProfileRunData(name="run1", x_metric=[], y_metric=list(range(5000)))
+        box_plot = BoxPlot([data])
+        box_plot.MAX_POINTS = 100
+
+        box = box_plot._create_box(data)
+
+        assert list(box.q1) == [1249.75]
+        assert list(box.median) == [2499.5]
+        assert list(box.q3) == [3749.25]
+        # no outliers to draw
+        assert len(box.y[0]) == 0
+        assert box.boxpoints == "outliers"
+
+    def test_create_box_without_values(self):
+        data = ProfileRunData(name="run1", x_metric=[], y_metric=[])
+
+        box = BoxPlot([data])._create_box(data)
+
+        assert box.q1 is None
+        assert len(box.y) == 0
+
+
+class TestHeatMap:
+    def test_bin_histogram2d_counts_every_value(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=100_000)
+        y = rng.normal(size=100_000)
+
+        x_centers, y_centers, counts = bin_histogram2d(x, y, max_bins=50)
+
+        assert counts.shape == (len(y_centers), len(x_centers))
+        assert len(x_centers) <= 50 and len(y_centers) <= 50
+        assert counts.sum() == 100_000
+
+    def test_bin_histogram2d_centers_integers(self):
+        x = [1, 2, 2, 3, 3, 3]
+        y = [10, 10, 10, 10, 10, 20]
+
+        x_centers, y_centers, counts = bin_histogram2d(x, y, max_bins=100)
+
+        assert x_centers.tolist() == [1, 2, 3]
+        widths = np.diff(y_centers)
+        assert np.all(widths == np.round(widths))
+        assert counts[0].tolist() == [1, 2, 2]
+        assert counts[-1].tolist() == [0, 0, 1]
+        assert counts.sum() == len(x)
+
+    def test_create_heat_map_embeds_bins(self):
+        data = ProfileRunData(
+            name="run1", x_metric=list(range(10_000)), y_metric=[5] * 10_000
+        )
+        heat_map = HeatMap([data])
+
+        hm = heat_map._create_heat_map(data)
+
+        assert len(hm.x) <= heat_map.MAX_BINS + 1
+        assert np.asarray(hm.z).sum() == 10_000
@@ -31,6 +31,7 @@ from unittest.mock import MagicMock, mock_open, patch
 import pytest
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.exceptions import GenAIPerfException
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 from genai_perf.metrics.statistics import Statistics
 from genai_perf.metrics.telemetry_statistics import TelemetryStatistics
 from genai_perf.subcommand.process_export_files import ProcessExportFiles
@@ -274,6 +275,139 @@ class TestProcessExportFilesHandler:
                 mock_pa.assert_not_called()
                 mock_gap.assert_not_called()
 
+    @pytest.fixture
+    def mock_sketches(self):
+        return {
+            "request_latency": QuantileSketch.from_values(
+                [5_000_000, 6_000_000]
+            ).to_dict()
+        }
+
+    def test_process_gap_profile_file_with_sketches(
+        self, process_export_files, mock_gap_profile_data, mock_sketches
+    ):
+        mock_gap_profile_data["request_count"] = {"unit": "count", "avg": 2}
+        mock_gap_profile_data["sketches"] = mock_sketches
+        with patch(
+            "builtins.open", mock_open(read_data=json.dumps(mock_gap_profile_data))
+        ):
+            process_export_files._process_gap_profile_file(Path("mock_gap.json"))
+        assert process_export_files._request_counts == [2]
+        assert process_export_files._sketch_dicts == [mock_sketches]
+
+    def test_parse_input_directory_merges_sketches(
+        self, process_export_files, mock_sketches
+    ):
+        process_export_files._config.output.export_timeline = False
+        process_export_files._config.output.steady_state_detection = False
+
+        mock_subdir = MagicMock()
+        mock_subdir.is_dir.return_value = True
+
+        mock_pa_file = MagicMock()
+        mock_pa_file.name = "pa_profile.json"
+        mock_gap_file = MagicMock()
+        mock_gap_file.name = "gap_profile_genai_perf.json"
+
+        mock_subdir.glob.side_effect = lambda pattern: (
+            [mock_pa_file, mock_gap_file] if pattern == "*.json" else []
+        )
+
+        def process_gap_profile_file(gap_profile_file):
+            process_export_files._throughput_metrics_dict["request_throughput"].append(
+                10.0
+            )
+            process_export_files._sketch_dicts.append(mock_sketches)
+
+        with patch.object(Path, "iterdir", return_value=[mock_subdir, mock_subdir]):
+            with patch.object(
+                process_export_files, "_process_pa_profile_file"
+            ) as mock_pa, patch.object(
+                process_export_files,
+                "_process_gap_profile_file",
+                side_effect=process_gap_profile_file,
+            ) as mock_gap:
+                process_export_files._parse_input_directory(Path("test_dir"))
+
+                mock_pa.assert_not_called()
+                assert mock_gap.call_count == 2
+
+    @pytest.mark.parametrize(
+        "input_config, export_timeline, steady_state_detection, has_sessions",
+        [
+            ({"goodput": {"request_latency": 10}}, False, False, False),
+            ({"goodput_profiles": {"fast": {}}}, False, False, False),
+            ({"slo_attainment": ["request_latency"]}, False, False, False),
+            ({}, True, False, False),
+            ({}, False, True, False),
+            ({}, False, False, True),
+        ],
+    )
+    def test_can_merge_sketches_needs_requests(
+        self,
+        process_export_files,
+        mock_sketches,
+        input_config,
+        export_timeline,
+        steady_state_detection,
+        has_sessions,
+    ):
+        process_export_files._config.output.export_timeline = export_timeline
+        process_export_files._config.output.steady_state_detection = (
+            steady_state_detection
+        )
+        process_export_files._input_config = {"input": input_config}
+        process_export_files._has_sessions = has_sessions
+        process_export_files._throughput_metrics_dict["request_throughput"] = [10.0]
+        process_export_files._sketch_dicts = [mock_sketches]
+
+        assert not process_export_files._can_merge_sketches()
+
+    def test_can_merge_sketches_missing_sketches(
+        self, process_export_files, mock_sketches
+    ):
+        process_export_files._config.output.export_timeline = False
+        process_export_files._config.output.steady_state_detection = False
+        process_export_files._throughput_metrics_dict["request_throughput"] = [
+            10.0,
+            10.0,
+        ]
+        process_export_files._sketch_dicts = [mock_sketches]
+
+        assert not process_export_files._can_merge_sketches()
+
+        process_export_files._sketch_dicts.append(mock_sketches)
+        assert process_export_files._can_merge_sketches()
+
+    def test_set_merged_statistics(self, process_export_files):
+        process_export_files._config.output.percentiles = [50, 99]
+        process_export_files._throughput_metrics_dict = {
+            "request_throughput": [10.0, 15.0],
+            "output_token_throughput": [100.0, 150.0],
+        }
+        process_export_files._request_counts = [2, 3]
+        process_export_files._sketch_dicts = [
+            {"request_latency": QuantileSketch.from_values([1e6, 2e6]).to_dict()},
+            {"request_latency": QuantileSketch.from_values([3e6, 4e6, 5e6]).to_dict()},
+        ]
+
+        process_export_files._set_merged_statistics()
+        stats = process_export_files._merged_statistics.stats_dict
+
+        assert stats["request_throughput"]["avg"] == 25.0
+        assert stats["output_token_throughput"]["avg"] == 250.0
+        assert stats["request_count"]["avg"] == 5
+        # The time metrics are scaled to milliseconds by the output reporter
+        assert stats["request_latency"]["avg"] == pytest.approx(3e6)
+        assert stats["request_latency"]["min"] == 1e6
+        assert stats["request_latency"]["max"] == 5e6
+        assert stats["request_latency"]["p50"] == pytest.approx(3e6, rel=0.01)
+        perf_stats = process_export_files._create_perf_stats(MagicMock(), MagicMock())
+        assert perf_stats is process_export_files._merged_statistics
+        assert (
+            process_export_files._create_session_stats(MagicMock(), MagicMock()) == {}
+        )
+
     def test_set_model_names(self, process_export_files):
         process_export_files._input_config = {"model_names": ["test_model"]}
         process_export_files._set_model_names()
@@ -375,6 +509,16 @@ class TestProcessExportFilesHandler:
         process_export_files._create_session_stats = MagicMock(
             return_value=mock_session_stats
         )
+        mock_timeline = MagicMock()
+        process_export_files._create_timeline = MagicMock(return_value=mock_timeline)
+        mock_steady_state_window = MagicMock()
+        process_export_files._create_steady_state_window = MagicMock(
+            return_value=mock_steady_state_window
+        )
+        mock_slo_attainment = MagicMock()
+        process_export_files._create_slo_attainment = MagicMock(
+            return_value=mock_slo_attainment
+        )
 
         perf_analyzer_config = MagicMock()
         objectives = MagicMock()
@@ -390,6 +534,9 @@ class TestProcessExportFilesHandler:
         process_export_files._create_session_stats.assert_called_once_with(
             perf_analyzer_config, objectives
         )
+        process_export_files._create_timeline.assert_called_once_with(
+            perf_analyzer_config, objectives
+        )
 
         mock_output_reporter.assert_called_once_with(
             mock_perf_stats,
@@ -397,6 +544,9 @@ class TestProcessExportFilesHandler:
             process_export_files._config,
             perf_analyzer_config,
             mock_session_stats,
+            mock_timeline,
+            mock_steady_state_window,
+            mock_slo_attainment,
         )
         mock_output_reporter.return_value.report_output.assert_called_once()
 
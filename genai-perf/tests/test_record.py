@@ -299,6 +299,46 @@ class TestRecord(unittest.TestCase):
             else:
                 self.assertEqual(metric1.calculate_percentage_gain(metric2), 100)
 
+    def test_percentile_record_type(self):
+        """
+        Test that a percentile without its own module is derived
+        from the p99 record type of the same metric
+        """
+        record_type = RecordType.get("request_latency_p99.9")
+
+        self.assertEqual(record_type.tag, "request_latency_p99.9")
+        self.assertEqual(record_type.header(), "p99.9 Request Latency (ms)")
+        self.assertIs(RecordType.get("request_latency_p99.9"), record_type)
+        self.assertNotIn("request_latency_p99.9", RecordType.get_all_record_types())
+
+        # Lower latency is better, as for the p99 record type
+        self.assertGreater(record_type(value=1), record_type(value=2))
+        self.assertEqual((record_type(value=1) + record_type(value=2)).value(), 3)
+
+        gpu_record = RecordType.get("gpu_utilization_p99.99")(value=50, device_uuid="0")
+        self.assertEqual(gpu_record.header(), "p99.99 GPU Utilization (%)")
+        self.assertEqual(gpu_record.device_uuid(), "0")
+
+    def test_percentile_record_type_without_percentiles(self):
+        """
+        Test that only the metrics with percentile records have derived ones
+        """
+        with self.assertRaises(KeyError):
+            RecordType.get("request_throughput_p99.9")
+
+    def test_get_all_record_types_imports_once(self):
+        """
+        Test that the record type modules are only listed and imported once
+        """
+        with patch("genai_perf.record.record.os.listdir") as mock_listdir:
+            record_types = RecordType.get_all_record_types()
+
+        mock_listdir.assert_not_called()
+        self.assertIs(record_types, RecordType.get_all_record_types())
+        self.assertIs(
+            RecordType.get("request_latency_p99"), record_types["request_latency_p99"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -28,8 +28,9 @@ IMPORT_PREFIX = "genai_perf.inputs.retrievers.synthetic_data_retriever"
 class TestSyntheticDataRetriever:
 
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @pytest.mark.parametrize(
         "batch_size_text, num_dataset_entries",
@@ -64,8 +65,9 @@ class TestSyntheticDataRetriever:
             assert all(text == "test prompt" for text in row.texts)
 
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @patch(
         f"{IMPORT_PREFIX}.SyntheticImageGenerator.create_synthetic_image",
@@ -127,8 +129,9 @@ class TestSyntheticDataRetriever:
                 assert row.audios[0] == "wav,test_base64_encoding"
 
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @patch(
         f"{IMPORT_PREFIX}.SyntheticImageGenerator.create_synthetic_image",
@@ -199,8 +202,9 @@ class TestSyntheticDataRetriever:
             assert all(audio == "wav,test_base64_encoding" for audio in row.audios)
 
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @pytest.mark.parametrize(
         "input_filenames, num_dataset_entries",
@@ -241,8 +245,9 @@ class TestSyntheticDataRetriever:
                 assert row.texts[0] == "test prompt"
 
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @patch(f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_prefix_prompts_pool")
     @patch(
@@ -300,8 +305,9 @@ class TestSyntheticDataRetriever:
         ],  # Generate predictable session IDs
     )
     @patch(
-        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompt",
-        return_value="test prompt",
+        f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_synthetic_prompts",
+        side_effect=lambda tokenizer, num_prompts, *args, **kwargs: ["test prompt"]
+        * num_prompts,
     )
     @patch(f"{IMPORT_PREFIX}.SyntheticPromptGenerator.create_prefix_prompts_pool")
     @patch(
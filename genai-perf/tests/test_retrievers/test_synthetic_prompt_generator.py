@@ -25,13 +25,16 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from contextlib import nullcontext as does_not_raise
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.exceptions import GenAIPerfException
 from genai_perf.inputs.retrievers.synthetic_prompt_generator import (
     SyntheticPromptGenerator,
 )
+from genai_perf.tokenized_corpus_cache import TokenizedCorpusCache
 from genai_perf.tokenizer import get_tokenizer
 
 
@@ -89,3 +92,139 @@ class TestSyntheticPromptGenerator:
                 prompt_hash_list=[1, 2, 3],
                 block_size=5,
             )
+
+    def test_initialize_corpus_with_cache(self, tmp_path, monkeypatch):
+        for name, value in [
+            ("_tokenized_corpus", None),
+            ("_corpus_length", 0),
+            ("_corpus_cache", None),
+        ]:
+            monkeypatch.setattr(SyntheticPromptGenerator, name, value)
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not\nto be, that is\nthe question\n")
+        tokenizer = MagicMock()
+        tokenizer.side_effect = lambda texts: {
+            "input_ids": [[len(w) for w in text.split()] for text in texts]
+        }
+        tokenizer.get_identifier.return_value = "test_tokenizer@main"
+
+        SyntheticPromptGenerator.set_corpus_cache(TokenizedCorpusCache(tmp_path))
+        SyntheticPromptGenerator._initialize_corpus(tokenizer, str(corpus_path))
+        tokens = SyntheticPromptGenerator._tokenized_corpus.tolist()
+        num_tokenizer_calls = tokenizer.call_count
+
+        # The tokens are memory-mapped from the cache without tokenizing again
+        SyntheticPromptGenerator._tokenized_corpus = None
+        SyntheticPromptGenerator._initialize_corpus(tokenizer, str(corpus_path))
+
+        assert tokenizer.call_count == num_tokenizer_calls
+        assert SyntheticPromptGenerator._tokenized_corpus.tolist() == tokens
+        assert SyntheticPromptGenerator._corpus_length == len(tokens)
+        prompt_tokens = SyntheticPromptGenerator._generate_prompt_tokens(3)
+        assert len(prompt_tokens) == 3
+        assert prompt_tokens.dtype == np.int32
+
+    def test_small_text_corpus(self, tmp_path, monkeypatch):
+        for name, value in [
+            ("_tokenized_corpus", None),
+            ("_corpus_length", 0),
+            ("_corpus_file", None),
+            ("_corpus_cache", None),
+            ("_cache", {}),
+        ]:
+            monkeypatch.setattr(SyntheticPromptGenerator, name, value)
+        # Fewer lines than threads
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not\nto be\n")
+        tokenizer = MagicMock()
+        tokenizer.side_effect = lambda texts: {
+            "input_ids": [[len(w) for w in text.split()] for text in texts]
+        }
+
+        SyntheticPromptGenerator.set_corpus_file(corpus_path)
+        SyntheticPromptGenerator._initialize_corpus(tokenizer)
+
+        assert SyntheticPromptGenerator._tokenized_corpus.tolist() == [2, 3, 2, 3, 2, 2]
+        tokenizer.assert_called_once_with(["To be, or not to be"])
+
+        # A corpus without any token is rejected
+        corpus_path.write_text("\n")
+        SyntheticPromptGenerator._tokenized_corpus = None
+        with pytest.raises(GenAIPerfException, match="has no tokens"):
+            SyntheticPromptGenerator._initialize_corpus(tokenizer)
+
+    def test_npy_corpus_is_memory_mapped(self, tmp_path, monkeypatch):
+        for name, value in [
+            ("_tokenized_corpus", None),
+            ("_corpus_length", 0),
+            ("_corpus_file", None),
+            ("_corpus_cache", None),
+            ("_cache", {}),
+        ]:
+            monkeypatch.setattr(SyntheticPromptGenerator, name, value)
+        corpus_path = tmp_path / "corpus.npy"
+        np.save(corpus_path, np.arange(10, dtype=np.int32))
+        tokenizer = MagicMock()
+        tokenizer.decode.side_effect = lambda tokens: " ".join(map(str, tokens))
+        tokenizer.get_identifier.return_value = "test_tokenizer@main"
+
+        SyntheticPromptGenerator.set_corpus_file(corpus_path)
+        monkeypatch.setattr("random.randrange", lambda n: 8)
+        prompt = SyntheticPromptGenerator.create_synthetic_prompt(tokenizer, 4, 0)
+
+        tokenizer.encode.assert_not_called()
+        assert isinstance(SyntheticPromptGenerator._tokenized_corpus, np.memmap)
+        # the prompt wraps around the end of the corpus
+        assert prompt == "8 9 0 1"
+        prompt_tokens = SyntheticPromptGenerator._generate_prompt_tokens(2)
+        assert np.shares_memory(
+            prompt_tokens, SyntheticPromptGenerator._tokenized_corpus
+        )
+
+        # changing the corpus drops the tokens of the previous one
+        SyntheticPromptGenerator.set_corpus_file(None)
+        assert SyntheticPromptGenerator._tokenized_corpus is None
+
+    def test_create_synthetic_prompts(self, tmp_path, monkeypatch):
+        for name, value in [
+            ("_tokenized_corpus", None),
+            ("_corpus_length", 0),
+            ("_corpus_file", None),
+            ("_corpus_cache", None),
+            ("_cache", {}),
+        ]:
+            monkeypatch.setattr(SyntheticPromptGenerator, name, value)
+        corpus_path = tmp_path / "corpus.npy"
+        np.save(corpus_path, np.arange(10, dtype=np.int32))
+        SyntheticPromptGenerator.set_corpus_file(corpus_path)
+        tokenizer = MagicMock()
+        tokenizer.get_identifier.return_value = "test_tokenizer@main"
+        tokenizer.batch_decode.side_effect = lambda sequences: [
+            " ".join(map(str, tokens)) for tokens in sequences
+        ]
+
+        prompts = SyntheticPromptGenerator.create_synthetic_prompts(
+            tokenizer, 5, 4, 0, rng=np.random.default_rng(0), batch_size=2
+        )
+
+        # the prompts are decoded two at a time
+        assert tokenizer.batch_decode.call_count == 3
+        tokenizer.decode.assert_not_called()
+        assert len(prompts) == 5
+        for prompt in prompts:
+            tokens = list(map(int, prompt.split()))
+            assert len(tokens) == 4
+            # consecutive tokens of the corpus, wrapping around its end
+            assert all((b - a) % 10 == 1 for a, b in zip(tokens, tokens[1:]))
+
+        # the same seed gives the same prompts
+        assert prompts == SyntheticPromptGenerator.create_synthetic_prompts(
+            tokenizer, 5, 4, 0, rng=np.random.default_rng(0), batch_size=2
+        )
+
+        # the prompts are at most as long as the corpus
+        prompts = SyntheticPromptGenerator.create_synthetic_prompts(
+            tokenizer, 2, 50, 0, rng=np.random.default_rng(0)
+        )
+        assert [len(prompt.split()) for prompt in prompts] == [10, 10]
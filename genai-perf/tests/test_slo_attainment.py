@@ -0,0 +1,150 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+from genai_perf.goodput_calculator import SLOAttainment
+from genai_perf.metrics.llm_metrics import LLMMetrics
+
+
+class TestSLOAttainment:
+
+    TEST_METRIC = LLMMetrics(
+        time_to_first_tokens=[4_000_000, 1_000_000, 3_000_000, 2_000_000],  # ms
+        inter_token_latencies=[1_000_000, 4_000_000, 2_000_000, 3_000_000],  # ms
+        output_token_throughputs_per_user=[40.0, 10.0, 30.0, 20.0],
+    )
+
+    TEST_BENCHMARK_DURATION = 2
+
+    def test_time_related_metric(self) -> None:
+        sa = SLOAttainment(
+            ["time_to_first_token"],
+            self.TEST_METRIC,
+            self.TEST_BENCHMARK_DURATION,
+            grid_size=4,
+        )
+
+        assert sa.num_requests == 4
+        assert sa.thresholds["time_to_first_token"].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert sa.counts.tolist() == [1, 2, 3, 4]
+        assert sa.fractions.tolist() == [0.25, 0.5, 0.75, 1.0]
+        assert sa.goodputs.tolist() == [0.5, 1.0, 1.5, 2.0]
+        assert sa.get_unit("time_to_first_token") == "ms"
+        assert sa.get_unit("goodput") == "requests/sec"
+
+    def test_throughput_related_metric(self) -> None:
+        sa = SLOAttainment(
+            ["output_token_throughput_per_user"],
+            self.TEST_METRIC,
+            self.TEST_BENCHMARK_DURATION,
+            grid_size=4,
+        )
+
+        thresholds = sa.thresholds["output_token_throughput_per_user"]
+        assert thresholds.tolist() == [10.0, 20.0, 30.0, 40.0]
+        assert sa.counts.tolist() == [4, 3, 2, 1]
+        assert sa.get_unit("output_token_throughput_per_user") == "tokens/sec/user"
+
+    def test_two_metrics(self) -> None:
+        sa = SLOAttainment(
+            ["time_to_first_token", "inter_token_latency"],
+            self.TEST_METRIC,
+            self.TEST_BENCHMARK_DURATION,
+            grid_size=4,
+        )
+
+        assert sa.counts.shape == (4, 4)
+        # TTFT <= 3 ms and ITL <= 3 ms: the requests at (3, 2) and (2, 3)
+        assert sa.counts[2][2] == 2
+        assert sa.counts[3][3] == 4
+        assert sa.counts[0][3] == 1
+        assert len(sa.to_rows()) == 16
+        assert sa.to_rows()[-1] == [4.0, 4.0, 1.0, 2.0]
+
+    def test_matches_brute_force(self) -> None:
+        rng = np.random.default_rng(0)
+        ttfts = rng.integers(1, 10**9, 200)
+        throughputs = rng.uniform(1, 100, 200)
+        metric = LLMMetrics(
+            time_to_first_tokens=ttfts.tolist(),
+            output_token_throughputs_per_user=throughputs.tolist(),
+        )
+        names = ["time_to_first_token", "output_token_throughput_per_user"]
+        sa = SLOAttainment(names, metric, benchmark_duration=1, grid_size=7)
+
+        for i, ttft_slo in enumerate(sa.thresholds[names[0]]):
+            for j, throughput_slo in enumerate(sa.thresholds[names[1]]):
+                expected = np.sum(
+                    (ttfts / 1e6 <= ttft_slo) & (throughputs >= throughput_slo)
+                )
+                assert sa.counts[i][j] == expected
+
+    def test_pairs_metrics_by_request(self) -> None:
+        # the second request has a single response and no ITL
+        metric = LLMMetrics(
+            request_latencies=[5_000_000, 5_000_000, 5_000_000],
+            time_to_first_tokens=[1_000_000, 2_000_000, 3_000_000],
+            inter_token_latencies=[3_000_000, 1_000_000],
+        )
+        metric.set_request_indices("inter_token_latencies", [0, 2])
+        sa = SLOAttainment(
+            ["time_to_first_token", "inter_token_latency"],
+            metric,
+            self.TEST_BENCHMARK_DURATION,
+            grid_size=3,
+        )
+
+        assert sa.num_requests == 3
+        assert sa.thresholds["inter_token_latency"].tolist() == [1.0, 2.0, 3.0]
+        # TTFT <= 2 ms and ITL <= 3 ms: only the first request
+        assert sa.counts[1][2] == 1
+        # the request without an ITL never meets the SLOs
+        assert sa.counts[2][2] == 2
+        assert sa.fractions[2][2] == 2 / 3
+
+    @pytest.mark.parametrize(
+        "slo_names, grid_size, message",
+        [
+            ([], 4, "one or two metrics"),
+            (
+                ["time_to_first_token", "inter_token_latency", "request_latency"],
+                4,
+                "one or two metrics",
+            ),
+            (["time_to_first_token"], 1, "at least two thresholds"),
+            (["output_sequence_length"], 4, "Invalid SLO attainment metrics"),
+            (["request_latency"], 4, "no requests"),
+        ],
+    )
+    def test_invalid_arguments(self, slo_names, grid_size, message) -> None:
+        with pytest.raises(ValueError, match=message):
+            SLOAttainment(
+                slo_names,
+                self.TEST_METRIC,
+                self.TEST_BENCHMARK_DURATION,
+                grid_size,
+            )
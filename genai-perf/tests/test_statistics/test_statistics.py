@@ -24,8 +24,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import numpy as np
 import pytest
 from genai_perf.metrics import ImageRetrievalMetrics, LLMMetrics, Metrics, Statistics
+from genai_perf.metrics.quantile_sketch import QuantileSketch
 
 BASE_METRIC_UNITS = {
     "request_throughput": "requests/sec",
@@ -89,3 +91,73 @@ class TestStatistics:
         stats = Statistics(metrics=metrics).stats_dict
         for metric, unit in expected_units.items():
             assert stats[metric]["unit"] == unit
+
+    def test_default_percentiles(self):
+        stats = Statistics(Metrics(request_latencies=[4, 5, 6])).stats_dict
+        assert list(stats["request_latency"]) == [
+            "unit",
+            "avg",
+            "p25",
+            "p50",
+            "p75",
+            "p90",
+            "p95",
+            "p99",
+            "min",
+            "max",
+            "std",
+        ]
+
+    def test_configured_percentiles(self):
+        data = np.random.default_rng(0).lognormal(size=1001)
+        metrics = Metrics(request_latencies=data.tolist())
+        stats = Statistics(metrics, percentiles=[99.99, 50, 99.9, 50])
+
+        assert stats.percentiles == [50, 99.9, 99.99]
+        latency = stats.stats_dict["request_latency"]
+        assert [key for key in latency if key.startswith("p")] == [
+            "p50",
+            "p99.9",
+            "p99.99",
+        ]
+        for percentile in stats.percentiles:
+            label = f"p{percentile:g}"
+            assert latency[label] == np.percentile(data, percentile)
+        assert latency["avg"] == np.mean(data)
+        assert latency["min"] == np.min(data)
+        assert latency["max"] == np.max(data)
+        assert latency["std"] == pytest.approx(np.std(data))
+
+    def test_create_records_with_configured_percentiles(self):
+        metrics = Metrics(request_latencies=[4, 5, 6])
+        stats = Statistics(metrics, percentiles=[99, 99.9])
+
+        records = stats.create_records()
+
+        assert "request_latency_p99" in records
+        assert "request_latency_p25" not in records
+        record = records["request_latency_p99.9"]
+        assert record.value() == pytest.approx(np.percentile([4, 5, 6], 99.9))
+        assert record.header() == "p99.9 Request Latency (ms)"
+
+    def test_from_sketches(self):
+        data = np.random.default_rng(0).lognormal(3, 1, size=10_000)
+        sketch = QuantileSketch.from_values(data)
+        metrics = LLMMetrics(request_throughputs=[20.0])
+
+        stats = Statistics.from_sketches(
+            metrics, {"request_latency": sketch}, percentiles=[50, 99]
+        ).stats_dict
+
+        assert list(stats)[:2] == ["request_throughput", "request_latency"]
+        latency = stats["request_latency"]
+        assert latency["unit"] == "ms"
+        assert latency["avg"] == pytest.approx(np.mean(data))
+        for label, percentile in [("p50", 50), ("p99", 99)]:
+            assert latency[label] == pytest.approx(
+                np.percentile(data, percentile), rel=0.01
+            )
+        assert latency["min"] == np.min(data)
+        assert latency["max"] == np.max(data)
+        assert latency["std"] == pytest.approx(np.std(data))
+        assert stats["request_throughput"]["avg"] == 20.0
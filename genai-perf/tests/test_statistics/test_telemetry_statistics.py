@@ -80,6 +80,19 @@ class TestTelemetryStatistics:
             stats_dict["gpu_power_usage"]["gpu0"]["p99"] == 29.8
         )  # np.percentile([10, 20, 30], 99)
 
+    def test_configured_percentiles(self, mock_metrics):
+        telemetry_statistics = TelemetryStatistics(mock_metrics, [50, 99.9])
+        gpu_stats = telemetry_statistics.stats_dict["gpu_power_usage"]["gpu0"]
+
+        assert "p99" not in gpu_stats
+        assert gpu_stats["p50"] == 20.0
+        assert gpu_stats["p99.9"] == pytest.approx(29.98)
+
+        telemetry_records = telemetry_statistics.create_records()
+        record = telemetry_records["gpu0"]["gpu_power_usage_p99.9"]
+        assert record.value() == pytest.approx(29.98)
+        assert record.header() == "p99.9 GPU Power Usage (W)"
+
     def test_scaling_data(self, telemetry_statistics):
         telemetry_statistics.scale_data()
         stats_dict = telemetry_statistics.stats_dict
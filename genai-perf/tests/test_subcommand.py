@@ -15,10 +15,16 @@
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
 from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.config.input.config_field import ConfigField
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.profile_data_parser import LLMProfileDataParser
+from genai_perf.subcommand.profile import Profile
 from genai_perf.subcommand.subcommand import Subcommand
+from genai_perf.subcommand.tokenize_corpus import tokenize_corpus_handler
 
 
 class TestCommon:
@@ -55,3 +61,58 @@ class TestCommon:
             assert (
                 kwargs["stdout"] is subprocess.DEVNULL
             ), "When the verbose flag is not passed, stdout should be redirected to /dev/null."
+
+
+class TestProfile:
+    @patch("genai_perf.plots.plot_manager.PlotManager")
+    @patch("genai_perf.plots.plot_config_parser.PlotConfigParser")
+    def test_create_plots_reuses_statistics(
+        self, mock_plot_config_parser, mock_plot_manager
+    ):
+        config = ConfigCommand(user_config={"model_name": "test_model"})
+        profile = Profile(config, extra_args=None)
+        profile._profile_export_file = config.output.artifact_directory / "export.json"
+        profile._tokenizer = MagicMock()
+        profile._data_parser = MagicMock(spec=LLMProfileDataParser)
+        profile._data_parser.get_profile_load_info.return_value = [("concurrency", "1")]
+
+        profile.create_plots()
+
+        mock_plot_config_parser.create_init_yaml_config.assert_called_once()
+        assert mock_plot_config_parser.create_init_yaml_config.call_args.kwargs[
+            "filenames"
+        ] == [profile._profile_export_file]
+        _, kwargs = mock_plot_config_parser.call_args
+        assert kwargs["tokenizer"] is profile._tokenizer
+        assert kwargs["statistics"] == {
+            profile._profile_export_file: profile._data_parser.get_statistics.return_value
+        }
+        assert mock_plot_manager.call_args.kwargs["static_images"] is False
+        mock_plot_manager.return_value.generate_plots.assert_called_once()
+
+
+class TestTokenizeCorpus:
+    def test_requires_tokenizer(self, tmp_path):
+        config = ConfigCommand(skip_inferencing_and_checking=True)
+        config.input.synthetic_tokens.corpus = tmp_path / "corpus.txt"
+        config.tokenized_corpus_filename = tmp_path / "corpus.npy"
+
+        with pytest.raises(GenAIPerfException, match="requires --tokenizer"):
+            tokenize_corpus_handler(config)
+
+    @patch("genai_perf.subcommand.tokenize_corpus.get_tokenizer")
+    def test_writes_tokenized_corpus(self, mock_get_tokenizer, tmp_path):
+        mock_get_tokenizer.return_value.get_identifier.return_value = "gpt2@main"
+        mock_get_tokenizer.return_value.side_effect = lambda texts: {
+            "input_ids": [[len(word) for word in text.split()] for text in texts]
+        }
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not to be\n")
+        config = ConfigCommand(skip_inferencing_and_checking=True)
+        config.tokenizer.name = "gpt2"
+        config.input.synthetic_tokens.corpus = corpus_path
+        config.tokenized_corpus_filename = tmp_path / "corpus.npy"
+
+        tokenize_corpus_handler(config)
+
+        assert np.load(tmp_path / "corpus.npy").tolist() == [2, 3, 2, 3, 2, 2]
@@ -0,0 +1,113 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from unittest.mock import MagicMock, patch
+
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.token_count_cache import (
+    TOKEN_COUNT_CACHE_FILE,
+    TokenCountCache,
+    get_token_count_cache,
+)
+
+
+class TestTokenCountCache:
+    def test_get_and_put(self, tmp_path):
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        assert cache.get(["hello", "world"]) == [None, None]
+
+        cache.put(["hello", "world"], [1, 2])
+        assert cache.get(["world", "foo", "hello"]) == [2, None, 1]
+        assert cache.pop_stats() == (2, 3)
+        assert cache.pop_stats() == (0, 0)
+
+    def test_persists_across_instances(self, tmp_path):
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        cache.put(["hello"], [1])
+        cache.close()
+
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        assert cache.get(["hello"]) == [1]
+
+    def test_keyed_by_tokenizer(self, tmp_path):
+        gpt2 = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        gpt2.put(["hello"], [1])
+
+        other_revision = TokenCountCache(tmp_path / "cache.db", "gpt2@v2", 100)
+        assert other_revision.get(["hello"]) == [None]
+        other_revision.put(["hello"], [5])
+
+        assert gpt2.get(["hello"]) == [1]
+        assert other_revision.get(["hello"]) == [5]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 3)
+        with patch("genai_perf.token_count_cache.time.time", return_value=1):
+            cache.put(["a", "b", "c"], [1, 2, 3])
+        with patch("genai_perf.token_count_cache.time.time", return_value=2):
+            cache.get(["a"])
+        with patch("genai_perf.token_count_cache.time.time", return_value=3):
+            cache.put(["d", "e"], [4, 5])
+
+        assert cache.get(["a", "b", "c", "d", "e"]) == [1, None, None, 4, 5]
+
+    def test_evicts_down_to_low_water_mark(self, tmp_path):
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        cache.put([str(i) for i in range(101)], [1] * 101)
+        assert cache._count_entries() == 90
+
+        # the entries are not counted again until the cache is full again
+        with patch.object(
+            cache, "_count_entries", wraps=cache._count_entries
+        ) as mock_count:
+            cache.put([str(i) for i in range(1000, 1010)], [1] * 10)
+            mock_count.assert_not_called()
+            cache.put(["full"], [1])
+            mock_count.assert_called_once()
+
+    def test_pickle(self, tmp_path):
+        cache = TokenCountCache(tmp_path / "cache.db", "gpt2@main", 100)
+        cache.put(["hello"], [1])
+
+        copied = pickle.loads(pickle.dumps(cache))
+        assert copied.get(["hello"]) == [1]
+
+    def test_get_token_count_cache(self, tmp_path):
+        config = ConfigCommand({"model_name": "test_model"})
+        tokenizer = MagicMock()
+        tokenizer.get_identifier.return_value = "gpt2@main:tokenizers"
+        assert get_token_count_cache(config, tokenizer) is None
+
+        config.tokenizer.count_cache_dir = tmp_path
+        cache = get_token_count_cache(config, tokenizer)
+        assert cache is not None
+        # the tokenizer is only identified, and so loaded, on first use
+        tokenizer.get_identifier.assert_not_called()
+        cache.put(["hello"], [1])
+        assert (tmp_path / TOKEN_COUNT_CACHE_FILE).exists()
+        tokenizer.get_identifier.assert_called_once()
+
+    def test_get_token_count_cache_keyed_by_backend(self, tmp_path):
+        config = ConfigCommand({"model_name": "test_model"})
+        config.tokenizer.count_cache_dir = tmp_path
+        caches = []
+        for backend in ["tokenizers", "transformers"]:
+            tokenizer = MagicMock()
+            tokenizer.get_identifier.return_value = f"gpt2@main:{backend}"
+            caches.append(get_token_count_cache(config, tokenizer))
+
+        tokenizers_cache, transformers_cache = caches
+        tokenizers_cache.put(["hello"], [1])
+        assert transformers_cache.get(["hello"]) == [None]
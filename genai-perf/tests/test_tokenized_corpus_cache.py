@@ -0,0 +1,141 @@
+# Copyright 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from genai_perf.config.input.config_command import ConfigCommand
+from genai_perf.exceptions import GenAIPerfException
+from genai_perf.tokenized_corpus_cache import (
+    TokenizedCorpusCache,
+    get_tokenized_corpus_cache,
+    get_tokenizer_info_path,
+    load_tokenized_corpus,
+    write_tokenized_corpus,
+)
+
+
+class TestTokenizedCorpusCache:
+    def test_save_and_load(self, tmp_path):
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not to be")
+        cache = TokenizedCorpusCache(tmp_path / "cache")
+        assert cache.load(corpus_path, "gpt2@main") is None
+
+        saved = cache.save(corpus_path, "gpt2@main", [1, 2, 3])
+        loaded = TokenizedCorpusCache(tmp_path / "cache").load(corpus_path, "gpt2@main")
+
+        for tokens in [saved, loaded]:
+            assert isinstance(tokens, np.memmap)
+            assert tokens.dtype == np.int32
+            assert tokens.tolist() == [1, 2, 3]
+        # no temporary file is left behind
+        assert [path.name for path in (tmp_path / "cache").iterdir()] == [
+            cache.get_path(corpus_path, "gpt2@main").name
+        ]
+
+    def test_keyed_by_tokenizer_and_corpus(self, tmp_path):
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not to be")
+        cache = TokenizedCorpusCache(tmp_path)
+        cache.save(corpus_path, "gpt2@main", [1, 2, 3])
+
+        assert cache.load(corpus_path, "gpt2@other") is None
+        corpus_path.write_text("That is the question")
+        assert cache.load(corpus_path, "gpt2@main") is None
+
+    def test_ignores_invalid_file(self, tmp_path):
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not to be")
+        cache = TokenizedCorpusCache(tmp_path)
+        cache.get_path(corpus_path, "gpt2@main").write_bytes(b"not an array")
+
+        assert cache.load(corpus_path, "gpt2@main") is None
+
+    def test_get_tokenized_corpus_cache(self, tmp_path):
+        config = ConfigCommand({"model_name": "test_model"})
+        assert get_tokenized_corpus_cache(config) is None
+
+        config.tokenizer.corpus_cache_dir = tmp_path
+        assert isinstance(get_tokenized_corpus_cache(config), TokenizedCorpusCache)
+
+
+class TestWriteTokenizedCorpus:
+    @pytest.fixture
+    def tokenizer(self):
+        tokenizer = MagicMock()
+        tokenizer.side_effect = lambda texts: {
+            "input_ids": [[len(word) for word in text.split()] for text in texts]
+        }
+        tokenizer.get_identifier.return_value = "gpt2@main"
+        return tokenizer
+
+    def test_write_and_load(self, tmp_path, tokenizer, monkeypatch):
+        monkeypatch.setattr(
+            "genai_perf.tokenized_corpus_cache.CORPUS_LINES_PER_TEXT", 2
+        )
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not\n\nto be, that is\nthe question\n")
+        output_path = tmp_path / "tokens" / "corpus.npy"
+
+        num_tokens = write_tokenized_corpus(
+            tokenizer, corpus_path, output_path, batch_size=1
+        )
+
+        tokens = load_tokenized_corpus(output_path, "gpt2@main")
+        assert num_tokens == 10
+        assert isinstance(tokens, np.memmap)
+        assert tokens.tolist() == [2, 3, 2, 3, 2, 3, 4, 2, 3, 8]
+        # the lines are tokenized in batches of texts of two lines each
+        assert [call.args[0] for call in tokenizer.call_args_list] == [
+            ["To be, or not to be, that is"],
+            ["the question"],
+        ]
+        assert sorted(path.name for path in output_path.parent.iterdir()) == [
+            "corpus.npy",
+            "corpus.npy.json",
+        ]
+
+    def test_load_checks_tokenizer(self, tmp_path, tokenizer, caplog):
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("To be, or not to be\n")
+        output_path = tmp_path / "corpus.npy"
+        write_tokenized_corpus(tokenizer, corpus_path, output_path)
+
+        with pytest.raises(GenAIPerfException, match="tokenized with gpt2@main"):
+            load_tokenized_corpus(output_path, "llama@main")
+
+        # Corpora written without the tokenizer can not be checked
+        get_tokenizer_info_path(output_path).unlink()
+        assert len(load_tokenized_corpus(output_path, "llama@main")) == 6
+        assert "Cannot check" in caplog.text
+
+    def test_write_empty_corpus(self, tmp_path, tokenizer):
+        corpus_path = tmp_path / "corpus.txt"
+        corpus_path.write_text("\n")
+
+        num_tokens = write_tokenized_corpus(
+            tokenizer, corpus_path, tmp_path / "corpus.npy"
+        )
+
+        assert num_tokens == 0
+        with pytest.raises(GenAIPerfException, match="has no tokens"):
+            load_tokenized_corpus(tmp_path / "corpus.npy")
+
+    def test_load_rejects_other_arrays(self, tmp_path):
+        np.save(tmp_path / "corpus.npy", np.zeros(3, dtype=np.int64))
+
+        with pytest.raises(GenAIPerfException, match="not a tokenized corpus"):
+            load_tokenized_corpus(tmp_path / "corpus.npy")
@@ -24,9 +24,55 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.config.input.config_defaults import TokenizerDefaults
-from genai_perf.tokenizer import get_tokenizer
+from genai_perf.inputs.input_constants import TokenizerBackend
+from genai_perf.tokenizer import (
+    FastTokenizer,
+    Tokenizer,
+    get_empty_tokenizer,
+    get_tokenizer,
+)
+
+
+@pytest.fixture
+def local_tokenizer_dir(tmp_path):
+    """
+    A small byte-level BPE tokenizer saved as tokenizer.json, which both
+    transformers and the tokenizers library can load without downloading
+    """
+    from tokenizers import Tokenizer as RustTokenizer
+    from tokenizers import decoders, models, pre_tokenizers, processors, trainers
+
+    tokenizer = RustTokenizer(models.BPE(unk_token="<unk>"))
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    trainer = trainers.BpeTrainer(
+        vocab_size=300,
+        special_tokens=["<unk>", "<s>", "</s>"],
+        initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+    )
+    tokenizer.train_from_iterator(
+        ["This is a test. Isn't it?", "Hello world, hello tokens!"] * 10, trainer
+    )
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="<s> $A", special_tokens=[("<s>", 1)]
+    )
+    tokenizer.save(str(tmp_path / "tokenizer.json"))
+    (tmp_path / "tokenizer_config.json").write_text(
+        json.dumps(
+            {
+                "tokenizer_class": "PreTrainedTokenizerFast",
+                "bos_token": "<s>",
+                "eos_token": {"__type": "AddedToken", "content": "</s>"},
+            }
+        )
+    )
+    return tmp_path
 
 
 class TestTokenizer:
@@ -98,3 +144,129 @@ class TestTokenizer:
 
         output = tokenizer.decode(tokens, skip_special_tokens=False)
         assert any([s in output for s in special_tokens])
+
+    def test_tokenizers_backend_matches_transformers(self, local_tokenizer_dir):
+        fast = Tokenizer()
+        fast.set_tokenizer(
+            str(local_tokenizer_dir), False, "main", backend=TokenizerBackend.TOKENIZERS
+        )
+        slow = Tokenizer()
+        slow.set_tokenizer(str(local_tokenizer_dir), False, "main")
+
+        assert isinstance(fast._tokenizer, FastTokenizer)
+        assert fast.is_fast()
+        assert fast.bos_token_id() == slow.bos_token_id() == 1
+        assert fast._tokenizer.eos_token_id == slow._tokenizer.eos_token_id == 2
+
+        texts = ["This is a test. Isn't it?", "hello , world !", ""]
+        for text in texts:
+            assert fast.encode(text) == slow.encode(text)
+            tokens = fast.encode(text, add_special_tokens=True)
+            assert tokens == slow.encode(text, add_special_tokens=True)
+            assert fast.decode(tokens) == slow.decode(tokens)
+            assert fast.decode(tokens, skip_special_tokens=False) == slow.decode(
+                tokens, skip_special_tokens=False
+            )
+            assert fast(text)["input_ids"] == slow(text)["input_ids"]
+
+        sequences = [fast.encode(text, add_special_tokens=True) for text in texts]
+        assert fast.batch_decode(sequences) == slow.batch_decode(sequences)
+        assert fast.batch_decode(sequences) == [fast.decode(s) for s in sequences]
+        assert fast.batch_decode(
+            sequences, skip_special_tokens=False
+        ) == slow.batch_decode(sequences, skip_special_tokens=False)
+
+        fast_batch = fast(texts, return_offsets_mapping=True)
+        slow_batch = slow(texts, return_offsets_mapping=True)
+        assert fast_batch.data["input_ids"] == slow_batch.data["input_ids"]
+        assert [list(map(tuple, o)) for o in fast_batch["offset_mapping"]] == [
+            list(map(tuple, o)) for o in slow_batch["offset_mapping"]
+        ]
+
+    def test_tokenizers_backend_loads_transformers_on_demand(self, local_tokenizer_dir):
+        tokenizer = Tokenizer()
+        with patch.object(
+            Tokenizer, "_load_transformers_tokenizer"
+        ) as mock_load_transformers:
+            tokenizer.set_tokenizer(
+                str(local_tokenizer_dir),
+                False,
+                "main",
+                backend=TokenizerBackend.TOKENIZERS,
+            )
+            tokenizer.decode(tokenizer.encode("Hello world"))
+            mock_load_transformers.assert_not_called()
+
+            # The attributes that the tokenizers library does not have are
+            # taken from the transformers tokenizer
+            tokenizer._tokenizer.apply_chat_template([], tokenize=False)
+            mock_load_transformers.assert_called_once()
+            mock_load_transformers.return_value.apply_chat_template.assert_called_once()
+
+    def test_tokenizers_backend_from_hub_cache(self, local_tokenizer_dir):
+        def hf_hub_download(repo_id, filename, revision):
+            assert (repo_id, revision) == ("org/model", "v1")
+            return str(local_tokenizer_dir / filename)
+
+        tokenizer = Tokenizer()
+        with patch("huggingface_hub.hf_hub_download", side_effect=hf_hub_download):
+            tokenizer.set_tokenizer(
+                "org/model", False, "v1", backend=TokenizerBackend.TOKENIZERS
+            )
+
+        assert isinstance(tokenizer._tokenizer, FastTokenizer)
+        assert tokenizer.bos_token_id() == 1
+
+    @pytest.mark.parametrize("trust_remote_code", [True, False])
+    def test_tokenizers_backend_falls_back_to_transformers(
+        self, tmp_path, trust_remote_code
+    ):
+        # Without a tokenizer.json, or with trust_remote_code,
+        # the tokenizer is loaded with transformers
+        tokenizer_dir = tmp_path if not trust_remote_code else "org/model"
+        tokenizer = Tokenizer()
+        with patch.object(
+            Tokenizer, "_load_transformers_tokenizer", return_value=MagicMock()
+        ) as mock_load_transformers:
+            tokenizer.set_tokenizer(
+                str(tokenizer_dir),
+                trust_remote_code,
+                "main",
+                backend=TokenizerBackend.TOKENIZERS,
+            )
+
+        mock_load_transformers.assert_called_once()
+        assert tokenizer._tokenizer is mock_load_transformers.return_value
+        assert tokenizer.get_identifier() == f"{tokenizer_dir}@main:transformers"
+
+    def test_get_identifier_includes_loaded_backend(self, local_tokenizer_dir):
+        fast = Tokenizer()
+        fast.set_tokenizer(
+            str(local_tokenizer_dir), False, "main", backend=TokenizerBackend.TOKENIZERS
+        )
+        slow = Tokenizer()
+        slow.set_tokenizer(str(local_tokenizer_dir), False, "main")
+
+        assert fast.get_identifier() == f"{local_tokenizer_dir}@main:tokenizers"
+        assert slow.get_identifier() == f"{local_tokenizer_dir}@main:transformers"
+        assert get_empty_tokenizer().get_identifier() == "@"
+
+    def test_get_identifier_loads_lazy_tokenizer(self, local_tokenizer_dir):
+        tokenizer = Tokenizer()
+        tokenizer.set_tokenizer(
+            str(local_tokenizer_dir),
+            False,
+            "main",
+            lazy=True,
+            backend=TokenizerBackend.TOKENIZERS,
+        )
+        assert "_tokenizer" not in tokenizer.__dict__
+        assert tokenizer.get_identifier().endswith(":tokenizers")
+
+    def test_get_tokenizer_backend(self, local_tokenizer_dir):
+        config = self._create_tokenizer_config(name=str(local_tokenizer_dir))
+        config.tokenizer.backend = TokenizerBackend.TOKENIZERS
+
+        tokenizer = get_tokenizer(config)
+
+        assert isinstance(tokenizer._tokenizer, FastTokenizer)
@@ -35,9 +35,12 @@ from genai_perf.config.generate.perf_analyzer_config import PerfAnalyzerConfig
 from genai_perf.config.input.config_command import ConfigCommand
 from genai_perf.config.run.run_config import RunConfig
 from genai_perf.export_data.exporter_config import ExporterConfig
+from genai_perf.goodput_calculator.slo_attainment import SLOAttainment
 from genai_perf.measurements.run_config_measurement import RunConfigMeasurement
 from genai_perf.metrics.metrics import Metrics
 from genai_perf.metrics.statistics import Statistics
+from genai_perf.metrics.steady_state import SteadyStateWindow
+from genai_perf.metrics.timeline import Timeline
 from genai_perf.record.types.gpu_power_usage_p99 import GPUPowerUsageP99
 from genai_perf.record.types.gpu_utilization_p99 import GPUUtilizationP99
 from genai_perf.record.types.input_sequence_length_p99 import InputSequenceLengthP99
@@ -73,6 +76,9 @@ def create_default_exporter_config(
     config: Optional[ConfigCommand] = None,
     telemetry_stats: Dict[str, Any] = {},
     session_stats: Dict[str, Any] = {},
+    timeline: Optional[Timeline] = None,
+    steady_state_window: Optional[SteadyStateWindow] = None,
+    slo_attainment: Optional[SLOAttainment] = None,
 ) -> ExporterConfig:
     if not config:
         config = ConfigCommand({"model_name": "test_model"})
@@ -87,6 +93,9 @@ def create_default_exporter_config(
         extra_inputs=config.input.extra,
         telemetry_stats=telemetry_stats,
         session_stats=session_stats,
+        timeline=timeline,
+        steady_state_window=steady_state_window,
+        slo_attainment=slo_attainment,
     )
 
 